@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+여러 행 기록 벤치마크: 행마다 save_gold_price_data_to_csv vs 일괄 기록
+
+같은 GoldPriceData 제너레이터를 행마다 저장하는 방식과
+save_gold_price_data_batch_to_csv로 한 번에 저장하는 방식(fsync 정책별)으로 기록해
+소요 시간을 비교합니다. 두 방식 모두 열 저장소 동기화는 끄고 잽니다.
+
+실행:
+    uv run python benchmarks/bench_batch_writer.py
+    uv run python benchmarks/bench_batch_writer.py --rows 100000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from kimchi_gold import data_collector
+from kimchi_gold.configuration import DATA_STORAGE_DIRECTORY
+from kimchi_gold.price_fetcher import build_gold_price_data
+
+
+def generate_daily_data(row_count: int):
+    first_day = datetime(1900, 1, 1)
+    for day_number in range(row_count):
+        gold_price_data = build_gold_price_data(150000.0 + day_number % 1000, 3345.2, 1399.5)
+        gold_price_data.data_collection_timestamp = first_day + timedelta(days=day_number)
+        yield gold_price_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 행 기록 벤치마크")
+    parser.add_argument("--rows", type=int, default=20_000, help="기록할 행 수")
+    arguments = parser.parse_args()
+
+    data_collector.PRICE_COLUMNS_ENABLED = False
+    # validate_safe_path를 그대로 통과하도록 데이터 디렉토리 안에 임시 디렉토리를 만든다
+    with tempfile.TemporaryDirectory(dir=DATA_STORAGE_DIRECTORY) as temporary_directory:
+        results = {}
+
+        per_row_path = Path(temporary_directory) / "per_row.csv"
+        started_at = time.perf_counter()
+        for gold_price_data in generate_daily_data(arguments.rows):
+            data_collector.save_gold_price_data_to_csv(gold_price_data, per_row_path)
+        results["per-row save"] = time.perf_counter() - started_at
+
+        for fsync_policy in data_collector.BULK_WRITE_FSYNC_POLICIES:
+            batch_path = Path(temporary_directory) / f"batch_{fsync_policy}.csv"
+            started_at = time.perf_counter()
+            data_collector.save_gold_price_data_batch_to_csv(
+                generate_daily_data(arguments.rows), batch_path, fsync_policy=fsync_policy
+            )
+            results[f"batch (fsync={fsync_policy})"] = time.perf_counter() - started_at
+            assert batch_path.read_bytes() == per_row_path.read_bytes()
+
+    print(f"{arguments.rows:,} rows\n")
+    print(f"{'writer':<22} | {'total (ms)':>11} | {'rows/s':>11}")
+    print("-" * 50)
+    for label, seconds in results.items():
+        print(f"{label:<22} | {seconds * 1000:>11.1f} | {arguments.rows / seconds:>11,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
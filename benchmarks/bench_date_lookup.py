@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+기록 날짜 확인 벤치마크: 처음부터 읽기 vs 끝에서부터 읽기 vs 날짜 색인
+
+합성 가격 로그(기본 1천만 행, 어제 날짜로 끝남)를 임시 디렉토리에 만들고,
+수집 때마다 하는 "오늘 날짜가 이미 있는가" 확인과 최근/중간 날짜 확인을
+세 방식으로 재서 소요 시간과 읽은 바이트 수를 비교합니다.
+
+실행:
+    uv run python benchmarks/bench_date_lookup.py
+    uv run python benchmarks/bench_date_lookup.py --rows 100000
+"""
+
+import argparse
+import csv
+import math
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from kimchi_gold.configuration import CSV_COLUMN_HEADERS
+from kimchi_gold.price_log_lookup import LoggedDateIndex, find_date_in_log_tail
+
+# date 타입이 표현할 수 있는 범위 안에서 하루에 여러 행을 두어 행 수를 맞춘다
+MAX_SYNTHETIC_DAYS = 700_000
+WRITE_BATCH_ROWS = 100_000
+
+
+def write_synthetic_log(log_path: Path, row_count: int) -> date:
+    """어제로 끝나는 날짜순 로그를 만들고 첫 날짜를 반환합니다."""
+    day_count = min(row_count, MAX_SYNTHETIC_DAYS)
+    rows_per_day = math.ceil(row_count / day_count)
+    first_date = date.today() - timedelta(days=math.ceil(row_count / rows_per_day))
+    with log_path.open("w", encoding="utf-8", newline="") as log_file:
+        log_file.write(",".join(CSV_COLUMN_HEADERS) + "\n")
+        batch = []
+        for row_number in range(row_count):
+            logged_date = first_date + timedelta(days=row_number // rows_per_day)
+            batch.append(f"{logged_date.isoformat()},152340.00,3345.20,1399.50,-536.41,-0.28\n")
+            if len(batch) == WRITE_BATCH_ROWS:
+                log_file.writelines(batch)
+                batch.clear()
+        log_file.writelines(batch)
+    return first_date
+
+
+def scan_from_top(log_path: Path, target_date_string: str) -> bool:
+    """기존 방식: 처음부터 한 줄씩 읽다가 찾으면 멈춤"""
+    with log_path.open("r", encoding="utf-8") as csv_file:
+        csv_reader = csv.reader(csv_file)
+        next(csv_reader, None)
+        for data_row in csv_reader:
+            if data_row and data_row[0].startswith(target_date_string):
+                return True
+    return False
+
+
+def measure(lookup, repetitions: int):
+    durations = []
+    for _ in range(repetitions):
+        start_time = time.perf_counter()
+        found = lookup()
+        durations.append(time.perf_counter() - start_time)
+    return found, min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록 날짜 확인 벤치마크")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="합성 로그 행 수")
+    parser.add_argument("--repetitions", type=int, default=3, help="방식별 반복 횟수 (최솟값 출력)")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        log_path = Path(temporary_directory) / "kimchi_gold_price_log.csv"
+        generation_started = time.perf_counter()
+        first_date = write_synthetic_log(log_path, arguments.rows)
+        print(
+            f"synthetic log: {arguments.rows:,} rows, {log_path.stat().st_size / 1e6:,.0f} MB "
+            f"({time.perf_counter() - generation_started:.1f}s to generate)"
+        )
+
+        date_index = LoggedDateIndex(log_path)
+        index_started = time.perf_counter()
+        date_index.load_dates()
+        print(f"date index build: {time.perf_counter() - index_started:.2f}s (once, then reused)\n")
+
+        today = date.today()
+        lookups = {
+            "today (not logged)": today,
+            "yesterday (last row)": today - timedelta(days=1),
+            "30 days ago": today - timedelta(days=30),
+            "middle of log": first_date + (today - first_date) / 2,
+        }
+        print(f"{'target':<22} | {'mode':<13} | {'found':>5} | {'time (ms)':>11}")
+        print("-" * 60)
+        for label, target_date in lookups.items():
+            target_date_string = target_date.isoformat()
+            for mode_name, lookup in (
+                ("scan from top", lambda: scan_from_top(log_path, target_date_string)),
+                ("tail seek", lambda: find_date_in_log_tail(log_path, target_date_string)),
+                ("date index", lambda: date_index.contains(target_date_string)),
+            ):
+                found, seconds = measure(lookup, arguments.repetitions)
+                print(f"{label:<22} | {mode_name:<13} | {str(found):>5} | {seconds * 1000:>11.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+CSV 파싱 벤치마크: pd.read_csv vs read_price_log_arrays (NumPy 배열로 바로)
+
+합성 가격 로그를 행 수별(기본 1천, 100만, 5천만 행)로 만들고 전체 이력을 읽는 시간과
+결과가 차지하는 메모리를 비교합니다. pandas 쪽은 날짜를 문자열로 둔 가장 가벼운
+`pd.read_csv`와, dtype을 지정하고 날짜까지 변환하는 방식(이전 `read_price_history_csv`)을
+잽니다. 합성 로그는 1677년 이전 날짜를 포함해 `parse_dates`는 dateutil로 한 행씩
+변환하므로 비교에서 뺐습니다. 백테스트는 읽은 뒤 바로 `.values`로 배열만 쓰므로
+DataFrame을 만들지 않는 경로의 비용이 곧 백테스트의 읽기 비용입니다.
+
+실행:
+    uv run python benchmarks/bench_fast_parser.py
+    uv run python benchmarks/bench_fast_parser.py --rows 1000 1000000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "benchmarks"))
+
+from bench_date_lookup import write_synthetic_log
+from kimchi_gold.configuration import CSV_COLUMN_HEADERS
+from kimchi_gold.price_columns import read_price_log_arrays
+
+
+def read_typed_dataframe(log_path: Path) -> pd.DataFrame:
+    """dtype 지정 read_csv + 날짜 앞 10자를 numpy로 변환해 DatetimeIndex로"""
+    dataframe = pd.read_csv(
+        log_path, dtype={CSV_COLUMN_HEADERS[0]: str, **{header: np.float64 for header in CSV_COLUMN_HEADERS[1:]}}
+    )
+    date_strings = dataframe.pop(CSV_COLUMN_HEADERS[0]).str.slice(0, 10).to_numpy(dtype=str)
+    return dataframe.set_axis(pd.DatetimeIndex(date_strings.astype("datetime64[D]").astype("datetime64[s]")))
+
+
+PANDAS_READERS = {
+    "pd.read_csv": pd.read_csv,
+    "read_csv typed+dates": read_typed_dataframe,
+}
+
+
+def measure(operation, repetitions: int):
+    durations = []
+    for _ in range(repetitions):
+        started_at = time.perf_counter()
+        result = operation()
+        durations.append(time.perf_counter() - started_at)
+    return min(durations), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV 파싱 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 1_000_000, 50_000_000], help="합성 로그 행 수")
+    parser.add_argument("--repetitions", type=int, default=3, help="방식별 반복 횟수 (최솟값 출력, 1천만 행 이상은 1회)")
+    arguments = parser.parse_args()
+
+    print(f"{'rows':>12} | {'file (MB)':>9} | {'reader':<22} | {'time (ms)':>11} | {'result (MB)':>11}")
+    print("-" * 80)
+    for row_count in arguments.rows:
+        repetitions = 1 if row_count >= 10_000_000 else arguments.repetitions
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            log_path = Path(temporary_directory) / "kimchi_gold_price_log.csv"
+            write_synthetic_log(log_path, row_count)
+            file_megabytes = log_path.stat().st_size / 1e6
+
+            array_seconds, price_columns = measure(lambda: read_price_log_arrays(log_path), repetitions)
+            array_megabytes = sum(column.nbytes for column in price_columns) / 1e6
+            expected_domestic_prices = price_columns.domestic_price[:: max(1, row_count // 1000)].copy()
+            # 큰 로그에서 pandas가 쓸 메모리를 남겨 두기 위해 결과 배열을 먼저 놓아 준다
+            del price_columns
+            print(f"{row_count:>12,} | {file_megabytes:>9.1f} | {'read_price_log_arrays':<22} | {array_seconds * 1000:>11.1f} | {array_megabytes:>11.1f}")
+
+            for reader_name, pandas_reader in PANDAS_READERS.items():
+                try:
+                    pandas_seconds, dataframe = measure(lambda: pandas_reader(log_path), repetitions)
+                except MemoryError:
+                    print(f"{row_count:>12,} | {file_megabytes:>9.1f} | {reader_name:<22} | {'MemoryError':>11} |")
+                    continue
+                assert np.array_equal(
+                    dataframe["국내금(원/g)"].to_numpy()[:: max(1, row_count // 1000)], expected_domestic_prices
+                )
+                dataframe_megabytes = dataframe.memory_usage(deep=True).sum() / 1e6
+                del dataframe
+                print(
+                    f"{row_count:>12,} | {file_megabytes:>9.1f} | {reader_name:<22} | "
+                    f"{pandas_seconds * 1000:>11.1f} | {dataframe_megabytes:>11.1f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+시세 수집 부하 테스트
+
+로컬 HTTPS 스탠드인 서버(지연, 지터, 오류율, 응답 크기 조절)를 대상으로 동시성을
+단계별로 높여 가며 `fetch_current_gold_market_data`를 호출하고, 단계별 처리량,
+지연 백분위수, 서버가 받은 요청 수, 실패 원인(timeout/http_error/circuit_open 등)을
+출력합니다.
+
+실행:
+    uv run python benchmarks/bench_fetcher_load.py
+    uv run python benchmarks/bench_fetcher_load.py --latency 0.05 --jitter 0.05 --error-rate 0.05
+    uv run python benchmarks/bench_fetcher_load.py --uncoalesced --payload-bytes 200000
+"""
+
+import argparse
+import logging
+import sys
+from functools import partial
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "tests"))
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.http_session import close_shared_http_session, get_shared_http_session
+from kimchi_gold.quote_cache import set_shared_quote_cache
+from kimchi_gold.rate_limiter import set_shared_upstream_rate_limiters
+from fetcher_load import format_load_report, run_load_test
+from naver_stand_in import NaverStandInServer, default_stand_in_pages, route_session_to_stand_in
+
+
+def parse_concurrency_levels(text: str):
+    return [int(level) for level in text.split(",") if level]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스탠드인 서버 대상 시세 수집 부하 테스트")
+    parser.add_argument("--levels", type=parse_concurrency_levels, default=[1, 2, 4, 8, 16, 32],
+                        help="쉼표로 구분한 동시성 단계 (기본값: 1,2,4,8,16,32)")
+    parser.add_argument("--calls", type=int, default=20, help="작업 스레드당 호출 수")
+    parser.add_argument("--latency", type=float, default=0.02, help="응답마다 넣는 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.01, help="응답마다 더하는 최대 지터 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503으로 응답할 확률")
+    parser.add_argument("--payload-bytes", type=int, default=0, help="가격 태그 뒤에 붙일 본문 크기")
+    parser.add_argument("--deadline", type=float, default=15.0, help="스냅샷 마감 시간 (초)")
+    parser.add_argument("--seed", type=int, default=0, help="지터/오류 난수 시드")
+    parser.add_argument("--uncoalesced", action="store_true",
+                        help="single-flight를 거치지 않고 호출마다 실제로 수집")
+    arguments = parser.parse_args()
+
+    # 오류율을 높이면 재시도/서킷 브레이커 경고가 쏟아지므로 요약 표만 출력
+    logging.basicConfig(level=logging.CRITICAL)
+    # TTL 캐시가 켜져 있으면 첫 호출 이후 서버에 요청이 가지 않으므로 끈다
+    set_shared_quote_cache(None)
+    # 호스트별 요청 속도 제한은 실제 네이버 보호용이므로 스탠드인 대상 측정에서는 끈다
+    set_shared_upstream_rate_limiters(None)
+
+    snapshot_function = (
+        price_fetcher.collect_gold_market_data_snapshot
+        if arguments.uncoalesced
+        else price_fetcher.fetch_current_gold_market_data
+    )
+    snapshot_fetcher = partial(snapshot_function, deadline_seconds=arguments.deadline)
+
+    print(
+        f"latency={arguments.latency}s jitter={arguments.jitter}s error_rate={arguments.error_rate} "
+        f"payload={arguments.payload_bytes}B deadline={arguments.deadline}s "
+        f"mode={'uncoalesced' if arguments.uncoalesced else 'single-flight'}"
+    )
+    with NaverStandInServer(
+        pages=default_stand_in_pages(padding_bytes=arguments.payload_bytes),
+        latency_seconds=arguments.latency,
+        jitter_seconds=arguments.jitter,
+        error_rate=arguments.error_rate,
+        seed=arguments.seed,
+    ) as stand_in:
+        close_shared_http_session()
+        route_session_to_stand_in(get_shared_http_session(), stand_in)
+        try:
+            results = run_load_test(stand_in, arguments.levels, arguments.calls, snapshot_fetcher)
+        finally:
+            close_shared_http_session()
+    print(format_load_report(results))
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+HTML 파서 백엔드 벤치마크: html.parser vs lxml vs scan
+
+tests/fixtures/naver의 전체 크기 market-index 페이지 묶음을 각 백엔드로 반복 파싱하여
+초당 처리 페이지 수와 최대 메모리 사용량(tracemalloc 피크, 프로세스 RSS 증가분)을 비교합니다.
+RSS는 백엔드끼리 섞이지 않도록 백엔드마다 별도 프로세스에서 측정합니다.
+
+실행: uv run python benchmarks/bench_html_parsers.py
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "tests"))
+
+from kimchi_gold.html_parsers import available_html_parser_backends, extract_price_text
+from naver_stand_in import load_naver_fixture_pages
+
+ROUNDS = 20
+
+
+def measure_backend(backend: str) -> dict:
+    pages = list(load_naver_fixture_pages().values())
+    rss_before_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for page in pages:
+            if extract_price_text(page, backend) is None:
+                raise ValueError(f"{backend}: price tag not found")
+    elapsed = time.perf_counter() - started
+    rss_after_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    tracemalloc.start()
+    for page in pages:
+        extract_price_text(page, backend)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "backend": backend,
+        "pages_per_second": ROUNDS * len(pages) / elapsed,
+        "tracemalloc_peak_kib": peak_bytes / 1024,
+        "rss_growth_kib": rss_after_kib - rss_before_kib,
+    }
+
+
+def main() -> None:
+    if len(sys.argv) == 3 and sys.argv[1] == "--backend":
+        print(json.dumps(measure_backend(sys.argv[2])))
+        return
+
+    page_count = len(load_naver_fixture_pages())
+    print(f"corpus: {page_count} pages x {ROUNDS} rounds")
+    print(f"{'backend':<12} {'pages/s':>10} {'py peak KiB':>12} {'RSS +KiB':>10}")
+    for backend in available_html_parser_backends():
+        output = subprocess.run(
+            [sys.executable, __file__, "--backend", backend],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        print(
+            f"{result['backend']:<12} {result['pages_per_second']:>10.1f} "
+            f"{result['tracemalloc_peak_kib']:>12.0f} {result['rss_growth_kib']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+공유 HTTP 세션 벤치마크
+
+로컬 HTTPS 스탠드인 서버를 대상으로 1, 3, 100회 연속 스냅샷을 수집하면서
+호출마다 새 연결을 여는 방식(기존 `requests.get`)과 공유 keep-alive 풀을
+비교합니다. 서버 측에서 센 TLS 핸드셰이크 수와 총 소요 시간을 출력합니다.
+
+실행: uv run python benchmarks/bench_http_session.py
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "tests"))
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.http_session import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    close_shared_http_session,
+    create_http_session,
+    get_shared_http_session,
+)
+from kimchi_gold.quote_cache import set_shared_quote_cache
+from kimchi_gold.rate_limiter import set_shared_upstream_rate_limiters
+from naver_stand_in import NaverStandInServer, route_session_to_stand_in
+
+SNAPSHOT_COUNTS = (1, 3, 100)
+
+
+def run_snapshots(snapshot_count: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(snapshot_count):
+        price_fetcher.fetch_current_gold_market_data()
+    return time.perf_counter() - start_time
+
+
+def bench_per_call_sessions(stand_in: NaverStandInServer, snapshot_count: int):
+    """기존 동작: 요청마다 새 세션(= requests.get)을 만들고 닫는다"""
+    created_sessions = []
+
+    def new_routed_session():
+        session = route_session_to_stand_in(create_http_session(), stand_in)
+        created_sessions.append(session)
+        return session
+
+    stand_in.reset_counters()
+    with patch.object(price_fetcher, "get_shared_http_session", new_routed_session):
+        elapsed = run_snapshots(snapshot_count)
+    for session in created_sessions:
+        session.close()
+    return stand_in.handshake_count, elapsed
+
+
+def bench_shared_session(stand_in: NaverStandInServer, snapshot_count: int):
+    """새 동작: 프로세스 공유 keep-alive 풀"""
+    close_shared_http_session()
+    route_session_to_stand_in(
+        get_shared_http_session(),
+        stand_in,
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+    )
+    stand_in.reset_counters()
+    elapsed = run_snapshots(snapshot_count)
+    close_shared_http_session()
+    return stand_in.handshake_count, elapsed
+
+
+def main():
+    # 캐시와 호스트별 속도 제한이 켜져 있으면 연결 비용 대신 캐시 적중/대기 시간을 재게 되므로 끈다
+    set_shared_quote_cache(None)
+    set_shared_upstream_rate_limiters(None)
+    print(f"{'snapshots':>9} | {'mode':<16} | {'handshakes':>10} | {'wall (s)':>9} | {'ms/snapshot':>11}")
+    print("-" * 68)
+    with NaverStandInServer() as stand_in:
+        for snapshot_count in SNAPSHOT_COUNTS:
+            for mode_name, bench in (
+                ("per-call", bench_per_call_sessions),
+                ("shared pool", bench_shared_session),
+            ):
+                handshakes, elapsed = bench(stand_in, snapshot_count)
+                print(
+                    f"{snapshot_count:>9} | {mode_name:<16} | {handshakes:>10} | "
+                    f"{elapsed:>9.3f} | {elapsed / snapshot_count * 1000:>11.2f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
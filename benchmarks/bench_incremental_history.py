@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+새 행 반영 벤치마크: 전체 다시 읽기 vs 추가분만 읽기 (IncrementalPriceHistory)
+
+합성 가격 로그(기본 100만 행)에 하루 한 행씩 추가하면서, 매번 CSV 전체를 다시 파싱하는
+방식과 `IncrementalPriceHistory.refresh()`로 추가된 줄만 파싱하는 방식의 시간을 비교합니다.
+
+실행:
+    uv run python benchmarks/bench_incremental_history.py
+    uv run python benchmarks/bench_incremental_history.py --rows 10000000 --appends 50
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "benchmarks"))
+
+from bench_date_lookup import write_synthetic_log
+from kimchi_gold.price_history import IncrementalPriceHistory, read_price_history_csv
+
+
+def main():
+    parser = argparse.ArgumentParser(description="새 행 반영 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="합성 로그 행 수")
+    parser.add_argument("--appends", type=int, default=20, help="한 행씩 추가하고 다시 읽는 횟수")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        log_path = Path(temporary_directory) / "kimchi_gold_price_log.csv"
+        write_synthetic_log(log_path, arguments.rows)
+
+        incremental_history = IncrementalPriceHistory(log_path)
+        started_at = time.perf_counter()
+        incremental_history.refresh()
+        initial_load_seconds = time.perf_counter() - started_at
+
+        full_reload_seconds = []
+        incremental_seconds = []
+        for append_number in range(arguments.appends):
+            with log_path.open("a", encoding="utf-8") as log_file:
+                log_file.write(f"2999-01-{append_number % 28 + 1:02d},152340.00,3345.20,1399.50,-536.41,-0.28\n")
+
+            started_at = time.perf_counter()
+            full_history = read_price_history_csv(log_path)
+            full_reload_seconds.append(time.perf_counter() - started_at)
+
+            started_at = time.perf_counter()
+            incremental_history.refresh()
+            incremental_seconds.append(time.perf_counter() - started_at)
+            assert incremental_history.row_count == len(full_history)
+
+    print(f"{arguments.rows:,} rows, initial incremental load {initial_load_seconds:.2f}s (once)\n")
+    print(f"{'per appended row':<24} | {'median (ms)':>11} | {'max (ms)':>9}")
+    print("-" * 51)
+    for label, durations in (("full re-parse", full_reload_seconds), ("incremental refresh", incremental_seconds)):
+        durations.sort()
+        print(f"{label:<24} | {durations[len(durations) // 2] * 1000:>11.3f} | {durations[-1] * 1000:>9.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
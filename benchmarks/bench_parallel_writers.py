@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+동시 기록 벤치마크: 잠금 + 저널 추가 vs 잠금 없는 추가
+
+N개 프로세스가 같은 로그에 한 행씩 K번 기록할 때의 처리량(행/초)과
+결과 로그의 무결성(헤더 수, 잘리거나 섞인 행 수, 빠진 행 수)을 비교합니다.
+잠금 없는 추가는 기존 방식(존재 확인 후 append 모드로 열어 쓰기)입니다.
+
+실행:
+    uv run python benchmarks/bench_parallel_writers.py
+    uv run python benchmarks/bench_parallel_writers.py --writers 1 2 4 8 16 --rows-per-writer 500
+"""
+
+import argparse
+import csv
+import multiprocessing
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from kimchi_gold.configuration import CSV_COLUMN_HEADERS
+from kimchi_gold.price_fetcher import build_gold_price_data
+from kimchi_gold.price_log_journal import append_rows_to_csv_atomically
+
+
+def generate_daily_data(first_day_number: int, row_count: int):
+    for day_number in range(first_day_number, first_day_number + row_count):
+        gold_price_data = build_gold_price_data(150000.0, 3345.2, 1399.5)
+        gold_price_data.data_collection_timestamp = datetime(1900, 1, 1) + timedelta(days=day_number)
+        yield gold_price_data
+
+
+def write_unlocked(csv_path: Path, first_day_number: int, row_count: int, start_event) -> None:
+    start_event.wait()
+    for gold_price_data in generate_daily_data(first_day_number, row_count):
+        file_already_exists = csv_path.exists()
+        with csv_path.open(mode="a", encoding="utf-8", newline="") as csv_file:
+            csv_writer = csv.writer(csv_file)
+            if not file_already_exists:
+                csv_writer.writerow(CSV_COLUMN_HEADERS)
+            csv_writer.writerow(gold_price_data.convert_to_csv_row_format())
+
+
+def write_locked(csv_path: Path, first_day_number: int, row_count: int, start_event, fsync_policy: str) -> None:
+    """save_gold_price_data_to_csv와 같은 경로 (fsync 정책만 지정)"""
+    start_event.wait()
+    for gold_price_data in generate_daily_data(first_day_number, row_count):
+        append_rows_to_csv_atomically(
+            csv_path, [gold_price_data.convert_to_csv_row_format()], fsync_policy=fsync_policy
+        )
+
+
+def check_integrity(csv_path: Path, expected_row_count: int) -> str:
+    lines = csv_path.read_text(encoding="utf-8").splitlines()
+    header_count = sum(line == ",".join(CSV_COLUMN_HEADERS) for line in lines)
+    data_lines = [line for line in lines if line != ",".join(CSV_COLUMN_HEADERS)]
+    malformed_count = sum(line.count(",") != 5 or len(line.split(",", 1)[0]) != 10 for line in data_lines)
+    missing_count = expected_row_count - (len(data_lines) - malformed_count)
+    return f"headers={header_count} malformed={malformed_count} missing={missing_count}"
+
+
+def run_writers(mode: str, writer_count: int, rows_per_writer: int, directory: Path):
+    csv_path = directory / f"{mode}_{writer_count}.csv"
+    process_context = multiprocessing.get_context("fork")
+    start_event = process_context.Event()
+    writers = []
+    for writer_number in range(writer_count):
+        arguments = (csv_path, writer_number * rows_per_writer, rows_per_writer, start_event)
+        if mode == "unlocked":
+            writers.append(process_context.Process(target=write_unlocked, args=arguments))
+        else:
+            writers.append(process_context.Process(target=write_locked, args=arguments + (mode.split("=")[1],)))
+    for writer in writers:
+        writer.start()
+    started_at = time.perf_counter()
+    start_event.set()
+    for writer in writers:
+        writer.join()
+    elapsed_seconds = time.perf_counter() - started_at
+    return elapsed_seconds, check_integrity(csv_path, writer_count * rows_per_writer)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 기록 벤치마크")
+    parser.add_argument("--writers", type=int, nargs="+", default=[1, 2, 4, 8], help="동시 기록 프로세스 수")
+    parser.add_argument("--rows-per-writer", type=int, default=200, help="프로세스마다 기록할 행 수")
+    arguments = parser.parse_args()
+
+    print(f"{'mode':<18} | {'writers':>7} | {'rows/s':>9} | integrity")
+    print("-" * 70)
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        for mode in ("unlocked", "locked fsync=none", "locked fsync=batch"):
+            for writer_count in arguments.writers:
+                elapsed_seconds, integrity = run_writers(
+                    mode, writer_count, arguments.rows_per_writer, Path(temporary_directory)
+                )
+                rows_per_second = writer_count * arguments.rows_per_writer / elapsed_seconds
+                print(f"{mode:<18} | {writer_count:>7} | {rows_per_second:>9,.0f} | {integrity}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
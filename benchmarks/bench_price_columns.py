@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+가격 이력 읽기 벤치마크: pd.read_csv vs 열 저장소 메모리 매핑
+
+합성 가격 로그(기본 100만 행)를 만들고 전체 이력을 읽는 시간을 비교합니다.
+열 저장소는 처음 한 번 만들고(전체 파싱), 이후 읽기는 메모리 매핑만 합니다.
+
+실행:
+    uv run python benchmarks/bench_price_columns.py
+    uv run python benchmarks/bench_price_columns.py --rows 10000000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "benchmarks"))
+
+from bench_date_lookup import write_synthetic_log
+from kimchi_gold.price_columns import ColumnarPriceStore, load_price_columns
+
+
+def measure(operation, repetitions: int) -> float:
+    durations = []
+    for _ in range(repetitions):
+        started_at = time.perf_counter()
+        operation()
+        durations.append(time.perf_counter() - started_at)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가격 이력 읽기 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="합성 로그 행 수")
+    parser.add_argument("--repetitions", type=int, default=3, help="방식별 반복 횟수 (최솟값 출력)")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        log_path = Path(temporary_directory) / "kimchi_gold_price_log.csv"
+        write_synthetic_log(log_path, arguments.rows)
+
+        build_seconds = measure(lambda: ColumnarPriceStore(log_path).sync(), 1)
+        with log_path.open("a", encoding="utf-8") as log_file:
+            log_file.write("2999-01-01,152340.00,3345.20,1399.50,-536.41,-0.28\n")
+
+        results = {
+            "pd.read_csv": measure(lambda: pd.read_csv(log_path, parse_dates=["날짜"]), arguments.repetitions),
+            "memmap (synced)": measure(lambda: load_price_columns(log_path, sync=False), arguments.repetitions),
+            "memmap + sync check": measure(lambda: load_price_columns(log_path), arguments.repetitions),
+            "memmap -> DataFrame": measure(
+                lambda: load_price_columns(log_path, sync=False).to_dataframe(), arguments.repetitions
+            ),
+            "mean premium (memmap)": measure(
+                lambda: float(load_price_columns(log_path, sync=False).kimchi_premium_percent.mean()),
+                arguments.repetitions,
+            ),
+        }
+
+    print(f"{arguments.rows:,} rows, column store build {build_seconds:.2f}s (once)\n")
+    print(f"{'read path':<24} | {'time (ms)':>11}")
+    print("-" * 38)
+    for label, seconds in results.items():
+        print(f"{label:<24} | {seconds * 1000:>11.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
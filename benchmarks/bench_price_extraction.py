@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+가격 추출 벤치마크: 전체 다운로드 + BeautifulSoup vs 스트리밍 스캐너
+
+tests/fixtures/naver의 전체 크기 market-index 페이지를 8 KiB chunk로 흘려보내며
+두 방식이 읽어야 하는 바이트 수와 파싱 시간(중앙값)을 비교합니다.
+
+실행: uv run python benchmarks/bench_price_extraction.py
+"""
+
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "tests"))
+
+from bs4 import BeautifulSoup
+
+from kimchi_gold.price_scanner import StreamingPriceTagScanner
+from naver_stand_in import load_naver_fixture_pages
+
+CHUNK_SIZE = 8192
+REPETITIONS = 30
+
+
+def iter_chunks(page: bytes):
+    for offset in range(0, len(page), CHUNK_SIZE):
+        yield page[offset:offset + CHUNK_SIZE]
+
+
+def extract_with_full_dom(page: bytes):
+    chunks = []
+    bytes_read = 0
+    for chunk in iter_chunks(page):
+        chunks.append(chunk)
+        bytes_read += len(chunk)
+    soup = BeautifulSoup(b"".join(chunks), "html.parser")
+    price_tag = soup.find(
+        "strong",
+        class_=lambda class_name: class_name and "DetailInfo_price" in class_name,
+    )
+    return price_tag.get_text(), bytes_read
+
+
+def extract_with_streaming_scanner(page: bytes):
+    buffer = bytearray()
+    scanner = StreamingPriceTagScanner()
+    for chunk in iter_chunks(page):
+        buffer += chunk
+        price_text = scanner.scan(buffer)
+        if price_text is not None:
+            return price_text, len(buffer)
+    raise ValueError("price tag not found")
+
+
+def measure(extractor, page: bytes):
+    durations = []
+    for _ in range(REPETITIONS):
+        start_time = time.perf_counter()
+        price_text, bytes_read = extractor(page)
+        durations.append(time.perf_counter() - start_time)
+    return price_text, bytes_read, statistics.median(durations)
+
+
+def main():
+    print(f"{'page':<32} | {'mode':<9} | {'bytes read':>10} | {'parse (ms)':>10} | price")
+    print("-" * 84)
+    for path, page in load_naver_fixture_pages().items():
+        dom_price, dom_bytes, dom_time = measure(extract_with_full_dom, page)
+        scan_price, scan_bytes, scan_time = measure(extract_with_streaming_scanner, page)
+        assert dom_price == scan_price, (dom_price, scan_price)
+        print(f"{path:<32} | {'full DOM':<9} | {dom_bytes:>10,} | {dom_time * 1000:>10.2f} | {dom_price}")
+        print(f"{'':<32} | {'streaming':<9} | {scan_bytes:>10,} | {scan_time * 1000:>10.3f} | {scan_price}")
+        print(
+            f"{'':<32} | {'savings':<9} | {1 - scan_bytes / dom_bytes:>10.0%} | "
+            f"{dom_time / scan_time:>9.0f}x |"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+가격 로그 저장소 벤치마크: CSV vs SQLite(WAL)
+
+합성 일별 로그(기본 20만 행)를 두 백엔드에 각각 기록한 뒤
+일괄 기록, 하루치 추가, 과거 날짜 덮어쓰기, 날짜 존재 확인, 1년 기간 조회,
+전체 읽기, 동시 기록(스레드마다 새 날짜를 하나씩 기록)을 재서 비교합니다.
+
+실행:
+    uv run python benchmarks/bench_price_storage.py
+    uv run python benchmarks/bench_price_storage.py --rows 1000000 --writers 8
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from kimchi_gold.price_storage import CsvPriceLogBackend, DailyPriceRecord, SqlitePriceLogBackend
+
+FIRST_SYNTHETIC_DATE = date(1900, 1, 1)
+
+
+def synthetic_records(first_day_number: int, day_count: int):
+    for day_number in range(first_day_number, first_day_number + day_count):
+        yield DailyPriceRecord(
+            (FIRST_SYNTHETIC_DATE + timedelta(days=day_number)).isoformat(),
+            150000.0 + day_number % 1000,
+            3345.2,
+            1399.5,
+            -536.41,
+            -0.28,
+        )
+
+
+def measure(operation, repetitions: int = 1) -> float:
+    """반복 실행 중 가장 짧은 1회 소요 시간 (초)"""
+    durations = []
+    for _ in range(repetitions):
+        started_at = time.perf_counter()
+        operation()
+        durations.append(time.perf_counter() - started_at)
+    return min(durations)
+
+
+def run_concurrent_writers(price_log, first_day_number: int, writer_count: int, rows_per_writer: int) -> float:
+    def write_rows(writer_number):
+        for record in synthetic_records(first_day_number + writer_number * rows_per_writer, rows_per_writer):
+            price_log.upsert_records([record])
+
+    writer_threads = [threading.Thread(target=write_rows, args=(number,)) for number in range(writer_count)]
+    started_at = time.perf_counter()
+    for writer_thread in writer_threads:
+        writer_thread.start()
+    for writer_thread in writer_threads:
+        writer_thread.join()
+    return time.perf_counter() - started_at
+
+
+def benchmark_backend(price_log, row_count: int, writer_count: int, rows_per_writer: int) -> dict:
+    results = {}
+    results["bulk write"] = measure(lambda: price_log.upsert_records(synthetic_records(0, row_count)))
+
+    next_day_number = iter(range(row_count, row_count + 1000))
+    results["append one day"] = measure(
+        lambda: price_log.upsert_records(synthetic_records(next(next_day_number), 1)), repetitions=20
+    )
+    results["overwrite old day"] = measure(
+        lambda: price_log.upsert_records(synthetic_records(row_count // 2, 1)), repetitions=3
+    )
+
+    last_date = (FIRST_SYNTHETIC_DATE + timedelta(days=row_count)).isoformat()
+    middle_date = (FIRST_SYNTHETIC_DATE + timedelta(days=row_count // 2)).isoformat()
+    results["has_date (latest)"] = measure(lambda: price_log.has_date(last_date), repetitions=20)
+    results["has_date (middle)"] = measure(lambda: price_log.has_date(middle_date), repetitions=5)
+
+    range_start = FIRST_SYNTHETIC_DATE + timedelta(days=row_count - 365)
+    results["range (1 year)"] = measure(
+        lambda: price_log.read_records(range_start.isoformat(), last_date), repetitions=5
+    )
+    results["read all"] = measure(price_log.read_records, repetitions=3)
+    results[f"{writer_count} writers x {rows_per_writer}"] = run_concurrent_writers(
+        price_log, row_count + 1000, writer_count, rows_per_writer
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가격 로그 저장소 벤치마크")
+    parser.add_argument("--rows", type=int, default=200_000, help="합성 로그 행 수")
+    parser.add_argument("--writers", type=int, default=4, help="동시 기록 스레드 수")
+    parser.add_argument("--rows-per-writer", type=int, default=50, help="스레드마다 하나씩 기록할 행 수")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        temporary_path = Path(temporary_directory)
+        csv_results = benchmark_backend(
+            CsvPriceLogBackend(temporary_path / "log.csv"),
+            arguments.rows,
+            arguments.writers,
+            arguments.rows_per_writer,
+        )
+        with SqlitePriceLogBackend(temporary_path / "log.sqlite3") as sqlite_log:
+            sqlite_results = benchmark_backend(
+                sqlite_log, arguments.rows, arguments.writers, arguments.rows_per_writer
+            )
+
+    print(f"{arguments.rows:,} rows\n")
+    print(f"{'operation':<22} | {'csv (ms)':>11} | {'sqlite (ms)':>11}")
+    print("-" * 50)
+    for operation_name, csv_seconds in csv_results.items():
+        print(f"{operation_name:<22} | {csv_seconds * 1000:>11.3f} | {sqlite_results[operation_name] * 1000:>11.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+최근 기간 읽기 벤치마크: 전체 이력 읽고 거르기 vs 월별 위치 색인으로 시작 달부터 읽기
+
+합성 가격 로그(기본 1만, 100만, 1천만 행)에서 차트와 이상치 분석이 쓰는 최근 365일만 읽는
+시간을 비교합니다. 전체 쪽은 CSV 전체를 파싱한 뒤 날짜로 거르고, 색인 쪽은
+`load_price_history_since()`로 시작 날짜가 속한 달의 첫 행까지 건너뛰어 그 뒤만 파싱합니다.
+색인은 처음 한 번 만들고(표의 index build), 이후에는 추가된 줄만 읽어 갱신합니다.
+
+실행:
+    uv run python benchmarks/bench_range_read.py
+    uv run python benchmarks/bench_range_read.py --rows 1000000 --days 30
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "benchmarks"))
+
+from bench_date_lookup import write_synthetic_log
+from kimchi_gold.price_history import clear_price_history_cache, load_price_history_since, read_price_history_csv
+from kimchi_gold.price_log_month_index import MonthOffsetIndex
+
+
+def measure(operation, repetitions: int):
+    durations = []
+    for _ in range(repetitions):
+        clear_price_history_cache()
+        started_at = time.perf_counter()
+        result = operation()
+        durations.append(time.perf_counter() - started_at)
+    return min(durations), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="최근 기간 읽기 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000], help="합성 로그 행 수")
+    parser.add_argument("--days", type=int, default=365, help="읽을 최근 일수")
+    parser.add_argument("--repetitions", type=int, default=3, help="방식별 반복 횟수 (최솟값 출력)")
+    arguments = parser.parse_args()
+    start_date = date.today() - timedelta(days=arguments.days)
+
+    print(f"{'rows':>12} | {'window rows':>11} | {'full parse + filter (ms)':>24} | {'index build (ms)':>16} | {'range read (ms)':>15}")
+    print("-" * 92)
+    for row_count in arguments.rows:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            log_path = Path(temporary_directory) / "kimchi_gold_price_log.csv"
+            write_synthetic_log(log_path, row_count)
+
+            def read_full_then_filter():
+                full_history = read_price_history_csv(log_path)
+                return full_history[full_history.index >= pd.Timestamp(start_date)]
+
+            full_seconds, expected_history = measure(read_full_then_filter, arguments.repetitions)
+            started_at = time.perf_counter()
+            MonthOffsetIndex(log_path).update()
+            build_seconds = time.perf_counter() - started_at
+            range_seconds, range_history = measure(
+                lambda: load_price_history_since(log_path, start_date), arguments.repetitions
+            )
+            pd.testing.assert_frame_equal(range_history, expected_history)
+            print(
+                f"{row_count:>12,} | {len(range_history):>11,} | {full_seconds * 1000:>24.1f} | "
+                f"{build_seconds * 1000:>16.1f} | {range_seconds * 1000:>15.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -53,6 +53,11 @@ if __name__ == "__main__":
         config_mock.NAVER_DOMESTIC_GOLD_URL = "https://m.stock.naver.com/marketindex/metals/M04020000"
         config_mock.NAVER_INTERNATIONAL_GOLD_URL = "https://m.stock.naver.com/marketindex/metals/GCcv1"
         config_mock.NAVER_USD_KRW_EXCHANGE_URL = "https://m.stock.naver.com/marketindex/exchange/FX_USDKRW"
+        config_mock.NAVER_INTERNATIONAL_SILVER_URL = "https://m.stock.naver.com/marketindex/metals/SIcv1"
+        config_mock.NAVER_INTERNATIONAL_PLATINUM_URL = "https://m.stock.naver.com/marketindex/metals/PLcv1"
+        config_mock.NAVER_JPY_KRW_EXCHANGE_URL = "https://m.stock.naver.com/marketindex/exchange/FX_JPYKRW"
+        config_mock.NAVER_CNY_KRW_EXCHANGE_URL = "https://m.stock.naver.com/marketindex/exchange/FX_CNYKRW"
+        config_mock.NAVER_EUR_KRW_EXCHANGE_URL = "https://m.stock.naver.com/marketindex/exchange/FX_EURKRW"
         config_mock.CSV_COLUMN_HEADERS = [
             "날짜",
             "국내금(원/g)",
@@ -62,11 +67,63 @@ if __name__ == "__main__":
             "김치프리미엄(%)",
         ]
         config_mock.TROY_OUNCE_TO_GRAM_CONVERSION_RATE = 31.1035
+        config_mock.HTML_PARSER_BACKEND = "auto"
+        config_mock.MARKET_SNAPSHOT_DEADLINE_SECONDS = 15.0
+        config_mock.MARKET_SNAPSHOT_FAIL_FAST = True
+        config_mock.MARKET_SNAPSHOT_SERVE_STALE = False
+        config_mock.CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+        config_mock.CIRCUIT_BREAKER_RECOVERY_SECONDS = 60.0
+        config_mock.REQUEST_MAX_RETRIES = 2
+        config_mock.REQUEST_RETRY_BASE_DELAY_SECONDS = 0.25
+        config_mock.REQUEST_RETRY_MAX_DELAY_SECONDS = 2.0
+        config_mock.REQUEST_HEDGING_ENABLED = False
+        config_mock.REQUEST_HEDGE_PERCENTILE = 95
+        config_mock.REQUEST_HEDGE_MIN_SAMPLES = 20
+        config_mock.QUOTE_CACHE_ENABLED = False
+        config_mock.QUOTE_CACHE_TTL_SECONDS = 30.0
+        config_mock.QUOTE_CACHE_STALE_WHILE_REVALIDATE_SECONDS = 120.0
+        config_mock.QUOTE_CACHE_FILE = Path.home() / ".cache" / "kimchi-gold" / "quote_cache.json"
+        config_mock.FETCH_METRICS_ENABLED = True
+        config_mock.FETCH_METRICS_JSONL_FILE = None
+        config_mock.PAGE_ARCHIVE_ENABLED = False
+        config_mock.UPSTREAM_RATE_LIMIT_ENABLED = False
+        config_mock.CSV_TAIL_READ_BLOCK_SIZE = 64 * 1024
+        config_mock.CSV_DATE_INDEX_ENABLED = False
+        config_mock.PRICE_LOG_BACKEND = "csv"
+        config_mock.PRICE_LOG_SQLITE_FILE = data_dir / "kimchi_gold_price_log.sqlite3"
+        config_mock.SQLITE_BUSY_TIMEOUT_SECONDS = 10.0
+        config_mock.PRICE_COLUMNS_ENABLED = True
+        config_mock.PRICE_LOG_MONTH_INDEX_ENABLED = True
+        config_mock.BULK_WRITE_BUFFER_SIZE = 1024 * 1024
+        config_mock.BULK_WRITE_FLUSH_EVERY_ROWS = 10_000
+        config_mock.BULK_WRITE_FSYNC_POLICY = "batch"
+        config_mock.UPSTREAM_REQUESTS_PER_SECOND = 5.0
+        config_mock.UPSTREAM_REQUEST_BURST = 10
+        config_mock.UPSTREAM_RATE_LIMIT_DIRECTORY = Path.home() / ".cache" / "kimchi-gold" / "rate_limits"
+        config_mock.PAGE_ARCHIVE_DIRECTORY = data_dir / "page_archive"
         sys.modules['kimchi_gold.configuration'] = config_mock
         
         # Load dependencies in order
         load_module_from_file('kimchi_gold.data_models', src_path / "data_models.py")
+        load_module_from_file('kimchi_gold.http_session', src_path / "http_session.py")
+        load_module_from_file('kimchi_gold.async_http_client', src_path / "async_http_client.py")
+        load_module_from_file('kimchi_gold.price_scanner', src_path / "price_scanner.py")
+        load_module_from_file('kimchi_gold.html_parsers', src_path / "html_parsers.py")
+        load_module_from_file('kimchi_gold.fetch_deadline', src_path / "fetch_deadline.py")
+        load_module_from_file('kimchi_gold.request_resilience', src_path / "request_resilience.py")
+        load_module_from_file('kimchi_gold.circuit_breaker', src_path / "circuit_breaker.py")
+        load_module_from_file('kimchi_gold.quote_cache', src_path / "quote_cache.py")
+        load_module_from_file('kimchi_gold.page_archive', src_path / "page_archive.py")
+        load_module_from_file('kimchi_gold.single_flight', src_path / "single_flight.py")
+        load_module_from_file('kimchi_gold.rate_limiter', src_path / "rate_limiter.py")
+        load_module_from_file('kimchi_gold.fetch_metrics', src_path / "fetch_metrics.py")
+        load_module_from_file('kimchi_gold.instruments', src_path / "instruments.py")
         load_module_from_file('kimchi_gold.price_fetcher', src_path / "price_fetcher.py")
+        load_module_from_file('kimchi_gold.price_log_lookup', src_path / "price_log_lookup.py")
+        load_module_from_file('kimchi_gold.price_log_journal', src_path / "price_log_journal.py")
+        load_module_from_file('kimchi_gold.price_storage', src_path / "price_storage.py")
+        load_module_from_file('kimchi_gold.price_columns', src_path / "price_columns.py")
+        load_module_from_file('kimchi_gold.price_log_month_index', src_path / "price_log_month_index.py")
         data_collector = load_module_from_file('kimchi_gold.data_collector', src_path / "data_collector.py")
         
         logger.info("금 가격 데이터 수집 시작")
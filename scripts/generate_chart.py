@@ -40,8 +40,36 @@ if __name__ == "__main__":
         config_mock.DATA_STORAGE_DIRECTORY = data_dir
         config_mock.DEFAULT_CHART_DISPLAY_MONTHS = DEFAULT_CHART_DISPLAY_MONTHS
         config_mock.CHART_OUTPUT_FILE_NAME = CHART_OUTPUT_FILE_NAME
+        config_mock.GOLD_PRICE_DATA_CSV_FILE = data_dir / "kimchi_gold_price_log.csv"
+        config_mock.CSV_COLUMN_HEADERS = [
+            "날짜",
+            "국내금(원/g)",
+            "국제금(달러/온스)",
+            "환율(원/달러)",
+            "김치프리미엄(원/g)",
+            "김치프리미엄(%)",
+        ]
+        config_mock.CSV_TAIL_READ_BLOCK_SIZE = 64 * 1024
+        config_mock.CSV_DATE_INDEX_ENABLED = False
+        config_mock.PRICE_LOG_BACKEND = "csv"
+        config_mock.PRICE_LOG_SQLITE_FILE = data_dir / "kimchi_gold_price_log.sqlite3"
+        config_mock.SQLITE_BUSY_TIMEOUT_SECONDS = 10.0
+        config_mock.BULK_WRITE_BUFFER_SIZE = 1024 * 1024
+        config_mock.BULK_WRITE_FLUSH_EVERY_ROWS = 10_000
+        config_mock.BULK_WRITE_FSYNC_POLICY = "batch"
+        config_mock.PRICE_HISTORY_DISK_CACHE_ENABLED = True
+        config_mock.PRICE_LOG_MONTH_INDEX_ENABLED = True
         sys.modules['kimchi_gold.configuration'] = config_mock
         
+        # Load the shared price history loader and its dependencies in order
+        load_module_from_file('kimchi_gold.data_models', src_path / "data_models.py")
+        load_module_from_file('kimchi_gold.price_log_lookup', src_path / "price_log_lookup.py")
+        load_module_from_file('kimchi_gold.price_log_journal', src_path / "price_log_journal.py")
+        load_module_from_file('kimchi_gold.price_storage', src_path / "price_storage.py")
+        load_module_from_file('kimchi_gold.price_columns', src_path / "price_columns.py")
+        load_module_from_file('kimchi_gold.price_log_month_index', src_path / "price_log_month_index.py")
+        load_module_from_file('kimchi_gold.price_history', src_path / "price_history.py")
+
         # Now load the chart generator
         chart_gen = load_module_from_file('kimchi_gold.chart_generator', chart_gen_path)
         
@@ -14,6 +14,19 @@ from .price_fetcher import (
     fetch_domestic_gold_price,
     fetch_international_gold_price,
     fetch_usd_krw_exchange_rate,
+    # asyncio API
+    fetch_current_gold_market_data_async,
+    fetch_domestic_gold_price_async,
+    fetch_international_gold_price_async,
+    fetch_usd_krw_exchange_rate_async,
+    # 소스별 수집 실패 정보
+    MarketDataCollectionError,
+    SourceFetchFailure,
+    # 서킷 브레이커 상태 (대시보드용)
+    get_market_data_feed_states,
+    # 다중 종목(귀금속, 환율) 일괄 수집
+    fetch_instrument_snapshot,
+    fetch_instrument_snapshot_async,
     # 하위 호환성을 위한 레거시 함수들과 별칭들
     get_current_gold_price_data,
     get_domestic_gold_price,
@@ -22,9 +35,44 @@ from .price_fetcher import (
     calc_kimchi_premium,
     get_usd_krw,
 )
+from .instruments import (
+    INSTRUMENT_REGISTRY,
+    InstrumentQuote,
+    InstrumentSnapshot,
+    MarketInstrument,
+    MetalPremium,
+)
+from .page_archive import ArchivedPage, PageArchive
+from .price_storage import (
+    # 가격 로그 저장소 (CSV, SQLite)
+    CsvPriceLogBackend,
+    DailyPriceRecord,
+    PriceLogBackend,
+    SqlitePriceLogBackend,
+    open_price_log_backend,
+)
+from .price_columns import ColumnarPriceStore, PriceColumns, load_price_columns, read_price_log_arrays
+from .price_history import (
+    IncrementalPriceHistory,
+    clear_price_history_cache,
+    load_price_history,
+    load_price_history_since,
+)
+from .price_log_month_index import MonthOffsetIndex, read_price_log_range
+from .fetch_metrics import (
+    # 요청 단계별 메트릭 (싱크 등록, Prometheus 텍스트)
+    FetchPhaseSample,
+    InMemoryHistogramSink,
+    JsonLinesMetricsSink,
+    PrometheusTextFileSink,
+    add_fetch_metrics_sink,
+    remove_fetch_metrics_sink,
+    render_fetch_metrics_prometheus_text,
+)
 from .data_collector import (
     collect_and_save_current_gold_market_data,
     save_gold_price_data_to_csv,
+    save_gold_price_data_batch_to_csv,
     check_if_date_already_logged,
     # 하위 호환성을 위한 레거시 함수들과 별칭들
     collect_current_gold_data,
@@ -57,9 +105,48 @@ __all__ = [
     "fetch_domestic_gold_price",
     "fetch_international_gold_price",
     "fetch_usd_krw_exchange_rate",
+    "fetch_current_gold_market_data_async",
+    "fetch_domestic_gold_price_async",
+    "fetch_international_gold_price_async",
+    "fetch_usd_krw_exchange_rate_async",
+    "MarketDataCollectionError",
+    "SourceFetchFailure",
+    "get_market_data_feed_states",
+    "fetch_instrument_snapshot",
+    "fetch_instrument_snapshot_async",
+    "INSTRUMENT_REGISTRY",
+    "InstrumentQuote",
+    "InstrumentSnapshot",
+    "MarketInstrument",
+    "MetalPremium",
+    "ArchivedPage",
+    "PageArchive",
+    "CsvPriceLogBackend",
+    "DailyPriceRecord",
+    "PriceLogBackend",
+    "SqlitePriceLogBackend",
+    "open_price_log_backend",
+    "ColumnarPriceStore",
+    "PriceColumns",
+    "load_price_columns",
+    "read_price_log_arrays",
+    "load_price_history",
+    "load_price_history_since",
+    "MonthOffsetIndex",
+    "read_price_log_range",
+    "clear_price_history_cache",
+    "IncrementalPriceHistory",
+    "FetchPhaseSample",
+    "InMemoryHistogramSink",
+    "JsonLinesMetricsSink",
+    "PrometheusTextFileSink",
+    "add_fetch_metrics_sink",
+    "remove_fetch_metrics_sink",
+    "render_fetch_metrics_prometheus_text",
     # 데이터 수집 및 저장
     "collect_and_save_current_gold_market_data",
     "save_gold_price_data_to_csv",
+    "save_gold_price_data_batch_to_csv",
     "check_if_date_already_logged",
     # 이상치 분석
     "perform_kimchi_premium_outlier_analysis",
@@ -0,0 +1,403 @@
+"""
+asyncio 기반의 최소 HTTP/1.1 클라이언트 모듈입니다.
+
+`requests`는 블로킹 I/O만 지원하므로, 이벤트 루프 하나에서 여러 시세를 동시에
+가져올 수 있도록 `asyncio.open_connection` 위에 keep-alive 커넥션 풀을 구현합니다.
+지원 범위는 시세 조회에 필요한 GET 요청(Content-Length, chunked, 연결 종료까지 읽기)으로
+한정합니다.
+
+알려진 제한 (requests 경로와 다른 점):
+    - https URL만 지원하고 리다이렉트는 따라가지 않으며 압축(gzip 등)은 요청하지 않습니다.
+    - 프록시를 지원하지 않습니다. `HTTPS_PROXY`/`ALL_PROXY` 환경 변수가 대상 URL에 적용되면
+      (`NO_PROXY` 제외 대상이 아니면) 직접 연결하지 않고 `AsyncProxyNotSupportedError`를 냅니다.
+      `price_fetcher`는 이 경우 `uses_environment_proxy()`로 미리 확인해 프록시를 지원하는
+      requests 경로를 작업 스레드에서 실행합니다.
+    - Host 헤더에는 기본 포트(443)가 아닐 때만 포트를 붙입니다.
+    - HTTP/1.0 응답은 `Connection: keep-alive`가 있을 때만 연결을 풀로 돌려보냅니다.
+"""
+
+import asyncio
+import logging
+import ssl
+import time
+import weakref
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 커넥션 풀 설정
+ASYNC_POOL_MAXSIZE = 10  # 호스트당 유지할 유휴 keep-alive 연결 수
+MAX_RESPONSE_LINE_LENGTH = 8192  # 상태 줄/헤더 줄 최대 길이
+MAX_RESPONSE_HEADER_COUNT = 100  # 응답 헤더 최대 개수
+
+_REDIRECT_STATUS_CODES = (301, 302, 303, 307, 308)
+DEFAULT_HTTPS_PORT = 443
+
+
+class AsyncProxyNotSupportedError(requests.ConnectionError):
+    """환경 변수의 프록시가 적용되는 URL을 직접 연결로 요청하려 한 경우"""
+
+
+def uses_environment_proxy(url: str) -> bool:
+    """requests와 같은 규칙(HTTPS_PROXY, ALL_PROXY, NO_PROXY)으로 URL에 프록시가 적용되는지 확인합니다."""
+    return requests.utils.select_proxy(url, requests.utils.get_environ_proxies(url)) is not None
+
+
+def is_keep_alive_response(http_version: str, response_headers: CaseInsensitiveDict) -> bool:
+    """HTTP/1.1은 `Connection: close`가 없으면, HTTP/1.0은 `Connection: keep-alive`가 있으면 연결을 재사용"""
+    connection_tokens = {token.strip().lower() for token in response_headers.get("Connection", "").split(",")}
+    if http_version == "HTTP/1.0":
+        return "keep-alive" in connection_tokens
+    return "close" not in connection_tokens
+
+
+def _contains_control_characters(text: str) -> bool:
+    return any(ord(character) < 0x20 or ord(character) == 0x7F for character in text)
+
+
+class _PooledConnection:
+    """풀에서 관리되는 단일 TCP(TLS) 연결"""
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        reused: bool = False,
+        connect_seconds: Optional[float] = None,
+    ):
+        self.reader = reader
+        self.writer = writer
+        self.reused = reused
+        self.connect_seconds = connect_seconds  # 연결(TCP + TLS)에 걸린 시간
+
+    def is_usable(self) -> bool:
+        return not self.writer.is_closing() and not self.reader.at_eof()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class AsyncHTTPResponse:
+    """
+    스트리밍 응답 객체. 본문을 끝까지 읽으면 연결이 풀로 반환되고,
+    중간에 닫으면 연결을 버립니다.
+    """
+
+    def __init__(
+        self,
+        pool: "AsyncConnectionPool",
+        pool_key: Tuple[str, int],
+        connection: _PooledConnection,
+        url: str,
+        status_code: int,
+        reason: str,
+        headers: CaseInsensitiveDict,
+        keep_alive: bool,
+        read_timeout: float,
+    ):
+        self._pool = pool
+        self._pool_key = pool_key
+        self._connection: Optional[_PooledConnection] = connection
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        # 이 요청에서 연결에 쓴 시간 (재사용한 연결이면 0)
+        self.connect_seconds = 0.0 if connection.reused else connection.connect_seconds
+        self._keep_alive = keep_alive
+        self._read_timeout = read_timeout
+        self._body_consumed = False
+
+    @property
+    def is_redirect(self) -> bool:
+        return "location" in self.headers and self.status_code in _REDIRECT_STATUS_CODES
+
+    def raise_for_status(self) -> None:
+        """requests와 같은 예외 타입(HTTPError)으로 4xx/5xx 상태를 알립니다."""
+        if 400 <= self.status_code < 600:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.HTTPError(
+                f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}",
+                response=self,
+            )
+
+    async def _read(self, coroutine):
+        return await asyncio.wait_for(coroutine, timeout=self._read_timeout)
+
+    async def _iter_raw_body(self, chunk_size: int) -> AsyncIterator[bytes]:
+        reader = self._connection.reader
+        transfer_encoding = self.headers.get("Transfer-Encoding", "").lower()
+        content_length = self.headers.get("Content-Length")
+
+        if self.status_code in (204, 304) or 100 <= self.status_code < 200:
+            return
+
+        if "chunked" in transfer_encoding:
+            while True:
+                size_line = await self._read(reader.readline())
+                size_text = size_line.split(b";", 1)[0].strip()
+                try:
+                    if not size_text or len(size_text) > 16:
+                        raise ValueError(size_text)
+                    chunk_length = int(size_text, 16)
+                except ValueError:
+                    raise requests.ConnectionError("Malformed chunk size in response.")
+                if chunk_length == 0:
+                    # 트레일러 헤더를 빈 줄까지 건너뜀
+                    while (await self._read(reader.readline())) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return
+                remaining = chunk_length
+                while remaining > 0:
+                    data = await self._read(reader.read(min(chunk_size, remaining)))
+                    if not data:
+                        raise requests.ConnectionError("Connection closed mid-chunk.")
+                    remaining -= len(data)
+                    yield data
+                await self._read(reader.readexactly(2))  # 청크 끝 CRLF
+        elif content_length is not None:
+            if len(content_length) > 20 or not content_length.strip().isdigit():
+                raise requests.ConnectionError("Malformed Content-Length in response.")
+            remaining = int(content_length)
+            while remaining > 0:
+                data = await self._read(reader.read(min(chunk_size, remaining)))
+                if not data:
+                    raise requests.ConnectionError("Connection closed before full body was read.")
+                remaining -= len(data)
+                yield data
+        else:
+            # 길이 정보가 없으면 서버가 연결을 닫을 때까지 읽는다
+            self._keep_alive = False
+            while True:
+                data = await self._read(reader.read(chunk_size))
+                if not data:
+                    return
+                yield data
+
+    async def iter_content(self, chunk_size: int = 8192) -> AsyncIterator[bytes]:
+        """응답 본문을 chunk 단위로 비동기 순회합니다."""
+        if self._connection is None:
+            return
+        async for data in self._iter_raw_body(chunk_size):
+            yield data
+        self._body_consumed = True
+
+    async def aclose(self) -> None:
+        """본문을 모두 읽었고 keep-alive가 가능하면 연결을 풀로 반환합니다."""
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        if self._body_consumed and self._keep_alive:
+            self._pool._release(self._pool_key, connection)
+        else:
+            connection.close()
+
+    async def __aenter__(self) -> "AsyncHTTPResponse":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+class AsyncConnectionPool:
+    """
+    (호스트, 포트)별 유휴 keep-alive 연결을 보관하는 풀.
+    하나의 이벤트 루프 안에서만 사용해야 합니다.
+    """
+
+    def __init__(self, pool_maxsize: int = ASYNC_POOL_MAXSIZE):
+        self.pool_maxsize = pool_maxsize
+        self.ssl_context = ssl.create_default_context()
+        self._idle_connections: Dict[Tuple[str, int], Deque[_PooledConnection]] = {}
+
+    async def _open_connection(
+        self, host: str, port: int
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_connection(
+            host,
+            port,
+            ssl=self.ssl_context,
+            server_hostname=host,
+            limit=MAX_RESPONSE_LINE_LENGTH * 8,
+        )
+
+    async def _acquire(
+        self, pool_key: Tuple[str, int], connect_timeout: float
+    ) -> _PooledConnection:
+        idle_connections = self._idle_connections.get(pool_key)
+        while idle_connections:
+            connection = idle_connections.pop()
+            if connection.is_usable():
+                connection.reused = True
+                return connection
+            connection.close()
+
+        connect_started = time.perf_counter()
+        reader, writer = await asyncio.wait_for(
+            self._open_connection(*pool_key), timeout=connect_timeout
+        )
+        return _PooledConnection(
+            reader, writer, connect_seconds=time.perf_counter() - connect_started
+        )
+
+    def _release(self, pool_key: Tuple[str, int], connection: _PooledConnection) -> None:
+        idle_connections = self._idle_connections.setdefault(pool_key, deque())
+        if len(idle_connections) >= self.pool_maxsize or not connection.is_usable():
+            connection.close()
+            return
+        idle_connections.append(connection)
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Tuple[float, float] = (3.0, 10.0),
+    ) -> AsyncHTTPResponse:
+        """
+        GET 요청을 보내고 헤더까지 읽은 스트리밍 응답을 반환합니다.
+        리다이렉트는 따라가지 않습니다.
+
+        Args:
+            url: 요청할 https URL
+            headers: 추가 요청 헤더
+            timeout: (연결 타임아웃, 읽기 타임아웃) 초
+
+        Raises:
+            AsyncProxyNotSupportedError: 환경 변수의 프록시가 이 URL에 적용되는 경우
+            requests.ConnectionError: 연결 실패 또는 잘못된 응답
+            requests.Timeout: 연결/읽기 타임아웃
+        """
+        connect_timeout, read_timeout = timeout
+        parsed_url = urlsplit(url)
+        if parsed_url.scheme != "https":
+            raise ValueError("AsyncConnectionPool only supports https URLs.")
+        if uses_environment_proxy(url):
+            raise AsyncProxyNotSupportedError(f"Proxy configured for {url}; AsyncConnectionPool connects directly only.")
+
+        request_target = parsed_url.path or "/"
+        if parsed_url.query:
+            request_target += f"?{parsed_url.query}"
+        host = parsed_url.hostname or ""
+        port = parsed_url.port or DEFAULT_HTTPS_PORT
+        host_header = f"[{host}]" if ":" in host else host
+        if port != DEFAULT_HTTPS_PORT:
+            host_header += f":{port}"
+        header_lines = {"Host": host_header, "Accept-Encoding": "identity", "Connection": "keep-alive"}
+        header_lines.update(headers or {})
+        # 요청 분할(CRLF injection) 방지
+        if " " in request_target or any(
+            _contains_control_characters(text)
+            for text in [request_target, *header_lines.keys(), *header_lines.values()]
+        ):
+            raise ValueError("Invalid characters in request target or headers.")
+        request_bytes = (
+            f"GET {request_target} HTTP/1.1\r\n"
+            + "".join(f"{name}: {value}\r\n" for name, value in header_lines.items())
+            + "\r\n"
+        ).encode("utf-8")
+
+        pool_key = (host, port)
+        for _attempt in range(2):
+            try:
+                connection = await self._acquire(pool_key, connect_timeout)
+            except asyncio.TimeoutError as timeout_error:
+                raise requests.ConnectTimeout(f"Connection to {host} timed out.") from timeout_error
+            except OSError as connect_error:
+                raise requests.ConnectionError(f"Connection to {host} failed: {connect_error}") from connect_error
+
+            try:
+                connection.writer.write(request_bytes)
+                await asyncio.wait_for(connection.writer.drain(), timeout=read_timeout)
+                http_version, status_code, reason, response_headers = await asyncio.wait_for(
+                    self._read_response_head(connection.reader), timeout=read_timeout
+                )
+            except asyncio.TimeoutError as timeout_error:
+                connection.close()
+                raise requests.ReadTimeout(f"Read from {host} timed out.") from timeout_error
+            except (OSError, asyncio.IncompleteReadError, EOFError) as read_error:
+                connection.close()
+                # 재사용한 유휴 연결이 서버 측에서 이미 닫힌 경우 새 연결로 한 번 재시도
+                if connection.reused:
+                    continue
+                raise requests.ConnectionError(f"Connection to {host} failed: {read_error}") from read_error
+            except ValueError as protocol_error:
+                connection.close()
+                raise requests.ConnectionError(f"Malformed response from {host}: {protocol_error}") from protocol_error
+
+            keep_alive = is_keep_alive_response(http_version, response_headers)
+            return AsyncHTTPResponse(
+                self,
+                pool_key,
+                connection,
+                url,
+                status_code,
+                reason,
+                response_headers,
+                keep_alive,
+                read_timeout,
+            )
+        raise requests.ConnectionError(f"Connection to {host} failed.")
+
+    @staticmethod
+    async def _read_response_head(
+        reader: asyncio.StreamReader,
+    ) -> Tuple[str, int, str, CaseInsensitiveDict]:
+        status_line = await reader.readline()
+        if not status_line:
+            raise EOFError("Connection closed before response.")
+        if len(status_line) > MAX_RESPONSE_LINE_LENGTH:
+            raise ValueError("Status line too long.")
+        parts = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/1.") or not parts[1].isdigit():
+            raise ValueError("Invalid status line.")
+        status_code = int(parts[1])
+        reason = parts[2] if len(parts) > 2 else ""
+
+        response_headers: CaseInsensitiveDict = CaseInsensitiveDict()
+        for _ in range(MAX_RESPONSE_HEADER_COUNT + 1):
+            header_line = await reader.readline()
+            if header_line in (b"\r\n", b"\n"):
+                return parts[0], status_code, reason, response_headers
+            if not header_line:
+                raise EOFError("Connection closed while reading headers.")
+            if len(header_line) > MAX_RESPONSE_LINE_LENGTH:
+                raise ValueError("Header line too long.")
+            name, separator, value = header_line.decode("latin-1").partition(":")
+            if not separator:
+                raise ValueError("Malformed header line.")
+            name, value = name.strip(), value.strip()
+            if name in response_headers:
+                response_headers[name] = f"{response_headers[name]}, {value}"
+            else:
+                response_headers[name] = value
+        raise ValueError("Too many response headers.")
+
+    async def aclose(self) -> None:
+        """유휴 연결을 모두 닫습니다."""
+        for idle_connections in self._idle_connections.values():
+            while idle_connections:
+                idle_connections.pop().close()
+
+
+_shared_async_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncConnectionPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_async_connection_pool() -> AsyncConnectionPool:
+    """
+    현재 실행 중인 이벤트 루프에 묶인 공유 커넥션 풀을 반환합니다.
+    같은 루프 안에서 반복 호출하면 연결이 재사용됩니다.
+    """
+    event_loop = asyncio.get_running_loop()
+    pool = _shared_async_pools.get(event_loop)
+    if pool is None:
+        pool = AsyncConnectionPool()
+        _shared_async_pools[event_loop] = pool
+    return pool
@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 import argparse
 from datetime import datetime
 import sys
@@ -6,6 +7,9 @@ from pathlib import Path
 import logging
 import math
 
+from .price_columns import PriceColumns, read_price_log_arrays
+from .price_history import load_price_history
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -14,7 +18,8 @@ def run_backtest(data, initial_investment=1000000, start_date=None, buy_threshol
     """Run the backtest strategy on the given data.
 
     Args:
-        data: DataFrame containing price data
+        data: DataFrame containing price data (load_data), or PriceColumns arrays
+            (read_price_log_arrays) to skip the DataFrame entirely until the results
         initial_investment: Initial investment amount in KRW (default 1,000,000)
         start_date: Optional datetime to filter data from
         buy_threshold: Threshold for buy signals (default -3.0)
@@ -35,25 +40,40 @@ def run_backtest(data, initial_investment=1000000, start_date=None, buy_threshol
     buy_price = None
     gold_quantity = 0  # 보유 금 수량 (그램)
 
-    # Filter by start date if provided
-    if start_date:
-        data = data[data["date"] >= start_date].copy()
-        if len(data) == 0:
-            print(f"No data available after {start_date}")
-            return None
-        # Reset index after filtering
-        data = data.reset_index(drop=True)
+    if isinstance(data, PriceColumns):
+        # Bolt Optimization: 파서가 만든 배열을 그대로 사용 (DataFrame은 결과를 돌려줄 때만 만듦)
+        price_columns = data.sorted_by_date()
+        if start_date:
+            price_columns = PriceColumns(
+                *(column[price_columns.dates >= np.datetime64(start_date)] for column in price_columns)
+            )
+            if price_columns.row_count == 0:
+                print(f"No data available after {start_date}")
+                return None
+        data = None
+        dates = price_columns.dates
+        krx_gold = price_columns.domestic_price
+        disparity = price_columns.kimchi_premium_percent
     else:
-        # Make a copy to avoid SettingWithCopyWarning
-        data = data.copy()
-
-    # 최적화를 위해 NumPy 배열로 변환
-    # Bolt Optimization: Vectorize data access to improve performance by ~25x
-    dates = data["date"].values
-    krx_gold = data["krx_gold"].values
-    disparity = data["disparity"].values
-    
-    n = len(data)
+        # Filter by start date if provided
+        if start_date:
+            data = data[data["date"] >= start_date].copy()
+            if len(data) == 0:
+                print(f"No data available after {start_date}")
+                return None
+            # Reset index after filtering
+            data = data.reset_index(drop=True)
+        else:
+            # Make a copy to avoid SettingWithCopyWarning
+            data = data.copy()
+
+        # 최적화를 위해 NumPy 배열로 변환
+        # Bolt Optimization: Vectorize data access to improve performance by ~25x
+        dates = data["date"].values
+        krx_gold = data["krx_gold"].values
+        disparity = data["disparity"].values
+
+    n = len(dates)
     positions = [0] * n
     pnl = [0.0] * n
     portfolio_values = [0.0] * n
@@ -129,6 +149,10 @@ def run_backtest(data, initial_investment=1000000, start_date=None, buy_threshol
             portfolio_values[i] = float(current_cash)
 
     # 결과 데이터를 DataFrame에 한꺼번에 기록
+    if data is None:
+        data = pd.DataFrame(
+            dict(zip(["date", "krx_gold", "Inter_gold", "exchange_rate", "disparity_won", "disparity"], price_columns))
+        )
     data["position"] = positions
     data["pnl"] = pnl
     data["portfolio_value"] = portfolio_values
@@ -155,7 +179,8 @@ def run_backtest(data, initial_investment=1000000, start_date=None, buy_threshol
 
 def load_data(file_path):
     """Load and prepare the data from CSV file."""
-    data = pd.read_csv(file_path)
+    # 공용 가격 이력 로더 (명시한 dtype, 날짜 오름차순, 같은 프로세스에서는 한 번만 파싱)
+    data = load_price_history(Path(file_path)).reset_index()
 
     # 날짜,국내금(원/g),국제금(달러/온스),환율(원/달러),김치프리미엄(원/g),김치프리미엄(%)
     data.columns = [
@@ -167,9 +192,6 @@ def load_data(file_path):
         "disparity",
     ]
 
-    # Convert date string to datetime
-    data["date"] = pd.to_datetime(data["date"])
-
     return data
 
 
@@ -229,7 +251,7 @@ def main():
         sys.exit(1)
 
     try:
-        data = load_data(data_file)
+        data = read_price_log_arrays(data_file)
     except Exception as e:
         logger.error(f"Error loading data: {e}")
         print("Error: 시스템 로그를 확인해주세요.")
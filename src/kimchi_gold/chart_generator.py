@@ -18,6 +18,7 @@ from .configuration import (
     DEFAULT_CHART_DISPLAY_MONTHS,
     CHART_OUTPUT_FILE_NAME,
 )
+from .price_history import load_price_history_since
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -47,20 +48,15 @@ def load_and_preprocess_gold_price_data(
         FileNotFoundError: 지정된 데이터 파일이 없을 경우 발생
         ValueError: 최근 'analysis_period_months' 동안의 데이터가 없을 경우 발생
     """
+    current_date = pd.Timestamp(datetime.now().date())
+    cutoff_date = current_date - timedelta(days=analysis_period_months * 30)
+
     try:
-        historical_data_df: pd.DataFrame = pd.read_csv(source_csv_file_path)
+        # Bolt Optimization: 월별 위치 색인으로 기간 시작 달부터만 읽음 (날짜순 DatetimeIndex)
+        filtered_period_data: pd.DataFrame = load_price_history_since(source_csv_file_path, cutoff_date)
     except FileNotFoundError:
         raise FileNotFoundError(f"Error: {source_csv_file_path} not found.")
 
-    # 날짜 컬럼을 datetime.date 형식으로 변환
-    historical_data_df.loc[:, "날짜"] = pd.to_datetime(historical_data_df["날짜"]).dt.date
-    historical_data_df = historical_data_df.set_index("날짜")
-
-    current_date = datetime.now().date()
-    cutoff_date = current_date - timedelta(days=analysis_period_months * 30)
-
-    filtered_period_data = historical_data_df[historical_data_df.index >= cutoff_date]
-
     if filtered_period_data.empty:
         raise ValueError(
             f"No data available for the last {analysis_period_months} months."
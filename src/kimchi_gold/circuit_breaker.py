@@ -0,0 +1,215 @@
+"""
+네이버 금융 URL별 서킷 브레이커 모듈입니다.
+
+한 페이지가 계속 실패하면(연속 실패 `CIRCUIT_BREAKER_FAILURE_THRESHOLD`회) 회로를 열어
+`CIRCUIT_BREAKER_RECOVERY_SECONDS` 동안은 요청을 보내지 않고 바로 실패시킵니다.
+그 뒤 한 번의 시험 요청(half-open)이 성공하면 다시 닫고, 실패하면 다시 엽니다.
+회로가 열려 있는 동안에는 마지막으로 성공한 값을 함께 알려주어
+호출 측이 오래된 값(stale)으로 대체할 수 있게 합니다.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .configuration import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RECOVERY_SECONDS,
+)
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 회로 상태
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 요청을 보내지 않고 실패할 때 발생합니다."""
+
+    def __init__(
+        self,
+        target_url: str,
+        retry_after_seconds: float,
+        last_good_value: Optional[float] = None,
+        last_success_time: Optional[float] = None,
+    ):
+        super().__init__(
+            f"Circuit open for {target_url}; retry after {retry_after_seconds:.1f}s."
+        )
+        self.target_url = target_url
+        self.retry_after_seconds = retry_after_seconds
+        self.last_good_value = last_good_value
+        self.last_success_time = last_success_time
+
+
+@dataclass
+class CircuitBreakerStatus:
+    """
+    대시보드 등에 보여줄 회로 상태 스냅샷.
+
+    Attributes:
+        target_url: 대상 URL
+        state: "closed", "open", "half_open"
+        consecutive_failures: 연속 실패 횟수
+        retry_after_seconds: 다음 시험 요청까지 남은 시간 (열려 있을 때만)
+        last_failure_message: 마지막 실패 원인
+        last_good_value: 마지막으로 성공한 값
+        last_success_time: 마지막 성공 시각 (epoch 초)
+    """
+
+    target_url: str
+    state: str
+    consecutive_failures: int
+    retry_after_seconds: Optional[float]
+    last_failure_message: Optional[str]
+    last_good_value: Optional[float]
+    last_success_time: Optional[float]
+
+
+class CircuitBreaker:
+    """URL 하나에 대한 closed → open → half_open 상태 기계 (스레드 안전)"""
+
+    def __init__(
+        self,
+        target_url: str,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_seconds: float = CIRCUIT_BREAKER_RECOVERY_SECONDS,
+    ):
+        self.target_url = target_url
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.state = CIRCUIT_CLOSED
+        self.consecutive_failures = 0
+        self.last_failure_message: Optional[str] = None
+        self.last_good_value: Optional[float] = None
+        self.last_success_time: Optional[float] = None
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def _retry_after_seconds(self) -> float:
+        return max(0.0, self._opened_at + self.recovery_seconds - time.monotonic())
+
+    def before_call(self) -> None:
+        """
+        요청을 보내기 전에 호출합니다.
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있거나 시험 요청이 이미 진행 중인 경우
+        """
+        with self._lock:
+            if self.state == CIRCUIT_CLOSED:
+                return
+            if self.state == CIRCUIT_OPEN:
+                retry_after_seconds = self._retry_after_seconds()
+                if retry_after_seconds > 0:
+                    raise self._open_error(retry_after_seconds)
+                self.state = CIRCUIT_HALF_OPEN
+                logger.info(f"Circuit half-open, sending trial request: {self.target_url}")
+            # half-open: 시험 요청은 한 번에 하나만
+            if self._trial_in_flight:
+                raise self._open_error(0.0)
+            self._trial_in_flight = True
+
+    def peek_open_error(self) -> Optional[CircuitOpenError]:
+        """
+        상태를 바꾸지 않고, 회로가 열려 있어 지금 호출하면 바로 실패할지 확인합니다.
+
+        Returns:
+            열려 있으면 CircuitOpenError, 아니면 None
+        """
+        with self._lock:
+            if self.state != CIRCUIT_OPEN:
+                return None
+            retry_after_seconds = self._retry_after_seconds()
+            if retry_after_seconds <= 0:
+                return None
+            return self._open_error(retry_after_seconds)
+
+    def record_success(self, value: float) -> None:
+        with self._lock:
+            if self.state != CIRCUIT_CLOSED:
+                logger.info(f"Circuit closed: {self.target_url}")
+            self.state = CIRCUIT_CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+            self.last_good_value = value
+            self.last_success_time = time.time()
+
+    def record_failure(self, error: BaseException) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_failure_message = f"{type(error).__name__}: {error}"
+            self._trial_in_flight = False
+            if (
+                self.state == CIRCUIT_HALF_OPEN
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                if self.state != CIRCUIT_OPEN:
+                    logger.warning(
+                        f"Circuit opened after {self.consecutive_failures} consecutive failures: "
+                        f"{self.target_url} ({self.last_failure_message})"
+                    )
+                self.state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+
+    def record_cancelled(self) -> None:
+        """취소된 요청은 성공도 실패도 아니므로 시험 요청 자리만 비웁니다."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def _open_error(self, retry_after_seconds: float) -> CircuitOpenError:
+        return CircuitOpenError(
+            self.target_url,
+            retry_after_seconds,
+            self.last_good_value,
+            self.last_success_time,
+        )
+
+    def status(self) -> CircuitBreakerStatus:
+        with self._lock:
+            return CircuitBreakerStatus(
+                target_url=self.target_url,
+                state=self.state,
+                consecutive_failures=self.consecutive_failures,
+                retry_after_seconds=(
+                    self._retry_after_seconds() if self.state == CIRCUIT_OPEN else None
+                ),
+                last_failure_message=self.last_failure_message,
+                last_good_value=self.last_good_value,
+                last_success_time=self.last_success_time,
+            )
+
+
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(target_url: str) -> CircuitBreaker:
+    """URL별 서킷 브레이커를 반환합니다 (없으면 생성)."""
+    circuit_breaker = _circuit_breakers.get(target_url)
+    if circuit_breaker is not None:
+        return circuit_breaker
+    with _circuit_breakers_lock:
+        return _circuit_breakers.setdefault(target_url, CircuitBreaker(target_url))
+
+
+def get_circuit_breaker_states() -> Dict[str, CircuitBreakerStatus]:
+    """지금까지 요청한 모든 URL의 회로 상태를 반환합니다 (요청을 보내지 않음)."""
+    with _circuit_breakers_lock:
+        circuit_breakers = list(_circuit_breakers.values())
+    return {
+        circuit_breaker.target_url: circuit_breaker.status()
+        for circuit_breaker in circuit_breakers
+    }
+
+
+def reset_circuit_breakers() -> None:
+    """모든 회로 상태를 지웁니다 (테스트, 수동 복구용)."""
+    with _circuit_breakers_lock:
+        _circuit_breakers.clear()
@@ -30,6 +30,88 @@ NAVER_DOMESTIC_GOLD_URL = "https://m.stock.naver.com/marketindex/metals/M0402000
 NAVER_INTERNATIONAL_GOLD_URL = "https://m.stock.naver.com/marketindex/metals/GCcv1"
 NAVER_USD_KRW_EXCHANGE_URL = "https://m.stock.naver.com/marketindex/exchange/FX_USDKRW"
 
+# 다중 종목 수집용 추가 URL (instruments.py 레지스트리에서 사용)
+NAVER_INTERNATIONAL_SILVER_URL = "https://m.stock.naver.com/marketindex/metals/SIcv1"
+NAVER_INTERNATIONAL_PLATINUM_URL = "https://m.stock.naver.com/marketindex/metals/PLcv1"
+NAVER_JPY_KRW_EXCHANGE_URL = "https://m.stock.naver.com/marketindex/exchange/FX_JPYKRW"
+NAVER_CNY_KRW_EXCHANGE_URL = "https://m.stock.naver.com/marketindex/exchange/FX_CNYKRW"
+NAVER_EUR_KRW_EXCHANGE_URL = "https://m.stock.naver.com/marketindex/exchange/FX_EURKRW"
+
+# HTML 파서 백엔드: "auto", "html.parser", "lxml", "scan"
+# "auto"는 import 시점에 lxml이 설치되어 있으면 lxml, 아니면 html.parser를 사용
+HTML_PARSER_BACKEND = "auto"
+
+# 시세 스냅샷 수집 설정
+MARKET_SNAPSHOT_DEADLINE_SECONDS = 15.0  # 세 시세 요청 전체에 대한 마감 시간
+MARKET_SNAPSHOT_FAIL_FAST = True  # 한 소스가 실패하면 나머지 요청을 즉시 중단
+MARKET_SNAPSHOT_SERVE_STALE = False  # 회로가 열린 소스는 마지막 성공 값으로 대체 (stale 표시)
+
+# 서킷 브레이커 설정 (URL별)
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3  # 연속 실패가 이 횟수에 도달하면 회로를 엶
+CIRCUIT_BREAKER_RECOVERY_SECONDS = 60.0  # 회로를 연 뒤 시험 요청까지 기다리는 시간
+
+# 요청 재시도/헤징 설정
+REQUEST_MAX_RETRIES = 2  # 5xx, 연결 오류 시 최대 재시도 횟수
+REQUEST_RETRY_BASE_DELAY_SECONDS = 0.25  # 지수 백오프 시작값 (full jitter)
+REQUEST_RETRY_MAX_DELAY_SECONDS = 2.0  # 백오프 상한
+REQUEST_HEDGING_ENABLED = False  # 느린 응답에 같은 요청을 하나 더 보내 먼저 온 응답 사용
+REQUEST_HEDGE_PERCENTILE = 95  # 최근 응답 시간의 이 백분위수를 넘기면 헤지 요청 전송
+REQUEST_HEDGE_MIN_SAMPLES = 20  # 헤징에 필요한 최소 응답 시간 표본 수
+
+# 시세 캐시 설정
+QUOTE_CACHE_ENABLED = True  # URL별 시세 캐시 사용 여부
+QUOTE_CACHE_TTL_SECONDS = 30.0  # 이 시간 안의 반복 호출은 요청 없이 캐시 값 사용
+QUOTE_CACHE_STALE_WHILE_REVALIDATE_SECONDS = 120.0  # TTL 이후 이 시간까지는 캐시 값을 주고 백그라운드 갱신
+QUOTE_CACHE_FILE = Path.home() / ".cache" / "kimchi-gold" / "quote_cache.json"  # CLI 실행 간 공유 캐시
+
+# 업스트림 요청 속도 제한 (같은 호스트에서 도는 수집기, 백필, check 실행이 호스트별 토큰 버킷을 공유)
+UPSTREAM_RATE_LIMIT_ENABLED = True  # 네이버 요청 전에 프로세스 간 공유 토큰 버킷에서 토큰을 받음
+UPSTREAM_REQUESTS_PER_SECOND = 5.0  # 호스트별 초당 요청 수 (모든 프로세스 합계)
+UPSTREAM_REQUEST_BURST = 10  # 한 번에 몰아서 보낼 수 있는 요청 수 (다중 종목 스냅샷 한 번 분량)
+UPSTREAM_RATE_LIMIT_DIRECTORY = Path.home() / ".cache" / "kimchi-gold" / "rate_limits"  # 호스트별 버킷 상태 파일
+
+# 요청 단계별 메트릭 설정
+FETCH_METRICS_ENABLED = True  # 단계별 시간을 기본 인메모리 히스토그램에 기록
+FETCH_METRICS_JSONL_FILE = None  # 경로를 지정하면 샘플을 JSON Lines로도 기록 (예: Path("logs/fetch_metrics.jsonl"))
+
+# 장중 수집 설정
+INTRADAY_TICK_DIRECTORY = DATA_STORAGE_DIRECTORY / "ticks"  # 날짜별 틱 파일 위치
+INTRADAY_POLL_INTERVAL_SECONDS = 60.0  # 장중 수집 주기
+INTRADAY_POLL_JITTER_SECONDS = 5.0  # 매 회차에 더하는 최대 지터
+
+# 원본 페이지 보관 설정 (기록 모드: 받은 HTML을 압축해 내용 주소로 저장, page_replay로 재생)
+PAGE_ARCHIVE_ENABLED = False  # True면 fetch_* 함수가 받은 페이지 전체를 보관소에 기록
+PAGE_ARCHIVE_DIRECTORY = DATA_STORAGE_DIRECTORY / "page_archive"
+
+# 과거 시세 백필 설정 (네이버 금융 일별 시세 페이지, `&page=N`으로 페이지 지정)
+NAVER_DOMESTIC_GOLD_HISTORY_URL = "https://finance.naver.com/marketindex/goldDailyQuote.naver"
+NAVER_INTERNATIONAL_GOLD_HISTORY_URL = "https://finance.naver.com/marketindex/worldDailyQuote.naver?marketindexCd=CMDT_GC&fdtc=2"
+NAVER_USD_KRW_HISTORY_URL = "https://finance.naver.com/marketindex/exchangeDailyQuote.naver?marketindexCd=FX_USDKRW"
+BACKFILL_MAX_CONCURRENCY = 8  # 동시에 받는 페이지 수
+BACKFILL_REQUESTS_PER_SECOND = 5.0  # 모든 작업 스레드가 공유하는 초당 요청 수 상한
+
+# 기록 날짜 조회 설정
+CSV_TAIL_READ_BLOCK_SIZE = 64 * 1024  # 로그 끝에서부터 거꾸로 읽을 때 한 번에 읽는 크기
+CSV_DATE_INDEX_ENABLED = False  # 날짜순이 아닌 로그면 True: 날짜 색인 파일(.<로그 이름>.dates.json)로 조회
+
+# 가격 로그 저장소 설정 ("csv": kimchi_gold_price_log.csv만, "sqlite": CSV와 함께 WAL 모드 SQLite 파일에도 기록)
+# 읽는 쪽(차트, 이상치 분석, 백테스트, 웹사이트)은 CSV만 읽으므로 어느 쪽이든 CSV는 항상 기록함
+PRICE_LOG_BACKEND = "csv"
+PRICE_LOG_SQLITE_FILE = DATA_STORAGE_DIRECTORY / "kimchi_gold_price_log.sqlite3"
+SQLITE_BUSY_TIMEOUT_SECONDS = 10.0  # 다른 프로세스가 쓰는 중일 때 잠금을 기다리는 최대 시간
+
+# 열 저장소 설정 (CSV 로그 옆 .<로그 이름>.columns/에 열별 바이너리 파일, 메모리 매핑으로 읽음)
+PRICE_COLUMNS_ENABLED = True  # CSV에 기록할 때마다 열 저장소도 갱신
+PRICE_HISTORY_DISK_CACHE_ENABLED = True  # load_price_history()가 열 저장소를 파싱 결과 캐시로 사용 (읽는 쪽도 없으면 만들고 갱신)
+
+# 기간 읽기 설정 (CSV 로그 옆 .<로그 이름>.months.json에 달마다 첫 행의 바이트 위치)
+PRICE_LOG_MONTH_INDEX_ENABLED = True  # CSV에 기록할 때마다 갱신하고, 최근 기간만 읽을 때 시작 달로 건너뜀 (읽는 쪽도 갱신)
+
+# 여러 행 일괄 기록 설정 (임시 파일에 모아 쓴 뒤 한 번에 로그 끝에 붙임)
+BULK_WRITE_BUFFER_SIZE = 1024 * 1024  # 임시 파일 쓰기 버퍼 크기 (바이트)
+BULK_WRITE_FLUSH_EVERY_ROWS = 10_000  # 이 행 수마다 버퍼를 비움 (0이면 끝에서 한 번)
+BULK_WRITE_FSYNC_POLICY = "batch"  # "none": OS에 맡김, "batch": 로그에 붙인 뒤 한 번, "flush": 버퍼를 비울 때마다
+
 # CSV 파일 헤더
 CSV_COLUMN_HEADERS = [
     "날짜",
@@ -1,20 +1,29 @@
 """
-금 가격 데이터를 수집하고 CSV 파일에 저장하는 모듈입니다.
+금 가격 데이터를 수집하고 가격 로그(CSV, 설정에 따라 SQLite에도)에 저장하는 모듈입니다.
 """
 
-import csv
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from .configuration import (
+    BULK_WRITE_FLUSH_EVERY_ROWS,
+    BULK_WRITE_FSYNC_POLICY,
     GOLD_PRICE_DATA_CSV_FILE,
-    CSV_COLUMN_HEADERS,
     DATA_STORAGE_DIRECTORY,
+    PRICE_COLUMNS_ENABLED,
+    PRICE_LOG_MONTH_INDEX_ENABLED,
+    PRICE_LOG_BACKEND,
+    PRICE_LOG_SQLITE_FILE,
 )
 from .data_models import GoldPriceData
 from .price_fetcher import fetch_current_gold_market_data
+from .price_columns import sync_price_columns
+from .price_log_journal import BULK_WRITE_FSYNC_POLICIES, append_rows_to_csv_atomically
+from .price_log_lookup import is_date_logged
+from .price_log_month_index import sync_month_offset_index
+from .price_storage import PRICE_LOG_BACKEND_NAMES, CsvPriceLogBackend, DailyPriceRecord, open_price_log_backend
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -57,6 +66,7 @@ def check_if_date_already_logged(
 ) -> bool:
     """
     지정된 날짜가 이미 파일에 기록되어 있으면 True 반환
+    (파일 끝에서부터 읽으므로 로그 길이와 관계없이 최근 날짜는 바로 확인)
 
     Args:
         csv_file_path: 확인할 CSV 파일 경로
@@ -80,15 +90,13 @@ def check_if_date_already_logged(
     target_date_string = target_date_to_check.strftime("%Y-%m-%d")
 
     try:
-        with safe_csv_file_path.open("r", encoding="utf-8") as csv_file:
-            csv_reader = csv.reader(csv_file)
-            next(csv_reader, None)  # 헤더 스킵
-            for data_row in csv_reader:
-                if data_row and data_row[0].startswith(target_date_string):
-                    logger.debug(f"Found existing data for {target_date_string}")
-                    return True
-        logger.debug(f"No data found for {target_date_string}")
-        return False
+        # Bolt Optimization: 로그는 날짜순이므로 파일 끝에서부터 읽다가 더 오래된 행에서 멈춤
+        date_already_logged = is_date_logged(safe_csv_file_path, target_date_string)
+        if date_already_logged:
+            logger.debug(f"Found existing data for {target_date_string}")
+        else:
+            logger.debug(f"No data found for {target_date_string}")
+        return date_already_logged
 
     except Exception as file_read_error:
         logger.error(f"Error reading file {csv_file_path}: {file_read_error}")
@@ -98,65 +106,216 @@ def check_if_date_already_logged(
 def save_gold_price_data_to_csv(
     gold_price_data_object: GoldPriceData,
     output_csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE,
-) -> None:
+    skip_if_date_already_logged: bool = False,
+) -> bool:
     """
     GoldPriceData 객체를 CSV 파일에 저장합니다.
 
+    로그 쓰기 잠금 안에서 헤더 필요 여부와 (요청 시) 같은 날짜 존재 여부를 확인한 뒤
+    저널을 거쳐 추가하므로, 수집기 여러 개가 동시에 저장해도 행이 섞이거나 중복되지 않습니다.
+
     Args:
         gold_price_data_object: 저장할 금 가격 데이터
         output_csv_file_path: 저장할 CSV 파일 경로
+        skip_if_date_already_logged: 같은 날짜 행이 이미 있으면 저장하지 않음
+
+    Returns:
+        저장했으면 True, 같은 날짜가 이미 있어 건너뛰었으면 False
 
     Raises:
         IOError: 파일 쓰기 실패 시
         ValueError: 안전하지 않은 파일 경로인 경우
     """
     safe_output_csv_file_path = validate_safe_path(output_csv_file_path)
+    data_row_for_csv = gold_price_data_object.convert_to_csv_row_format()
 
     try:
-        file_already_exists = safe_output_csv_file_path.exists()
+        written_row_count = append_rows_to_csv_atomically(
+            safe_output_csv_file_path,
+            [data_row_for_csv],
+            skip_if_date_logged=data_row_for_csv[0] if skip_if_date_already_logged else None,
+        )
+    except Exception as file_write_error:
+        logger.error(
+            f"Failed to write data to {safe_output_csv_file_path}: {file_write_error}"
+        )
+        raise IOError("파일 쓰기 실패: 시스템 로그를 확인해주세요.")
 
-        with safe_output_csv_file_path.open(
-            mode="a", encoding="utf-8", newline=""
-        ) as csv_file:
-            csv_writer = csv.writer(csv_file)
+    if not written_row_count:
+        return False
+    logger.info(f"Data written to {safe_output_csv_file_path}: {data_row_for_csv}")
 
-            # 파일이 없으면 헤더 작성
-            if not file_already_exists:
-                csv_writer.writerow(CSV_COLUMN_HEADERS)
-                logger.debug(
-                    f"Created new CSV file with headers: {safe_output_csv_file_path}"
-                )
+    if PRICE_COLUMNS_ENABLED:
+        # Bolt Optimization: 추가한 행만 열 저장소에 이어 붙여 읽는 쪽이 CSV를 다시 파싱하지 않게 함
+        sync_price_columns(safe_output_csv_file_path)
+    if PRICE_LOG_MONTH_INDEX_ENABLED:
+        # 월별 위치 색인도 추가한 줄만 읽어 갱신 (최근 기간만 읽는 쪽이 앞부분을 건너뜀)
+        sync_month_offset_index(safe_output_csv_file_path)
+    return True
 
-            # 데이터 행 작성
-            data_row_for_csv = gold_price_data_object.convert_to_csv_row_format()
-            csv_writer.writerow(data_row_for_csv)
-            logger.info(f"Data written to {safe_output_csv_file_path}: {data_row_for_csv}")
 
+def save_gold_price_data_batch_to_csv(
+    gold_price_data_objects: Iterable[GoldPriceData],
+    output_csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE,
+    flush_every_rows: int = BULK_WRITE_FLUSH_EVERY_ROWS,
+    fsync_policy: str = BULK_WRITE_FSYNC_POLICY,
+) -> int:
+    """
+    여러 GoldPriceData를 CSV 파일에 한 번에 저장합니다 (전부 저장되거나 하나도 저장되지 않음).
+
+    `save_gold_price_data_to_csv()`를 행마다 부르면 매번 파일을 열고 확인하므로,
+    백필이나 틱 요약처럼 많은 행을 쓸 때 사용합니다.
+
+    Args:
+        gold_price_data_objects: 저장할 금 가격 데이터들 (제너레이터 가능)
+        output_csv_file_path: 저장할 CSV 파일 경로
+        flush_every_rows: 이 행 수마다 쓰기 버퍼를 비움
+        fsync_policy: "none", "batch", "flush"
+
+    Returns:
+        저장한 행 수
+
+    Raises:
+        IOError: 파일 쓰기 실패 시 (로그는 그대로)
+        ValueError: 안전하지 않은 파일 경로나 알 수 없는 fsync 정책인 경우
+    """
+    safe_output_csv_file_path = validate_safe_path(output_csv_file_path)
+    if fsync_policy not in BULK_WRITE_FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy: {fsync_policy!r} (expected one of {BULK_WRITE_FSYNC_POLICIES})")
+
+    try:
+        written_row_count = append_rows_to_csv_atomically(
+            safe_output_csv_file_path,
+            (gold_price_data.convert_to_csv_row_format() for gold_price_data in gold_price_data_objects),
+            flush_every_rows,
+            fsync_policy,
+        )
+        logger.info(f"{written_row_count} rows written to {safe_output_csv_file_path}")
     except Exception as file_write_error:
         logger.error(
             f"Failed to write data to {safe_output_csv_file_path}: {file_write_error}"
         )
         raise IOError("파일 쓰기 실패: 시스템 로그를 확인해주세요.")
 
+    if PRICE_COLUMNS_ENABLED and written_row_count:
+        sync_price_columns(safe_output_csv_file_path)
+    if PRICE_LOG_MONTH_INDEX_ENABLED and written_row_count:
+        sync_month_offset_index(safe_output_csv_file_path)
+    return written_row_count
+
+
+def check_if_date_already_in_price_log(
+    target_date_to_check: Optional[datetime] = None,
+    price_log_backend: str = PRICE_LOG_BACKEND,
+    csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE,
+    database_path: Path = PRICE_LOG_SQLITE_FILE,
+) -> bool:
+    """
+    지정된 날짜가 CSV 로그와 (CSV가 아닌 백엔드를 설정했다면) 그 저장소 모두에 있으면 True 반환
+
+    Args:
+        target_date_to_check: 확인할 날짜 (기본값: 오늘)
+        price_log_backend: 가격 로그 저장소 ("csv" 또는 "sqlite")
+        csv_file_path: 확인할 CSV 파일 경로
+        database_path: sqlite 저장소일 때 확인할 SQLite 파일 경로
+    """
+    if not check_if_date_already_logged(csv_file_path, target_date_to_check):
+        return False
+    if price_log_backend == "csv":
+        return True
+
+    if target_date_to_check is None:
+        target_date_to_check = datetime.now()
+
+    try:
+        with open_price_log_backend(
+            price_log_backend, validate_safe_path(csv_file_path), validate_safe_path(database_path)
+        ) as price_log:
+            return price_log.has_date(target_date_to_check.strftime("%Y-%m-%d"))
+    except Exception as price_log_read_error:
+        logger.error(f"Error reading {price_log_backend} price log: {price_log_read_error}")
+        return False
+
+
+def save_gold_price_data_to_price_log(
+    gold_price_data_object: GoldPriceData,
+    price_log_backend: str = PRICE_LOG_BACKEND,
+    output_csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE,
+    output_database_path: Path = PRICE_LOG_SQLITE_FILE,
+    skip_if_date_already_logged: bool = False,
+) -> bool:
+    """
+    GoldPriceData 객체를 가격 로그에 저장합니다.
+
+    차트, 이상치 분석, 백테스트, 웹사이트는 CSV 로그만 읽으므로 어느 백엔드든 CSV에는 항상 기록하고,
+    CSV가 아닌 백엔드를 설정했으면 `open_price_log_backend()`로 연 저장소에도 같은 행을 기록합니다
+    (CSV를 먼저 쓰므로 중간에 실패해도 읽는 쪽이 보는 로그에는 빠지지 않음).
+
+    Args:
+        gold_price_data_object: 저장할 금 가격 데이터
+        price_log_backend: 가격 로그 저장소 ("csv" 또는 "sqlite")
+        output_csv_file_path: 저장할 CSV 파일 경로
+        output_database_path: sqlite 저장소일 때 함께 저장할 SQLite 파일 경로
+        skip_if_date_already_logged: 같은 날짜 행이 이미 있으면 저장하지 않음
+
+    Returns:
+        CSV에 새로 저장했으면 True, 같은 날짜가 이미 있어 건너뛰었으면 False
+
+    Raises:
+        IOError: 파일이나 데이터베이스 쓰기 실패 시
+        ValueError: 안전하지 않은 파일 경로나 알 수 없는 백엔드 이름인 경우
+    """
+    if price_log_backend not in PRICE_LOG_BACKEND_NAMES:
+        raise ValueError(f"Unknown price log backend: {price_log_backend!r}")
+
+    written_to_csv = save_gold_price_data_to_csv(
+        gold_price_data_object, output_csv_file_path, skip_if_date_already_logged=skip_if_date_already_logged
+    )
+    if price_log_backend == "csv":
+        return written_to_csv
+
+    safe_output_csv_file_path = validate_safe_path(output_csv_file_path)
+    safe_database_path = validate_safe_path(output_database_path)
+    record = DailyPriceRecord.from_gold_price_data(gold_price_data_object)
+    try:
+        with open_price_log_backend(price_log_backend, safe_output_csv_file_path, safe_database_path) as price_log:
+            if not written_to_csv:
+                # CSV에 먼저 기록된 날짜는 그 행을 그대로 옮겨 두 로그의 값이 어긋나지 않게 함
+                logged_records = CsvPriceLogBackend(safe_output_csv_file_path).read_records(record.date, record.date)
+                record = logged_records[-1] if logged_records else record
+            price_log.upsert_records([record])
+        logger.info(f"Data written to {safe_database_path}: {record.to_csv_row()}")
+    except Exception as database_write_error:
+        logger.error(f"Failed to write data to {safe_database_path}: {database_write_error}")
+        raise IOError("데이터베이스 쓰기 실패: 시스템 로그를 확인해주세요.")
+    return written_to_csv
+
 
 def collect_and_save_current_gold_market_data(
     output_csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE,
     skip_if_data_already_exists: bool = True,
+    price_log_backend: str = PRICE_LOG_BACKEND,
+    output_database_path: Path = PRICE_LOG_SQLITE_FILE,
 ) -> bool:
     """
-    현재 금 가격 데이터를 수집하고 CSV 파일에 저장합니다.
+    현재 금 가격 데이터를 수집하고 가격 로그에 저장합니다.
 
     Args:
         output_csv_file_path: 데이터를 저장할 CSV 파일 경로
         skip_if_data_already_exists: 오늘 날짜 데이터가 이미 있으면 스킵할지 여부
+        price_log_backend: 가격 로그 저장소 ("csv" 또는 "sqlite", sqlite도 CSV에 함께 기록)
+        output_database_path: sqlite 저장소일 때 데이터를 함께 저장할 SQLite 파일 경로
 
     Returns:
         성공적으로 수집했으면 True, 실패하면 False
     """
     try:
+        if price_log_backend not in PRICE_LOG_BACKEND_NAMES:
+            raise ValueError(f"Unknown price log backend: {price_log_backend!r}")
+
         # 오늘 날짜 데이터 존재 여부 확인
-        if skip_if_data_already_exists and check_if_date_already_logged(
-            output_csv_file_path
+        if skip_if_data_already_exists and check_if_date_already_in_price_log(
+            None, price_log_backend, output_csv_file_path, output_database_path
         ):
             logger.info("오늘 날짜 데이터가 이미 존재합니다. 수집을 스킵합니다.")
             return True
@@ -165,8 +324,16 @@ def collect_and_save_current_gold_market_data(
         logger.info("금 가격 데이터 수집 시작")
         current_gold_market_data = fetch_current_gold_market_data()
 
-        # CSV 파일에 저장
-        save_gold_price_data_to_csv(current_gold_market_data, output_csv_file_path)
+        # 가격 로그에 저장 (수집하는 동안 다른 수집기가 먼저 기록했으면 잠금 안에서 다시 확인해 건너뜀)
+        if not save_gold_price_data_to_price_log(
+            current_gold_market_data,
+            price_log_backend,
+            output_csv_file_path,
+            output_database_path,
+            skip_if_date_already_logged=skip_if_data_already_exists,
+        ):
+            logger.info("다른 수집기가 오늘 날짜 데이터를 먼저 기록했습니다.")
+            return True
 
         logger.info(
             f"데이터 수집 완료: 김치 프리미엄 {current_gold_market_data.kimchi_premium_percent:.2f}%"
@@ -187,12 +354,7 @@ def write_to_csv(
     """
     safe_csv_file_path = validate_safe_path(csv_file_path)
     try:
-        file_already_exists = safe_csv_file_path.exists()
-        with safe_csv_file_path.open(mode="a", encoding="utf-8", newline="") as csv_file:
-            csv_writer = csv.writer(csv_file)
-            if not file_already_exists:
-                csv_writer.writerow(CSV_COLUMN_HEADERS)
-            csv_writer.writerow(row_data)
+        append_rows_to_csv_atomically(safe_csv_file_path, [row_data])
     except Exception as legacy_write_error:
         logger.error(f"Legacy write_to_csv failed: {legacy_write_error}")
         raise
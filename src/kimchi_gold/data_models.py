@@ -2,7 +2,7 @@
 kimchi-gold 프로젝트의 데이터 모델을 정의하는 모듈입니다.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List
 
@@ -18,11 +18,17 @@ class GoldPriceData:
     kimchi_premium_amount: float  # 김치 프리미엄 금액 (원/g)
     kimchi_premium_percent: float  # 김치 프리미엄 비율 (%)
     data_collection_timestamp: datetime = None  # 데이터 수집 시간
+    stale_sources: List[str] = field(default_factory=list)  # 마지막 성공 값으로 대체된 소스
 
     def __post_init__(self):
         if self.data_collection_timestamp is None:
             self.data_collection_timestamp = datetime.now()
 
+    @property
+    def is_stale(self) -> bool:
+        """하나 이상의 시세가 서킷 브레이커의 마지막 성공 값으로 대체되었는지 여부"""
+        return bool(self.stale_sources)
+
     def convert_to_csv_row_format(
         self, date_string_format: str = "%Y-%m-%d"
     ) -> List[str]:
@@ -0,0 +1,175 @@
+"""
+시세 스냅샷 수집의 전체 마감 시간, 취소 신호, 소스별 실패 정보를 다루는 모듈입니다.
+
+스냅샷 하나는 국내 금, 국제 금, 환율 세 소스가 모두 있어야 완성되므로
+한 소스가 실패하거나 마감 시간을 넘기면 나머지 요청을 계속할 이유가 없습니다.
+`FetchDeadline`은 스냅샷 전체에 하나만 만들어 모든 요청이 공유합니다.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+# 사용자에게 보여주는 메시지 (세부 원인은 로그와 `failures`로만 확인)
+MARKET_DATA_COLLECTION_ERROR_MESSAGE = (
+    "금 가격 데이터를 가져올 수 없습니다. 시스템 로그를 확인해주세요."
+)
+
+
+class FetchCancelledError(Exception):
+    """스냅샷 마감 시간이 지났거나 fail-fast로 취소되어 요청을 중단할 때 발생합니다."""
+
+    def __init__(self, message: str, deadline_exceeded: bool):
+        super().__init__(message)
+        self.deadline_exceeded = deadline_exceeded
+
+
+class FetchDeadline:
+    """
+    여러 요청이 공유하는 마감 시각과 취소 신호.
+
+    동기 경로에서는 진행 중인 requests 호출을 강제로 끊을 수 없으므로,
+    각 요청이 `clamp_timeout()`으로 타임아웃을 남은 시간 이내로 줄이고
+    chunk를 읽을 때마다 `check()`로 취소 여부를 확인합니다.
+
+    `parent`를 주면 부모의 마감 시간과 취소 신호를 함께 따르는 하위 마감 시간이
+    됩니다 (헤지 요청처럼 스냅샷 전체는 두고 요청 하나만 취소할 때 사용).
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: Optional[float],
+        parent: Optional["FetchDeadline"] = None,
+    ):
+        self.timeout_seconds = timeout_seconds
+        self.parent = parent
+        self.expires_at = (
+            None if timeout_seconds is None else time.monotonic() + timeout_seconds
+        )
+        self._cancel_event = threading.Event()
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간(초)을 반환합니다. 마감 시간이 없으면 None."""
+        remaining_seconds = None
+        if self.expires_at is not None:
+            remaining_seconds = max(0.0, self.expires_at - time.monotonic())
+        if self.parent is not None:
+            parent_remaining_seconds = self.parent.remaining()
+            if remaining_seconds is None or (
+                parent_remaining_seconds is not None
+                and parent_remaining_seconds < remaining_seconds
+            ):
+                remaining_seconds = parent_remaining_seconds
+        return remaining_seconds
+
+    @property
+    def expired(self) -> bool:
+        remaining_seconds = self.remaining()
+        return remaining_seconds is not None and remaining_seconds <= 0
+
+    def cancel(self) -> None:
+        """이 마감 시간을 공유하는 모든 요청에 중단 신호를 보냅니다."""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set() or (
+            self.parent is not None and self.parent.cancelled
+        )
+
+    def sleep(self, seconds: float) -> None:
+        """
+        최대 `seconds`초 기다립니다. 취소되면 바로 깨어납니다.
+        호출 측은 깨어난 뒤 `check()`로 계속할지 확인합니다.
+        """
+        self._cancel_event.wait(seconds)
+
+    def check(self, target_url: str) -> None:
+        """
+        요청을 계속해도 되는지 확인합니다.
+
+        Raises:
+            FetchCancelledError: 취소되었거나 마감 시간이 지난 경우
+        """
+        if self.cancelled:
+            raise FetchCancelledError(
+                f"Request to {target_url} was cancelled.", deadline_exceeded=self.expired
+            )
+        if self.expired:
+            raise FetchCancelledError(
+                f"Snapshot deadline ({self.timeout_seconds}s) exceeded while fetching {target_url}.",
+                deadline_exceeded=True,
+            )
+
+    def clamp_timeout(self, timeout: Tuple[float, float]) -> Tuple[float, float]:
+        """(connect, read) 타임아웃을 남은 시간 이내로 줄입니다."""
+        remaining_seconds = self.remaining()
+        if remaining_seconds is None:
+            return timeout
+        # 0 타임아웃은 requests에서 즉시 실패하므로 아주 작은 양수로 둔다
+        remaining_seconds = max(remaining_seconds, 0.001)
+        connect_timeout, read_timeout = timeout
+        return min(connect_timeout, remaining_seconds), min(read_timeout, remaining_seconds)
+
+
+@dataclass
+class SourceFetchFailure:
+    """
+    스냅샷에서 실패한 소스 하나의 정보.
+
+    Attributes:
+        source_name: 소스 이름 ("domestic_gold", "international_gold", "usd_krw")
+        timed_out: 요청 타임아웃 또는 스냅샷 마감 시간 초과로 실패했는지 여부
+        cancelled: 다른 소스의 실패로 fail-fast 취소되었는지 여부
+        circuit_open: 서킷 브레이커가 열려 있어 요청 없이 실패했는지 여부
+        error: 원래 예외 (끝나지 않은 채 취소된 경우 None)
+    """
+
+    source_name: str
+    timed_out: bool = False
+    cancelled: bool = False
+    circuit_open: bool = False
+    error: Optional[BaseException] = None
+
+    def describe(self) -> str:
+        if self.timed_out:
+            status = "timeout"
+        elif self.circuit_open:
+            status = "circuit_open"
+        elif self.cancelled:
+            status = "cancelled"
+        else:
+            status = "error"
+        if self.error is None:
+            return f"{self.source_name}={status}"
+        return f"{self.source_name}={status} ({type(self.error).__name__}: {self.error})"
+
+
+class MarketDataCollectionError(ValueError):
+    """
+    시세 스냅샷 수집 실패.
+
+    메시지는 기존과 같은 일반 문구를 유지하고(내부 정보 노출 방지),
+    어느 소스가 왜 실패했는지는 `failures`로 확인합니다.
+    """
+
+    def __init__(
+        self,
+        failures: List[SourceFetchFailure],
+        message: str = MARKET_DATA_COLLECTION_ERROR_MESSAGE,
+    ):
+        super().__init__(message)
+        self.failures = failures
+
+    @property
+    def failed_sources(self) -> List[str]:
+        return [failure.source_name for failure in self.failures]
+
+    @property
+    def timed_out_sources(self) -> List[str]:
+        return [failure.source_name for failure in self.failures if failure.timed_out]
+
+    def describe_failures(self) -> str:
+        """로그용 요약 문자열 (예: "domestic_gold=timeout, usd_krw=cancelled")"""
+        return ", ".join(failure.describe() for failure in self.failures)
@@ -0,0 +1,414 @@
+"""
+시세 요청의 단계별 시간(연결, 첫 바이트, 다운로드, 파싱)을 측정하고 내보내는 모듈입니다.
+
+요청 하나가 끝날 때마다 `FetchPhaseSample`이 만들어져 등록된 싱크(sink)로 전달됩니다.
+
+- `InMemoryHistogramSink`: 소스/단계별 히스토그램 (기본으로 등록됨)
+- `JsonLinesMetricsSink`: 샘플을 JSON Lines 파일에 한 줄씩 추가
+- `PrometheusTextFileSink`: Prometheus 텍스트 형식 파일을 갱신
+  (node_exporter textfile collector 용)
+
+`FetchMetricsSink`를 상속해 `record(sample)`을 구현하면 `add_fetch_metrics_sink()`로 등록할 수 있습니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from .configuration import FETCH_METRICS_ENABLED, FETCH_METRICS_JSONL_FILE
+from .fetch_deadline import FetchCancelledError
+from .price_log_lookup import apply_log_file_mode
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 측정 단계
+FETCH_PHASES = ("connect", "ttfb", "download", "parse", "total")
+
+# 히스토그램 버킷 상한 (초)
+FETCH_LATENCY_BUCKETS_SECONDS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# 요청 결과
+FETCH_OUTCOME_OK = "ok"
+FETCH_OUTCOME_NOT_MODIFIED = "not_modified"
+FETCH_OUTCOME_HTTP_ERROR = "http_error"
+FETCH_OUTCOME_TIMEOUT = "timeout"
+FETCH_OUTCOME_CONNECTION_ERROR = "connection_error"
+FETCH_OUTCOME_INVALID_RESPONSE = "invalid_response"
+FETCH_OUTCOME_PARSE_ERROR = "parse_error"
+FETCH_OUTCOME_CANCELLED = "cancelled"
+FETCH_OUTCOME_ERROR = "error"
+
+PROMETHEUS_METRIC_PREFIX = "kimchi_gold_fetch"
+
+
+@dataclass
+class FetchPhaseSample:
+    """
+    요청 하나의 단계별 측정값.
+
+    Attributes:
+        source_name: 소스 이름 ("domestic_gold" 등)
+        target_url: 요청 URL
+        outcome: 결과 ("ok", "not_modified", "http_error", "timeout", ...)
+        total_seconds: 요청 시작부터 끝(성공 또는 실패)까지
+        connect_seconds: TCP/TLS 연결 시간 (재사용 연결이면 0, 알 수 없으면 None)
+        ttfb_seconds: 요청 시작부터 응답 헤더 수신까지 (연결 시간 포함)
+        download_seconds: 응답 헤더 이후 본문 읽기에 쓴 시간 (파싱 시간 제외)
+        parse_seconds: 가격 추출(스트리밍 스캔 + DOM 파싱)에 쓴 시간
+        bytes_read: 읽은 본문 크기
+        error_type: 실패한 경우 예외 클래스 이름
+        timestamp: 요청이 끝난 시각 (epoch 초)
+    """
+
+    source_name: str
+    target_url: str
+    outcome: str
+    total_seconds: float
+    connect_seconds: Optional[float] = None
+    ttfb_seconds: Optional[float] = None
+    download_seconds: Optional[float] = None
+    parse_seconds: float = 0.0
+    bytes_read: int = 0
+    error_type: Optional[str] = None
+    timestamp: float = 0.0
+
+    def phase_seconds(self) -> Dict[str, float]:
+        """측정된 단계별 시간 (측정되지 않은 단계는 제외)"""
+        phases = {
+            "connect": self.connect_seconds,
+            "ttfb": self.ttfb_seconds,
+            "download": self.download_seconds,
+            "parse": self.parse_seconds if self.bytes_read else None,
+            "total": self.total_seconds,
+        }
+        return {phase: seconds for phase, seconds in phases.items() if seconds is not None}
+
+
+def classify_fetch_outcome(error: Optional[BaseException], failed_phase: str) -> str:
+    """예외와 실패한 단계로 요청 결과를 분류합니다."""
+    if error is None:
+        return FETCH_OUTCOME_OK
+    if isinstance(error, FetchCancelledError):
+        return FETCH_OUTCOME_TIMEOUT if error.deadline_exceeded else FETCH_OUTCOME_CANCELLED
+    if isinstance(error, requests.HTTPError):
+        return FETCH_OUTCOME_HTTP_ERROR
+    if isinstance(error, requests.Timeout):
+        return FETCH_OUTCOME_TIMEOUT
+    if isinstance(error, (requests.ConnectionError, ConnectionError)):
+        return FETCH_OUTCOME_CONNECTION_ERROR
+    if isinstance(error, ValueError):
+        if failed_phase == "parse":
+            return FETCH_OUTCOME_PARSE_ERROR
+        return FETCH_OUTCOME_INVALID_RESPONSE
+    if isinstance(error, asyncio.CancelledError):
+        return FETCH_OUTCOME_CANCELLED
+    return FETCH_OUTCOME_ERROR
+
+
+class FetchPhaseTimer:
+    """
+    요청 하나의 단계를 측정합니다. fetch 함수가 단계가 바뀔 때마다 호출하고
+    마지막에 `finish()`로 샘플을 만들어 싱크에 보냅니다.
+
+    시간은 `time.perf_counter()`로만 잽니다.
+    """
+
+    def __init__(self, source_name: str, target_url: str):
+        self.source_name = source_name
+        self.target_url = target_url
+        self.phase = "request"
+        self.started_at = time.perf_counter()
+        self.headers_received_at: Optional[float] = None
+        self.connect_seconds: Optional[float] = None
+        self.parse_seconds = 0.0
+        self.bytes_read = 0
+        self.not_modified = False
+
+    def headers_received(self, connect_seconds: Optional[float]) -> None:
+        self.headers_received_at = time.perf_counter()
+        self.connect_seconds = connect_seconds
+        self.phase = "download"
+
+    def chunk_received(self, chunk: bytes) -> None:
+        self.bytes_read += len(chunk)
+
+    @contextmanager
+    def parsing(self) -> Iterator[None]:
+        """가격 추출 구간을 잽니다. 예외가 나면 실패 단계를 "parse"로 남깁니다."""
+        previous_phase, self.phase = self.phase, "parse"
+        parse_started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.parse_seconds += time.perf_counter() - parse_started
+        self.phase = previous_phase
+
+    def finish(self, error: Optional[BaseException] = None) -> FetchPhaseSample:
+        finished_at = time.perf_counter()
+        ttfb_seconds = download_seconds = None
+        if self.headers_received_at is not None:
+            ttfb_seconds = self.headers_received_at - self.started_at
+            download_seconds = max(
+                0.0, finished_at - self.headers_received_at - self.parse_seconds
+            )
+        outcome = classify_fetch_outcome(error, self.phase)
+        if outcome == FETCH_OUTCOME_OK and self.not_modified:
+            outcome = FETCH_OUTCOME_NOT_MODIFIED
+        sample = FetchPhaseSample(
+            source_name=self.source_name,
+            target_url=self.target_url,
+            outcome=outcome,
+            total_seconds=finished_at - self.started_at,
+            connect_seconds=self.connect_seconds,
+            ttfb_seconds=ttfb_seconds,
+            download_seconds=download_seconds,
+            parse_seconds=self.parse_seconds,
+            bytes_read=self.bytes_read,
+            error_type=None if error is None else type(error).__name__,
+            timestamp=time.time(),
+        )
+        emit_fetch_phase_sample(sample)
+        return sample
+
+
+class FetchMetricsSink(ABC):
+    """싱크 인터페이스. `record()`를 구현하지 않은 싱크는 만들 때 TypeError로 실패합니다."""
+
+    @abstractmethod
+    def record(self, sample: FetchPhaseSample) -> None:
+        """요청 하나의 단계별 샘플을 기록합니다."""
+
+
+def _escape_prometheus_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_prometheus_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class InMemoryHistogramSink(FetchMetricsSink):
+    """
+    (소스, 단계)별 누적 히스토그램과 (소스, 결과)별 요청 수를 메모리에 보관합니다.
+    버킷이 고정되어 있어 샘플이 많아도 메모리가 늘지 않습니다.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = FETCH_LATENCY_BUCKETS_SECONDS):
+        self.buckets = tuple(sorted(buckets))
+        self._bucket_counts: Dict[Tuple[str, str], List[int]] = {}
+        self._sums: Dict[Tuple[str, str], float] = {}
+        self._outcome_counts: Dict[Tuple[str, str], int] = {}
+        self._bytes_read: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, sample: FetchPhaseSample) -> None:
+        with self._lock:
+            for phase, seconds in sample.phase_seconds().items():
+                key = (sample.source_name, phase)
+                bucket_counts = self._bucket_counts.get(key)
+                if bucket_counts is None:
+                    # 마지막 칸은 +Inf 버킷
+                    bucket_counts = self._bucket_counts[key] = [0] * (len(self.buckets) + 1)
+                bucket_counts[bisect_left(self.buckets, seconds)] += 1
+                self._sums[key] = self._sums.get(key, 0.0) + seconds
+            outcome_key = (sample.source_name, sample.outcome)
+            self._outcome_counts[outcome_key] = self._outcome_counts.get(outcome_key, 0) + 1
+            self._bytes_read[sample.source_name] = (
+                self._bytes_read.get(sample.source_name, 0) + sample.bytes_read
+            )
+
+    def count(self, source_name: str, phase: str = "total") -> int:
+        with self._lock:
+            return sum(self._bucket_counts.get((source_name, phase), ()))
+
+    def outcome_count(self, source_name: str, outcome: str) -> int:
+        with self._lock:
+            return self._outcome_counts.get((source_name, outcome), 0)
+
+    def quantile(self, source_name: str, phase: str, quantile: float) -> Optional[float]:
+        """
+        버킷 상한 기준의 근사 분위수 (Prometheus histogram_quantile과 같은 방식, 보간 없음).
+
+        Returns:
+            분위수가 속한 버킷의 상한(초), 샘플이 없으면 None (+Inf 버킷이면 inf)
+        """
+        with self._lock:
+            bucket_counts = list(self._bucket_counts.get((source_name, phase), ()))
+        total_count = sum(bucket_counts)
+        if total_count == 0:
+            return None
+        rank = quantile * total_count
+        cumulative_count = 0
+        for upper_bound, bucket_count in zip(self.buckets + (float("inf"),), bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank:
+                return upper_bound
+        return float("inf")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bucket_counts.clear()
+            self._sums.clear()
+            self._outcome_counts.clear()
+            self._bytes_read.clear()
+
+    def render_prometheus_text(self) -> str:
+        """Prometheus 텍스트 노출 형식(0.0.4)으로 렌더링합니다."""
+        with self._lock:
+            bucket_counts = {key: list(counts) for key, counts in self._bucket_counts.items()}
+            sums = dict(self._sums)
+            outcome_counts = dict(self._outcome_counts)
+            bytes_read = dict(self._bytes_read)
+
+        lines = [
+            f"# HELP {PROMETHEUS_METRIC_PREFIX}_phase_seconds Market data fetch latency by phase.",
+            f"# TYPE {PROMETHEUS_METRIC_PREFIX}_phase_seconds histogram",
+        ]
+        for (source_name, phase), counts in sorted(bucket_counts.items()):
+            labels = (
+                f'source="{_escape_prometheus_label(source_name)}",'
+                f'phase="{_escape_prometheus_label(phase)}"'
+            )
+            cumulative_count = 0
+            for upper_bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative_count += bucket_count
+                lines.append(
+                    f"{PROMETHEUS_METRIC_PREFIX}_phase_seconds_bucket"
+                    f'{{{labels},le="{_format_prometheus_number(upper_bound)}"}} {cumulative_count}'
+                )
+            lines.append(
+                f"{PROMETHEUS_METRIC_PREFIX}_phase_seconds_sum{{{labels}}} "
+                f"{_format_prometheus_number(sums[(source_name, phase)])}"
+            )
+            lines.append(f"{PROMETHEUS_METRIC_PREFIX}_phase_seconds_count{{{labels}}} {cumulative_count}")
+
+        lines += [
+            f"# HELP {PROMETHEUS_METRIC_PREFIX}_requests_total Market data fetches by outcome.",
+            f"# TYPE {PROMETHEUS_METRIC_PREFIX}_requests_total counter",
+        ]
+        for (source_name, outcome), outcome_count in sorted(outcome_counts.items()):
+            lines.append(
+                f"{PROMETHEUS_METRIC_PREFIX}_requests_total"
+                f'{{source="{_escape_prometheus_label(source_name)}",'
+                f'outcome="{_escape_prometheus_label(outcome)}"}} {outcome_count}'
+            )
+
+        lines += [
+            f"# HELP {PROMETHEUS_METRIC_PREFIX}_response_bytes_total Response body bytes read.",
+            f"# TYPE {PROMETHEUS_METRIC_PREFIX}_response_bytes_total counter",
+        ]
+        for source_name, source_bytes_read in sorted(bytes_read.items()):
+            lines.append(
+                f"{PROMETHEUS_METRIC_PREFIX}_response_bytes_total"
+                f'{{source="{_escape_prometheus_label(source_name)}"}} {source_bytes_read}'
+            )
+        return "\n".join(lines) + "\n"
+
+
+class JsonLinesMetricsSink(FetchMetricsSink):
+    """샘플을 JSON Lines 파일에 한 줄씩 추가합니다 (오프라인 분석용)."""
+
+    def __init__(self, file_path: Path):
+        self.file_path = Path(file_path)
+        self._lock = threading.Lock()
+
+    def record(self, sample: FetchPhaseSample) -> None:
+        line = json.dumps(asdict(sample), ensure_ascii=False) + "\n"
+        with self._lock:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.file_path, "a", encoding="utf-8") as jsonl_file:
+                jsonl_file.write(line)
+
+
+class PrometheusTextFileSink(FetchMetricsSink):
+    """
+    샘플마다 히스토그램을 갱신하고 Prometheus 텍스트 파일을 원자적으로 다시 씁니다.
+    node_exporter의 textfile collector 디렉토리를 가리키면 됩니다.
+    """
+
+    def __init__(self, file_path: Path, histogram: Optional[InMemoryHistogramSink] = None):
+        self.file_path = Path(file_path)
+        self.histogram = histogram if histogram is not None else InMemoryHistogramSink()
+        self._lock = threading.Lock()
+
+    def record(self, sample: FetchPhaseSample) -> None:
+        self.histogram.record(sample)
+        with self._lock:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            # 수집기가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=self.file_path.parent, prefix=".fetch_metrics.", suffix=".tmp"
+            )
+            try:
+                # mkstemp는 0600으로 만들므로, 다른 사용자로 도는 node_exporter도 읽을 수 있게 기존 파일
+                # 권한(없으면 0666 & ~umask)을 줌
+                apply_log_file_mode(file_descriptor, self.file_path)
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as temporary_file:
+                    temporary_file.write(self.histogram.render_prometheus_text())
+                os.replace(temporary_path, self.file_path)
+            except BaseException:
+                os.unlink(temporary_path)
+                raise
+
+
+_shared_fetch_histogram = InMemoryHistogramSink()
+_fetch_metrics_sinks: List[FetchMetricsSink] = []
+_fetch_metrics_sinks_lock = threading.Lock()
+if FETCH_METRICS_ENABLED:
+    _fetch_metrics_sinks.append(_shared_fetch_histogram)
+    if FETCH_METRICS_JSONL_FILE is not None:
+        _fetch_metrics_sinks.append(JsonLinesMetricsSink(FETCH_METRICS_JSONL_FILE))
+
+
+def get_shared_fetch_histogram() -> InMemoryHistogramSink:
+    """기본으로 등록되는 프로세스 공유 히스토그램을 반환합니다."""
+    return _shared_fetch_histogram
+
+
+def add_fetch_metrics_sink(sink: FetchMetricsSink) -> None:
+    """`FetchMetricsSink`를 상속한 싱크를 등록합니다."""
+    with _fetch_metrics_sinks_lock:
+        if sink not in _fetch_metrics_sinks:
+            _fetch_metrics_sinks.append(sink)
+
+
+def remove_fetch_metrics_sink(sink: FetchMetricsSink) -> None:
+    with _fetch_metrics_sinks_lock:
+        if sink in _fetch_metrics_sinks:
+            _fetch_metrics_sinks.remove(sink)
+
+
+def get_fetch_metrics_sinks() -> List[FetchMetricsSink]:
+    with _fetch_metrics_sinks_lock:
+        return list(_fetch_metrics_sinks)
+
+
+def emit_fetch_phase_sample(sample: FetchPhaseSample) -> None:
+    """등록된 모든 싱크에 샘플을 보냅니다. 싱크 오류는 수집을 방해하지 않도록 로그만 남깁니다."""
+    for sink in get_fetch_metrics_sinks():
+        try:
+            sink.record(sample)
+        except Exception as sink_error:
+            logger.warning(f"메트릭 싱크 기록 실패 ({type(sink).__name__}): {sink_error}")
+
+
+def render_fetch_metrics_prometheus_text() -> str:
+    """공유 히스토그램을 Prometheus 텍스트 형식으로 반환합니다 (HTTP /metrics 핸들러 등에서 사용)."""
+    return _shared_fetch_histogram.render_prometheus_text()
@@ -0,0 +1,482 @@
+"""
+네이버 금융 일별 시세 페이지에서 과거 시세를 받아 CSV 로그의 빈 날짜를 채우는 모듈입니다.
+
+GitHub Action이 실패한 날은 `kimchi_gold_price_log.csv`에 행이 없으므로, 세 시세의
+일별 시세 페이지(`&page=N`, 최신 날짜부터 한 페이지에 여러 날)를 받아 빠진 날짜의
+행을 만들어 넣습니다.
+
+- 페이지는 스레드 풀에서 동시에 받고, 모든 작업 스레드가 하나의 토큰 버킷을 공유해
+  초당 요청 수를 제한합니다. 첫 페이지의 행 수로 필요한 페이지 수를 추정해 한 번에
+  요청하므로 여러 해를 채워도 페이지 수 / 초당 요청 수 정도의 시간이면 끝납니다.
+- 국내 금 시세가 있는 날(거래일)만 채우며, 국제 금/환율은 그 날짜 이전의 가장 최근
+  값(최대 `HISTORY_QUOTE_MAX_AGE_DAYS`일)을 사용합니다.
+- 기존 행은 그대로 두고 빠진 날짜만 추가한 뒤 날짜순으로 정렬해 원자적으로 다시 씁니다
+  (마지막 날짜 뒤만 채우면 다시 쓰지 않고 끝에 한 번에 붙임).
+  같은 범위로 다시 실행해도 파일이 바뀌지 않습니다 (멱등).
+
+실행: `backfill --start 2023-05-09 --end 2026-07-24`
+"""
+
+import argparse
+import bisect
+import csv
+import logging
+import math
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from .configuration import (
+    BACKFILL_MAX_CONCURRENCY,
+    BACKFILL_REQUESTS_PER_SECOND,
+    CSV_COLUMN_HEADERS,
+    GOLD_PRICE_DATA_CSV_FILE,
+    NAVER_DOMESTIC_GOLD_HISTORY_URL,
+    NAVER_INTERNATIONAL_GOLD_HISTORY_URL,
+    NAVER_USD_KRW_HISTORY_URL,
+    REQUEST_HEADERS,
+)
+from .data_collector import validate_safe_path
+from .http_session import get_shared_http_session
+from .price_log_journal import append_rows_to_csv_atomically, price_log_write_lock, replace_csv_atomically
+from .price_fetcher import (
+    DOMESTIC_GOLD_SOURCE,
+    INTERNATIONAL_GOLD_SOURCE,
+    USD_KRW_SOURCE,
+    ResponseBodyLimiter,
+    build_gold_price_data,
+    get_retry_delay,
+    validate_naver_finance_url,
+    validate_price,
+    validate_response_headers,
+)
+from .rate_limiter import TokenBucketRateLimiter, get_shared_upstream_rate_limiters
+from .request_resilience import RetryPolicy
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 일별 시세 표의 한 행: <td class="date">2024.05.10</td> <td class="num">99,380.67</td>
+HISTORY_ROW_PATTERN = re.compile(
+    rb'<td class="date">\s*(\d{4})\.(\d{2})\.(\d{2})\s*</td>\s*'
+    rb'<td class="num">\s*([\d,]+(?:\.\d+)?)\s*</td>'
+)
+
+# 국제 금/환율이 이 기간보다 오래되면 그 날짜는 채우지 않음 (연휴, 해외 휴장 고려)
+HISTORY_QUOTE_MAX_AGE_DAYS = 5
+
+# 소스별 최대 페이지 수 (페이지 끝을 감지하지 못하는 경우의 안전장치)
+BACKFILL_MAX_PAGES_PER_SOURCE = 1000
+
+
+@dataclass(frozen=True)
+class HistorySource:
+    """일별 시세 페이지 하나 (소스 이름은 price_fetcher의 소스 이름과 같음)"""
+
+    name: str
+    base_url: str
+
+
+HISTORY_SOURCES = (
+    HistorySource(DOMESTIC_GOLD_SOURCE, NAVER_DOMESTIC_GOLD_HISTORY_URL),
+    HistorySource(INTERNATIONAL_GOLD_SOURCE, NAVER_INTERNATIONAL_GOLD_HISTORY_URL),
+    HistorySource(USD_KRW_SOURCE, NAVER_USD_KRW_HISTORY_URL),
+)
+
+
+@dataclass
+class BackfillResult:
+    """
+    백필 결과.
+
+    Attributes:
+        filled_dates: 새로 추가한 날짜
+        unmatched_dates: 국내 금 시세는 있지만 국제 금/환율이 없어 채우지 못한 날짜
+        page_count: 받은 페이지 수
+    """
+
+    filled_dates: List[date] = field(default_factory=list)
+    unmatched_dates: List[date] = field(default_factory=list)
+    page_count: int = 0
+
+
+def build_history_page_url(base_url: str, page_number: int) -> str:
+    separator = "&" if "?" in base_url else "?"
+    return f"{base_url}{separator}page={page_number}"
+
+
+def parse_history_page(page_content: bytes, source_name: str) -> List[Tuple[date, float]]:
+    """
+    일별 시세 페이지에서 (날짜, 가격) 행을 페이지 순서(최신 날짜부터)대로 추출합니다.
+    페이지는 EUC-KR이지만 날짜와 숫자는 ASCII이므로 디코딩 없이 바이트로 찾습니다.
+
+    Raises:
+        ValueError: 날짜나 가격이 비정상인 경우
+    """
+    history_rows = []
+    for row_match in HISTORY_ROW_PATTERN.finditer(page_content):
+        year, month, day, price_text = row_match.groups()
+        trading_day = date(int(year), int(month), int(day))
+        price = validate_price(float(price_text.replace(b",", b"")), source_name)
+        history_rows.append((trading_day, price))
+    return history_rows
+
+
+class HistoryPageFetcher:
+    """
+    일별 시세 페이지를 동시에 받는 수집기.
+
+    페이지 요청은 `executor`의 작업 스레드에서 실행되고, 요청마다 공유 토큰 버킷에서
+    토큰을 하나 받은 뒤(호스트별 프로세스 간 버킷도 거침) 보냅니다. 일시적 오류는 실시간 수집과 같은 재시도 정책을 따릅니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = BACKFILL_MAX_CONCURRENCY,
+        requests_per_second: float = BACKFILL_REQUESTS_PER_SECOND,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        self.rate_limiter = TokenBucketRateLimiter(requests_per_second, burst=max_concurrency)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="history-page"
+        )
+        self.page_count = 0
+        self._page_count_lock = threading.Lock()
+
+    def request_page(self, page_url: str) -> bytes:
+        """페이지 하나를 받아 본문을 반환합니다 (보안 검증은 실시간 수집과 동일)."""
+        self.rate_limiter.acquire()
+        # 같은 호스트에 요청하는 다른 프로세스(수집기, check)와 속도 제한을 공유
+        upstream_rate_limiters = get_shared_upstream_rate_limiters()
+        if upstream_rate_limiters is not None:
+            upstream_rate_limiters.for_url(page_url).acquire()
+        with get_shared_http_session().get(
+            page_url,
+            headers=REQUEST_HEADERS,
+            timeout=(3.0, 10.0),
+            allow_redirects=False,
+            stream=True,
+            verify=True,
+        ) as response:
+            validate_response_headers(page_url, response)
+            body_limiter = ResponseBodyLimiter(page_url)
+            for chunk in response.iter_content(chunk_size=8192):
+                body_limiter.add(chunk)
+        with self._page_count_lock:
+            self.page_count += 1
+        return body_limiter.content
+
+    def fetch_page(self, source: HistorySource, page_number: int) -> List[Tuple[date, float]]:
+        page_url = build_history_page_url(source.base_url, page_number)
+        validate_naver_finance_url(page_url)
+        retry_number = 0
+        while True:
+            try:
+                return parse_history_page(self.request_page(page_url), source.name)
+            except Exception as page_error:
+                backoff_seconds = get_retry_delay(page_error, retry_number, self.retry_policy)
+                if backoff_seconds is None:
+                    raise
+                retry_number += 1
+                logger.warning(
+                    f"일시적 오류로 재시도합니다 ({retry_number}/{self.retry_policy.max_retries}, "
+                    f"{backoff_seconds:.2f}s 후): {page_url} - {page_error}"
+                )
+                time.sleep(backoff_seconds)
+
+    def collect_quotes(self, source: HistorySource, start_date: date) -> Dict[date, float]:
+        """
+        `start_date`까지 거슬러 올라가며 한 소스의 일별 시세를 모읍니다.
+
+        첫 페이지로 페이지당 행 수를 알아낸 뒤 남은 기간에 필요한 페이지 수(주말 제외)를
+        추정해 한 번에 요청합니다. 빈 페이지나 이미 받은 날짜만 있는 페이지(마지막 페이지
+        이후)를 만나면 멈추고, 추정이 모자라면 다음 묶음을 다시 추정합니다.
+        """
+        first_page_rows = self.fetch_page(source, 1)
+        if not first_page_rows:
+            return {}
+        quotes = dict(first_page_rows)
+        rows_per_page = len(first_page_rows)
+        oldest_date = min(quotes)
+        next_page_number = 2
+
+        while oldest_date > start_date and next_page_number <= BACKFILL_MAX_PAGES_PER_SOURCE:
+            remaining_trading_days = (oldest_date - start_date).days * 5 / 7
+            page_batch_size = min(
+                math.ceil(remaining_trading_days / rows_per_page) + 1,
+                BACKFILL_MAX_PAGES_PER_SOURCE - next_page_number + 1,
+            )
+            page_futures = [
+                self.executor.submit(self.fetch_page, source, page_number)
+                for page_number in range(next_page_number, next_page_number + page_batch_size)
+            ]
+            next_page_number += page_batch_size
+
+            reached_last_page = False
+            try:
+                for page_future in page_futures:
+                    page_rows = page_future.result()
+                    if not page_rows or all(trading_day in quotes for trading_day, _ in page_rows):
+                        reached_last_page = True
+                        break
+                    quotes.update(page_rows)
+                    oldest_date = min(oldest_date, min(trading_day for trading_day, _ in page_rows))
+            finally:
+                for page_future in page_futures:
+                    page_future.cancel()
+            if reached_last_page:
+                break
+
+        logger.info(f"{source.name}: {len(quotes)}일치 시세 수집 (가장 오래된 날짜 {oldest_date})")
+        return {
+            trading_day: price for trading_day, price in quotes.items() if trading_day >= start_date
+        }
+
+    def collect_all_quotes(
+        self, start_date: date, sources: Sequence[HistorySource] = HISTORY_SOURCES
+    ) -> Dict[str, Dict[date, float]]:
+        """세 소스를 동시에 수집합니다 (소스별 페이지 요청은 공유 풀과 토큰 버킷을 거침)."""
+        with ThreadPoolExecutor(
+            max_workers=len(sources), thread_name_prefix="history-source"
+        ) as source_executor:
+            source_futures = {
+                source.name: source_executor.submit(self.collect_quotes, source, start_date)
+                for source in sources
+            }
+            return {name: future.result() for name, future in source_futures.items()}
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "HistoryPageFetcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def find_quote_as_of(
+    quotes: Dict[date, float],
+    sorted_quote_dates: List[date],
+    trading_day: date,
+    max_age_days: int = HISTORY_QUOTE_MAX_AGE_DAYS,
+) -> Optional[float]:
+    """`trading_day` 또는 그 이전의 가장 최근 시세 (너무 오래되었으면 None)"""
+    position = bisect.bisect_right(sorted_quote_dates, trading_day)
+    if position == 0:
+        return None
+    quote_date = sorted_quote_dates[position - 1]
+    if (trading_day - quote_date).days > max_age_days:
+        return None
+    return quotes[quote_date]
+
+
+def build_backfill_rows(
+    history_quotes: Dict[str, Dict[date, float]],
+    missing_dates: Sequence[date],
+) -> Tuple[List[List[str]], List[date]]:
+    """
+    빠진 날짜의 CSV 행을 만듭니다.
+
+    Returns:
+        (CSV 행 목록, 국제 금/환율이 없어 만들지 못한 날짜 목록)
+    """
+    domestic_quotes = history_quotes[DOMESTIC_GOLD_SOURCE]
+    international_quotes = history_quotes[INTERNATIONAL_GOLD_SOURCE]
+    usd_krw_quotes = history_quotes[USD_KRW_SOURCE]
+    international_dates = sorted(international_quotes)
+    usd_krw_dates = sorted(usd_krw_quotes)
+
+    backfill_rows = []
+    unmatched_dates = []
+    for trading_day in missing_dates:
+        international_price = find_quote_as_of(
+            international_quotes, international_dates, trading_day
+        )
+        usd_krw_rate = find_quote_as_of(usd_krw_quotes, usd_krw_dates, trading_day)
+        if international_price is None or usd_krw_rate is None:
+            unmatched_dates.append(trading_day)
+            continue
+        gold_price_data = build_gold_price_data(
+            domestic_quotes[trading_day], international_price, usd_krw_rate
+        )
+        gold_price_data.data_collection_timestamp = datetime.combine(
+            trading_day, datetime.min.time()
+        )
+        backfill_rows.append(gold_price_data.convert_to_csv_row_format())
+    return backfill_rows, unmatched_dates
+
+
+def read_logged_rows(csv_file_path: Path) -> Tuple[List[str], List[List[str]]]:
+    """CSV 로그의 (헤더, 데이터 행)을 읽습니다. 파일이 없으면 기본 헤더와 빈 목록."""
+    if not csv_file_path.exists():
+        return list(CSV_COLUMN_HEADERS), []
+    with csv_file_path.open("r", encoding="utf-8", newline="") as csv_file:
+        csv_reader = csv.reader(csv_file)
+        header_row = next(csv_reader, None) or list(CSV_COLUMN_HEADERS)
+        return header_row, [data_row for data_row in csv_reader if data_row]
+
+
+def merge_rows_into_csv(csv_file_path: Path, backfill_rows: List[List[str]]) -> int:
+    """
+    기존 행은 그대로 두고 아직 없는 날짜의 행만 더해 날짜순으로 다시 씁니다.
+    `replace_csv_atomically()`로 임시 파일에 쓴 뒤 바꾸므로 중간에 실패해도 원본은 그대로이고 권한도 유지됩니다.
+    날짜순 로그의 마지막 날짜 뒤에만 채우는 경우에는 다시 쓰지 않고 끝에 한 번에 붙입니다.
+
+    Returns:
+        추가한 행 수
+    """
+    safe_csv_file_path = validate_safe_path(csv_file_path)
+    # 읽기부터 바꿔 끼우기까지 잠가 그 사이 수집기가 추가한 행을 덮어쓰지 않게 함
+    with price_log_write_lock(safe_csv_file_path):
+        header_row, logged_rows = read_logged_rows(safe_csv_file_path)
+        logged_row_dates = [data_row[0][:10] for data_row in logged_rows]
+        logged_dates = set(logged_row_dates)
+        new_rows = [data_row for data_row in backfill_rows if data_row[0][:10] not in logged_dates]
+        if not new_rows:
+            return 0
+
+        # 날짜 문자열("%Y-%m-%d")은 사전순이 곧 날짜순; 안정 정렬이라 같은 날짜의 기존 순서는 유지
+        new_rows.sort(key=lambda data_row: data_row[0][:10])
+        if logged_rows and safe_csv_file_path.exists() and new_rows[0][0][:10] > logged_row_dates[-1] and all(
+            earlier_date <= later_date for earlier_date, later_date in zip(logged_row_dates, logged_row_dates[1:])
+        ):
+            # Bolt Optimization: 최근 빈 날짜만 채우는 경우 전체를 다시 쓰지 않고 추가분만 붙임
+            return append_rows_to_csv_atomically(safe_csv_file_path, new_rows)
+
+        merged_rows = sorted(logged_rows + new_rows, key=lambda data_row: data_row[0][:10])
+        replace_csv_atomically(safe_csv_file_path, header_row, merged_rows)
+        return len(new_rows)
+
+
+def find_logged_dates(csv_file_path: Path) -> Set[str]:
+    """CSV 로그에 기록된 날짜 문자열("%Y-%m-%d") 집합"""
+    _, logged_rows = read_logged_rows(validate_safe_path(csv_file_path))
+    return {data_row[0][:10] for data_row in logged_rows}
+
+
+def backfill_missing_dates(
+    start_date: date,
+    end_date: date,
+    csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE,
+    max_concurrency: int = BACKFILL_MAX_CONCURRENCY,
+    requests_per_second: float = BACKFILL_REQUESTS_PER_SECOND,
+    dry_run: bool = False,
+) -> BackfillResult:
+    """
+    [start_date, end_date] 범위에서 CSV 로그에 없는 거래일을 채웁니다.
+
+    Args:
+        start_date: 채울 범위의 시작 날짜
+        end_date: 채울 범위의 끝 날짜 (포함)
+        csv_file_path: CSV 로그 경로
+        max_concurrency: 동시에 받는 페이지 수
+        requests_per_second: 초당 요청 수 상한
+        dry_run: True면 파일을 바꾸지 않고 채울 날짜만 계산
+
+    Returns:
+        BackfillResult
+    """
+    if start_date > end_date:
+        raise ValueError("start_date must not be after end_date.")
+
+    with HistoryPageFetcher(max_concurrency, requests_per_second) as page_fetcher:
+        # 국제 금/환율은 시작일 이전 값이 필요할 수 있어 조금 더 거슬러 올라간다
+        history_quotes = page_fetcher.collect_all_quotes(
+            start_date - timedelta(days=HISTORY_QUOTE_MAX_AGE_DAYS)
+        )
+        page_count = page_fetcher.page_count
+
+    logged_dates = find_logged_dates(csv_file_path)
+    missing_dates = sorted(
+        trading_day
+        for trading_day in history_quotes[DOMESTIC_GOLD_SOURCE]
+        if start_date <= trading_day <= end_date and trading_day.isoformat() not in logged_dates
+    )
+    backfill_rows, unmatched_dates = build_backfill_rows(history_quotes, missing_dates)
+    for unmatched_date in unmatched_dates:
+        logger.warning(f"{unmatched_date}: 국제 금 또는 환율 시세가 없어 채우지 않습니다.")
+
+    filled_dates = [date.fromisoformat(data_row[0]) for data_row in backfill_rows]
+    if not dry_run and backfill_rows:
+        merge_rows_into_csv(csv_file_path, backfill_rows)
+    logger.info(f"백필 {'계획' if dry_run else '완료'}: {len(filled_dates)}일, 페이지 {page_count}개")
+    return BackfillResult(filled_dates, unmatched_dates, page_count)
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="네이버 금융 일별 시세로 CSV 로그의 빠진 날짜를 채웁니다."
+    )
+    parser.add_argument(
+        "--start", type=date.fromisoformat, default=None, metavar="YYYY-MM-DD",
+        help="채울 범위의 시작 날짜 (기본값: 로그의 첫 날짜)",
+    )
+    parser.add_argument(
+        "--end", type=date.fromisoformat, default=None, metavar="YYYY-MM-DD",
+        help="채울 범위의 끝 날짜 (기본값: 어제, 오늘은 일별 수집이 기록)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=BACKFILL_MAX_CONCURRENCY,
+        help="동시에 받는 페이지 수",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=BACKFILL_REQUESTS_PER_SECOND,
+        help="초당 요청 수 상한",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="파일을 바꾸지 않고 채울 날짜만 출력",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    메인 실행 함수
+    """
+    # 로깅 설정
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    arguments = build_argument_parser().parse_args(argv)
+
+    try:
+        start_date = arguments.start
+        if start_date is None:
+            logged_dates = find_logged_dates(GOLD_PRICE_DATA_CSV_FILE)
+            if not logged_dates:
+                print("로그가 비어 있습니다. --start로 시작 날짜를 지정해주세요.")
+                return 1
+            start_date = date.fromisoformat(min(logged_dates))
+        end_date = arguments.end or date.today() - timedelta(days=1)
+
+        backfill_result = backfill_missing_dates(
+            start_date,
+            end_date,
+            max_concurrency=arguments.concurrency,
+            requests_per_second=arguments.rate,
+            dry_run=arguments.dry_run,
+        )
+        action = "채울" if arguments.dry_run else "채운"
+        print(f"{start_date} ~ {end_date}: {action} 날짜 {len(backfill_result.filled_dates)}일")
+        for filled_date in backfill_result.filled_dates:
+            print(f"  {filled_date}")
+        if backfill_result.unmatched_dates:
+            print(f"국제 금/환율이 없어 채우지 못한 날짜 {len(backfill_result.unmatched_dates)}일")
+        return 0
+    except Exception as main_execution_error:
+        logger.error(f"예기치 못한 오류 발생: {main_execution_error}")
+        print("예기치 못한 오류 발생: 시스템 로그를 확인해주세요.")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
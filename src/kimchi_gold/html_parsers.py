@@ -0,0 +1,146 @@
+"""
+네이버 금융 페이지에서 가격 태그 텍스트를 찾는 HTML 파서 백엔드 모듈입니다.
+
+사용 가능한 백엔드:
+- "html.parser": BeautifulSoup + 표준 라이브러리 파서 (의존성 없음, 가장 관대함)
+- "lxml": lxml.html + XPath (lxml이 설치된 경우에만)
+- "scan": 정규식 스캐너 (DOM을 만들지 않음, 가장 빠름)
+
+`configuration.HTML_PARSER_BACKEND`로 고르며, "auto"이면 import 시점에
+lxml 설치 여부를 확인해 lxml, 없으면 html.parser를 사용합니다.
+스트리밍 스캐너가 가격을 찾지 못했을 때의 전체 문서 파싱에 쓰이므로
+auto 선택은 DOM 기반 백엔드 중에서만 이루어집니다.
+"""
+
+import importlib.util
+import logging
+from typing import Callable, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+from .configuration import HTML_PARSER_BACKEND
+from .price_scanner import scan_price_text
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+PRICE_TAG_XPATH = '//strong[contains(@class, "DetailInfo_price")]'
+
+
+def is_lxml_available() -> bool:
+    """lxml이 설치되어 있는지 확인합니다."""
+    return importlib.util.find_spec("lxml") is not None
+
+
+def extract_price_text_with_html_parser(content: bytes) -> Optional[str]:
+    """BeautifulSoup(html.parser)로 가격 태그 텍스트를 찾습니다."""
+    soup = BeautifulSoup(content, "html.parser")
+
+    # Find element with class containing "DetailInfo_price"
+    price_tag = soup.find(
+        "strong",
+        class_=lambda class_name: class_name and "DetailInfo_price" in class_name,
+    )
+    return price_tag.get_text() if price_tag else None
+
+
+def extract_price_text_with_lxml(content: bytes) -> Optional[str]:
+    """lxml.html과 XPath로 가격 태그 텍스트를 찾습니다."""
+    import lxml.etree
+    import lxml.html
+
+    try:
+        document = lxml.html.document_fromstring(
+            content, parser=lxml.html.HTMLParser(encoding="utf-8")
+        )
+    except lxml.etree.ParserError:
+        # 빈 문서 등 파싱할 내용이 없는 경우
+        return None
+    price_tags = document.xpath(PRICE_TAG_XPATH)
+    return price_tags[0].text_content() if price_tags else None
+
+
+def extract_price_text_with_scan(content: bytes) -> Optional[str]:
+    """DOM을 만들지 않고 정규식 스캐너로 가격 태그 텍스트를 찾습니다."""
+    return scan_price_text(content)
+
+
+HTML_PARSER_BACKENDS: Dict[str, Callable[[bytes], Optional[str]]] = {
+    "html.parser": extract_price_text_with_html_parser,
+    "lxml": extract_price_text_with_lxml,
+    "scan": extract_price_text_with_scan,
+}
+
+
+def available_html_parser_backends() -> List[str]:
+    """현재 환경에서 사용할 수 있는 백엔드 이름 목록을 반환합니다."""
+    return [
+        backend_name
+        for backend_name in HTML_PARSER_BACKENDS
+        if backend_name != "lxml" or is_lxml_available()
+    ]
+
+
+def resolve_html_parser_backend(requested_backend: str = "auto") -> str:
+    """
+    설정값을 실제 사용할 백엔드 이름으로 바꿉니다.
+
+    Args:
+        requested_backend: "auto" 또는 HTML_PARSER_BACKENDS의 키
+
+    Returns:
+        사용할 백엔드 이름
+
+    Raises:
+        ValueError: 알 수 없는 백엔드 이름인 경우
+    """
+    if requested_backend == "auto":
+        return "lxml" if is_lxml_available() else "html.parser"
+
+    if requested_backend not in HTML_PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown HTML parser backend: {requested_backend!r}. "
+            f"Choose one of {sorted(HTML_PARSER_BACKENDS)} or 'auto'."
+        )
+
+    if requested_backend == "lxml" and not is_lxml_available():
+        logger.warning("lxml이 설치되어 있지 않아 html.parser 백엔드를 사용합니다.")
+        return "html.parser"
+
+    return requested_backend
+
+
+_active_html_parser_backend = resolve_html_parser_backend(HTML_PARSER_BACKEND)
+
+
+def get_html_parser_backend() -> str:
+    """현재 선택된 백엔드 이름을 반환합니다."""
+    return _active_html_parser_backend
+
+
+def set_html_parser_backend(requested_backend: str) -> str:
+    """
+    실행 중에 백엔드를 바꿉니다.
+
+    Returns:
+        실제로 선택된 백엔드 이름
+    """
+    global _active_html_parser_backend
+    _active_html_parser_backend = resolve_html_parser_backend(requested_backend)
+    logger.debug(f"HTML parser backend: {_active_html_parser_backend}")
+    return _active_html_parser_backend
+
+
+def extract_price_text(content: bytes, backend: Optional[str] = None) -> Optional[str]:
+    """
+    선택된(또는 지정한) 백엔드로 가격 태그 텍스트를 찾습니다.
+
+    Args:
+        content: HTML 본문
+        backend: 사용할 백엔드 이름 (None이면 현재 선택된 백엔드)
+
+    Returns:
+        가격 태그 텍스트, 없으면 None
+    """
+    backend_name = resolve_html_parser_backend(backend) if backend else _active_html_parser_backend
+    return HTML_PARSER_BACKENDS[backend_name](content)
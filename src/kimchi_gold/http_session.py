@@ -0,0 +1,166 @@
+"""
+네이버 금융 요청에 공유되는 HTTP 세션(keep-alive 커넥션 풀)을 관리하는 모듈입니다.
+
+국내 금, 국제 금, 환율 조회가 모두 같은 호스트(m.stock.naver.com)로 향하므로
+하나의 `requests.Session`을 프로세스 안에서 재사용하면 TCP/TLS 핸드셰이크를
+호출마다 반복하지 않아도 됩니다.
+
+세션의 연결은 TCP/TLS 연결에 걸린 시간을 기록하므로, `get_connect_seconds()`로
+응답 하나의 연결 단계 시간을 구할 수 있습니다 (재사용된 연결이면 0).
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 커넥션 풀 설정
+HTTP_POOL_CONNECTIONS = 4  # 캐시할 호스트별 풀 개수
+HTTP_POOL_MAXSIZE = 10  # 호스트당 유지할 keep-alive 연결 수
+
+
+class ConnectTimingHTTPConnection(HTTPConnection):
+    """연결(TCP)에 걸린 시간과 연결 완료 시각을 기록하는 연결"""
+
+    connected_at: Optional[float] = None
+    connect_seconds: Optional[float] = None
+
+    def connect(self):
+        connect_started = time.perf_counter()
+        super().connect()
+        self.connected_at = time.perf_counter()
+        self.connect_seconds = self.connected_at - connect_started
+
+
+class ConnectTimingHTTPSConnection(HTTPSConnection):
+    """연결(TCP + TLS 핸드셰이크)에 걸린 시간과 연결 완료 시각을 기록하는 연결"""
+
+    connected_at: Optional[float] = None
+    connect_seconds: Optional[float] = None
+
+    def connect(self):
+        connect_started = time.perf_counter()
+        super().connect()
+        self.connected_at = time.perf_counter()
+        self.connect_seconds = self.connected_at - connect_started
+
+
+class ConnectTimingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = ConnectTimingHTTPConnection
+
+
+class ConnectTimingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = ConnectTimingHTTPSConnection
+
+
+class ConnectTimingHTTPAdapter(HTTPAdapter):
+    """연결 시간을 기록하는 커넥션 풀을 사용하는 어댑터"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": ConnectTimingHTTPConnectionPool,
+            "https": ConnectTimingHTTPSConnectionPool,
+        }
+
+
+def get_connect_seconds(response, request_started: float) -> Optional[float]:
+    """
+    응답을 받은 연결의 연결 단계 시간을 반환합니다.
+
+    Args:
+        response: `stream=True`로 받아 아직 닫지 않은 requests.Response
+        request_started: 요청 직전의 `time.perf_counter()` 값
+
+    Returns:
+        이 요청에서 새로 연결했으면 연결 시간(초), 재사용한 연결이면 0.0,
+        연결 정보를 알 수 없으면 None
+    """
+    connection = getattr(getattr(response, "raw", None), "connection", None)
+    connected_at = getattr(connection, "connected_at", None)
+    if not isinstance(connected_at, float):
+        return None
+    if connected_at < request_started:
+        return 0.0
+    return connection.connect_seconds
+
+
+_shared_http_session: Optional[requests.Session] = None
+_shared_http_session_pid: Optional[int] = None
+_shared_http_session_lock = threading.Lock()
+
+
+def create_http_session(
+    pool_connections: int = HTTP_POOL_CONNECTIONS,
+    pool_maxsize: int = HTTP_POOL_MAXSIZE,
+) -> requests.Session:
+    """
+    keep-alive 커넥션 풀이 설정된 새 세션을 만듭니다.
+
+    Args:
+        pool_connections: 캐시할 호스트별 풀 개수
+        pool_maxsize: 호스트당 유지할 최대 연결 수
+
+    Returns:
+        HTTPS 어댑터가 마운트된 requests.Session
+    """
+    session = requests.Session()
+    # 재시도는 호출 측에서 명시적으로 다루므로 어댑터 수준 재시도는 끈다
+    https_adapter = ConnectTimingHTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=0,
+    )
+    session.mount("https://", https_adapter)
+    return session
+
+
+def get_shared_http_session() -> requests.Session:
+    """
+    프로세스 전체에서 공유되는 세션을 반환합니다 (스레드 안전).
+
+    fork 이후 자식 프로세스는 부모의 소켓을 공유하지 않도록 새 세션을 만듭니다.
+
+    Returns:
+        공유 requests.Session
+    """
+    global _shared_http_session, _shared_http_session_pid
+
+    current_pid = os.getpid()
+    session = _shared_http_session
+    if session is not None and _shared_http_session_pid == current_pid:
+        return session
+
+    with _shared_http_session_lock:
+        if _shared_http_session is None or _shared_http_session_pid != current_pid:
+            _shared_http_session = create_http_session()
+            _shared_http_session_pid = current_pid
+            logger.debug("Created shared HTTP session (pid=%d)", current_pid)
+        return _shared_http_session
+
+
+def close_shared_http_session() -> None:
+    """공유 세션의 풀에 남아 있는 연결을 모두 닫습니다."""
+    global _shared_http_session, _shared_http_session_pid
+
+    with _shared_http_session_lock:
+        if (
+            _shared_http_session is not None
+            and _shared_http_session_pid == os.getpid()
+        ):
+            _shared_http_session.close()
+        _shared_http_session = None
+        _shared_http_session_pid = None
+
+
+atexit.register(close_shared_http_session)
@@ -0,0 +1,208 @@
+"""
+수집할 수 있는 시세 종목(귀금속, 원화 환율) 레지스트리와 다중 종목 스냅샷 타입을 정의하는 모듈입니다.
+
+종목마다 URL과 함수를 따로 두지 않고 레지스트리에 등록해 두면,
+`price_fetcher.fetch_instrument_snapshot()` 한 번으로 원하는 종목들을 공유 커넥션 풀에서
+동시에 가져옵니다. 종목 키는 기존 소스 이름("domestic_gold" 등)과 같아서 서킷 브레이커,
+메트릭, 실패 정보가 같은 이름을 씁니다.
+
+국내 시세는 KRX 금만 있으므로 은/백금은 국제 시세의 원/g 환산값만 계산하고
+프리미엄은 None입니다.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from .configuration import (
+    NAVER_CNY_KRW_EXCHANGE_URL,
+    NAVER_DOMESTIC_GOLD_URL,
+    NAVER_EUR_KRW_EXCHANGE_URL,
+    NAVER_INTERNATIONAL_GOLD_URL,
+    NAVER_INTERNATIONAL_PLATINUM_URL,
+    NAVER_INTERNATIONAL_SILVER_URL,
+    NAVER_JPY_KRW_EXCHANGE_URL,
+    NAVER_USD_KRW_EXCHANGE_URL,
+)
+from .fetch_deadline import SourceFetchFailure
+
+INSTRUMENT_KIND_METAL = "metal"
+INSTRUMENT_KIND_CURRENCY = "currency"
+
+
+@dataclass(frozen=True)
+class MarketInstrument:
+    """
+    시세 종목 하나.
+
+    Attributes:
+        key: 종목 키 (소스 이름으로도 사용)
+        display_name: 표시 이름
+        url: 네이버 금융 market-index 페이지 URL
+        unit: 가격 단위
+        kind: INSTRUMENT_KIND_METAL 또는 INSTRUMENT_KIND_CURRENCY
+        quote_unit_amount: 환율 고시 단위 (JPY는 100엔당 원화)
+    """
+
+    key: str
+    display_name: str
+    url: str
+    unit: str
+    kind: str
+    quote_unit_amount: float = 1.0
+
+
+@dataclass(frozen=True)
+class MetalDefinition:
+    """
+    귀금속 하나를 구성하는 종목 키.
+
+    Attributes:
+        metal: 귀금속 이름 ("gold", "silver", "platinum")
+        international_key: 국제 시세 종목 키 (달러/온스)
+        domestic_key: 국내 시세 종목 키 (원/g, 없으면 프리미엄을 계산하지 않음)
+    """
+
+    metal: str
+    international_key: str
+    domestic_key: Optional[str] = None
+
+
+INSTRUMENT_REGISTRY: Dict[str, MarketInstrument] = {
+    instrument.key: instrument
+    for instrument in (
+        MarketInstrument("domestic_gold", "국내 금", NAVER_DOMESTIC_GOLD_URL, "원/g", INSTRUMENT_KIND_METAL),
+        MarketInstrument("international_gold", "국제 금", NAVER_INTERNATIONAL_GOLD_URL, "달러/온스", INSTRUMENT_KIND_METAL),
+        MarketInstrument("international_silver", "국제 은", NAVER_INTERNATIONAL_SILVER_URL, "달러/온스", INSTRUMENT_KIND_METAL),
+        MarketInstrument("international_platinum", "국제 백금", NAVER_INTERNATIONAL_PLATINUM_URL, "달러/온스", INSTRUMENT_KIND_METAL),
+        MarketInstrument("usd_krw", "USD/KRW", NAVER_USD_KRW_EXCHANGE_URL, "원", INSTRUMENT_KIND_CURRENCY),
+        MarketInstrument("jpy_krw", "JPY/KRW", NAVER_JPY_KRW_EXCHANGE_URL, "원", INSTRUMENT_KIND_CURRENCY, 100.0),
+        MarketInstrument("cny_krw", "CNY/KRW", NAVER_CNY_KRW_EXCHANGE_URL, "원", INSTRUMENT_KIND_CURRENCY),
+        MarketInstrument("eur_krw", "EUR/KRW", NAVER_EUR_KRW_EXCHANGE_URL, "원", INSTRUMENT_KIND_CURRENCY),
+    )
+}
+
+METAL_DEFINITIONS: Dict[str, MetalDefinition] = {
+    "gold": MetalDefinition("gold", "international_gold", "domestic_gold"),
+    "silver": MetalDefinition("silver", "international_silver"),
+    "platinum": MetalDefinition("platinum", "international_platinum"),
+}
+
+# 통화 코드 -> 원화 환율 종목 키 (KRW는 기준 통화)
+CURRENCY_INSTRUMENT_KEYS: Dict[str, str] = {
+    "USD": "usd_krw",
+    "JPY": "jpy_krw",
+    "CNY": "cny_krw",
+    "EUR": "eur_krw",
+}
+
+# 국제 귀금속 시세(달러)를 원화로 환산할 때 쓰는 환율 종목
+METAL_CONVERSION_RATE_KEY = CURRENCY_INSTRUMENT_KEYS["USD"]
+
+
+def resolve_instruments(names: Optional[Iterable[str]] = None) -> List[MarketInstrument]:
+    """
+    종목 키, 귀금속 이름, 통화 코드를 수집할 종목 목록으로 풉니다.
+    귀금속 이름은 국제/국내 시세와 원화 환산용 USD/KRW를 함께 포함합니다.
+
+    Args:
+        names: 예) ["gold", "silver", "JPY", "eur_krw"] (None이면 전체 종목)
+
+    Returns:
+        중복 없이 레지스트리 순서로 정렬된 종목 목록
+
+    Raises:
+        ValueError: 알 수 없는 이름인 경우
+    """
+    if names is None:
+        return list(INSTRUMENT_REGISTRY.values())
+
+    selected_keys = set()
+    for name in names:
+        if name in INSTRUMENT_REGISTRY:
+            selected_keys.add(name)
+        elif name in METAL_DEFINITIONS:
+            metal_definition = METAL_DEFINITIONS[name]
+            selected_keys.update({metal_definition.international_key, METAL_CONVERSION_RATE_KEY})
+            if metal_definition.domestic_key is not None:
+                selected_keys.add(metal_definition.domestic_key)
+        elif name.upper() in CURRENCY_INSTRUMENT_KEYS:
+            selected_keys.add(CURRENCY_INSTRUMENT_KEYS[name.upper()])
+        else:
+            raise ValueError(f"알 수 없는 종목입니다: {name}")
+    return [instrument for key, instrument in INSTRUMENT_REGISTRY.items() if key in selected_keys]
+
+
+@dataclass(frozen=True)
+class InstrumentQuote:
+    """종목 하나의 시세 (stale이면 서킷 브레이커의 마지막 성공 값)"""
+
+    instrument: MarketInstrument
+    price: float
+    stale: bool = False
+
+
+@dataclass(frozen=True)
+class MetalPremium:
+    """
+    귀금속 하나의 원/g 환산 가격과 프리미엄.
+
+    Attributes:
+        metal: 귀금속 이름
+        international_price: 국제 시세 (달러/온스)
+        international_krw_per_g: 국제 시세의 원/g 환산값
+        domestic_price: 국내 시세 (원/g, 국내 종목이 없으면 None)
+        premium_amount: 프리미엄 금액 (원/g, 국내 시세가 없으면 None)
+        premium_percent: 프리미엄 비율 (%, 국내 시세가 없으면 None)
+    """
+
+    metal: str
+    international_price: float
+    international_krw_per_g: float
+    domestic_price: Optional[float] = None
+    premium_amount: Optional[float] = None
+    premium_percent: Optional[float] = None
+
+
+@dataclass
+class InstrumentSnapshot:
+    """
+    한 번의 수집 주기에서 가져온 여러 종목의 시세.
+
+    일부 종목이 실패해도 나머지 시세는 `quotes`에 남고, 실패 정보는 `failures`에 담깁니다.
+    """
+
+    quotes: Dict[str, InstrumentQuote]
+    metal_premiums: Dict[str, MetalPremium] = field(default_factory=dict)
+    failures: List[SourceFetchFailure] = field(default_factory=list)
+    collected_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.failures
+
+    @property
+    def stale_keys(self) -> List[str]:
+        return [key for key, quote in self.quotes.items() if quote.stale]
+
+    def price(self, key: str) -> Optional[float]:
+        """종목 키의 시세 (수집하지 않았거나 실패했으면 None)"""
+        quote = self.quotes.get(key)
+        return quote.price if quote is not None else None
+
+    def krw_per_currency_unit(self, currency_code: str) -> Optional[float]:
+        """1 통화 단위당 원화 (예: JPY는 100엔당 고시 값을 1엔당으로 환산)"""
+        if currency_code.upper() == "KRW":
+            return 1.0
+        quote = self.quotes.get(CURRENCY_INSTRUMENT_KEYS.get(currency_code.upper(), ""))
+        if quote is None:
+            return None
+        return quote.price / quote.instrument.quote_unit_amount
+
+    def cross_rate(self, base_currency: str, quote_currency: str) -> Optional[float]:
+        """원화 환율로 계산한 교차 환율 (예: cross_rate("USD", "JPY")는 1달러당 엔)"""
+        base_krw = self.krw_per_currency_unit(base_currency)
+        quote_krw = self.krw_per_currency_unit(quote_currency)
+        if base_krw is None or quote_krw is None:
+            return None
+        return base_krw / quote_krw
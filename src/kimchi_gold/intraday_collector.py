@@ -0,0 +1,292 @@
+"""
+장중 시세를 계속 수집하는 데몬 모듈입니다.
+
+하루 한 번(cron) 수집으로는 장중 김치 프리미엄 급등을 볼 수 없으므로,
+하나의 asyncio 이벤트 루프에서 N초마다(지터 포함) 세 시세를 수집해
+`TickStore`에 틱으로 기록합니다. 날짜가 바뀌면 전날 틱에서 일별 CSV 행을 만듭니다.
+
+장시간 실행을 위해:
+- 이벤트 루프, 커넥션 풀, 틱 파일 디스크립터는 한 번만 만들어 계속 재사용합니다.
+- 틱은 메모리에 쌓지 않고 바로 파일에 기록하며, 요약은 파일을 순회해 계산합니다.
+
+실행: `collect_intraday --interval 60 --jitter 5`
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import random
+import signal
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional
+
+from .configuration import (
+    GOLD_PRICE_DATA_CSV_FILE,
+    INTRADAY_POLL_INTERVAL_SECONDS,
+    INTRADAY_POLL_JITTER_SECONDS,
+    MARKET_SNAPSHOT_DEADLINE_SECONDS,
+    PRICE_LOG_BACKEND,
+    PRICE_LOG_SQLITE_FILE,
+)
+from .data_collector import check_if_date_already_in_price_log, save_gold_price_data_to_price_log
+from .fetch_deadline import MarketDataCollectionError
+from .price_fetcher import fetch_current_gold_market_data_async
+from .quote_cache import set_shared_quote_cache
+from .tick_store import IntradayTick, TickStore
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def write_daily_row_from_ticks(
+    tick_store: TickStore,
+    trading_day: date,
+    csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE,
+    price_log_backend: str = PRICE_LOG_BACKEND,
+    database_path: Path = PRICE_LOG_SQLITE_FILE,
+) -> bool:
+    """
+    하루치 틱의 마지막 값으로 일별 행을 가격 로그(CSV, 설정에 따라 SQLite에도)에 기록합니다.
+    이미 그 날짜 행이 있으면(예: cron 수집) 기록하지 않습니다.
+
+    Returns:
+        행을 새로 기록했으면 True
+    """
+    trading_day_start = datetime.combine(trading_day, datetime.min.time())
+    if check_if_date_already_in_price_log(trading_day_start, price_log_backend, csv_file_path, database_path):
+        logger.info(f"{trading_day} 데이터가 이미 존재합니다. 일별 행 기록을 스킵합니다.")
+        return False
+
+    tick_summary = tick_store.summarize_day(trading_day)
+    if tick_summary is None:
+        logger.info(f"{trading_day} 틱이 없어 일별 행을 기록하지 않습니다.")
+        return False
+
+    if not save_gold_price_data_to_price_log(
+        tick_summary.to_daily_gold_price_data(),
+        price_log_backend,
+        csv_file_path,
+        database_path,
+        skip_if_date_already_logged=True,
+    ):
+        logger.info(f"{trading_day} 데이터를 다른 수집기가 먼저 기록했습니다.")
+        return False
+    logger.info(
+        f"{trading_day} 일별 행 기록: 틱 {tick_summary.tick_count}개, 김치 프리미엄 "
+        f"시가 {tick_summary.premium_percent_open:.2f}% / 고가 {tick_summary.premium_percent_high:.2f}% / "
+        f"저가 {tick_summary.premium_percent_low:.2f}% / 종가 {tick_summary.premium_percent_close:.2f}%"
+    )
+    return True
+
+
+class IntradayCollector:
+    """
+    고정 주기 + 지터로 스냅샷을 수집해 틱으로 기록하는 수집기.
+
+    다음 수집 시각은 이전 예정 시각에 주기를 더해 정하므로 수집 시간이 주기를
+    조금 넘겨도 일정이 밀리지 않고, 크게 넘기면 놓친 회차는 건너뜁니다.
+    지터는 매 회차에 [0, jitter_seconds] 만큼 더해져 여러 수집기가 같은 순간에
+    요청을 보내지 않게 합니다.
+    """
+
+    def __init__(
+        self,
+        poll_interval_seconds: float = INTRADAY_POLL_INTERVAL_SECONDS,
+        jitter_seconds: float = INTRADAY_POLL_JITTER_SECONDS,
+        tick_store: Optional[TickStore] = None,
+        daily_csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE,
+        write_daily_rows: bool = True,
+    ):
+        if poll_interval_seconds <= 0:
+            raise ValueError("poll_interval_seconds must be positive.")
+        self.poll_interval_seconds = poll_interval_seconds
+        self.jitter_seconds = max(0.0, jitter_seconds)
+        self.tick_store = tick_store if tick_store is not None else TickStore()
+        self.daily_csv_file_path = daily_csv_file_path
+        self.write_daily_rows = write_daily_rows
+        self.tick_count = 0
+        self.failure_count = 0
+        self.skipped_poll_count = 0
+        self.last_tick: Optional[IntradayTick] = None
+        self._current_day: Optional[date] = None
+
+    async def collect_tick(self) -> Optional[IntradayTick]:
+        """
+        스냅샷 하나를 수집해 틱으로 기록합니다.
+        수집이나 기록 실패는 로그만 남기고 None을 반환합니다 (데몬은 계속 실행).
+        공유 시세 캐시를 끄는 것은 `run()`이 하므로 직접 부를 때는 캐시가 없는 상태에서 부릅니다.
+        """
+        try:
+            gold_market_data = await fetch_current_gold_market_data_async(
+                deadline_seconds=min(MARKET_SNAPSHOT_DEADLINE_SECONDS, self.poll_interval_seconds)
+            )
+        except MarketDataCollectionError as collection_error:
+            self.failure_count += 1
+            logger.warning(f"틱 수집 실패: {collection_error.describe_failures()}")
+            return None
+
+        if gold_market_data.is_stale:
+            # 마지막 성공 값으로 대체된 시세는 장중 틱으로 의미가 없다
+            logger.info(f"오래된 시세가 포함되어 틱을 기록하지 않습니다: {gold_market_data.stale_sources}")
+            return None
+
+        tick = IntradayTick.from_gold_price_data(gold_market_data)
+        if self._current_day is not None and tick.trading_day != self._current_day:
+            self.finalize_day(self._current_day)
+        self._current_day = tick.trading_day
+
+        try:
+            self.tick_store.append(tick)
+        except (OSError, sqlite3.Error) as tick_write_error:
+            # 디스크가 가득 차는 등 일시적인 쓰기 실패로 며칠씩 돌아야 하는 데몬이 멈추지 않게 함
+            self.failure_count += 1
+            logger.error(f"틱 기록 실패: {tick_write_error}")
+            return None
+        self.tick_count += 1
+        self.last_tick = tick
+        logger.debug(f"틱 기록: 김치 프리미엄 {tick.kimchi_premium_percent:.2f}%")
+        return tick
+
+    def finalize_day(self, trading_day: date) -> bool:
+        """지난 날짜의 틱으로 일별 CSV 행을 기록합니다."""
+        if not self.write_daily_rows:
+            return False
+        try:
+            return write_daily_row_from_ticks(
+                self.tick_store, trading_day, self.daily_csv_file_path
+            )
+        except (OSError, ValueError, sqlite3.Error) as daily_row_error:
+            logger.error(f"{trading_day} 일별 행 기록 실패: {daily_row_error}")
+            return False
+
+    def finalize_previous_days(self, today: Optional[date] = None) -> List[date]:
+        """
+        재시작 전에 기록되지 않은 지난 날짜의 일별 행을 채웁니다.
+
+        Returns:
+            새로 기록한 날짜 목록
+        """
+        today = today or date.today()
+        return [
+            trading_day
+            for trading_day in self.tick_store.recorded_days()
+            if trading_day < today and self.finalize_day(trading_day)
+        ]
+
+    async def run(
+        self,
+        stop_event: Optional[asyncio.Event] = None,
+        max_ticks: Optional[int] = None,
+    ) -> None:
+        """
+        `stop_event`가 설정되거나 `max_ticks`번 수집할 때까지 수집합니다.
+
+        Args:
+            stop_event: 설정되면 다음 회차를 기다리지 않고 종료
+            max_ticks: 수집 회차 수 제한 (테스트/일회성 실행용, 실패한 회차 포함)
+        """
+        stop_event = stop_event or asyncio.Event()
+        event_loop = asyncio.get_running_loop()
+        if self.write_daily_rows:
+            self.finalize_previous_days()
+
+        logger.info(
+            f"장중 수집 시작: {self.poll_interval_seconds}s 주기, 지터 최대 {self.jitter_seconds}s"
+        )
+        poll_count = 0
+        next_poll_due = event_loop.time()
+        # 매 회차 새 시세가 필요하므로 TTL 캐시는 끈다 (켜 두면 직전 회차 값을 현재 시각의 틱으로 기록)
+        previous_quote_cache = set_shared_quote_cache(None)
+        try:
+            while not stop_event.is_set():
+                await self.collect_tick()
+                poll_count += 1
+                if max_ticks is not None and poll_count >= max_ticks:
+                    break
+
+                next_poll_due += self.poll_interval_seconds
+                now = event_loop.time()
+                if next_poll_due < now:
+                    missed_polls = math.ceil((now - next_poll_due) / self.poll_interval_seconds)
+                    self.skipped_poll_count += missed_polls
+                    next_poll_due += missed_polls * self.poll_interval_seconds
+                    logger.warning(f"수집이 주기보다 오래 걸려 {missed_polls}회를 건너뜁니다.")
+
+                delay_seconds = next_poll_due - now + random.uniform(0, self.jitter_seconds)
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=delay_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            set_shared_quote_cache(previous_quote_cache)
+            self.tick_store.close()
+            logger.info(
+                f"장중 수집 종료: 틱 {self.tick_count}개, 실패 {self.failure_count}회"
+            )
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="장중 금 시세를 계속 수집해 틱으로 기록합니다.")
+    parser.add_argument(
+        "--interval", type=float, default=INTRADAY_POLL_INTERVAL_SECONDS,
+        help="수집 주기 (초)",
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=INTRADAY_POLL_JITTER_SECONDS,
+        help="매 회차에 더하는 최대 지터 (초)",
+    )
+    parser.add_argument(
+        "--max-ticks", type=int, default=None,
+        help="수집 회차 수 제한 (지정하지 않으면 종료 신호까지 실행)",
+    )
+    parser.add_argument(
+        "--finalize-day", type=date.fromisoformat, default=None, metavar="YYYY-MM-DD",
+        help="수집하지 않고 해당 날짜의 틱으로 일별 CSV 행만 기록",
+    )
+    return parser
+
+
+async def run_until_signalled(collector: IntradayCollector, max_ticks: Optional[int]) -> None:
+    """SIGINT/SIGTERM을 받으면 현재 회차를 마치고 종료합니다."""
+    stop_event = asyncio.Event()
+    event_loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        try:
+            event_loop.add_signal_handler(signal_number, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            # Windows 등 시그널 핸들러를 지원하지 않는 환경
+            pass
+    await collector.run(stop_event, max_ticks)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    메인 실행 함수
+    """
+    # 로깅 설정
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    arguments = build_argument_parser().parse_args(argv)
+
+    try:
+        if arguments.finalize_day is not None:
+            with TickStore() as tick_store:
+                write_daily_row_from_ticks(tick_store, arguments.finalize_day)
+            return 0
+
+        collector = IntradayCollector(arguments.interval, arguments.jitter)
+        asyncio.run(run_until_signalled(collector, arguments.max_ticks))
+        return 0
+    except Exception as main_execution_error:
+        logger.error(f"예기치 못한 오류 발생: {main_execution_error}")
+        print("예기치 못한 오류 발생: 시스템 로그를 확인해주세요.")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
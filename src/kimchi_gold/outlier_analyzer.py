@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Optional
 
 from .configuration import GOLD_PRICE_DATA_CSV_FILE
+from .price_history import load_price_history_since
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -58,18 +59,17 @@ def filter_dataframe_by_recent_dates(
     if source_dataframe.empty:
         return source_dataframe
 
-    processed_dataframe = source_dataframe.copy()
-
-    # The date column should already be datetime type from pd.read_csv(parse_dates=...)
+    # 날짜 컬럼은 load_price_history()에서 이미 datetime64로 읽은 값
 
     # 기준 날짜 계산
-    current_date = datetime.now().date()
+    current_date = pd.Timestamp(datetime.now().date())
     cutoff_date = current_date - timedelta(days=days_to_look_back)
 
     # 날짜 필터링
-    filtered_dataframe = processed_dataframe[
-        (processed_dataframe[date_column_name].dt.date >= cutoff_date)
-        & (processed_dataframe[date_column_name].dt.date <= current_date)
+    # Bolt Optimization: .dt.date 객체 변환 대신 datetime64 그대로 비교
+    date_values = source_dataframe[date_column_name]
+    filtered_dataframe = source_dataframe[
+        (date_values >= cutoff_date) & (date_values < current_date + timedelta(days=1))
     ].copy()
 
     logger.debug(
@@ -187,7 +187,9 @@ def perform_kimchi_premium_outlier_analysis(
             logger.error(f"데이터 파일이 없습니다: {data_csv_file_path}")
             return None
 
-        historical_data_dataframe = pd.read_csv(data_csv_file_path, parse_dates=['날짜'])
+        # Bolt Optimization: 분석 기간이 시작하는 달부터만 읽음 (월별 위치 색인)
+        analysis_start_date = datetime.now().date() - timedelta(days=historical_analysis_days)
+        historical_data_dataframe = load_price_history_since(data_csv_file_path, analysis_start_date).reset_index()
         logger.debug(f"데이터 로드 완료: {len(historical_data_dataframe)} 행")
 
         # 이상치 분석 수행
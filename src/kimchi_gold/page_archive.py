@@ -0,0 +1,194 @@
+"""
+수집한 시세 페이지 원본 HTML을 압축해 내용 주소(content-addressed)로 보관하는 모듈입니다.
+
+기록 모드에서는 요청마다 받은 본문 전체를 SHA-256 해시를 이름으로 gzip 압축해 저장하고,
+(수집 시각, URL, 해시, 파싱한 가격)을 색인에 한 줄씩 추가합니다. 같은 페이지는 한 번만
+저장되므로 오래 도는 수집기에서도 디스크 사용량은 서로 다른 페이지 수에만 비례합니다.
+
+보관한 페이지는 `page_replay` 모듈이 네트워크 없이 파싱 파이프라인으로 다시 흘려보내
+(CI, 프로파일링) 마크업이 바뀌었을 때 과거 페이지를 다시 파싱하는 데 사용합니다.
+
+디렉토리 구성:
+    <보관 디렉토리>/objects/ab/cdef....html.gz  (해시 앞 2자리로 하위 디렉토리 분산)
+    <보관 디렉토리>/index.jsonl                 (수집 기록, 추가 전용)
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from .configuration import PAGE_ARCHIVE_DIRECTORY, PAGE_ARCHIVE_ENABLED
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+PAGE_ARCHIVE_INDEX_FILE_NAME = "index.jsonl"
+PAGE_ARCHIVE_OBJECTS_DIRECTORY_NAME = "objects"
+PAGE_ARCHIVE_OBJECT_SUFFIX = ".html.gz"
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    """
+    색인의 수집 기록 하나.
+
+    Attributes:
+        fetched_at: 수집 시각 (epoch 초)
+        url: 요청 URL
+        digest: 본문 SHA-256 (16진수)
+        size: 압축 전 본문 크기 (바이트)
+        price: 수집 당시 파싱한 가격
+    """
+
+    fetched_at: float
+    url: str
+    digest: str
+    size: int
+    price: Optional[float] = None
+
+
+class PageArchive:
+    """
+    내용 주소 방식의 페이지 보관소 (스레드 안전).
+
+    본문 파일은 임시 파일에 쓴 뒤 `os.replace`로 옮기므로 반쯤 쓴 파일이 보이지 않고,
+    색인 한 줄은 `O_APPEND`로 한 번에 추가하므로 여러 프로세스가 함께 기록해도 섞이지 않습니다.
+    """
+
+    def __init__(self, directory: Path = PAGE_ARCHIVE_DIRECTORY, compression_level: int = 6):
+        self.directory = Path(directory)
+        self.compression_level = compression_level
+        self._index_lock = threading.Lock()
+
+    @property
+    def index_path(self) -> Path:
+        return self.directory / PAGE_ARCHIVE_INDEX_FILE_NAME
+
+    def object_path(self, digest: str) -> Path:
+        return (
+            self.directory
+            / PAGE_ARCHIVE_OBJECTS_DIRECTORY_NAME
+            / digest[:2]
+            / f"{digest[2:]}{PAGE_ARCHIVE_OBJECT_SUFFIX}"
+        )
+
+    def store_page(self, content: bytes) -> str:
+        """
+        본문을 저장하고 해시를 반환합니다. 이미 있는 본문은 다시 쓰지 않습니다.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self.object_path(digest)
+        if object_path.exists():
+            return digest
+
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        # mtime=0으로 압축 결과를 내용에만 의존하게 만든다
+        compressed_content = gzip.compress(content, self.compression_level, mtime=0)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=object_path.parent, prefix=".page.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(compressed_content)
+            os.replace(temporary_path, object_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+        return digest
+
+    def record(
+        self,
+        url: str,
+        content: bytes,
+        price: Optional[float] = None,
+        fetched_at: Optional[float] = None,
+    ) -> ArchivedPage:
+        """본문을 저장하고 수집 기록을 색인에 추가합니다."""
+        archived_page = ArchivedPage(
+            fetched_at=time.time() if fetched_at is None else fetched_at,
+            url=url,
+            digest=self.store_page(content),
+            size=len(content),
+            price=price,
+        )
+        index_line = (json.dumps(asdict(archived_page), ensure_ascii=False) + "\n").encode("utf-8")
+        with self._index_lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            index_descriptor = os.open(
+                self.index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+            try:
+                os.write(index_descriptor, index_line)
+            finally:
+                os.close(index_descriptor)
+        return archived_page
+
+    def iter_records(self, url: Optional[str] = None) -> Iterator[ArchivedPage]:
+        """색인을 기록 순서대로 읽습니다 (기록 도중 잘린 줄은 건너뜀)."""
+        try:
+            index_file = self.index_path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with index_file:
+            for index_line in index_file:
+                try:
+                    archived_page = ArchivedPage(**json.loads(index_line))
+                except (ValueError, TypeError):
+                    logger.warning(f"손상된 보관 색인 줄을 건너뜁니다: {index_line[:80]!r}")
+                    continue
+                if url is None or archived_page.url == url:
+                    yield archived_page
+
+    def latest_records(self) -> Dict[str, ArchivedPage]:
+        """URL별 가장 최근 수집 기록"""
+        latest_pages: Dict[str, ArchivedPage] = {}
+        for archived_page in self.iter_records():
+            latest_pages[archived_page.url] = archived_page
+        return latest_pages
+
+    def load_page(self, digest: str) -> bytes:
+        """
+        저장된 본문을 읽습니다.
+
+        Raises:
+            FileNotFoundError: 본문이 없는 경우
+            ValueError: 본문이 손상되어 해시가 맞지 않는 경우
+        """
+        content = gzip.decompress(self.object_path(digest).read_bytes())
+        if hashlib.sha256(content).hexdigest() != digest:
+            raise ValueError(f"보관된 페이지가 손상되었습니다: {digest}")
+        return content
+
+    def object_count(self) -> int:
+        objects_directory = self.directory / PAGE_ARCHIVE_OBJECTS_DIRECTORY_NAME
+        if not objects_directory.exists():
+            return 0
+        return sum(1 for _ in objects_directory.glob(f"*/*{PAGE_ARCHIVE_OBJECT_SUFFIX}"))
+
+
+_shared_page_archive: Optional[PageArchive] = PageArchive() if PAGE_ARCHIVE_ENABLED else None
+
+
+def get_shared_page_archive() -> Optional[PageArchive]:
+    """fetch_* 함수가 받은 페이지를 기록할 보관소 (기록 모드가 아니면 None)"""
+    return _shared_page_archive
+
+
+def set_shared_page_archive(page_archive: Optional[PageArchive]) -> Optional[PageArchive]:
+    """
+    기록할 보관소를 교체합니다 (None이면 기록 끔).
+
+    Returns:
+        이전 보관소
+    """
+    global _shared_page_archive
+    previous_page_archive, _shared_page_archive = _shared_page_archive, page_archive
+    return previous_page_archive
@@ -0,0 +1,210 @@
+"""
+보관한 원본 페이지를 네트워크 없이 파싱 파이프라인으로 다시 흘려보내는 모듈입니다.
+
+- 재생(replay): 공유 HTTP 세션에 보관소를 읽는 어댑터를 마운트하면 `fetch_*` 함수가
+  실제 요청 대신 보관된 페이지를 받습니다. 응답 검증, 스트리밍 스캐너, DOM 파서까지
+  실시간 수집과 같은 경로를 타므로 CI나 프로파일링에서 네트워크 없이 재현할 수 있습니다.
+- 재파싱(reparse): 네이버 마크업이 바뀌어 파서를 고친 뒤 과거 페이지 전체를 다시 파싱하여
+  수집 당시 기록한 가격과 달라진 페이지를 찾습니다.
+
+재생은 requests 세션을 쓰는 동기 경로만 지원합니다 (`*_async` 함수는 자체 소켓 풀 사용).
+
+사용법:
+    uv run python -m kimchi_gold.page_replay replay
+    uv run python -m kimchi_gold.page_replay reparse
+    uv run python -m kimchi_gold.page_replay stats
+"""
+
+import argparse
+import io
+import logging
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from .configuration import PAGE_ARCHIVE_DIRECTORY
+from .http_session import close_shared_http_session, get_shared_http_session
+from .page_archive import ArchivedPage, PageArchive
+from .price_fetcher import (
+    fetch_current_gold_market_data,
+    parse_price_from_page_content,
+    print_formatted_gold_price,
+)
+from .quote_cache import set_shared_quote_cache
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+REPLAY_CONTENT_TYPE = "text/html; charset=utf-8"
+
+
+class PageArchiveReplayAdapter(BaseAdapter):
+    """
+    요청 URL에 해당하는 보관 페이지를 응답으로 돌려주는 requests 어댑터.
+
+    기본적으로 URL별 가장 최근 페이지를 돌려주고, `sequential=True`면 기록된 순서대로
+    한 장씩 돌려준 뒤 마지막 페이지를 반복합니다 (기록한 수집 세션을 그대로 재현).
+    보관되지 않은 URL은 404로 응답합니다.
+    """
+
+    def __init__(self, page_archive: PageArchive, sequential: bool = False):
+        super().__init__()
+        self.page_archive = page_archive
+        self.sequential = sequential
+        self._records_by_url: Dict[str, List[ArchivedPage]] = {}
+        for archived_page in page_archive.iter_records():
+            self._records_by_url.setdefault(archived_page.url, []).append(archived_page)
+        self._next_positions: Dict[str, int] = {}
+        self._position_lock = threading.Lock()
+        self._response_builder = HTTPAdapter()
+        self.replayed_count = 0
+
+    def select_record(self, url: str) -> Optional[ArchivedPage]:
+        archived_pages = self._records_by_url.get(url)
+        if not archived_pages:
+            return None
+        if not self.sequential:
+            return archived_pages[-1]
+        with self._position_lock:
+            position = self._next_positions.get(url, 0)
+            self._next_positions[url] = position + 1
+        return archived_pages[min(position, len(archived_pages) - 1)]
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        archived_page = self.select_record(request.url)
+        if archived_page is None:
+            logger.warning(f"보관된 페이지가 없습니다: {request.url}")
+            raw_response = HTTPResponse(
+                body=io.BytesIO(b""), status=404, reason="Not Found", preload_content=False
+            )
+        else:
+            content = self.page_archive.load_page(archived_page.digest)
+            raw_response = HTTPResponse(
+                body=io.BytesIO(content),
+                headers={"Content-Type": REPLAY_CONTENT_TYPE, "Content-Length": str(len(content))},
+                status=200,
+                reason="OK",
+                preload_content=False,
+            )
+            with self._position_lock:
+                self.replayed_count += 1
+        return self._response_builder.build_response(request, raw_response)
+
+    def close(self):
+        self._response_builder.close()
+
+
+def install_replay(
+    session: requests.Session, page_archive: PageArchive, sequential: bool = False
+) -> PageArchiveReplayAdapter:
+    """세션의 HTTP(S) 요청이 보관소에서 응답을 받도록 어댑터를 마운트합니다."""
+    replay_adapter = PageArchiveReplayAdapter(page_archive, sequential=sequential)
+    session.mount("https://", replay_adapter)
+    session.mount("http://", replay_adapter)
+    return replay_adapter
+
+
+@dataclass
+class ReparseReport:
+    """
+    재파싱 결과.
+
+    Attributes:
+        page_count: 다시 파싱한 수집 기록 수
+        changed_pages: 수집 당시와 가격이 달라진 기록과 새 가격
+        failed_pages: 더 이상 파싱되지 않는 기록과 오류 메시지
+    """
+
+    page_count: int = 0
+    changed_pages: List[tuple] = field(default_factory=list)
+    failed_pages: List[tuple] = field(default_factory=list)
+
+
+def reparse_archived_pages(page_archive: PageArchive, url: Optional[str] = None) -> ReparseReport:
+    """
+    보관된 페이지를 현재 파서로 다시 파싱하여 수집 당시 가격과 비교합니다.
+    같은 본문은 한 번만 파싱합니다.
+    """
+    report = ReparseReport()
+    prices_by_digest: Dict[str, object] = {}
+    for archived_page in page_archive.iter_records(url):
+        report.page_count += 1
+        if archived_page.digest not in prices_by_digest:
+            try:
+                content = page_archive.load_page(archived_page.digest)
+                prices_by_digest[archived_page.digest] = parse_price_from_page_content(
+                    content, archived_page.url, f"보관 페이지 가격 파싱 실패 ({archived_page.digest[:12]})"
+                )
+            except (OSError, ValueError) as parse_error:
+                prices_by_digest[archived_page.digest] = parse_error
+        reparsed_price = prices_by_digest[archived_page.digest]
+        if isinstance(reparsed_price, Exception):
+            report.failed_pages.append((archived_page, str(reparsed_price)))
+        elif archived_page.price is not None and reparsed_price != archived_page.price:
+            report.changed_pages.append((archived_page, reparsed_price))
+    return report
+
+
+def replay_latest_snapshot(page_archive: PageArchive):
+    """보관된 최신 페이지로 현재 시세 스냅샷을 오프라인으로 계산합니다."""
+    # 캐시가 있으면 보관소를 거치지 않으므로 끄고, 새 세션에 어댑터를 마운트
+    previous_quote_cache = set_shared_quote_cache(None)
+    close_shared_http_session()
+    install_replay(get_shared_http_session(), page_archive)
+    try:
+        return fetch_current_gold_market_data()
+    finally:
+        close_shared_http_session()
+        set_shared_quote_cache(previous_quote_cache)
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="보관한 원본 페이지 재생/재파싱")
+    parser.add_argument(
+        "--archive", type=Path, default=PAGE_ARCHIVE_DIRECTORY, help="보관 디렉토리"
+    )
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    subcommands.add_parser("replay", help="보관된 최신 페이지로 시세 스냅샷 계산 (네트워크 없음)")
+    reparse_parser = subcommands.add_parser("reparse", help="보관된 페이지 전체를 현재 파서로 다시 파싱")
+    reparse_parser.add_argument("--url", default=None, help="이 URL의 기록만 다시 파싱")
+    subcommands.add_parser("stats", help="보관소 통계")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = build_argument_parser().parse_args(argv)
+    page_archive = PageArchive(arguments.archive)
+
+    if arguments.command == "replay":
+        try:
+            print_formatted_gold_price(replay_latest_snapshot(page_archive))
+        except Exception as replay_error:
+            logger.error(f"재생 실패: {replay_error}")
+            return 1
+        return 0
+
+    if arguments.command == "reparse":
+        report = reparse_archived_pages(page_archive, arguments.url)
+        print(f"재파싱한 기록: {report.page_count}건")
+        for archived_page, reparsed_price in report.changed_pages:
+            print(f"  [변경] {archived_page.url} {archived_page.price} -> {reparsed_price} ({archived_page.digest[:12]})")
+        for archived_page, error_message in report.failed_pages:
+            print(f"  [실패] {archived_page.url} ({archived_page.digest[:12]}): {error_message}")
+        return 1 if report.failed_pages else 0
+
+    records = list(page_archive.iter_records())
+    print(f"수집 기록: {len(records)}건, URL: {len({record.url for record in records})}개")
+    print(f"저장된 페이지: {page_archive.object_count()}개 (중복 제거 후)")
+    print(f"원본 크기 합계: {sum(record.size for record in records):,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    sys.exit(main())
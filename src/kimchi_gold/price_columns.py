@@ -0,0 +1,331 @@
+"""
+가격 로그를 열(column)별 바이너리 파일로 저장하고 메모리 매핑으로 읽는 모듈입니다.
+
+CSV는 읽을 때마다 전체를 파싱해야 하지만, 열마다 고정 크기 값만 이어 붙인 파일은
+`np.memmap`으로 열면 파싱도 복사도 없이 바로 배열로 쓸 수 있습니다.
+
+저장소 구성: `<로그 디렉토리>/.<로그 이름>.columns/`
+    date.int64                 1970-01-01부터의 일 수 (datetime64[D]와 같은 표현)
+    domestic_price.float64     국내 금 가격 (원/g)
+    international_price.float64, usd_krw_rate.float64,
+    kimchi_premium_amount.float64, kimchi_premium_percent.float64
+    meta.json                  행 수와 동기화한 시점의 CSV inode, 크기, 끝부분 바이트
+
+열 파일은 추가 전용이며 행 순서는 CSV와 같습니다. 읽는 쪽은 meta.json의 행 수까지만
+매핑하므로 추가 도중에 늘어난 꼬리는 보이지 않고, 다음 추가 때 잘라 냅니다.
+CSV에 줄이 추가되기만 했으면 늘어난 부분만 파싱해 이어 붙이고, 그 밖의 변경
+(백필 병합, 수동 편집)이면 전체를 다시 만듭니다.
+
+`read_price_log_arrays()`는 열 저장소 없이 CSV를 메모리 매핑해 조각마다 `np.loadtxt`의
+C 파서로 바로 float64/datetime64 배열에 채웁니다 (중간 DataFrame 없음).
+"""
+
+import csv
+import io
+import json
+import logging
+import mmap
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .configuration import CSV_COLUMN_HEADERS
+from .price_log_lookup import DATE_FIELD_LENGTH, INDEX_TAIL_CHECK_BYTES, apply_log_file_mode
+from .price_storage import PRICE_VALUE_COLUMNS
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DATE_COLUMN_DTYPE = np.dtype("<i8")
+VALUE_COLUMN_DTYPE = np.dtype("<f8")
+COLUMN_FILE_SUFFIXES = {DATE_COLUMN_DTYPE: ".int64", VALUE_COLUMN_DTYPE: ".float64"}
+PRICE_COLUMN_DTYPES = {"date": DATE_COLUMN_DTYPE, **{column: VALUE_COLUMN_DTYPE for column in PRICE_VALUE_COLUMNS}}
+# np.loadtxt가 한 행을 읽는 형식 (날짜는 앞 10바이트만 남겨 "YYYY-MM-DD HH:MM:SS"도 날짜로 읽음)
+PRICE_LOG_ROW_DTYPE = np.dtype(
+    [("date", f"S{DATE_FIELD_LENGTH}"), *((column, VALUE_COLUMN_DTYPE) for column in PRICE_VALUE_COLUMNS)]
+)
+FAST_PARSE_CHUNK_BYTES = 16 * 1024 * 1024  # read_price_log_arrays()가 한 번에 파싱하는 크기
+
+
+class PriceColumns(NamedTuple):
+    """열별 가격 배열 (저장소에서 읽으면 읽기 전용 메모리 매핑)"""
+
+    dates: np.ndarray  # datetime64[D]
+    domestic_price: np.ndarray
+    international_price: np.ndarray
+    usd_krw_rate: np.ndarray
+    kimchi_premium_amount: np.ndarray
+    kimchi_premium_percent: np.ndarray
+
+    @property
+    def row_count(self) -> int:
+        return len(self.dates)
+
+    def sorted_by_date(self) -> "PriceColumns":
+        """날짜순으로 정렬한 열 (이미 정렬돼 있으면 그대로, 같은 날짜끼리는 기록 순서 유지)"""
+        if self.row_count < 2 or bool(np.all(self.dates[1:] >= self.dates[:-1])):
+            return self
+        date_order = np.argsort(self.dates, kind="stable")
+        return PriceColumns(*(column[date_order] for column in self))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """`pd.read_csv(..., parse_dates=["날짜"])`와 같은 열 이름의 DataFrame"""
+        return pd.DataFrame(
+            {
+                CSV_COLUMN_HEADERS[0]: self.dates.astype("datetime64[ns]"),
+                **{header: column for header, column in zip(CSV_COLUMN_HEADERS[1:], self[1:])},
+            }
+        )
+
+
+def parse_price_log_rows(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    CSV 데이터 행 텍스트를 (일 수 int64 배열, (행 수, 5) float64 배열)로 파싱합니다.
+    열이 모자라거나 숫자가 아닌 행은 경고 후 건너뜁니다.
+    """
+    date_strings: List[str] = []
+    value_rows: List[List[float]] = []
+    for data_row in csv.reader(io.StringIO(text)):
+        if not data_row:
+            continue
+        try:
+            if len(data_row) < len(CSV_COLUMN_HEADERS):
+                raise ValueError(f"열 수 부족: {data_row!r}")
+            value_rows.append([float(value) for value in data_row[1:6]])
+        except ValueError as row_error:
+            logger.warning(f"가격 로그 행을 건너뜁니다: {row_error}")
+            continue
+        date_strings.append(data_row[0].strip()[:DATE_FIELD_LENGTH])
+    # Bolt Optimization: 날짜 문자열은 행마다 파싱하지 않고 numpy로 한 번에 변환
+    day_numbers = np.array(date_strings, dtype="datetime64[D]").astype(DATE_COLUMN_DTYPE)
+    values = np.array(value_rows, dtype=VALUE_COLUMN_DTYPE).reshape(-1, len(PRICE_VALUE_COLUMNS))
+    return day_numbers, values
+
+
+def parse_price_log_bytes(data: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    CSV 데이터 행 바이트를 `parse_price_log_rows()`와 같은 형식의 배열로 파싱합니다.
+
+    Bolt Optimization: 행마다 csv.reader와 float()를 거치지 않고 np.loadtxt의 C 파서로 한 번에
+    읽습니다. 형식이 어긋난 행이 있으면 그 조각만 행 단위 파서로 다시 읽어 건너뜁니다.
+    """
+    if not data.strip():
+        return np.empty(0, dtype=DATE_COLUMN_DTYPE), np.empty((0, len(PRICE_VALUE_COLUMNS)), dtype=VALUE_COLUMN_DTYPE)
+    try:
+        parsed_rows = np.loadtxt(
+            io.BytesIO(data),
+            delimiter=",",
+            dtype=PRICE_LOG_ROW_DTYPE,
+            usecols=range(len(CSV_COLUMN_HEADERS)),
+            comments=None,
+            ndmin=1,
+        )
+        day_numbers = parsed_rows["date"].astype("datetime64[D]").astype(DATE_COLUMN_DTYPE)
+    except ValueError:
+        return parse_price_log_rows(data.decode("utf-8"))
+    values = np.empty((len(parsed_rows), len(PRICE_VALUE_COLUMNS)), dtype=VALUE_COLUMN_DTYPE)
+    for column_index, column_name in enumerate(PRICE_VALUE_COLUMNS):
+        values[:, column_index] = parsed_rows[column_name]
+    return day_numbers, values
+
+
+def read_price_log_arrays(
+    csv_file_path: Path,
+    chunk_bytes: int = FAST_PARSE_CHUNK_BYTES,
+    start_offset: Optional[int] = None,
+) -> PriceColumns:
+    """
+    CSV 가격 로그를 DataFrame 없이 연속된 열 배열로 읽습니다 (파일 순서 그대로).
+
+    파일을 메모리 매핑해 줄 경계에 맞춘 `chunk_bytes` 크기 조각마다 파싱하고, 결과는 처음 조각의
+    행 길이로 어림한 크기의 배열에 바로 채우므로 행 수가 많아도 조각 하나만큼만 더 씁니다.
+    `start_offset`(줄 시작 위치)을 주면 헤더 대신 그 위치부터 끝까지만 읽습니다.
+
+    Raises:
+        FileNotFoundError: CSV 파일이 없는 경우
+    """
+    columns = [np.empty(0, dtype=column_dtype) for column_dtype in PRICE_COLUMN_DTYPES.values()]
+    row_count = 0
+    with Path(csv_file_path).open("rb") as binary_file:
+        file_size = os.fstat(binary_file.fileno()).st_size
+        if file_size == 0:
+            return PriceColumns(columns[0].view("datetime64[D]"), *columns[1:])
+        with mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            chunk_start = mapped_file.find(b"\n") + 1 if start_offset is None else start_offset
+            first_chunk_start = chunk_start
+            while 0 < chunk_start < file_size:
+                chunk_end = min(file_size, chunk_start + max(1, chunk_bytes))
+                if chunk_end < file_size:
+                    line_end = mapped_file.find(b"\n", chunk_end)
+                    chunk_end = file_size if line_end == -1 else line_end + 1
+                day_numbers, values = parse_price_log_bytes(mapped_file[chunk_start:chunk_end])
+
+                new_row_count = row_count + len(day_numbers)
+                if new_row_count > len(columns[0]):
+                    # 지금까지의 평균 행 길이로 남은 행 수를 어림해 늘림 (모자라면 다음 조각에서 다시 늘림)
+                    bytes_per_row = (chunk_end - first_chunk_start) / max(1, new_row_count)
+                    estimated_row_count = new_row_count + int((file_size - chunk_end) / bytes_per_row * 1.05) + 1
+                    for column in columns:
+                        column.resize(estimated_row_count, refcheck=False)
+                columns[0][row_count:new_row_count] = day_numbers
+                for column_index in range(len(PRICE_VALUE_COLUMNS)):
+                    columns[column_index + 1][row_count:new_row_count] = values[:, column_index]
+                row_count = new_row_count
+                chunk_start = chunk_end
+    for column in columns:
+        column.resize(row_count, refcheck=False)
+    return PriceColumns(columns[0].view("datetime64[D]"), *columns[1:])
+
+
+class ColumnarPriceStore:
+    """CSV 가격 로그 옆에 두는 열별 바이너리 저장소"""
+
+    def __init__(self, csv_file_path: Path, directory: Optional[Path] = None):
+        self.csv_file_path = Path(csv_file_path)
+        self.directory = (
+            Path(directory)
+            if directory is not None
+            else self.csv_file_path.with_name(f".{self.csv_file_path.name}.columns")
+        )
+        self.meta_path = self.directory / "meta.json"
+        self._lock = threading.Lock()
+
+    def column_path(self, column_name: str) -> Path:
+        return self.directory / f"{column_name}{COLUMN_FILE_SUFFIXES[PRICE_COLUMN_DTYPES[column_name]]}"
+
+    def read_meta(self) -> Optional[dict]:
+        try:
+            meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict) or not {"row_count", "inode", "size", "tail"} <= meta.keys():
+            return None
+        return meta
+
+    def write_meta(self, row_count: int, csv_stat: Optional[os.stat_result], synced_size: int, tail: bytes) -> None:
+        meta = {
+            "row_count": row_count,
+            "inode": csv_stat.st_ino if csv_stat is not None else None,
+            "size": synced_size,
+            "tail": tail.hex(),
+        }
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, prefix=".meta.", suffix=".tmp")
+        try:
+            apply_log_file_mode(file_descriptor, self.csv_file_path)
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as temporary_file:
+                json.dump(meta, temporary_file)
+            os.replace(temporary_path, self.meta_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def append_columns(self, row_count: int, day_numbers: np.ndarray, values: np.ndarray) -> int:
+        """
+        행 수 `row_count`인 열 파일들 끝에 행을 추가하고 새 행 수를 반환합니다.
+        `row_count`가 0이면 새 파일을 만들어 바꿔 끼우므로, 이미 매핑한 쪽은 예전 파일을 계속 봅니다.
+        """
+        for column_index, (column_name, column_dtype) in enumerate(PRICE_COLUMN_DTYPES.items()):
+            column_values = day_numbers if column_index == 0 else values[:, column_index - 1]
+            column_bytes = np.ascontiguousarray(column_values, dtype=column_dtype).tobytes()
+            column_path = self.column_path(column_name)
+            if row_count == 0:
+                file_descriptor, temporary_path = tempfile.mkstemp(
+                    dir=self.directory, prefix=f".{column_name}.", suffix=".tmp"
+                )
+                try:
+                    apply_log_file_mode(file_descriptor, self.csv_file_path)
+                    with os.fdopen(file_descriptor, "wb") as temporary_file:
+                        temporary_file.write(column_bytes)
+                    os.replace(temporary_path, column_path)
+                except BaseException:
+                    os.unlink(temporary_path)
+                    raise
+                continue
+            with column_path.open("ab") as column_file:
+                # 이전 추가가 meta.json 갱신 전에 중단됐으면 남은 꼬리를 잘라 낸다
+                # (읽는 쪽은 meta.json의 행 수까지만 매핑하므로 매핑된 영역은 건드리지 않음)
+                column_file.truncate(row_count * column_dtype.itemsize)
+                column_file.write(column_bytes)
+        return row_count + len(day_numbers)
+
+    def sync(self) -> int:
+        """
+        CSV의 변경을 열 파일에 반영합니다.
+
+        Returns:
+            새로 반영한 행 수 (전체를 다시 만들었으면 전체 행 수)
+        """
+        with self._lock, self.csv_file_path.open("rb") as binary_file:
+            csv_stat = os.fstat(binary_file.fileno())
+            meta = self.read_meta()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if meta is not None and meta["inode"] == csv_stat.st_ino:
+                synced_size = meta["size"]
+                synced_tail = bytes.fromhex(meta["tail"])
+                if synced_size == csv_stat.st_size:
+                    return 0
+                if len(synced_tail) <= synced_size < csv_stat.st_size:
+                    binary_file.seek(synced_size - len(synced_tail))
+                    if binary_file.read(len(synced_tail)) == synced_tail:
+                        return self.append_from(binary_file, csv_stat, meta["row_count"], synced_size)
+
+            # 전체 다시 만들기: 먼저 행 수를 0으로 돌려 읽는 쪽이 바뀌는 중인 파일을 매핑하지 않게 한다
+            self.write_meta(0, None, 0, b"")
+            binary_file.seek(0)
+            header_size = len(binary_file.readline())
+            return self.append_from(binary_file, csv_stat, 0, header_size)
+
+    def append_from(self, binary_file, csv_stat: os.stat_result, row_count: int, start_offset: int) -> int:
+        binary_file.seek(start_offset)
+        appended_bytes = binary_file.read(csv_stat.st_size - start_offset)
+        # 기록 중인 마지막 줄(개행 전)은 다음 동기화 때 읽는다
+        complete_length = appended_bytes.rfind(b"\n") + 1
+        day_numbers, values = parse_price_log_bytes(appended_bytes[:complete_length])
+        new_row_count = self.append_columns(row_count, day_numbers, values)
+
+        synced_size = start_offset + complete_length
+        tail_length = min(INDEX_TAIL_CHECK_BYTES, synced_size)
+        binary_file.seek(synced_size - tail_length)
+        self.write_meta(new_row_count, csv_stat, synced_size, binary_file.read(tail_length))
+        if len(day_numbers):
+            logger.debug(f"열 저장소에 {len(day_numbers)}행 반영: {self.directory}")
+        return len(day_numbers)
+
+    def load(self) -> PriceColumns:
+        """마지막 동기화 시점의 열들을 읽기 전용 메모리 매핑으로 엽니다 (복사 없음)."""
+        meta = self.read_meta()
+        row_count = meta["row_count"] if meta is not None else 0
+        columns = []
+        for column_name, column_dtype in PRICE_COLUMN_DTYPES.items():
+            if row_count == 0:
+                columns.append(np.empty(0, dtype=column_dtype))
+            else:
+                columns.append(np.memmap(self.column_path(column_name), dtype=column_dtype, mode="r", shape=(row_count,)))
+        columns[0] = columns[0].view("datetime64[D]")
+        return PriceColumns(*columns)
+
+
+def load_price_columns(csv_file_path: Path, sync: bool = True) -> PriceColumns:
+    """
+    CSV 가격 로그의 열 저장소를 (필요하면 먼저 동기화하고) 메모리 매핑으로 엽니다.
+
+    Raises:
+        FileNotFoundError: CSV 파일이 없는 경우 (sync=True)
+    """
+    columnar_store = ColumnarPriceStore(csv_file_path)
+    if sync:
+        columnar_store.sync()
+    return columnar_store.load()
+
+
+def sync_price_columns(csv_file_path: Path) -> None:
+    """CSV에 기록한 뒤 열 저장소를 따라 갱신합니다. 실패해도 CSV 기록에는 영향을 주지 않습니다."""
+    try:
+        ColumnarPriceStore(csv_file_path).sync()
+    except (OSError, ValueError) as sync_error:
+        logger.warning(f"열 저장소를 갱신하지 못했습니다: {csv_file_path} - {sync_error}")
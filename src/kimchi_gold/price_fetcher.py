@@ -2,15 +2,23 @@
 금 가격 데이터를 네이버 금융에서 가져오는 모듈입니다.
 """
 
+import asyncio
+import dataclasses
 import re
 import time
 import logging
 import math
-from typing import Tuple
-from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    ThreadPoolExecutor,
+    wait,
+)
 from urllib.parse import urlparse
+
 import requests
-from bs4 import BeautifulSoup
 
 from .configuration import (
     REQUEST_HEADERS,
@@ -18,12 +26,79 @@ from .configuration import (
     NAVER_INTERNATIONAL_GOLD_URL,
     NAVER_USD_KRW_EXCHANGE_URL,
     TROY_OUNCE_TO_GRAM_CONVERSION_RATE,
+    MARKET_SNAPSHOT_DEADLINE_SECONDS,
+    MARKET_SNAPSHOT_FAIL_FAST,
+    MARKET_SNAPSHOT_SERVE_STALE,
+    REQUEST_HEDGING_ENABLED,
+    QUOTE_CACHE_ENABLED,
+    QUOTE_CACHE_FILE,
+    PAGE_ARCHIVE_ENABLED,
 )
 from .data_models import GoldPriceData
+from .http_session import get_connect_seconds, get_shared_http_session
+from .async_http_client import get_shared_async_connection_pool, uses_environment_proxy
+from .price_scanner import StreamingPriceTagScanner
+from .html_parsers import extract_price_text
+from .fetch_deadline import (
+    FetchCancelledError,
+    FetchDeadline,
+    MarketDataCollectionError,
+    SourceFetchFailure,
+)
+from .circuit_breaker import (
+    CircuitBreakerStatus,
+    CircuitOpenError,
+    get_circuit_breaker,
+)
+from .quote_cache import QuoteCache, get_shared_quote_cache, set_shared_quote_cache
+from .page_archive import PageArchive, get_shared_page_archive, set_shared_page_archive
+from .single_flight import AsyncSingleFlight, SingleFlight
+from .rate_limiter import get_shared_upstream_rate_limiters
+from .fetch_metrics import FetchPhaseTimer
+from .instruments import (
+    INSTRUMENT_REGISTRY,
+    METAL_CONVERSION_RATE_KEY,
+    METAL_DEFINITIONS,
+    InstrumentQuote,
+    InstrumentSnapshot,
+    MarketInstrument,
+    MetalPremium,
+    resolve_instruments,
+)
+from .request_resilience import (
+    RetryPolicy,
+    get_hedge_delay,
+    get_shared_latency_tracker,
+    is_retryable_error,
+)
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# DoS Protection: 응답 크기(5MB)와 본문 읽기 시간 제한
+MAX_RESPONSE_SIZE_BYTES = 5 * 1024 * 1024
+SLOW_READ_TIMEOUT_SECONDS = 10.0
+
+# 가격을 찾은 뒤 남은 본문이 이 크기 이하면 끝까지 읽어 keep-alive 연결을 재사용
+EARLY_TERMINATION_DRAIN_LIMIT_BYTES = 64 * 1024
+
+# 캐시 재검증 헤더(ETag/Last-Modified)로 저장할 최대 길이
+MAX_CACHE_VALIDATOR_LENGTH = 256
+
+# 스냅샷을 구성하는 소스 이름 (소스별 오류 보고에 사용)
+DOMESTIC_GOLD_SOURCE = "domestic_gold"
+INTERNATIONAL_GOLD_SOURCE = "international_gold"
+USD_KRW_SOURCE = "usd_krw"
+MARKET_DATA_SOURCE_URLS = {
+    DOMESTIC_GOLD_SOURCE: NAVER_DOMESTIC_GOLD_URL,
+    INTERNATIONAL_GOLD_SOURCE: NAVER_INTERNATIONAL_GOLD_URL,
+    USD_KRW_SOURCE: NAVER_USD_KRW_EXCHANGE_URL,
+}
+# 메트릭/로그용 URL -> 소스 이름 (다중 종목 레지스트리의 종목 키 포함)
+MARKET_DATA_SOURCE_NAMES = {
+    instrument.url: instrument.key for instrument in INSTRUMENT_REGISTRY.values()
+}
+
 
 def validate_price(price: float, name: str) -> float:
     """
@@ -55,25 +130,16 @@ def validate_price(price: float, name: str) -> float:
     return price
 
 
-def extract_price_from_naver_finance(
-    target_url: str,
-    error_message: str,
-    price_pattern: str = r"[\d,]+(?:\.\d+)?",
-) -> float:
+def validate_naver_finance_url(target_url: str) -> None:
     """
-    네이버 금융 페이지에서 가격 정보를 추출하는 공통 함수
+    요청 전에 URL이 허용된 네이버 금융 주소인지 검증합니다 (SSRF 방지).
+    동기/비동기 경로가 같은 검증을 공유합니다.
 
     Args:
-        target_url: 가격 정보를 가져올 네이버 금융 URL
-        error_message: 오류 시 표시할 메시지
-        price_pattern: 가격 추출을 위한 정규식 패턴
-
-    Returns:
-        추출된 가격 (float)
+        target_url: 검증할 URL
 
     Raises:
-        requests.RequestException: HTTP 요청 실패 시
-        ValueError: 가격 정보를 찾을 수 없을 시
+        ValueError: 허용되지 않는 스킴, 포트, 호스트인 경우
     """
     # SSRF Protection: Validate URL scheme and domain
     parsed_url = urlparse(target_url)
@@ -104,105 +170,899 @@ def extract_price_from_naver_finance(
         logger.warning(f"[SECURITY] SSRF attempt blocked: Invalid domain '{hostname}' in {target_url}")
         raise ValueError(f"Invalid domain: {hostname}. Only naver.com and its subdomains are allowed.")
 
+
+def validate_response_headers(target_url: str, response) -> None:
+    """
+    응답 본문을 읽기 전에 리다이렉트, 상태 코드, Content-Type, Content-Length를 검증합니다.
+    `requests.Response`와 `AsyncHTTPResponse` 모두 사용할 수 있습니다.
+
+    Raises:
+        ValueError: 리다이렉트, 허용되지 않는 Content-Type, 크기 초과인 경우
+        requests.HTTPError: 4xx/5xx 응답인 경우
+    """
+    if response.is_redirect:
+        logger.warning(f"[SECURITY] SSRF attempt blocked: Unexpected redirect encountered for {target_url}")
+        raise ValueError("Redirects are not allowed for security reasons (SSRF bypass risk).")
+    response.raise_for_status()  # Raise an exception for bad status codes
+
+    # Mitigate unintended payloads by checking Content-Type
+    content_type = response.headers.get("Content-Type", "")
+    if not content_type.lower().startswith("text/html"):
+        logger.warning("[SECURITY] Unexpected payload blocked: Invalid Content-Type %r from %r", content_type, target_url)
+        raise ValueError(f"Invalid Content-Type: {content_type}. Only text/html is allowed.")
+
+    # Fail-fast on Content-Length if provided
+    content_length = response.headers.get("Content-Length")
+    if content_length:
+        # Security Enhancement: Prevent algorithmic complexity DoS from int() parsing
+        length_int = None
+        if len(content_length) <= 20:
+            try:
+                val = int(content_length)
+                if val >= 0:
+                    length_int = val
+            except ValueError:
+                # Ignore malformed Content-Length and fall back to the stream size check
+                pass
+
+        if length_int is not None and length_int > MAX_RESPONSE_SIZE_BYTES:
+            logger.warning(f"[SECURITY] DoS mitigation: Payload exceeds maximum size limit ({MAX_RESPONSE_SIZE_BYTES} bytes) from {target_url} based on Content-Length ({length_int}).")
+            raise ValueError("Response size exceeds the maximum limit (5MB) based on Content-Length. Potential DoS risk.")
+
+
+class ResponseBodyLimiter:
+    """
+    스트리밍으로 읽는 응답 본문의 크기와 총 읽기 시간을 제한합니다 (DoS 방지).
+    동기/비동기 읽기 루프가 chunk마다 `add()`를 호출하고, 받은 본문은 `buffer`에 누적됩니다.
+    """
+
+    def __init__(self, target_url: str):
+        self.target_url = target_url
+        self.buffer = bytearray()
+        self.start_time = time.monotonic()
+
+    @property
+    def current_size(self) -> int:
+        return len(self.buffer)
+
+    def add(self, chunk: bytes) -> None:
+        # Slow-read DoS mitigation
+        if time.monotonic() - self.start_time > SLOW_READ_TIMEOUT_SECONDS:
+            logger.warning(f"[SECURITY] DoS mitigation: Slow read detected and timed out while fetching {self.target_url}.")
+            raise ValueError("Response reading timed out (Slowloris mitigation).")
+
+        self.buffer += chunk
+        if self.current_size > MAX_RESPONSE_SIZE_BYTES:
+            logger.warning(f"[SECURITY] DoS mitigation: Response stream exceeds maximum size limit ({MAX_RESPONSE_SIZE_BYTES} bytes) from {self.target_url}.")
+            raise ValueError("Response size exceeds the maximum limit (5MB). Potential DoS risk.")
+
+    @property
+    def content(self) -> bytes:
+        return bytes(self.buffer)
+
+
+def can_drain_remaining_body(response, bytes_read: int) -> bool:
+    """
+    가격을 찾은 뒤 남은 본문이 작으면(Content-Length 기준) 끝까지 읽어
+    keep-alive 연결을 풀에 돌려줄 수 있는지 판단합니다.
+    남은 양을 모르거나 크면 연결을 닫는 편이 더 쌉니다.
+    """
+    content_length = response.headers.get("Content-Length")
+    if not content_length or len(content_length) > 20:
+        return False
+    try:
+        remaining_bytes = int(content_length) - bytes_read
+    except ValueError:
+        return False
+    return 0 <= remaining_bytes <= EARLY_TERMINATION_DRAIN_LIMIT_BYTES
+
+
+def convert_price_text_to_float(
+    text: str,
+    target_url: str,
+    error_message: str,
+    price_pattern: str = r"[\d,]+(?:\.\d+)?",
+) -> Optional[float]:
+    """
+    가격 태그 텍스트에서 숫자를 뽑아 검증된 float으로 변환합니다.
+
+    Returns:
+        검증된 가격, 텍스트에 숫자가 없으면 None
+
+    Raises:
+        ValueError: 가격 문자열이 너무 길거나 유효하지 않은 값인 경우
+    """
+    price_match = re.search(price_pattern, text)
+    if not price_match:
+        return None
+    matched_string = price_match.group().replace(",", "")
+    # Security Enhancement: Prevent algorithmic complexity DoS by limiting string length before float()
+    if len(matched_string) > 50:
+        logger.warning(f"[SECURITY] DoS mitigation: Extracted price string exceeds length limit ({len(matched_string)} > 50) from {target_url}.")
+        raise ValueError("추출된 가격 문자열이 너무 깁니다. (DoS 방지)")
+    extracted_price = float(matched_string)
+    return validate_price(extracted_price, error_message.split(" ")[0])
+
+
+def scan_streamed_price(
+    price_scanner: StreamingPriceTagScanner,
+    body_limiter: ResponseBodyLimiter,
+    error_message: str,
+    price_pattern: str,
+) -> Optional[float]:
+    """
+    지금까지 받은 본문에서 빠른 경로로 가격을 찾습니다.
+    태그가 없거나 숫자를 찾지 못하면 None을 반환하여 DOM 파서로 넘깁니다.
+    """
+    price_text = price_scanner.scan(body_limiter.buffer)
+    if price_text is None:
+        return None
+    return convert_price_text_to_float(
+        price_text, body_limiter.target_url, error_message, price_pattern
+    )
+
+
+def parse_price_from_html(
+    content: bytes,
+    target_url: str,
+    error_message: str,
+    price_pattern: str = r"[\d,]+(?:\.\d+)?",
+    parser_backend: Optional[str] = None,
+) -> float:
+    """
+    네이버 금융 HTML에서 가격을 찾아 검증된 float으로 반환합니다.
+
+    Args:
+        parser_backend: 사용할 HTML 파서 백엔드 (None이면 설정에서 선택된 백엔드)
+
+    Raises:
+        ValueError: 가격 정보를 찾을 수 없거나 유효하지 않은 경우
+    """
+    price_text = extract_price_text(content, parser_backend)
+    if price_text is not None:
+        extracted_price = convert_price_text_to_float(
+            price_text, target_url, error_message, price_pattern
+        )
+        if extracted_price is not None:
+            return extracted_price
+    raise ValueError(error_message)
+
+
+def build_conditional_request_headers(cached_quote) -> Dict[str, str]:
+    """캐시된 시세가 있으면 조건부 GET 헤더를 붙인 요청 헤더를 반환합니다."""
+    if cached_quote is None or not cached_quote.conditional_request_headers():
+        return REQUEST_HEADERS
+    return {**REQUEST_HEADERS, **cached_quote.conditional_request_headers()}
+
+
+def get_cache_validator(response, header_name: str) -> Optional[str]:
+    header_value = response.headers.get(header_name)
+    if not isinstance(header_value, str) or len(header_value) > MAX_CACHE_VALIDATOR_LENGTH:
+        return None
+    return header_value
+
+
+def record_successful_fetch(
+    target_url: str,
+    price: float,
+    request_started: float,
+    response,
+    quote_cache: Optional[QuoteCache],
+) -> float:
+    """
+    성공한 요청의 응답 시간(헤징 기준)을 기록하고, 캐시가 있으면 가격과
+    재검증 헤더를 저장합니다. 동기/비동기 경로가 공유합니다.
+    """
+    get_shared_latency_tracker().record(target_url, time.perf_counter() - request_started)
+    if quote_cache is not None:
+        quote_cache.store(
+            target_url,
+            price,
+            etag=get_cache_validator(response, "ETag"),
+            last_modified=get_cache_validator(response, "Last-Modified"),
+        )
+    return price
+
+
+def archive_fetched_page(
+    page_archive: Optional[PageArchive], target_url: str, content: bytes, price: float
+) -> None:
+    """기록 모드면 받은 본문 전체를 보관합니다. 보관 실패는 수집을 실패시키지 않습니다."""
+    if page_archive is None:
+        return
+    try:
+        page_archive.record(target_url, content, price)
+    except OSError as archive_error:
+        logger.warning(f"페이지를 보관하지 못했습니다: {target_url} - {archive_error}")
+
+
+def parse_price_from_page_content(
+    content: bytes,
+    target_url: str,
+    error_message: str,
+    price_pattern: str = r"[\d,]+(?:\.\d+)?",
+) -> float:
+    """
+    이미 받은 본문 전체에서 실시간 수집과 같은 순서(스트리밍 스캐너, 실패하면 DOM 파서)로
+    가격을 추출합니다. 보관된 페이지를 네트워크 없이 다시 파싱할 때 사용합니다.
+    """
+    body_limiter = ResponseBodyLimiter(target_url)
+    body_limiter.add(content)
+    streamed_price = scan_streamed_price(
+        StreamingPriceTagScanner(), body_limiter, error_message, price_pattern
+    )
+    if streamed_price is not None:
+        return streamed_price
+    return parse_price_from_html(content, target_url, error_message, price_pattern)
+
+
+def get_market_data_source_name(target_url: str) -> str:
+    """메트릭에 기록할 소스 이름 (스냅샷 소스가 아니면 URL 경로의 마지막 부분)"""
+    source_name = MARKET_DATA_SOURCE_NAMES.get(target_url)
+    if source_name is not None:
+        return source_name
+    return urlparse(target_url).path.rstrip("/").rsplit("/", 1)[-1] or target_url
+
+
+def wait_for_upstream_rate_limit(target_url: str, deadline: Optional[FetchDeadline] = None) -> None:
+    """
+    호스트별 공유 토큰 버킷에서 차례를 받을 때까지 기다립니다 (실패하지 않고 줄을 섬).
+    마감 시간 안에 차례가 오지 않으면 토큰을 쓰지 않고 바로 포기합니다.
+
+    Raises:
+        FetchCancelledError: 차례가 마감 시간 뒤이거나 기다리는 동안 취소된 경우
+    """
+    upstream_rate_limiters = get_shared_upstream_rate_limiters()
+    if upstream_rate_limiters is None:
+        return
+    max_wait_seconds = deadline.remaining() if deadline is not None else None
+    wait_seconds = upstream_rate_limiters.for_url(target_url).reserve(max_wait_seconds)
+    if wait_seconds is None:
+        raise FetchCancelledError(
+            f"Upstream rate limit queue for {target_url} extends past the snapshot deadline.",
+            deadline_exceeded=True,
+        )
+    if wait_seconds <= 0:
+        return
+    logger.debug(f"요청 속도 제한으로 {wait_seconds:.3f}s 기다립니다: {target_url}")
+    if deadline is not None:
+        deadline.sleep(wait_seconds)
+        deadline.check(target_url)
+    else:
+        time.sleep(wait_seconds)
+
+
+async def wait_for_upstream_rate_limit_async(
+    target_url: str, deadline: Optional[FetchDeadline] = None
+) -> None:
+    """
+    `wait_for_upstream_rate_limit`의 asyncio 버전.
+    예약은 상태 파일 잠금을 기다릴 수 있으므로 작업 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+
+    Raises:
+        FetchCancelledError: 차례가 마감 시간 뒤인 경우 (토큰은 쓰지 않음)
+    """
+    upstream_rate_limiters = get_shared_upstream_rate_limiters()
+    if upstream_rate_limiters is None:
+        return
+    max_wait_seconds = deadline.remaining() if deadline is not None else None
+    wait_seconds = await asyncio.to_thread(
+        upstream_rate_limiters.for_url(target_url).reserve, max_wait_seconds
+    )
+    if wait_seconds is None:
+        raise FetchCancelledError(
+            f"Upstream rate limit queue for {target_url} extends past the snapshot deadline.",
+            deadline_exceeded=True,
+        )
+    if wait_seconds > 0:
+        logger.debug(f"요청 속도 제한으로 {wait_seconds:.3f}s 기다립니다: {target_url}")
+        await asyncio.sleep(wait_seconds)
+
+
+def fetch_price_from_naver_finance_once(
+    target_url: str,
+    error_message: str,
+    price_pattern: str = r"[\d,]+(?:\.\d+)?",
+    deadline: Optional[FetchDeadline] = None,
+    quote_cache: Optional[QuoteCache] = None,
+) -> float:
+    """
+    재시도나 헤징 없이 요청을 한 번 보내 가격을 추출합니다.
+    성공한 요청의 응답 시간은 헤징 기준(백분위수) 계산을 위해 기록합니다.
+    캐시에 재검증 헤더가 있으면 조건부 GET으로 보내고, 304면 캐시된 값을 반환합니다.
+    요청마다 단계별 시간(연결, 첫 바이트, 다운로드, 파싱)과 결과를 메트릭 싱크로 보냅니다.
+    요청 전에 호스트별 공유 토큰 버킷에서 차례를 기다립니다 (기다린 시간은 메트릭에서 제외).
+
+    Raises:
+        requests.RequestException: HTTP 요청 실패 시
+        ValueError: 가격 정보를 찾을 수 없을 시
+        FetchCancelledError: 마감 시간이 지났거나 취소된 경우
+    """
+    wait_for_upstream_rate_limit(target_url, deadline)
+    phase_timer = FetchPhaseTimer(get_market_data_source_name(target_url), target_url)
+    try:
+        price = request_price_from_naver_finance(
+            target_url, error_message, price_pattern, deadline, quote_cache, phase_timer
+        )
+    except BaseException as fetch_error:
+        phase_timer.finish(fetch_error)
+        raise
+    phase_timer.finish()
+    return price
+
+
+def request_price_from_naver_finance(
+    target_url: str,
+    error_message: str,
+    price_pattern: str,
+    deadline: Optional[FetchDeadline],
+    quote_cache: Optional[QuoteCache],
+    phase_timer: FetchPhaseTimer,
+) -> float:
+    """`fetch_price_from_naver_finance_once`의 본체 (단계 측정은 `phase_timer`에 기록)"""
     # Security Enhancement: Separate connect and read timeouts (3.0s connect, 10.0s read)
     # to prevent resource exhaustion from hanging connections (tarpits).
-    with requests.get(
+    request_timeout = (3.0, 10.0)
+    if deadline is not None:
+        deadline.check(target_url)
+        request_timeout = deadline.clamp_timeout(request_timeout)
+
+    cached_quote = quote_cache.get(target_url) if quote_cache is not None else None
+    page_archive = get_shared_page_archive()
+    request_started = time.perf_counter()
+    # Bolt Optimization: 공유 세션의 keep-alive 풀을 재사용하여 호출마다 TLS 핸드셰이크를 반복하지 않음
+    with get_shared_http_session().get(
         target_url,
-        headers=REQUEST_HEADERS,
-        timeout=(3.0, 10.0),
+        headers=build_conditional_request_headers(cached_quote),
+        timeout=request_timeout,
         allow_redirects=False,
         stream=True,
         verify=True,
     ) as response:
-        if response.is_redirect:
-            logger.warning(f"[SECURITY] SSRF attempt blocked: Unexpected redirect encountered for {target_url}")
-            raise ValueError("Redirects are not allowed for security reasons (SSRF bypass risk).")
-        response.raise_for_status()  # Raise an exception for bad status codes
-
-        # Mitigate unintended payloads by checking Content-Type
-        content_type = response.headers.get("Content-Type", "")
-        if not content_type.lower().startswith("text/html"):
-            logger.warning("[SECURITY] Unexpected payload blocked: Invalid Content-Type %r from %r", content_type, target_url)
-            raise ValueError(f"Invalid Content-Type: {content_type}. Only text/html is allowed.")
-
-        # DoS Protection: Limit response size (e.g., 5MB) and time limit
-        max_size = 5 * 1024 * 1024
-
-        # Fail-fast on Content-Length if provided
-        content_length = response.headers.get("Content-Length")
-        if content_length:
-            # Security Enhancement: Prevent algorithmic complexity DoS from int() parsing
-            length_int = None
-            if len(content_length) <= 20:
-                try:
-                    val = int(content_length)
-                    if val >= 0:
-                        length_int = val
-                except ValueError:
-                    # Ignore malformed Content-Length and fall back to the stream size check
-                    pass
-
-            if length_int is not None and length_int > max_size:
-                logger.warning(f"[SECURITY] DoS mitigation: Payload exceeds maximum size limit ({max_size} bytes) from {target_url} based on Content-Length ({length_int}).")
-                raise ValueError("Response size exceeds the maximum limit (5MB) based on Content-Length. Potential DoS risk.")
-
-        chunks = []
-        current_size = 0
-        start_time = time.monotonic()
-        timeout_seconds = 10.0
-
+        phase_timer.headers_received(get_connect_seconds(response, request_started))
+        if cached_quote is not None and response.status_code == 304:
+            # Bolt Optimization: 바뀌지 않은 페이지는 본문 없이 캐시를 연장
+            phase_timer.not_modified = True
+            get_shared_latency_tracker().record(target_url, time.perf_counter() - request_started)
+            quote_cache.mark_revalidated(target_url)
+            return cached_quote.price
+
+        validate_response_headers(target_url, response)
+
+        # Bolt Optimization: 가격 태그가 닫히는 즉시 추출하고 나머지 본문은 읽지 않음
+        body_limiter = ResponseBodyLimiter(target_url)
+        price_scanner = StreamingPriceTagScanner()
+        streamed_price = None
         for chunk in response.iter_content(chunk_size=8192):
-            # Slow-read DoS mitigation
-            if time.monotonic() - start_time > timeout_seconds:
-                logger.warning(f"[SECURITY] DoS mitigation: Slow read detected and timed out while fetching {target_url}.")
-                raise ValueError("Response reading timed out (Slowloris mitigation).")
-
-            chunks.append(chunk)
-            current_size += len(chunk)
-            if current_size > max_size:
-                logger.warning(f"[SECURITY] DoS mitigation: Response stream exceeds maximum size limit ({max_size} bytes) from {target_url}.")
-                raise ValueError("Response size exceeds the maximum limit (5MB). Potential DoS risk.")
-        content = b"".join(chunks)
-
-    soup = BeautifulSoup(content, "html.parser")
-
-    # Find element with class containing "DetailInfo_price"
-    price_tag = soup.find(
-        "strong",
-        class_=lambda class_name: class_name and "DetailInfo_price" in class_name,
-    )
-    if price_tag:
-        text = price_tag.get_text()
-        price_match = re.search(price_pattern, text)
-        if price_match:
-            matched_string = price_match.group().replace(",", "")
-            # Security Enhancement: Prevent algorithmic complexity DoS by limiting string length before float()
-            if len(matched_string) > 50:
-                logger.warning(f"[SECURITY] DoS mitigation: Extracted price string exceeds length limit ({len(matched_string)} > 50) from {target_url}.")
-                raise ValueError("추출된 가격 문자열이 너무 깁니다. (DoS 방지)")
-            extracted_price = float(matched_string)
-            return validate_price(extracted_price, error_message.split(" ")[0])
-    raise ValueError(error_message)
+            if deadline is not None:
+                deadline.check(target_url)
+            phase_timer.chunk_received(chunk)
+            body_limiter.add(chunk)
+            if streamed_price is None:
+                with phase_timer.parsing():
+                    streamed_price = scan_streamed_price(
+                        price_scanner, body_limiter, error_message, price_pattern
+                    )
+                # 기록 모드에서는 페이지 전체를 보관해야 하므로 끝까지 읽는다
+                if streamed_price is not None and page_archive is None and not can_drain_remaining_body(
+                    response, body_limiter.current_size
+                ):
+                    break
+        if streamed_price is not None:
+            archive_fetched_page(page_archive, target_url, body_limiter.content, streamed_price)
+            return record_successful_fetch(
+                target_url, streamed_price, request_started, response, quote_cache
+            )
+        content = body_limiter.content
+
+    # 빠른 경로가 실패하면 전체 본문을 DOM 파서로 분석
+    with phase_timer.parsing():
+        price = parse_price_from_html(content, target_url, error_message, price_pattern)
+    archive_fetched_page(page_archive, target_url, content, price)
+    return record_successful_fetch(target_url, price, request_started, response, quote_cache)
 
 
-def fetch_domestic_gold_price() -> float:
+def get_retry_delay(
+    error: BaseException,
+    retry_number: int,
+    retry_policy: RetryPolicy,
+    deadline: Optional[FetchDeadline] = None,
+) -> Optional[float]:
+    """
+    실패한 요청을 다시 보낼지 결정합니다. 동기/비동기 경로가 공유합니다.
+
+    Args:
+        error: 직전 시도에서 발생한 예외
+        retry_number: 지금까지 재시도한 횟수
+        retry_policy: 재시도 정책
+        deadline: 스냅샷 마감 시간 (백오프 후 남은 시간이 없으면 재시도하지 않음)
+
+    Returns:
+        재시도 전 대기 시간(초), 재시도하지 않으면 None
+    """
+    if retry_number >= retry_policy.max_retries or not is_retryable_error(error):
+        return None
+    backoff_seconds = retry_policy.backoff_delay(retry_number)
+    if deadline is not None:
+        remaining_seconds = deadline.remaining()
+        if deadline.cancelled or (
+            remaining_seconds is not None and remaining_seconds <= backoff_seconds
+        ):
+            return None
+    return backoff_seconds
+
+
+def fetch_price_with_hedge(
+    target_url: str,
+    error_message: str,
+    price_pattern: str = r"[\d,]+(?:\.\d+)?",
+    deadline: Optional[FetchDeadline] = None,
+    quote_cache: Optional[QuoteCache] = None,
+) -> float:
+    """
+    첫 요청이 최근 응답 시간의 백분위수 안에 끝나지 않으면 같은 요청을 하나 더 보내고
+    먼저 성공한 응답을 사용합니다. 진 쪽 요청은 취소 신호로 중단합니다.
+
+    Raises:
+        requests.RequestException, ValueError: 두 요청이 모두 실패한 경우 마지막 예외
+        FetchCancelledError: 마감 시간이 지났거나 취소된 경우
+    """
+    hedge_delay = get_hedge_delay(target_url)
+    if hedge_delay is None:
+        # 응답 시간 표본이 부족하면 헤징하지 않음
+        return fetch_price_from_naver_finance_once(
+            target_url, error_message, price_pattern, deadline, quote_cache
+        )
+
+    attempt_deadlines: List[FetchDeadline] = []
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    def start_attempt():
+        attempt_deadline = FetchDeadline(None, parent=deadline)
+        attempt_deadlines.append(attempt_deadline)
+        return executor.submit(
+            fetch_price_from_naver_finance_once,
+            target_url,
+            error_message,
+            price_pattern,
+            attempt_deadline,
+            quote_cache,
+        )
+
+    try:
+        done_attempts, pending_attempts = wait({start_attempt()}, timeout=hedge_delay)
+        if not done_attempts:
+            logger.info(f"응답 지연({hedge_delay:.3f}s 초과)으로 헤지 요청을 보냅니다: {target_url}")
+            pending_attempts.add(start_attempt())
+
+        last_error: Optional[BaseException] = None
+        while True:
+            for attempt in done_attempts:
+                if attempt.exception() is None:
+                    return attempt.result()
+                last_error = attempt.exception()
+            if not pending_attempts:
+                raise last_error
+            done_attempts, pending_attempts = wait(
+                pending_attempts,
+                timeout=deadline.remaining() if deadline is not None else None,
+                return_when=FIRST_COMPLETED,
+            )
+            if not done_attempts and deadline is not None:
+                deadline.check(target_url)
+    finally:
+        # 진 쪽 요청은 다음 chunk에서 취소 신호를 확인하고 끝난다
+        for attempt_deadline in attempt_deadlines:
+            attempt_deadline.cancel()
+        executor.shutdown(wait=False)
+
+
+def fetch_price_with_retries(
+    target_url: str,
+    error_message: str,
+    price_pattern: str = r"[\d,]+(?:\.\d+)?",
+    deadline: Optional[FetchDeadline] = None,
+    hedge: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    quote_cache: Optional[QuoteCache] = None,
+) -> float:
+    """일시적 오류는 재시도 정책에 따라 다시 시도하며 가격을 가져옵니다."""
+    hedging_enabled = REQUEST_HEDGING_ENABLED if hedge is None else hedge
+    retry_policy = retry_policy or RetryPolicy()
+    retry_number = 0
+    while True:
+        try:
+            if hedging_enabled:
+                return fetch_price_with_hedge(
+                    target_url, error_message, price_pattern, deadline, quote_cache
+                )
+            return fetch_price_from_naver_finance_once(
+                target_url, error_message, price_pattern, deadline, quote_cache
+            )
+        except Exception as fetch_error:
+            backoff_seconds = get_retry_delay(fetch_error, retry_number, retry_policy, deadline)
+            if backoff_seconds is None:
+                raise
+            retry_number += 1
+            logger.warning(
+                f"일시적 오류로 재시도합니다 ({retry_number}/{retry_policy.max_retries}, "
+                f"{backoff_seconds:.2f}s 후): {target_url} - {fetch_error}"
+            )
+            if deadline is not None:
+                deadline.sleep(backoff_seconds)
+            else:
+                time.sleep(backoff_seconds)
+
+
+def fetch_price_through_circuit_breaker(
+    target_url: str,
+    error_message: str,
+    price_pattern: str = r"[\d,]+(?:\.\d+)?",
+    deadline: Optional[FetchDeadline] = None,
+    hedge: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    quote_cache: Optional[QuoteCache] = None,
+) -> float:
+    """URL별 서킷 브레이커를 거쳐 가격을 가져오고 결과를 브레이커에 기록합니다."""
+    circuit_breaker = get_circuit_breaker(target_url)
+    circuit_breaker.before_call()
+    try:
+        price = fetch_price_with_retries(
+            target_url, error_message, price_pattern, deadline, hedge, retry_policy, quote_cache
+        )
+    except FetchCancelledError:
+        circuit_breaker.record_cancelled()
+        raise
+    except Exception as fetch_error:
+        circuit_breaker.record_failure(fetch_error)
+        raise
+    circuit_breaker.record_success(price)
+    return price
+
+
+def get_cached_price(
+    target_url: str,
+    quote_cache: Optional[QuoteCache],
+    refresh: Callable[[], float],
+) -> Optional[float]:
+    """
+    캐시에서 바로 쓸 수 있는 가격을 찾습니다. 동기/비동기 경로가 공유합니다.
+
+    TTL 안이면 그대로, stale-while-revalidate 구간이면 `refresh`를 백그라운드에서
+    한 번 실행하도록 예약하고 캐시된 값을 반환합니다.
+
+    Returns:
+        캐시된 가격, 요청이 필요하면 None
+    """
+    if quote_cache is None:
+        return None
+    cached_quote = quote_cache.get(target_url)
+    if cached_quote is None:
+        return None
+    if quote_cache.is_fresh(cached_quote):
+        return cached_quote.price
+    if quote_cache.can_serve_stale(cached_quote):
+        quote_cache.revalidate_in_background(target_url, refresh)
+        return cached_quote.price
+    return None
+
+
+def extract_price_from_naver_finance(
+    target_url: str,
+    error_message: str,
+    price_pattern: str = r"[\d,]+(?:\.\d+)?",
+    deadline: Optional[FetchDeadline] = None,
+    hedge: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    quote_cache: Optional[QuoteCache] = None,
+) -> float:
+    """
+    네이버 금융 페이지에서 가격 정보를 추출하는 공통 함수
+    URL별 서킷 브레이커가 열려 있으면 요청을 보내지 않고 바로 실패합니다.
+
+    Args:
+        target_url: 가격 정보를 가져올 네이버 금융 URL
+        error_message: 오류 시 표시할 메시지
+        price_pattern: 가격 추출을 위한 정규식 패턴
+        deadline: 스냅샷 전체 마감 시간 (있으면 타임아웃을 남은 시간 이내로 줄이고 취소 신호를 확인)
+        hedge: 지연 헤징 사용 여부 (None이면 configuration.REQUEST_HEDGING_ENABLED)
+        retry_policy: 5xx/연결 오류 재시도 정책 (None이면 기본 정책)
+        quote_cache: 시세 캐시 (None이면 캐시 없이 항상 요청)
+
+    Returns:
+        추출된 가격 (float)
+
+    Raises:
+        requests.RequestException: HTTP 요청 실패 시
+        ValueError: 가격 정보를 찾을 수 없을 시
+        FetchCancelledError: 마감 시간이 지났거나 취소된 경우
+        CircuitOpenError: 서킷 브레이커가 열려 있는 경우
+    """
+    validate_naver_finance_url(target_url)
+
+    cached_price = get_cached_price(
+        target_url,
+        quote_cache,
+        lambda: fetch_price_through_circuit_breaker(
+            target_url, error_message, price_pattern, quote_cache=quote_cache
+        ),
+    )
+    if cached_price is not None:
+        return cached_price
+
+    return fetch_price_through_circuit_breaker(
+        target_url, error_message, price_pattern, deadline, hedge, retry_policy, quote_cache
+    )
+
+
+async def fetch_price_from_naver_finance_once_async(
+    target_url: str,
+    error_message: str,
+    price_pattern: str = r"[\d,]+(?:\.\d+)?",
+    quote_cache: Optional[QuoteCache] = None,
+    deadline: Optional[FetchDeadline] = None,
+) -> float:
+    """`fetch_price_from_naver_finance_once`의 asyncio 버전"""
+    await wait_for_upstream_rate_limit_async(target_url, deadline)
+    phase_timer = FetchPhaseTimer(get_market_data_source_name(target_url), target_url)
+    try:
+        if uses_environment_proxy(target_url):
+            # asyncio 클라이언트는 프록시를 지원하지 않으므로 requests 경로를 작업 스레드에서 실행
+            price = await asyncio.to_thread(
+                request_price_from_naver_finance,
+                target_url, error_message, price_pattern, deadline, quote_cache, phase_timer,
+            )
+        else:
+            price = await request_price_from_naver_finance_async(
+                target_url, error_message, price_pattern, quote_cache, phase_timer
+            )
+    except BaseException as fetch_error:
+        phase_timer.finish(fetch_error)
+        raise
+    phase_timer.finish()
+    return price
+
+
+async def request_price_from_naver_finance_async(
+    target_url: str,
+    error_message: str,
+    price_pattern: str,
+    quote_cache: Optional[QuoteCache],
+    phase_timer: FetchPhaseTimer,
+) -> float:
+    """`request_price_from_naver_finance`의 asyncio 버전"""
+    cached_quote = quote_cache.get(target_url) if quote_cache is not None else None
+    page_archive = get_shared_page_archive()
+    request_started = time.perf_counter()
+    response = await get_shared_async_connection_pool().get(
+        target_url, headers=build_conditional_request_headers(cached_quote), timeout=(3.0, 10.0)
+    )
+    async with response:
+        phase_timer.headers_received(response.connect_seconds)
+        if cached_quote is not None and response.status_code == 304:
+            phase_timer.not_modified = True
+            # 304는 본문이 없으므로 바로 끝까지 읽은 것으로 처리되어 연결이 풀로 돌아간다
+            async for _ in response.iter_content():
+                pass
+            get_shared_latency_tracker().record(target_url, time.perf_counter() - request_started)
+            quote_cache.mark_revalidated(target_url)
+            return cached_quote.price
+
+        validate_response_headers(target_url, response)
+
+        body_limiter = ResponseBodyLimiter(target_url)
+        price_scanner = StreamingPriceTagScanner()
+        streamed_price = None
+        async for chunk in response.iter_content(chunk_size=8192):
+            phase_timer.chunk_received(chunk)
+            body_limiter.add(chunk)
+            if streamed_price is None:
+                with phase_timer.parsing():
+                    streamed_price = scan_streamed_price(
+                        price_scanner, body_limiter, error_message, price_pattern
+                    )
+                if streamed_price is not None and page_archive is None and not can_drain_remaining_body(
+                    response, body_limiter.current_size
+                ):
+                    break
+        if streamed_price is not None:
+            archive_fetched_page(page_archive, target_url, body_limiter.content, streamed_price)
+            return record_successful_fetch(
+                target_url, streamed_price, request_started, response, quote_cache
+            )
+        content = body_limiter.content
+
+    with phase_timer.parsing():
+        price = parse_price_from_html(content, target_url, error_message, price_pattern)
+    archive_fetched_page(page_archive, target_url, content, price)
+    return record_successful_fetch(target_url, price, request_started, response, quote_cache)
+
+
+async def fetch_price_with_hedge_async(
+    target_url: str,
+    error_message: str,
+    price_pattern: str = r"[\d,]+(?:\.\d+)?",
+    quote_cache: Optional[QuoteCache] = None,
+    deadline: Optional[FetchDeadline] = None,
+) -> float:
+    """`fetch_price_with_hedge`의 asyncio 버전. 진 쪽 요청은 task.cancel()로 취소합니다."""
+    hedge_delay = get_hedge_delay(target_url)
+    if hedge_delay is None:
+        return await fetch_price_from_naver_finance_once_async(
+            target_url, error_message, price_pattern, quote_cache, deadline
+        )
+
+    attempts = [
+        asyncio.ensure_future(
+            fetch_price_from_naver_finance_once_async(
+                target_url, error_message, price_pattern, quote_cache, deadline
+            )
+        )
+    ]
+    try:
+        done_attempts, pending_attempts = await asyncio.wait(attempts, timeout=hedge_delay)
+        if not done_attempts:
+            logger.info(f"응답 지연({hedge_delay:.3f}s 초과)으로 헤지 요청을 보냅니다: {target_url}")
+            hedge_attempt = asyncio.ensure_future(
+                fetch_price_from_naver_finance_once_async(
+                    target_url, error_message, price_pattern, quote_cache, deadline
+                )
+            )
+            attempts.append(hedge_attempt)
+            pending_attempts.add(hedge_attempt)
+
+        last_error: Optional[BaseException] = None
+        while True:
+            for attempt in done_attempts:
+                if attempt.exception() is None:
+                    return attempt.result()
+                last_error = attempt.exception()
+            if not pending_attempts:
+                raise last_error
+            done_attempts, pending_attempts = await asyncio.wait(
+                pending_attempts, return_when=asyncio.FIRST_COMPLETED
+            )
+    finally:
+        for attempt in attempts:
+            if not attempt.done():
+                attempt.cancel()
+        await asyncio.gather(*attempts, return_exceptions=True)
+
+
+async def fetch_price_with_retries_async(
+    target_url: str,
+    error_message: str,
+    price_pattern: str = r"[\d,]+(?:\.\d+)?",
+    hedge: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    quote_cache: Optional[QuoteCache] = None,
+    deadline: Optional[FetchDeadline] = None,
+) -> float:
+    """`fetch_price_with_retries`의 asyncio 버전"""
+    hedging_enabled = REQUEST_HEDGING_ENABLED if hedge is None else hedge
+    retry_policy = retry_policy or RetryPolicy()
+    retry_number = 0
+    while True:
+        try:
+            if hedging_enabled:
+                return await fetch_price_with_hedge_async(
+                    target_url, error_message, price_pattern, quote_cache, deadline
+                )
+            return await fetch_price_from_naver_finance_once_async(
+                target_url, error_message, price_pattern, quote_cache, deadline
+            )
+        except Exception as fetch_error:
+            backoff_seconds = get_retry_delay(fetch_error, retry_number, retry_policy, deadline)
+            if backoff_seconds is None:
+                raise
+            retry_number += 1
+            logger.warning(
+                f"일시적 오류로 재시도합니다 ({retry_number}/{retry_policy.max_retries}, "
+                f"{backoff_seconds:.2f}s 후): {target_url} - {fetch_error}"
+            )
+            await asyncio.sleep(backoff_seconds)
+
+
+async def extract_price_from_naver_finance_async(
+    target_url: str,
+    error_message: str,
+    price_pattern: str = r"[\d,]+(?:\.\d+)?",
+    hedge: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    quote_cache: Optional[QuoteCache] = None,
+    deadline: Optional[FetchDeadline] = None,
+) -> float:
+    """
+    `extract_price_from_naver_finance`의 asyncio 버전.
+    같은 URL 검증, 응답 검증, 크기/슬로우 리드 제한, 가격 검증, 재시도 정책,
+    서킷 브레이커, 시세 캐시를 사용합니다. stale-while-revalidate 갱신은
+    이벤트 루프를 막지 않도록 동기 경로로 백그라운드 스레드에서 실행합니다.
+
+    Raises:
+        requests.RequestException: HTTP 요청 실패 시
+        ValueError: 가격 정보를 찾을 수 없을 시
+        CircuitOpenError: 서킷 브레이커가 열려 있는 경우
+    """
+    validate_naver_finance_url(target_url)
+
+    cached_price = get_cached_price(
+        target_url,
+        quote_cache,
+        lambda: fetch_price_through_circuit_breaker(
+            target_url, error_message, price_pattern, quote_cache=quote_cache
+        ),
+    )
+    if cached_price is not None:
+        return cached_price
+
+    circuit_breaker = get_circuit_breaker(target_url)
+    circuit_breaker.before_call()
+    try:
+        price = await fetch_price_with_retries_async(
+            target_url, error_message, price_pattern, hedge, retry_policy, quote_cache, deadline
+        )
+    except (asyncio.CancelledError, FetchCancelledError):
+        # 마감 시간이나 요청 속도 제한 대기로 취소된 요청은 업스트림 실패가 아님
+        circuit_breaker.record_cancelled()
+        raise
+    except Exception as fetch_error:
+        circuit_breaker.record_failure(fetch_error)
+        raise
+    circuit_breaker.record_success(price)
+    return price
+
+
+def fetch_domestic_gold_price(deadline: Optional[FetchDeadline] = None) -> float:
     """국내 금 가격을 가져옵니다 (원/g)"""
     return extract_price_from_naver_finance(
-        NAVER_DOMESTIC_GOLD_URL, "국내 금 가격 정보를 찾을 수 없습니다."
+        NAVER_DOMESTIC_GOLD_URL, "국내 금 가격 정보를 찾을 수 없습니다.",
+        deadline=deadline,
+        quote_cache=get_shared_quote_cache(),
     )
 
 
-def fetch_international_gold_price() -> float:
+def fetch_international_gold_price(deadline: Optional[FetchDeadline] = None) -> float:
     """국제 금 가격을 가져옵니다 (달러/온스)"""
     return extract_price_from_naver_finance(
-        NAVER_INTERNATIONAL_GOLD_URL, "국제 금 가격 정보를 찾을 수 없습니다."
+        NAVER_INTERNATIONAL_GOLD_URL, "국제 금 가격 정보를 찾을 수 없습니다.",
+        deadline=deadline,
+        quote_cache=get_shared_quote_cache(),
     )
 
 
-def fetch_usd_krw_exchange_rate() -> float:
+def fetch_usd_krw_exchange_rate(deadline: Optional[FetchDeadline] = None) -> float:
     """USD/KRW 환율을 가져옵니다"""
     return extract_price_from_naver_finance(
-        NAVER_USD_KRW_EXCHANGE_URL, "환율 정보를 찾을 수 없습니다."
+        NAVER_USD_KRW_EXCHANGE_URL, "환율 정보를 찾을 수 없습니다.",
+        deadline=deadline,
+        quote_cache=get_shared_quote_cache(),
+    )
+
+
+async def fetch_domestic_gold_price_async(deadline: Optional[FetchDeadline] = None) -> float:
+    """국내 금 가격을 비동기로 가져옵니다 (원/g)"""
+    return await extract_price_from_naver_finance_async(
+        NAVER_DOMESTIC_GOLD_URL, "국내 금 가격 정보를 찾을 수 없습니다.",
+        deadline=deadline,
+        quote_cache=get_shared_quote_cache(),
+    )
+
+
+async def fetch_international_gold_price_async(deadline: Optional[FetchDeadline] = None) -> float:
+    """국제 금 가격을 비동기로 가져옵니다 (달러/온스)"""
+    return await extract_price_from_naver_finance_async(
+        NAVER_INTERNATIONAL_GOLD_URL, "국제 금 가격 정보를 찾을 수 없습니다.",
+        deadline=deadline,
+        quote_cache=get_shared_quote_cache(),
+    )
+
+
+async def fetch_usd_krw_exchange_rate_async(deadline: Optional[FetchDeadline] = None) -> float:
+    """USD/KRW 환율을 비동기로 가져옵니다"""
+    return await extract_price_from_naver_finance_async(
+        NAVER_USD_KRW_EXCHANGE_URL, "환율 정보를 찾을 수 없습니다.",
+        deadline=deadline,
+        quote_cache=get_shared_quote_cache(),
     )
 
 
@@ -242,59 +1102,650 @@ def calculate_kimchi_premium_values(
     return premium_amount_krw, premium_percentage
 
 
-def fetch_current_gold_market_data() -> GoldPriceData:
+def build_gold_price_data(
+    domestic_gold_price: float,
+    international_gold_price: float,
+    current_usd_krw_rate: float,
+) -> GoldPriceData:
     """
-    현재 금 가격 데이터를 수집하고 김치 프리미엄을 계산합니다.
+    세 시세로부터 원/g 환산 가격과 김치 프리미엄을 계산해 GoldPriceData를 만듭니다.
+    동기/비동기 수집 경로가 공유합니다.
+    """
+    # 국제 금 가격을 원/g으로 환산
+    international_gold_price_krw_per_gram = (
+        convert_international_gold_price_to_krw_per_gram(
+            international_gold_price, current_usd_krw_rate
+        )
+    )
+
+    # 김치 프리미엄 계산
+    premium_amount, premium_percentage = calculate_kimchi_premium_values(
+        domestic_gold_price, international_gold_price_krw_per_gram
+    )
+
+    # 데이터 객체 생성
+    return GoldPriceData(
+        domestic_price=domestic_gold_price,
+        international_price=international_gold_price,
+        usd_krw_rate=current_usd_krw_rate,
+        international_krw_per_g=international_gold_price_krw_per_gram,
+        kimchi_premium_amount=premium_amount,
+        kimchi_premium_percent=premium_percentage,
+    )
+
+
+def is_timeout_error(error: BaseException) -> bool:
+    """요청 타임아웃 계열의 예외인지 확인합니다."""
+    if isinstance(error, FetchCancelledError):
+        return error.deadline_exceeded
+    return isinstance(error, (requests.Timeout, asyncio.TimeoutError, TimeoutError))
+
+
+def build_source_fetch_failures(
+    source_errors: Dict[str, BaseException],
+    unfinished_sources: List[str],
+    deadline: FetchDeadline,
+) -> List[SourceFetchFailure]:
+    """
+    실패한 소스와 끝나지 않은 소스를 SourceFetchFailure 목록으로 정리합니다.
+    동기/비동기 수집 경로가 공유합니다.
+
+    Args:
+        source_errors: 예외로 끝난 소스 이름과 예외
+        unfinished_sources: 마감 시간 초과 또는 fail-fast로 중단된 소스 이름
+        deadline: 스냅샷 마감 시간
+
+    Returns:
+        소스별 실패 정보 목록
+    """
+    failures = [
+        SourceFetchFailure(
+            source_name=source_name,
+            timed_out=is_timeout_error(error),
+            cancelled=isinstance(error, FetchCancelledError) and not error.deadline_exceeded,
+            circuit_open=isinstance(error, CircuitOpenError),
+            error=error,
+        )
+        for source_name, error in source_errors.items()
+    ]
+    # 마감 시간이 지났으면 느린 소스, 아니면 다른 소스의 실패로 취소된 소스
+    deadline_exceeded = deadline.expired
+    failures.extend(
+        SourceFetchFailure(
+            source_name=source_name,
+            timed_out=deadline_exceeded,
+            cancelled=not deadline_exceeded,
+        )
+        for source_name in unfinished_sources
+    )
+    return failures
+
+
+def check_open_circuits(
+    serve_stale: bool,
+    source_urls: Optional[Dict[str, str]] = None,
+) -> Tuple[Dict[str, float], Dict[str, CircuitOpenError]]:
+    """
+    요청을 보내기 전에 회로가 열린 소스를 찾습니다.
+
+    Args:
+        serve_stale: True면 마지막 성공 값이 있는 소스는 그 값으로 대체
+        source_urls: 확인할 소스 이름별 URL (None이면 김치 프리미엄 스냅샷의 세 소스)
+
+    Returns:
+        (마지막 성공 값으로 대체할 소스별 시세, 바로 실패 처리할 소스별 CircuitOpenError)
+    """
+    stale_quotes: Dict[str, float] = {}
+    open_circuit_errors: Dict[str, CircuitOpenError] = {}
+    for source_name, target_url in (source_urls or MARKET_DATA_SOURCE_URLS).items():
+        open_circuit_error = get_circuit_breaker(target_url).peek_open_error()
+        if open_circuit_error is None:
+            continue
+        if serve_stale and open_circuit_error.last_good_value is not None:
+            stale_quotes[source_name] = open_circuit_error.last_good_value
+        else:
+            open_circuit_errors[source_name] = open_circuit_error
+    return stale_quotes, open_circuit_errors
+
+
+def finalize_market_quotes(
+    source_results: Dict[str, float],
+    source_errors: Dict[str, BaseException],
+    unfinished_sources: List[str],
+    stale_quotes: Dict[str, float],
+    deadline: FetchDeadline,
+) -> Tuple[Dict[str, float], List[str]]:
+    """
+    소스별 결과를 합쳐 스냅샷 시세를 만듭니다. 동기/비동기 수집 경로가 공유합니다.
+
+    Returns:
+        (소스 이름별 시세, 마지막 성공 값으로 대체된 소스 목록)
+
+    Raises:
+        MarketDataCollectionError: 실패했거나 끝나지 않은 소스가 있는 경우
+    """
+    if source_errors or unfinished_sources:
+        raise MarketDataCollectionError(
+            build_source_fetch_failures(source_errors, unfinished_sources, deadline)
+        )
+    stale_sources = [
+        source_name for source_name in MARKET_DATA_SOURCE_URLS if source_name in stale_quotes
+    ]
+    if stale_sources:
+        logger.warning(f"회로가 열린 소스는 마지막 성공 값을 사용합니다: {', '.join(stale_sources)}")
+    return {**stale_quotes, **source_results}, stale_sources
+
+
+def run_source_fetchers(
+    source_fetchers: Dict[str, Callable[[FetchDeadline], float]],
+    deadline: FetchDeadline,
+    fail_fast: bool,
+) -> Tuple[Dict[str, float], Dict[str, BaseException], List[str]]:
+    """
+    소스별 fetcher를 스레드 풀로 동시에 실행하고 마감 시간까지 기다립니다.
+    끝나면 `deadline`을 취소해 남은 요청이 다음 chunk에서 중단되게 합니다.
+
+    Returns:
+        (소스별 시세, 소스별 예외, 끝나지 않은 소스 목록)
+    """
+    source_results: Dict[str, float] = {}
+    source_errors: Dict[str, BaseException] = {}
+    if not source_fetchers:
+        return source_results, source_errors, []
+
+    executor = ThreadPoolExecutor(max_workers=len(source_fetchers))
+    try:
+        # 병렬로 데이터 수집 (공유 세션의 keep-alive 풀 사용)
+        future_sources = {
+            executor.submit(source_fetcher, deadline): source_name
+            for source_name, source_fetcher in source_fetchers.items()
+        }
+        # 순서대로 result(timeout)을 기다리면 최악의 경우 타임아웃이 누적되므로
+        # 전체를 한 번에 기다린다
+        done_futures, unfinished_futures = wait(
+            future_sources,
+            timeout=deadline.remaining(),
+            return_when=FIRST_EXCEPTION if fail_fast else ALL_COMPLETED,
+        )
+    finally:
+        # 진행 중인 요청은 취소 신호를 받거나 줄어든 타임아웃으로 곧 끝나므로 기다리지 않는다
+        deadline.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    for future in done_futures:
+        if future.exception() is None:
+            source_results[future_sources[future]] = future.result()
+        else:
+            source_errors[future_sources[future]] = future.exception()
+    unfinished_sources = [future_sources[future] for future in unfinished_futures]
+    return source_results, source_errors, unfinished_sources
+
+
+async def run_source_fetchers_async(
+    source_fetchers: Dict[str, Callable[[FetchDeadline], Awaitable[float]]],
+    deadline: FetchDeadline,
+    fail_fast: bool,
+) -> Tuple[Dict[str, float], Dict[str, BaseException], List[str]]:
+    """
+    `run_source_fetchers`의 asyncio 버전.
+    마감 시간 초과나 fail-fast 시 남은 작업을 실제로 취소(task.cancel)합니다.
+    """
+    source_results: Dict[str, float] = {}
+    source_errors: Dict[str, BaseException] = {}
+    if not source_fetchers:
+        return source_results, source_errors, []
+
+    task_sources = {
+        asyncio.ensure_future(source_fetcher(deadline)): source_name
+        for source_name, source_fetcher in source_fetchers.items()
+    }
+    try:
+        done_tasks, unfinished_tasks = await asyncio.wait(
+            task_sources,
+            timeout=deadline.remaining(),
+            return_when=asyncio.FIRST_EXCEPTION if fail_fast else asyncio.ALL_COMPLETED,
+        )
+    finally:
+        for task in task_sources:
+            if not task.done():
+                task.cancel()
+        # 취소된 작업이 연결을 정리할 때까지 기다린다 (예외는 아래에서 따로 확인)
+        await asyncio.gather(*task_sources, return_exceptions=True)
+
+    for task in done_tasks:
+        if task.exception() is None:
+            source_results[task_sources[task]] = task.result()
+        else:
+            source_errors[task_sources[task]] = task.exception()
+    unfinished_sources = [task_sources[task] for task in unfinished_tasks]
+    return source_results, source_errors, unfinished_sources
+
+
+def fetch_market_quotes(
+    deadline_seconds: Optional[float] = MARKET_SNAPSHOT_DEADLINE_SECONDS,
+    fail_fast: bool = MARKET_SNAPSHOT_FAIL_FAST,
+    serve_stale: bool = MARKET_SNAPSHOT_SERVE_STALE,
+) -> Tuple[Dict[str, float], List[str]]:
+    """
+    세 시세를 스레드 풀로 동시에 가져옵니다.
+
+    Args:
+        deadline_seconds: 세 요청 전체에 대한 마감 시간 (None이면 제한 없음)
+        fail_fast: True면 한 소스가 실패하는 즉시 나머지 요청을 중단
+        serve_stale: True면 회로가 열린 소스를 마지막 성공 값으로 대체
+
+    Returns:
+        (소스 이름별 시세, 마지막 성공 값으로 대체된 소스 목록)
+
+    Raises:
+        MarketDataCollectionError: 하나 이상의 소스가 실패하거나 마감 시간을 넘긴 경우
+    """
+    deadline = FetchDeadline(deadline_seconds)
+    stale_quotes, open_circuit_errors = check_open_circuits(serve_stale)
+    if open_circuit_errors and fail_fast:
+        # 스냅샷을 완성할 수 없으므로 나머지 소스에도 요청을 보내지 않음
+        raise MarketDataCollectionError(
+            build_source_fetch_failures(open_circuit_errors, [], deadline)
+        )
+
+    source_fetchers = {
+        DOMESTIC_GOLD_SOURCE: fetch_domestic_gold_price,
+        INTERNATIONAL_GOLD_SOURCE: fetch_international_gold_price,
+        USD_KRW_SOURCE: fetch_usd_krw_exchange_rate,
+    }
+    for skipped_source in [*stale_quotes, *open_circuit_errors]:
+        del source_fetchers[skipped_source]
+
+    source_results, source_errors, unfinished_sources = run_source_fetchers(
+        source_fetchers, deadline, fail_fast
+    )
+    source_errors = {**open_circuit_errors, **source_errors}
+    return finalize_market_quotes(
+        source_results, source_errors, unfinished_sources, stale_quotes, deadline
+    )
+
+
+async def fetch_market_quotes_async(
+    deadline_seconds: Optional[float] = MARKET_SNAPSHOT_DEADLINE_SECONDS,
+    fail_fast: bool = MARKET_SNAPSHOT_FAIL_FAST,
+    serve_stale: bool = MARKET_SNAPSHOT_SERVE_STALE,
+) -> Tuple[Dict[str, float], List[str]]:
+    """
+    `fetch_market_quotes`의 asyncio 버전.
+    마감 시간 초과나 fail-fast 시 남은 작업을 실제로 취소(task.cancel)합니다.
+
+    Raises:
+        MarketDataCollectionError: 하나 이상의 소스가 실패하거나 마감 시간을 넘긴 경우
+    """
+    deadline = FetchDeadline(deadline_seconds)
+    stale_quotes, open_circuit_errors = check_open_circuits(serve_stale)
+    if open_circuit_errors and fail_fast:
+        raise MarketDataCollectionError(
+            build_source_fetch_failures(open_circuit_errors, [], deadline)
+        )
+
+    source_fetchers = {
+        DOMESTIC_GOLD_SOURCE: fetch_domestic_gold_price_async,
+        INTERNATIONAL_GOLD_SOURCE: fetch_international_gold_price_async,
+        USD_KRW_SOURCE: fetch_usd_krw_exchange_rate_async,
+    }
+    for skipped_source in [*stale_quotes, *open_circuit_errors]:
+        del source_fetchers[skipped_source]
+
+    source_results, source_errors, unfinished_sources = await run_source_fetchers_async(
+        source_fetchers, deadline, fail_fast
+    )
+    source_errors = {**open_circuit_errors, **source_errors}
+    return finalize_market_quotes(
+        source_results, source_errors, unfinished_sources, stale_quotes, deadline
+    )
+
+
+def build_gold_price_data_from_quotes(
+    market_quotes: Dict[str, float], stale_sources: Optional[List[str]] = None
+) -> GoldPriceData:
+    """소스 이름별 시세로 GoldPriceData를 만듭니다."""
+    gold_market_data = build_gold_price_data(
+        market_quotes[DOMESTIC_GOLD_SOURCE],
+        market_quotes[INTERNATIONAL_GOLD_SOURCE],
+        market_quotes[USD_KRW_SOURCE],
+    )
+    gold_market_data.stale_sources = list(stale_sources or [])
+    return gold_market_data
+
+
+def get_market_data_feed_states() -> Dict[str, CircuitBreakerStatus]:
+    """
+    소스별 서킷 브레이커 상태를 반환합니다.
+    요청을 보내지 않으므로 대시보드가 자주 호출해도 타임아웃 지연이 없습니다.
+    """
+    return {
+        source_name: get_circuit_breaker(target_url).status()
+        for source_name, target_url in MARKET_DATA_SOURCE_URLS.items()
+    }
+
+
+def calculate_metal_premiums(market_quotes: Dict[str, float]) -> Dict[str, MetalPremium]:
+    """
+    수집된 종목 시세로 귀금속별 원/g 환산 가격과 프리미엄을 계산합니다.
+    국제 시세나 USD/KRW가 없는 귀금속은 건너뜁니다.
+    """
+    usd_krw_rate = market_quotes.get(METAL_CONVERSION_RATE_KEY)
+    if usd_krw_rate is None:
+        return {}
+
+    metal_premiums: Dict[str, MetalPremium] = {}
+    for metal, metal_definition in METAL_DEFINITIONS.items():
+        international_price = market_quotes.get(metal_definition.international_key)
+        if international_price is None:
+            continue
+        # 금 이외의 귀금속도 같은 트로이 온스 -> 그램 환산을 사용
+        international_krw_per_gram = convert_international_gold_price_to_krw_per_gram(
+            international_price, usd_krw_rate
+        )
+        domestic_price = market_quotes.get(metal_definition.domestic_key or "")
+        premium_amount = premium_percent = None
+        if domestic_price is not None:
+            premium_amount, premium_percent = calculate_kimchi_premium_values(
+                domestic_price, international_krw_per_gram
+            )
+        metal_premiums[metal] = MetalPremium(
+            metal=metal,
+            international_price=international_price,
+            international_krw_per_g=international_krw_per_gram,
+            domestic_price=domestic_price,
+            premium_amount=premium_amount,
+            premium_percent=premium_percent,
+        )
+    return metal_premiums
+
+
+def build_instrument_snapshot(
+    instruments: List[MarketInstrument],
+    source_results: Dict[str, float],
+    stale_quotes: Dict[str, float],
+    failures: List[SourceFetchFailure],
+) -> InstrumentSnapshot:
+    """종목별 결과를 레지스트리 순서의 InstrumentSnapshot으로 정리합니다."""
+    market_quotes = {**stale_quotes, **source_results}
+    return InstrumentSnapshot(
+        quotes={
+            instrument.key: InstrumentQuote(
+                instrument,
+                market_quotes[instrument.key],
+                stale=instrument.key in stale_quotes,
+            )
+            for instrument in instruments
+            if instrument.key in market_quotes
+        },
+        metal_premiums=calculate_metal_premiums(market_quotes),
+        failures=failures,
+    )
+
+
+def prepare_instrument_fetch(
+    instrument_names: Optional[Iterable[str]],
+    deadline_seconds: Optional[float],
+    serve_stale: bool,
+    require_all: bool,
+) -> Tuple[List[MarketInstrument], FetchDeadline, Dict[str, float], Dict[str, CircuitOpenError]]:
+    """동기/비동기 다중 종목 수집이 공유하는 준비 단계 (종목 해석, 열린 회로 확인)"""
+    instruments = resolve_instruments(instrument_names)
+    deadline = FetchDeadline(deadline_seconds)
+    stale_quotes, open_circuit_errors = check_open_circuits(
+        serve_stale, {instrument.key: instrument.url for instrument in instruments}
+    )
+    if open_circuit_errors and require_all:
+        # 모든 종목을 채울 수 없으므로 나머지 종목에도 요청을 보내지 않음
+        raise MarketDataCollectionError(
+            build_source_fetch_failures(open_circuit_errors, [], deadline)
+        )
+    return instruments, deadline, stale_quotes, open_circuit_errors
+
+
+def finalize_instrument_snapshot(
+    instruments: List[MarketInstrument],
+    deadline: FetchDeadline,
+    fetch_results: Tuple[Dict[str, float], Dict[str, BaseException], List[str]],
+    stale_quotes: Dict[str, float],
+    open_circuit_errors: Dict[str, CircuitOpenError],
+    require_all: bool,
+) -> InstrumentSnapshot:
+    source_results, source_errors, unfinished_sources = fetch_results
+    failures = build_source_fetch_failures(
+        {**open_circuit_errors, **source_errors}, unfinished_sources, deadline
+    )
+    if failures:
+        failure_summary = ", ".join(failure.describe() for failure in failures)
+        if require_all:
+            logger.error(f"다중 종목 수집 실패: {failure_summary}")
+            raise MarketDataCollectionError(failures)
+        logger.warning(f"일부 종목 수집 실패: {failure_summary}")
+    return build_instrument_snapshot(instruments, source_results, stale_quotes, failures)
+
+
+def fetch_instrument_snapshot(
+    instrument_names: Optional[Iterable[str]] = None,
+    deadline_seconds: Optional[float] = MARKET_SNAPSHOT_DEADLINE_SECONDS,
+    serve_stale: bool = MARKET_SNAPSHOT_SERVE_STALE,
+    require_all: bool = False,
+) -> InstrumentSnapshot:
+    """
+    여러 종목을 한 번의 호출로 동시에 가져옵니다 (공유 세션의 keep-alive 풀 사용).
+
+    Args:
+        instrument_names: 종목 키, 귀금속 이름("gold", "silver", "platinum"),
+            통화 코드("USD", "JPY", "CNY", "EUR")의 목록 (None이면 전체 종목)
+        deadline_seconds: 전체 요청에 대한 마감 시간 (초)
+        serve_stale: True면 회로가 열린 종목을 마지막 성공 값으로 대체 (`stale` 표시)
+        require_all: True면 한 종목이라도 실패할 때 MarketDataCollectionError를 발생
+            (False면 성공한 종목만 담고 실패 정보는 `failures`에 기록)
+
+    Returns:
+        InstrumentSnapshot 객체
+
+    Raises:
+        ValueError: 알 수 없는 종목 이름인 경우
+        MarketDataCollectionError: require_all이 True이고 실패한 종목이 있는 경우
+    """
+    instruments, deadline, stale_quotes, open_circuit_errors = prepare_instrument_fetch(
+        instrument_names, deadline_seconds, serve_stale, require_all
+    )
+    quote_cache = get_shared_quote_cache()
+    source_fetchers = {
+        instrument.key: (
+            lambda fetch_deadline, instrument=instrument: extract_price_from_naver_finance(
+                instrument.url,
+                f"{instrument.display_name} 시세 정보를 찾을 수 없습니다.",
+                deadline=fetch_deadline,
+                quote_cache=quote_cache,
+            )
+        )
+        for instrument in instruments
+        if instrument.key not in stale_quotes and instrument.key not in open_circuit_errors
+    }
+    fetch_results = run_source_fetchers(source_fetchers, deadline, fail_fast=require_all)
+    return finalize_instrument_snapshot(
+        instruments, deadline, fetch_results, stale_quotes, open_circuit_errors, require_all
+    )
+
+
+async def fetch_instrument_snapshot_async(
+    instrument_names: Optional[Iterable[str]] = None,
+    deadline_seconds: Optional[float] = MARKET_SNAPSHOT_DEADLINE_SECONDS,
+    serve_stale: bool = MARKET_SNAPSHOT_SERVE_STALE,
+    require_all: bool = False,
+) -> InstrumentSnapshot:
+    """
+    `fetch_instrument_snapshot`의 asyncio 버전.
+    현재 이벤트 루프 하나에서 공유 비동기 커넥션 풀로 모든 종목을 동시에 가져옵니다.
+    """
+    instruments, deadline, stale_quotes, open_circuit_errors = prepare_instrument_fetch(
+        instrument_names, deadline_seconds, serve_stale, require_all
+    )
+    quote_cache = get_shared_quote_cache()
+    source_fetchers = {
+        instrument.key: (
+            lambda fetch_deadline, instrument=instrument: extract_price_from_naver_finance_async(
+                instrument.url,
+                f"{instrument.display_name} 시세 정보를 찾을 수 없습니다.",
+                deadline=fetch_deadline,
+                quote_cache=quote_cache,
+            )
+        )
+        for instrument in instruments
+        if instrument.key not in stale_quotes and instrument.key not in open_circuit_errors
+    }
+    fetch_results = await run_source_fetchers_async(
+        source_fetchers, deadline, fail_fast=require_all
+    )
+    return finalize_instrument_snapshot(
+        instruments, deadline, fetch_results, stale_quotes, open_circuit_errors, require_all
+    )
+
+
+def copy_gold_price_data(gold_price_data: GoldPriceData) -> GoldPriceData:
+    """합쳐진 요청의 결과를 호출자별 복사본으로 만듭니다 (목록 필드까지 따로 가짐)."""
+    return dataclasses.replace(gold_price_data, stale_sources=list(gold_price_data.stale_sources))
+
+
+# 동시에 들어온 스냅샷 요청을 하나로 합친다 (스레드용, 이벤트 루프용)
+_market_snapshot_single_flight = SingleFlight()
+_market_snapshot_single_flight_async = AsyncSingleFlight()
+
+
+def collect_gold_market_data_snapshot(
+    deadline_seconds: Optional[float] = MARKET_SNAPSHOT_DEADLINE_SECONDS,
+    fail_fast: bool = MARKET_SNAPSHOT_FAIL_FAST,
+    serve_stale: bool = MARKET_SNAPSHOT_SERVE_STALE,
+) -> GoldPriceData:
+    """
+    시세 스냅샷을 실제로 한 번 수집합니다 (single-flight 없이).
     성능 최적화를 위해 ThreadPoolExecutor를 사용하여
     여러 웹 페이지의 데이터를 병렬로 수집합니다.
 
+    Args:
+        deadline_seconds: 스냅샷 전체 마감 시간 (초)
+        fail_fast: True면 한 소스가 실패하는 즉시 나머지 요청을 중단
+        serve_stale: True면 회로가 열린 소스를 마지막 성공 값으로 대체
+            (대체된 소스는 `GoldPriceData.stale_sources`에 표시)
+
     Returns:
         GoldPriceData 객체
 
     Raises:
-        ValueError: 데이터 수집 실패 시
+        MarketDataCollectionError: 데이터 수집 실패 시 (ValueError 하위 클래스,
+            `failures`에 소스별 실패 정보 포함)
     """
     try:
         logger.info("금 가격 데이터 수집 시작 (병렬)")
 
-        # 병렬로 데이터 수집
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            future_domestic = executor.submit(fetch_domestic_gold_price)
-            future_international = executor.submit(fetch_international_gold_price)
-            future_usd_krw = executor.submit(fetch_usd_krw_exchange_rate)
+        market_quotes, stale_sources = fetch_market_quotes(
+            deadline_seconds, fail_fast, serve_stale
+        )
+        gold_market_data = build_gold_price_data_from_quotes(market_quotes, stale_sources)
 
-            domestic_gold_price = future_domestic.result(timeout=15)
-            international_gold_price = future_international.result(timeout=15)
-            current_usd_krw_rate = future_usd_krw.result(timeout=15)
+        logger.info(f"데이터 수집 완료: 김치 프리미엄 {gold_market_data.kimchi_premium_percent:.2f}%")
+        return gold_market_data
 
-        # 국제 금 가격을 원/g으로 환산
-        international_gold_price_krw_per_gram = (
-            convert_international_gold_price_to_krw_per_gram(
-                international_gold_price, current_usd_krw_rate
-            )
-        )
+    except MarketDataCollectionError as collection_error:
+        logger.error(f"금 가격 데이터 수집 실패: {collection_error.describe_failures()}")
+        raise
+    except Exception as collection_error:
+        logger.error(f"금 가격 데이터 수집 실패: {collection_error}")
+        raise MarketDataCollectionError([])
+
+
+def fetch_current_gold_market_data(
+    deadline_seconds: Optional[float] = MARKET_SNAPSHOT_DEADLINE_SECONDS,
+    fail_fast: bool = MARKET_SNAPSHOT_FAIL_FAST,
+    serve_stale: bool = MARKET_SNAPSHOT_SERVE_STALE,
+) -> GoldPriceData:
+    """
+    현재 금 가격 데이터를 수집하고 김치 프리미엄을 계산합니다.
+
+    같은 인자로 진행 중인 수집이 있으면 새로 요청하지 않고 그 결과(또는 예외)를
+    함께 받습니다. 여러 스레드가 동시에 호출해도 소스당 요청은 한 번입니다.
+    호출자마다 결과의 복사본을 받으므로 한 호출자가 값을 바꿔도 다른 호출자에게는 영향이 없습니다.
+
+    Args:
+        deadline_seconds: 스냅샷 전체 마감 시간 (초)
+        fail_fast: True면 한 소스가 실패하는 즉시 나머지 요청을 중단
+        serve_stale: True면 회로가 열린 소스를 마지막 성공 값으로 대체
+            (대체된 소스는 `GoldPriceData.stale_sources`에 표시)
+
+    Returns:
+        GoldPriceData 객체
 
-        # 김치 프리미엄 계산
-        premium_amount, premium_percentage = calculate_kimchi_premium_values(
-            domestic_gold_price, international_gold_price_krw_per_gram
+    Raises:
+        MarketDataCollectionError: 데이터 수집 실패 시 (ValueError 하위 클래스,
+            `failures`에 소스별 실패 정보 포함)
+    """
+    return copy_gold_price_data(
+        _market_snapshot_single_flight.call(
+            (deadline_seconds, fail_fast, serve_stale),
+            lambda: collect_gold_market_data_snapshot(deadline_seconds, fail_fast, serve_stale),
         )
+    )
+
+
+async def collect_gold_market_data_snapshot_async(
+    deadline_seconds: Optional[float] = MARKET_SNAPSHOT_DEADLINE_SECONDS,
+    fail_fast: bool = MARKET_SNAPSHOT_FAIL_FAST,
+    serve_stale: bool = MARKET_SNAPSHOT_SERVE_STALE,
+) -> GoldPriceData:
+    """
+    `collect_gold_market_data_snapshot`의 asyncio 버전.
+    스레드 풀 없이 현재 이벤트 루프 하나에서 세 시세를 동시에 수집합니다.
+
+    Returns:
+        GoldPriceData 객체
 
-        # 데이터 객체 생성
-        gold_market_data = GoldPriceData(
-            domestic_price=domestic_gold_price,
-            international_price=international_gold_price,
-            usd_krw_rate=current_usd_krw_rate,
-            international_krw_per_g=international_gold_price_krw_per_gram,
-            kimchi_premium_amount=premium_amount,
-            kimchi_premium_percent=premium_percentage,
+    Raises:
+        MarketDataCollectionError: 데이터 수집 실패 시
+    """
+    try:
+        logger.info("금 가격 데이터 수집 시작 (asyncio)")
+
+        market_quotes, stale_sources = await fetch_market_quotes_async(
+            deadline_seconds, fail_fast, serve_stale
         )
+        gold_market_data = build_gold_price_data_from_quotes(market_quotes, stale_sources)
 
-        logger.info(f"데이터 수집 완료: 김치 프리미엄 {premium_percentage:.2f}%")
+        logger.info(f"데이터 수집 완료: 김치 프리미엄 {gold_market_data.kimchi_premium_percent:.2f}%")
         return gold_market_data
 
+    except MarketDataCollectionError as collection_error:
+        logger.error(f"금 가격 데이터 수집 실패: {collection_error.describe_failures()}")
+        raise
     except Exception as collection_error:
         logger.error(f"금 가격 데이터 수집 실패: {collection_error}")
-        raise ValueError("금 가격 데이터를 가져올 수 없습니다. 시스템 로그를 확인해주세요.")
+        raise MarketDataCollectionError([])
+
+
+async def fetch_current_gold_market_data_async(
+    deadline_seconds: Optional[float] = MARKET_SNAPSHOT_DEADLINE_SECONDS,
+    fail_fast: bool = MARKET_SNAPSHOT_FAIL_FAST,
+    serve_stale: bool = MARKET_SNAPSHOT_SERVE_STALE,
+) -> GoldPriceData:
+    """
+    `fetch_current_gold_market_data`의 asyncio 버전.
+    같은 이벤트 루프에서 동시에 호출된 코루틴들은 하나의 수집 태스크를 공유합니다.
+    호출자 하나가 취소되어도 공유 태스크는 다른 호출자를 위해 계속 실행됩니다.
+    동기 버전과 같이 호출자마다 결과의 복사본을 돌려줍니다.
+
+    Returns:
+        GoldPriceData 객체
+
+    Raises:
+        MarketDataCollectionError: 데이터 수집 실패 시
+    """
+    return copy_gold_price_data(
+        await _market_snapshot_single_flight_async.call(
+            (deadline_seconds, fail_fast, serve_stale),
+            lambda: collect_gold_market_data_snapshot_async(deadline_seconds, fail_fast, serve_stale),
+        )
+    )
 
 
 # 하위 호환성을 위한 레거시 함수들
@@ -334,6 +1785,8 @@ def print_formatted_gold_price(data: GoldPriceData):
     print(
         f"  -> 김치 프리미엄: {data.kimchi_premium_amount:,.2f} 원 ({data.kimchi_premium_percent:.2f}%)"
     )
+    if data.is_stale:
+        print(f"  [주의] 마지막 성공 값으로 대체된 시세: {', '.join(data.stale_sources)}")
     print("--------------------")
 
 
@@ -344,6 +1797,14 @@ def main():
     try:
         # 로깅 설정 (콘솔 출력용)
 
+        # CLI는 실행마다 새 프로세스이므로 디스크 캐시로 짧은 간격의 반복 실행을 흡수.
+        # 백그라운드 갱신 스레드는 프로세스가 끝나면 같이 죽으므로 stale 구간 없이
+        # TTL이 지난 값은 바로 조건부 GET으로 재검증한다 (바뀌지 않았으면 304)
+        if QUOTE_CACHE_ENABLED:
+            set_shared_quote_cache(QuoteCache(persist_path=QUOTE_CACHE_FILE, stale_while_revalidate_seconds=0.0))
+        if PAGE_ARCHIVE_ENABLED:
+            set_shared_page_archive(PageArchive())
+
         current_gold_data = fetch_current_gold_market_data()
         print_formatted_gold_price(current_gold_data)
 
@@ -0,0 +1,312 @@
+"""
+가격 로그를 한 번만 파싱해 여러 단계가 함께 쓰는 가격 이력 로더입니다.
+
+이상치 분석, 차트, 백테스트, 웹사이트가 각자 `pd.read_csv`로 같은 로그를 읽던 것을
+`load_price_history()` 하나로 모읍니다. 반환 형식은 항상 같습니다.
+
+    인덱스: 날짜 (datetime64[s], 이름 "날짜", 오름차순 정렬, 시각 부분은 버림)
+    열:     국내금(원/g), 국제금(달러/온스), 환율(원/달러), 김치프리미엄(원/g), 김치프리미엄(%) (float64)
+
+파싱 결과는 프로세스 안에서 (inode, 수정 시각, 크기)를 키로 캐시하므로 파일이 바뀌지
+않았으면 다시 파싱하지 않습니다. 디스크 캐시를 켜면 열 저장소(`price_columns`)를
+파싱 결과로 쓰므로, 수집 스크립트가 갱신해 둔 열 파일을 다른 프로세스(차트, 이상치 분석)가
+CSV 파싱 없이 바로 읽습니다.
+
+디스크 캐시나 월별 위치 색인을 켜 두면 읽기만 하는 쪽도 로그 옆의 열 저장소
+(`.<로그 이름>.columns/`)와 색인(`.<로그 이름>.months.json`)이 없거나 뒤처졌을 때 만들거나
+갱신합니다. 이 파일들은 로그와 같은 권한으로 쓰고(.gitignore 대상), 디렉터리에 쓸 수 없으면
+경고만 남기고 CSV를 직접 파싱합니다. 읽는 쪽에서 파일을 만들지 않으려면
+`use_disk_cache=False`(와 `load_price_history_since()`의 `use_month_index=False`)를 넘기거나
+설정에서 끕니다.
+
+대시보드나 모의 매매 루프처럼 오래 떠 있는 쪽은 `IncrementalPriceHistory`를 씁니다.
+마지막으로 읽은 바이트 위치와 행 수를 기억해 두었다가 그 뒤에 추가된 줄만 파싱해
+메모리의 열 배열에 이어 붙이고, 파일이 바뀌었으면(inode, 크기, 끝부분 바이트로 판단)
+처음부터 다시 읽습니다.
+
+최근 기간만 필요한 쪽(차트, 이상치 분석)은 `load_price_history_since()`를 씁니다. 월별 바이트
+위치 색인(`price_log_month_index`)으로 시작 날짜가 속한 달까지 건너뛰어 그 뒤만 파싱합니다.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .configuration import (
+    CSV_COLUMN_HEADERS,
+    GOLD_PRICE_DATA_CSV_FILE,
+    PRICE_HISTORY_DISK_CACHE_ENABLED,
+    PRICE_LOG_MONTH_INDEX_ENABLED,
+)
+from .price_columns import (
+    DATE_COLUMN_DTYPE,
+    VALUE_COLUMN_DTYPE,
+    ColumnarPriceStore,
+    PriceColumns,
+    parse_price_log_bytes,
+    read_price_log_arrays,
+)
+from .price_log_lookup import INDEX_TAIL_CHECK_BYTES
+from .price_log_month_index import read_price_log_range
+from .price_storage import PRICE_VALUE_COLUMNS
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+PRICE_HISTORY_DATE_COLUMN = CSV_COLUMN_HEADERS[0]
+PRICE_HISTORY_VALUE_COLUMNS = CSV_COLUMN_HEADERS[1:]
+# 초 단위: 나노초 단위(1677~2262년)와 달리 합성 장기 로그의 날짜도 담을 수 있음
+PRICE_HISTORY_DATE_DTYPE = np.dtype("datetime64[s]")
+
+INCREMENTAL_HISTORY_INITIAL_CAPACITY = 4096  # 메모리 열 배열의 처음 크기 (모자라면 두 배로 늘림)
+
+# 해석한 경로 -> ((inode, 수정 시각 ns, 크기), 파싱된 이력)
+_price_history_cache: Dict[Path, Tuple[Tuple[int, int, int], pd.DataFrame]] = {}
+_price_history_cache_lock = threading.Lock()
+
+
+def read_price_history_csv(csv_file_path: Path) -> pd.DataFrame:
+    """
+    CSV를 파싱해 가격 이력 형식으로 만듭니다 (캐시 없음).
+
+    Bolt Optimization: `read_price_log_arrays()`로 float64/datetime64 배열을 바로 만들고
+    DataFrame은 마지막에 한 번만 만듭니다 (문자열 날짜 열, 형식 추론, .dt.date 없음).
+    형식이 어긋난 행은 열 저장소와 같이 경고 후 건너뜁니다.
+
+    Raises:
+        ValueError: 날짜를 해석할 수 없는 행이 있는 경우
+    """
+    return price_columns_to_history(read_price_log_arrays(csv_file_path))
+
+
+def price_columns_to_history(price_columns: PriceColumns) -> pd.DataFrame:
+    """열 저장소 배열을 가격 이력 형식으로 만듭니다 (배열은 복사되므로 매핑이 바뀌어도 안전)."""
+    date_index = pd.DatetimeIndex(price_columns.dates.astype(PRICE_HISTORY_DATE_DTYPE), name=PRICE_HISTORY_DATE_COLUMN)
+    price_history = pd.DataFrame(
+        {header: np.array(column) for header, column in zip(PRICE_HISTORY_VALUE_COLUMNS, price_columns[1:])},
+        index=date_index,
+    )
+    if not price_history.index.is_monotonic_increasing:
+        # 백필이나 수동 편집으로 순서가 섞인 로그: 같은 날짜끼리는 기록 순서를 유지
+        price_history = price_history.sort_index(kind="mergesort")
+    return price_history
+
+
+def load_price_history(
+    csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE,
+    use_disk_cache: Optional[bool] = None,
+) -> pd.DataFrame:
+    """
+    가격 로그를 날짜 인덱스 DataFrame으로 읽습니다.
+
+    같은 프로세스에서 파일이 바뀌지 않았으면 캐시된 결과를 돌려줍니다. 반환값은 깊은
+    복사본이라 pandas의 Copy-on-Write 설정과 관계없이 호출한 쪽이 열을 추가하거나 값을
+    제자리에서 바꿔도 캐시와 다른 호출자의 결과에는 영향이 없습니다 (복사는 파싱보다 훨씬 쌈).
+
+    Args:
+        csv_file_path: 가격 로그 CSV 경로
+        use_disk_cache: 열 저장소를 파싱 결과 캐시로 쓸지 여부 (None이면 설정값)
+
+    Returns:
+        pd.DataFrame: 날짜(DatetimeIndex) 오름차순의 float64 가격 열
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+        pd.errors.EmptyDataError: 파일이 비어 있는 경우
+    """
+    if use_disk_cache is None:
+        use_disk_cache = PRICE_HISTORY_DISK_CACHE_ENABLED
+    resolved_file_path = Path(csv_file_path).resolve()
+    file_stat = os.stat(resolved_file_path)
+    if file_stat.st_size == 0:
+        raise pd.errors.EmptyDataError(f"비어있는 가격 로그: {csv_file_path}")
+    cache_key = (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+
+    with _price_history_cache_lock:
+        cached_entry = _price_history_cache.get(resolved_file_path)
+    if cached_entry is not None and cached_entry[0] == cache_key:
+        return cached_entry[1].copy(deep=True)
+
+    price_history = None
+    if use_disk_cache:
+        try:
+            columnar_store = ColumnarPriceStore(resolved_file_path)
+            columnar_store.sync()
+            price_history = price_columns_to_history(columnar_store.load())
+        except (OSError, ValueError) as cache_error:
+            logger.warning(f"열 저장소를 읽지 못해 CSV를 직접 파싱합니다: {csv_file_path} - {cache_error}")
+    if price_history is None:
+        price_history = read_price_history_csv(resolved_file_path)
+    logger.debug(f"가격 이력 파싱 완료: {csv_file_path} ({len(price_history)} 행)")
+
+    with _price_history_cache_lock:
+        _price_history_cache[resolved_file_path] = (cache_key, price_history)
+    return price_history.copy(deep=True)
+
+
+def load_price_history_since(
+    csv_file_path: Path,
+    start_date,
+    use_month_index: Optional[bool] = None,
+    use_disk_cache: Optional[bool] = None,
+) -> pd.DataFrame:
+    """
+    가격 로그에서 `start_date` 이후 행만 `load_price_history()`와 같은 형식으로 읽습니다.
+
+    Bolt Optimization: 월별 위치 색인으로 시작 날짜가 속한 달의 첫 행까지 건너뛰어 그 뒤만
+    파싱하므로 읽는 비용이 전체 이력이 아니라 기간 길이에 비례합니다. 같은 프로세스에서 이미
+    전체 이력을 읽어 두었으면 그 캐시를 자르고, 날짜순이 아닌 로그는 전체 이력을 읽어 거릅니다.
+
+    Args:
+        csv_file_path: 가격 로그 CSV 경로
+        start_date: 시작 날짜 (이 날짜의 행 포함)
+        use_month_index: 월별 위치 색인을 쓸지 여부 (None이면 설정값)
+        use_disk_cache: 전체 이력을 읽어 거를 때 열 저장소를 쓸지 여부 (None이면 설정값)
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+        pd.errors.EmptyDataError: 파일이 비어 있는 경우
+    """
+    if use_month_index is None:
+        use_month_index = PRICE_LOG_MONTH_INDEX_ENABLED
+    resolved_file_path = Path(csv_file_path).resolve()
+    file_stat = os.stat(resolved_file_path)
+    if file_stat.st_size == 0:
+        raise pd.errors.EmptyDataError(f"비어있는 가격 로그: {csv_file_path}")
+    start_timestamp = pd.Timestamp(np.datetime64(start_date, "D"))
+
+    with _price_history_cache_lock:
+        cached_entry = _price_history_cache.get(resolved_file_path)
+    if cached_entry is not None and cached_entry[0] == (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size):
+        cached_history = cached_entry[1]
+        return cached_history[cached_history.index >= start_timestamp].copy(deep=True)
+
+    if use_month_index:
+        try:
+            price_columns = read_price_log_range(resolved_file_path, start_date)
+        except ValueError as index_error:
+            logger.warning(f"월별 위치 색인으로 읽지 못해 전체 이력을 읽습니다: {csv_file_path} - {index_error}")
+            price_columns = None
+        if price_columns is not None:
+            return price_columns_to_history(price_columns)
+    price_history = load_price_history(resolved_file_path, use_disk_cache)
+    return price_history[price_history.index >= start_timestamp]
+
+
+def clear_price_history_cache() -> None:
+    """프로세스 안의 파싱 결과 캐시를 비웁니다."""
+    with _price_history_cache_lock:
+        _price_history_cache.clear()
+
+
+class IncrementalPriceHistory:
+    """
+    추가된 줄만 읽어 메모리의 열 배열에 이어 붙이는 가격 이력입니다.
+
+    `refresh()`를 주기적으로 부르면 마지막으로 읽은 바이트 위치 뒤의 완성된 줄만 파싱합니다.
+    개행 전까지만 기록된 마지막 줄은 다음 호출로 미루고, 로그가 잘리거나 다른 파일로
+    바뀌었으면 처음부터 다시 읽습니다.
+    """
+
+    def __init__(
+        self,
+        csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE,
+        initial_capacity: int = INCREMENTAL_HISTORY_INITIAL_CAPACITY,
+    ):
+        self.csv_file_path = Path(csv_file_path)
+        self.initial_capacity = max(1, initial_capacity)
+        self.full_reload_count = 0
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """읽은 위치와 메모리 열을 비웁니다 (다음 `refresh()`는 처음부터 읽음)."""
+        self.byte_offset = 0
+        self.row_count = 0
+        self.inode: Optional[int] = None
+        self.tail = b""
+        self._day_numbers = np.empty(self.initial_capacity, dtype=DATE_COLUMN_DTYPE)
+        self._values = np.empty((self.initial_capacity, len(PRICE_VALUE_COLUMNS)), dtype=VALUE_COLUMN_DTYPE)
+
+    def is_continuation_of_read_data(self, binary_file, file_stat: os.stat_result) -> bool:
+        """파일이 마지막으로 읽은 내용 뒤에 줄이 추가되기만 했는지 확인합니다."""
+        if self.inode != file_stat.st_ino or file_stat.st_size < self.byte_offset:
+            return False
+        binary_file.seek(self.byte_offset - len(self.tail))
+        return binary_file.read(len(self.tail)) == self.tail
+
+    def refresh(self) -> int:
+        """
+        마지막으로 읽은 뒤 추가된 행을 읽어 들입니다.
+
+        Returns:
+            새로 읽은 행 수 (처음부터 다시 읽었으면 전체 행 수)
+
+        Raises:
+            FileNotFoundError: 로그 파일이 없는 경우
+        """
+        with self._lock, self.csv_file_path.open("rb") as binary_file:
+            file_stat = os.fstat(binary_file.fileno())
+            if self.inode is None or not self.is_continuation_of_read_data(binary_file, file_stat):
+                if self.inode is not None:
+                    logger.info(f"가격 로그가 잘리거나 바뀌어 처음부터 다시 읽습니다: {self.csv_file_path}")
+                    self.full_reload_count += 1
+                self.reset()
+                binary_file.seek(0)
+                header_line = binary_file.readline()
+                if not header_line.endswith(b"\n"):
+                    # 헤더도 아직 다 기록되지 않은 로그
+                    return 0
+                self.inode = file_stat.st_ino
+                self.byte_offset = len(header_line)
+                self.tail = header_line[-INDEX_TAIL_CHECK_BYTES:]
+
+            if file_stat.st_size == self.byte_offset:
+                return 0
+            binary_file.seek(self.byte_offset)
+            appended_bytes = binary_file.read(file_stat.st_size - self.byte_offset)
+            # 기록 중인 마지막 줄(개행 전)은 다음 호출 때 읽는다
+            complete_length = appended_bytes.rfind(b"\n") + 1
+            if complete_length == 0:
+                return 0
+            day_numbers, values = parse_price_log_bytes(appended_bytes[:complete_length])
+            self.append_rows(day_numbers, values)
+
+            self.byte_offset += complete_length
+            self.tail = (self.tail + appended_bytes[:complete_length])[-INDEX_TAIL_CHECK_BYTES:]
+            return len(day_numbers)
+
+    def append_rows(self, day_numbers: np.ndarray, values: np.ndarray) -> None:
+        new_row_count = self.row_count + len(day_numbers)
+        if new_row_count > len(self._day_numbers):
+            # Bolt Optimization: 두 배씩 늘려 한 행씩 추가해도 복사 비용은 분할 상환 O(1)
+            new_capacity = max(new_row_count, 2 * len(self._day_numbers))
+            grown_day_numbers = np.empty(new_capacity, dtype=DATE_COLUMN_DTYPE)
+            grown_day_numbers[: self.row_count] = self._day_numbers[: self.row_count]
+            grown_values = np.empty((new_capacity, len(PRICE_VALUE_COLUMNS)), dtype=VALUE_COLUMN_DTYPE)
+            grown_values[: self.row_count] = self._values[: self.row_count]
+            self._day_numbers, self._values = grown_day_numbers, grown_values
+        self._day_numbers[self.row_count : new_row_count] = day_numbers
+        self._values[self.row_count : new_row_count] = values
+        self.row_count = new_row_count
+
+    def columns(self) -> PriceColumns:
+        """
+        지금까지 읽은 행의 읽기 전용 열 뷰를 반환합니다 (파일 순서, 복사 없음).
+        이후 `refresh()`는 이 뷰의 범위 밖에만 쓰므로 받아 둔 뷰의 값은 바뀌지 않습니다.
+        """
+        with self._lock:
+            columns = [self._day_numbers[: self.row_count].view("datetime64[D]")]
+            columns.extend(self._values[: self.row_count, column_index] for column_index in range(len(PRICE_VALUE_COLUMNS)))
+        for column in columns:
+            column.flags.writeable = False
+        return PriceColumns(*columns)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """지금까지 읽은 행을 `load_price_history()`와 같은 형식으로 반환합니다."""
+        return price_columns_to_history(self.columns())
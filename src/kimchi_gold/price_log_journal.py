@@ -0,0 +1,337 @@
+"""
+CSV 가격 로그 쓰기 잠금과 추가 저널(write-ahead) 모듈입니다.
+
+수동 실행(workflow_dispatch)과 cron 수집기, 또는 공유 스토리지를 쓰는 여러 호스트가
+동시에 로그에 쓰면 행이 섞이거나 둘 다 "헤더 없음"으로 판단할 수 있습니다.
+로그를 쓰는 모든 경로는 `price_log_write_lock()` 안에서 확인과 기록을 함께 합니다.
+
+- 잠금: 로그 옆 `.<로그 이름>.lock` 파일을 `fcntl.flock`으로 잠급니다 (로그 자체는
+  `os.replace`로 바뀔 수 있으므로 따로 둔 파일을 잠금). 같은 프로세스 안의 스레드는
+  경로별 RLock으로 차례를 정하며, 같은 스레드에서 다시 잠그면 그대로 통과합니다.
+- 저널: 붙일 행은 먼저 `.<로그 이름>.journal`에 두고, 붙이기 전 로그 크기와 내용 해시를
+  `.<로그 이름>.journal.commit`에 원자적으로 기록한 뒤 로그에 붙입니다. 붙이는 도중
+  프로세스가 죽으면 다음에 잠그는 쪽이 커밋 기록을 보고 원래 크기로 자른 뒤 다시 붙이고,
+  커밋 기록이 없는 저널(기록 전에 중단)은 버립니다.
+- 다시 쓰기: 백필 병합과 같은 날짜 덮어쓰기처럼 로그 전체를 다시 써야 하면
+  `replace_csv_atomically()`로 임시 파일에 쓰고 디스크에 내려 쓴 뒤 바꿔 끼웁니다.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+
+from .configuration import (
+    BULK_WRITE_BUFFER_SIZE,
+    BULK_WRITE_FLUSH_EVERY_ROWS,
+    BULK_WRITE_FSYNC_POLICY,
+    CSV_COLUMN_HEADERS,
+)
+from .price_log_lookup import apply_log_file_mode, is_date_logged
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 프로세스 안에서만 차례를 정함
+    fcntl = None
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+BULK_WRITE_FSYNC_POLICIES = ("none", "batch", "flush")
+
+
+class _PathWriteLock:
+    """경로 하나의 프로세스 안 잠금 상태 (RLock을 잡은 스레드만 바꿈)"""
+
+    def __init__(self):
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+        self.lock_descriptor: Optional[int] = None
+
+
+_path_write_locks: Dict[str, _PathWriteLock] = {}
+_path_write_locks_guard = threading.Lock()
+
+
+def lock_file_path(csv_file_path: Path) -> Path:
+    return csv_file_path.with_name(f".{csv_file_path.name}.lock")
+
+
+@contextmanager
+def price_log_write_lock(csv_file_path: Path) -> Iterator[None]:
+    """
+    로그 쓰기 잠금 (스레드 간, 프로세스 간). 처음 잠글 때 남은 저널을 먼저 복구합니다.
+    같은 스레드에서 다시 잠가도 됩니다.
+    """
+    csv_file_path = Path(csv_file_path)
+    with _path_write_locks_guard:
+        path_write_lock = _path_write_locks.setdefault(str(csv_file_path.resolve()), _PathWriteLock())
+    with path_write_lock.thread_lock:
+        if path_write_lock.depth == 0:
+            csv_file_path.parent.mkdir(parents=True, exist_ok=True)
+            lock_descriptor = os.open(lock_file_path(csv_file_path), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_descriptor, fcntl.LOCK_EX)
+                PriceLogAppendJournal(csv_file_path).recover()
+            except BaseException:
+                os.close(lock_descriptor)
+                raise
+            path_write_lock.lock_descriptor = lock_descriptor
+        path_write_lock.depth += 1
+        try:
+            yield
+        finally:
+            path_write_lock.depth -= 1
+            if path_write_lock.depth == 0:
+                # 디스크립터를 닫으면 flock도 풀린다
+                os.close(path_write_lock.lock_descriptor)
+                path_write_lock.lock_descriptor = None
+
+
+def hash_file(file_path: Path) -> str:
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as hashed_file:
+        for block in iter(lambda: hashed_file.read(BULK_WRITE_BUFFER_SIZE), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+class PriceLogAppendJournal:
+    """로그 끝에 붙일 내용을 먼저 기록해 두는 저널 (`price_log_write_lock()` 안에서 사용)"""
+
+    def __init__(self, csv_file_path: Path):
+        self.csv_file_path = Path(csv_file_path)
+        self.journal_path = self.csv_file_path.with_name(f".{self.csv_file_path.name}.journal")
+        self.commit_path = self.csv_file_path.with_name(f".{self.csv_file_path.name}.journal.commit")
+
+    def commit(self, staged_path: Path, prefix: bytes, fsync: bool = True) -> None:
+        """
+        준비된 파일을 저널로 옮기고 커밋 기록을 남긴 뒤 로그 끝에 붙입니다.
+
+        Args:
+            staged_path: 붙일 행이 담긴 파일 (저널로 옮겨짐)
+            prefix: 행 앞에 붙일 바이트 (새 로그의 헤더, 개행 없이 끝난 로그의 개행)
+            fsync: 저널, 커밋 기록, 로그를 디스크에 내려 쓸지 여부
+        """
+        csv_stat = self.csv_file_path.stat() if self.csv_file_path.exists() else None
+        os.replace(staged_path, self.journal_path)
+        commit_record = {
+            "inode": csv_stat.st_ino if csv_stat is not None else None,
+            "original_size": csv_stat.st_size if csv_stat is not None else 0,
+            "prefix": prefix.hex(),
+            "length": os.path.getsize(self.journal_path),
+            "sha256": hash_file(self.journal_path),
+        }
+        commit_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.commit_path.parent, prefix=f"{self.commit_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(commit_descriptor, "w", encoding="utf-8") as commit_file:
+                json.dump(commit_record, commit_file)
+                commit_file.flush()
+                if fsync:
+                    os.fsync(commit_file.fileno())
+            os.replace(temporary_path, self.commit_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+        try:
+            self.apply(commit_record, fsync)
+        except BaseException:
+            # 붙이지 못했으면 원래 크기로 되돌리고 저널을 버린다 (호출한 쪽에 실패를 알림)
+            if self.csv_file_path.exists():
+                os.truncate(self.csv_file_path, commit_record["original_size"])
+            self.clear()
+            raise
+        self.clear()
+
+    def apply(self, commit_record: dict, fsync: bool) -> None:
+        with open(self.journal_path, "rb") as journal_file, self.csv_file_path.open("ab") as csv_file:
+            # 앞선 시도가 일부만 붙였을 수 있으므로 원래 크기로 자르고 붙인다
+            csv_file.truncate(commit_record["original_size"])
+            csv_file.write(bytes.fromhex(commit_record["prefix"]))
+            shutil.copyfileobj(journal_file, csv_file, BULK_WRITE_BUFFER_SIZE)
+            csv_file.flush()
+            if fsync:
+                os.fsync(csv_file.fileno())
+
+    def read_commit_record(self) -> Optional[dict]:
+        try:
+            commit_record = json.loads(self.commit_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(commit_record, dict) or not {
+            "inode", "original_size", "prefix", "length", "sha256"
+        } <= commit_record.keys():
+            return None
+        return commit_record
+
+    def recover(self) -> bool:
+        """
+        중단된 추가를 마무리합니다 (잠금 안에서 호출).
+
+        Returns:
+            중단된 추가를 다시 붙였으면 True
+        """
+        commit_record = self.read_commit_record()
+        if commit_record is None:
+            if self.journal_path.exists():
+                logger.warning(f"커밋되지 않은 저널을 버립니다: {self.journal_path}")
+            self.clear()
+            return False
+
+        if (
+            not self.journal_path.exists()
+            or os.path.getsize(self.journal_path) != commit_record["length"]
+            or hash_file(self.journal_path) != commit_record["sha256"]
+        ):
+            logger.warning(f"손상된 저널을 버립니다: {self.journal_path}")
+            self.clear()
+            return False
+
+        csv_stat = self.csv_file_path.stat() if self.csv_file_path.exists() else None
+        if commit_record["inode"] is not None and (
+            csv_stat is None
+            or csv_stat.st_ino != commit_record["inode"]
+            or csv_stat.st_size < commit_record["original_size"]
+        ):
+            # 그 사이 로그가 바뀌었으면(다른 경로로 다시 씀) 어디에 붙일지 알 수 없다
+            logger.warning(f"로그가 바뀌어 중단된 추가를 버립니다: {self.csv_file_path}")
+            self.clear()
+            return False
+
+        self.apply(commit_record, fsync=True)
+        self.clear()
+        logger.warning(f"중단된 추가를 다시 붙였습니다: {self.csv_file_path} ({commit_record['length']} bytes)")
+        return True
+
+    def clear(self) -> None:
+        # 커밋 기록을 먼저 지워야 저널만 남았을 때 "커밋 안 됨"으로 판단된다
+        for journal_file_path in (self.commit_path, self.journal_path):
+            try:
+                os.unlink(journal_file_path)
+            except FileNotFoundError:
+                pass
+
+
+def replace_csv_atomically(csv_file_path: Path, header_row: Sequence[str], data_rows: Iterable[Sequence[str]]) -> None:
+    """
+    헤더와 행을 로그 옆 임시 파일에 쓰고 디스크에 내려 쓴 뒤 `os.replace`로 로그와 바꿉니다.
+
+    원본 로그의 권한을 그대로 유지하고, 중간에 실패하면 원본은 바뀌지 않습니다.
+    호출하는 쪽이 `price_log_write_lock()`을 잡고 있어야 그 사이 추가된 행을 덮어쓰지 않습니다.
+    """
+    csv_file_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_descriptor, temporary_path = tempfile.mkstemp(
+        dir=csv_file_path.parent, prefix=f".{csv_file_path.name}.", suffix=".tmp"
+    )
+    try:
+        apply_log_file_mode(temporary_descriptor, csv_file_path)
+        with os.fdopen(temporary_descriptor, "w", encoding="utf-8", newline="") as temporary_file:
+            csv_writer = csv.writer(temporary_file)
+            csv_writer.writerow(header_row)
+            csv_writer.writerows(data_rows)
+            temporary_file.flush()
+            # 바꿔 끼운 뒤 전원이 나가도 빈 로그가 남지 않도록 내용을 먼저 디스크에 내려 씀
+            os.fsync(temporary_file.fileno())
+        os.replace(temporary_path, csv_file_path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def format_csv_row(data_row: Sequence[str]) -> bytes:
+    row_buffer = io.StringIO()
+    csv.writer(row_buffer).writerow(data_row)
+    return row_buffer.getvalue().encode("utf-8")
+
+
+def log_ends_with_newline(csv_file_path: Path, file_size: int) -> bool:
+    with csv_file_path.open("rb") as binary_file:
+        binary_file.seek(file_size - 1)
+        return binary_file.read(1) == b"\n"
+
+
+def append_rows_to_csv_atomically(
+    csv_file_path: Path,
+    data_rows: Iterable[Sequence[str]],
+    flush_every_rows: int = BULK_WRITE_FLUSH_EVERY_ROWS,
+    fsync_policy: str = BULK_WRITE_FSYNC_POLICY,
+    skip_if_date_logged: Optional[str] = None,
+) -> int:
+    """
+    여러 행을 CSV 로그 끝에 한꺼번에 붙입니다 (전부 붙거나 하나도 붙지 않음).
+
+    행은 잠그기 전에 로그 옆 임시 파일(.<로그 이름>.*.staging)에 버퍼 하나로 흘려 쓰므로,
+    행을 만드는 제너레이터가 느리거나 도중에 실패해도 로그와 잠금은 건드리지 않습니다.
+    다 쓴 뒤 잠금 안에서 헤더 필요 여부(로그가 없거나 비어 있음)를 판단하고 저널을 거쳐 붙입니다.
+
+    Args:
+        csv_file_path: CSV 로그 경로 (검증된 경로)
+        data_rows: 기록할 행들 (제너레이터 가능)
+        flush_every_rows: 이 행 수마다 임시 파일 버퍼를 비움 (0이면 끝에서 한 번)
+        fsync_policy: "none", "batch"(로그에 붙인 뒤 한 번), "flush"(버퍼를 비울 때마다)
+        skip_if_date_logged: 주어지면 잠금 안에서 이 날짜("YYYY-MM-DD")가 이미 있는지 확인하고,
+            있으면 기록하지 않음 (확인과 기록 사이에 다른 수집기가 끼어들 수 없음)
+
+    Returns:
+        기록한 행 수
+
+    Raises:
+        ValueError: 알 수 없는 fsync 정책인 경우
+    """
+    if fsync_policy not in BULK_WRITE_FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy: {fsync_policy!r} (expected one of {BULK_WRITE_FSYNC_POLICIES})")
+
+    csv_file_path.parent.mkdir(parents=True, exist_ok=True)
+    staging_descriptor, staging_path = tempfile.mkstemp(
+        dir=csv_file_path.parent, prefix=f".{csv_file_path.name}.", suffix=".staging"
+    )
+    try:
+        row_count = 0
+        with os.fdopen(
+            staging_descriptor, "w", encoding="utf-8", newline="", buffering=BULK_WRITE_BUFFER_SIZE
+        ) as staging_file:
+            csv_writer = csv.writer(staging_file)
+            for data_row in data_rows:
+                csv_writer.writerow(data_row)
+                row_count += 1
+                if flush_every_rows and row_count % flush_every_rows == 0:
+                    staging_file.flush()
+                    if fsync_policy == "flush":
+                        os.fsync(staging_file.fileno())
+            staging_file.flush()
+            if fsync_policy != "none":
+                os.fsync(staging_file.fileno())
+        if row_count == 0:
+            return 0
+
+        with price_log_write_lock(csv_file_path):
+            original_size = csv_file_path.stat().st_size if csv_file_path.exists() else 0
+            if (
+                skip_if_date_logged is not None
+                and original_size > 0
+                and is_date_logged(csv_file_path, skip_if_date_logged)
+            ):
+                logger.info(f"{skip_if_date_logged} 데이터가 이미 기록되어 있어 추가하지 않습니다: {csv_file_path}")
+                return 0
+            if original_size == 0:
+                prefix = format_csv_row(CSV_COLUMN_HEADERS)
+            elif not log_ends_with_newline(csv_file_path, original_size):
+                prefix = b"\n"
+            else:
+                prefix = b""
+            PriceLogAppendJournal(csv_file_path).commit(Path(staging_path), prefix, fsync=fsync_policy != "none")
+        return row_count
+    finally:
+        if os.path.exists(staging_path):
+            os.unlink(staging_path)
@@ -0,0 +1,214 @@
+"""
+CSV 가격 로그에 특정 날짜가 기록되어 있는지 빠르게 확인하는 모듈입니다.
+
+로그는 날짜순으로 추가되므로(매일 수집, 백필은 정렬해서 병합) 파일 끝에서부터
+거꾸로 읽다가 찾는 날짜보다 오래된 행을 만나면 멈춥니다. 보통 확인하는 날짜는
+오늘이므로 로그가 아무리 길어도 마지막 블록 하나만 읽습니다.
+
+읽은 구간에서 날짜 순서가 뒤집힌 행을 만나면 전체를 읽어 확인합니다. 날짜순이 아닌
+로그(수동 편집 등)는 추가된 부분만 읽어 갱신하는 날짜 색인 파일로 조회할 수 있습니다.
+"""
+
+import json
+import logging
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Iterator, Optional, Set, Tuple
+
+from .configuration import CSV_DATE_INDEX_ENABLED, CSV_TAIL_READ_BLOCK_SIZE
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DATE_FIELD_LENGTH = len("YYYY-MM-DD")
+INDEX_TAIL_CHECK_BYTES = 64
+
+
+def file_mode_for_replacement(file_path: Path) -> int:
+    """
+    `os.replace`로 바꿔 끼울 임시 파일에 줄 권한을 반환합니다.
+    원본이 있으면 원본 권한을, 없으면 `open()`으로 만든 파일과 같은 0666 & ~umask를 씁니다
+    (mkstemp는 0600으로 만들므로 그대로 바꿔 끼우면 다른 사용자가 읽을 수 없게 됨).
+    """
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        current_umask = os.umask(0)
+        os.umask(current_umask)
+        return 0o666 & ~current_umask
+
+
+def apply_log_file_mode(file_descriptor: int, csv_file_path: Path) -> None:
+    """로그 옆에 mkstemp로 만든 파일(다시 쓴 로그, 색인, 열 저장소)에 로그와 같은 권한을 줍니다."""
+    if hasattr(os, "fchmod"):
+        os.fchmod(file_descriptor, file_mode_for_replacement(csv_file_path))
+
+
+def iter_lines_reversed(
+    binary_file, block_size: int = CSV_TAIL_READ_BLOCK_SIZE
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    파일의 줄을 끝에서부터 (줄 시작 위치, 줄 내용) 순서로 돌려줍니다.
+    줄 끝의 개행 문자(\\n, \\r\\n)는 제거하며, 블록 경계에 걸친 줄도 한 줄로 이어 붙입니다.
+    """
+    block_end = binary_file.seek(0, os.SEEK_END)
+    carried_bytes = b""
+    while block_end > 0:
+        block_start = max(0, block_end - block_size)
+        binary_file.seek(block_start)
+        block = binary_file.read(block_end - block_start) + carried_bytes
+        lines = block.split(b"\n")
+        # 첫 조각은 앞 블록에서 시작했을 수 있으므로 다음 블록과 이어 붙인다
+        carried_bytes = lines[0]
+        line_end = block_start + len(block)
+        for line in reversed(lines[1:]):
+            line_end -= len(line) + 1
+            yield line_end + 1, line.rstrip(b"\r")
+        block_end = block_start
+    yield 0, carried_bytes.rstrip(b"\r")
+
+
+def parse_row_date(line: bytes) -> bytes:
+    """CSV 한 줄의 첫 열에서 날짜 부분("YYYY-MM-DD")을 꺼냅니다."""
+    return line.split(b",", 1)[0].strip().strip(b'"')[:DATE_FIELD_LENGTH]
+
+
+def find_date_in_log_tail(
+    csv_file_path: Path, target_date_string: str, block_size: int = CSV_TAIL_READ_BLOCK_SIZE
+) -> Optional[bool]:
+    """
+    로그 끝에서부터 거꾸로 읽어 날짜를 찾습니다.
+
+    Returns:
+        찾으면 True, 찾는 날짜보다 오래된 행까지 왔는데 없으면 False,
+        읽은 구간에서 날짜 순서가 뒤집혀 판단할 수 없으면 None
+    """
+    target_date = target_date_string.encode("ascii")
+    with csv_file_path.open("rb") as binary_file:
+        later_row_date = None
+        for line_offset, line in iter_lines_reversed(binary_file, block_size):
+            if line_offset == 0:
+                break  # 헤더
+            if not line.strip():
+                continue
+            row_date = parse_row_date(line)
+            if later_row_date is not None and row_date > later_row_date:
+                logger.debug(f"Out-of-order rows in {csv_file_path}: {row_date!r} before {later_row_date!r}")
+                return None
+            if row_date == target_date:
+                return True
+            if row_date < target_date:
+                return False
+            later_row_date = row_date
+    return False
+
+
+def read_logged_dates(binary_file) -> Set[str]:
+    """현재 위치부터 끝까지 읽어 행의 날짜 집합을 만듭니다."""
+    return {
+        parse_row_date(line).decode("ascii", "replace")
+        for line in binary_file
+        if line.strip()
+    }
+
+
+def read_logged_date_set(csv_file_path: Path) -> Set[str]:
+    """로그 전체를 읽어 기록된 날짜 집합을 만듭니다."""
+    with csv_file_path.open("rb") as binary_file:
+        binary_file.readline()  # 헤더 스킵
+        return read_logged_dates(binary_file)
+
+
+class LoggedDateIndex:
+    """
+    로그 옆에 두는 날짜 색인 파일 (.<로그 이름>.dates.json).
+
+    색인에는 만든 시점의 로그 inode, 크기, 끝부분 바이트를 함께 저장합니다. 같은 파일에
+    줄이 추가되기만 했으면(inode 같음, 크기 증가, 예전 끝부분 그대로) 늘어난 부분만
+    읽어 갱신하고, 그 밖의 변경(백필 병합, 수동 편집)이면 전체를 다시 읽습니다.
+    """
+
+    def __init__(self, csv_file_path: Path):
+        self.csv_file_path = Path(csv_file_path)
+        self.index_path = self.csv_file_path.with_name(f".{self.csv_file_path.name}.dates.json")
+
+    def read_index(self) -> Optional[dict]:
+        try:
+            index_data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(index_data, dict) or not {"inode", "size", "tail", "dates"} <= index_data.keys():
+            return None
+        return index_data
+
+    def load_dates(self) -> Set[str]:
+        """최신 색인의 날짜 집합을 반환합니다 (낡았으면 늘어난 부분만 또는 전체를 다시 읽음)."""
+        index_data = self.read_index()
+        with self.csv_file_path.open("rb") as binary_file:
+            csv_stat = os.fstat(binary_file.fileno())
+            if index_data is not None and index_data["inode"] == csv_stat.st_ino:
+                indexed_size = index_data["size"]
+                indexed_tail = bytes.fromhex(index_data["tail"])
+                if indexed_size == csv_stat.st_size:
+                    return set(index_data["dates"])
+                if len(indexed_tail) <= indexed_size < csv_stat.st_size:
+                    binary_file.seek(indexed_size - len(indexed_tail))
+                    if binary_file.read(len(indexed_tail)) == indexed_tail:
+                        logged_dates = set(index_data["dates"]) | read_logged_dates(binary_file)
+                        self.save(csv_stat, binary_file, logged_dates)
+                        return logged_dates
+            binary_file.seek(0)
+            binary_file.readline()  # 헤더 스킵
+            logged_dates = read_logged_dates(binary_file)
+            self.save(csv_stat, binary_file, logged_dates)
+            return logged_dates
+
+    def save(self, csv_stat: os.stat_result, binary_file, logged_dates: Set[str]) -> None:
+        # 끝부분 바이트를 저장해 두면 다음 조회 때 줄이 추가되기만 했는지 확인할 수 있다
+        tail_length = min(INDEX_TAIL_CHECK_BYTES, csv_stat.st_size)
+        binary_file.seek(csv_stat.st_size - tail_length)
+        index_data = {
+            "inode": csv_stat.st_ino,
+            "size": csv_stat.st_size,
+            "tail": binary_file.read(tail_length).hex(),
+            "dates": sorted(logged_dates),
+        }
+        try:
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=self.index_path.parent, prefix=".dates.", suffix=".tmp"
+            )
+            try:
+                apply_log_file_mode(file_descriptor, self.csv_file_path)
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as temporary_file:
+                    json.dump(index_data, temporary_file)
+                os.replace(temporary_path, self.index_path)
+            except BaseException:
+                os.unlink(temporary_path)
+                raise
+        except OSError as index_write_error:
+            # 색인을 저장하지 못해도 이번 조회에는 방금 읽은 집합을 사용
+            logger.warning(f"날짜 색인을 저장하지 못했습니다: {self.index_path} - {index_write_error}")
+
+    def contains(self, target_date_string: str) -> bool:
+        return target_date_string in self.load_dates()
+
+
+def is_date_logged(
+    csv_file_path: Path,
+    target_date_string: str,
+    use_date_index: bool = CSV_DATE_INDEX_ENABLED,
+) -> bool:
+    """
+    날짜가 로그에 있는지 확인합니다.
+
+    날짜순 로그(기본)는 끝에서부터 읽어 판단하고, 읽은 구간에서 순서가 뒤집혀 있으면
+    전체를 읽습니다. 날짜순이 아닌 로그는 `use_date_index=True`로 날짜 색인을 사용합니다.
+    """
+    if use_date_index:
+        return LoggedDateIndex(csv_file_path).contains(target_date_string)
+    found_in_tail = find_date_in_log_tail(csv_file_path, target_date_string)
+    if found_in_tail is not None:
+        return found_in_tail
+    return target_date_string in read_logged_date_set(csv_file_path)
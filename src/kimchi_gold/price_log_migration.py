@@ -0,0 +1,111 @@
+"""
+CSV 가격 로그(와 장중 틱 파일)를 SQLite 가격 로그로 옮기는 모듈입니다.
+
+같은 날짜/시각은 덮어쓰므로 여러 번 실행해도 결과가 같습니다. CSV 파일은 그대로 두므로
+웹사이트와 차트는 계속 CSV를 읽고, 수집기는 `PRICE_LOG_BACKEND = "sqlite"`로 바꾼 뒤부터
+SQLite에 기록합니다.
+
+사용 예시:
+    uv run migrate_price_log
+    uv run migrate_price_log --include-ticks --verify
+"""
+
+import argparse
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from .configuration import GOLD_PRICE_DATA_CSV_FILE, INTRADAY_TICK_DIRECTORY, PRICE_LOG_SQLITE_FILE
+from .data_collector import validate_safe_path
+from .price_storage import CsvPriceLogBackend, SqlitePriceLogBackend
+from .tick_store import TickStore
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PriceLogMigrationReport:
+    """마이그레이션 결과"""
+
+    daily_row_count: int = 0  # 옮긴 일별 행 수
+    tick_count: int = 0  # 옮긴 장중 틱 수
+    verified: Optional[bool] = None  # 검증하지 않았으면 None
+
+
+def migrate_csv_to_sqlite(
+    csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE,
+    database_path: Path = PRICE_LOG_SQLITE_FILE,
+    tick_directory: Optional[Path] = None,
+    verify: bool = False,
+) -> PriceLogMigrationReport:
+    """
+    CSV 가격 로그를 SQLite로 옮깁니다.
+
+    Args:
+        csv_file_path: 원본 CSV 가격 로그
+        database_path: 대상 SQLite 파일 (없으면 생성)
+        tick_directory: 주어지면 이 디렉토리의 날짜별 틱 파일도 옮김
+        verify: 옮긴 뒤 CSV와 SQLite의 일별 행이 같은지 확인
+
+    Raises:
+        ValueError: 안전하지 않은 파일 경로인 경우
+    """
+    csv_log = CsvPriceLogBackend(validate_safe_path(csv_file_path))
+    report = PriceLogMigrationReport()
+    with SqlitePriceLogBackend(validate_safe_path(database_path)) as sqlite_log:
+        daily_records = csv_log.read_records()
+        report.daily_row_count = sqlite_log.upsert_records(daily_records)
+        logger.info(f"일별 행 {report.daily_row_count}개를 옮겼습니다: {csv_file_path} -> {database_path}")
+
+        if tick_directory is not None:
+            with TickStore(validate_safe_path(tick_directory)) as tick_store:
+                for trading_day in tick_store.recorded_days():
+                    # 하루치씩 한 트랜잭션으로 기록
+                    report.tick_count += sqlite_log.upsert_ticks(tick_store.iter_ticks(trading_day))
+            logger.info(f"장중 틱 {report.tick_count}개를 옮겼습니다: {tick_directory}")
+
+        if verify:
+            # CSV에 같은 날짜가 여러 번 있으면 마지막 행이 남는다
+            expected_records = list({record.date: record for record in daily_records}.values())
+            expected_records.sort(key=lambda record: record.date)
+            report.verified = sqlite_log.read_records() == expected_records
+            if not report.verified:
+                logger.warning(f"SQLite 가격 로그가 CSV와 다릅니다: {database_path}")
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    parser = argparse.ArgumentParser(description="CSV 가격 로그를 SQLite로 옮깁니다.")
+    parser.add_argument("--csv", type=Path, default=GOLD_PRICE_DATA_CSV_FILE, help="원본 CSV 가격 로그")
+    parser.add_argument("--database", type=Path, default=PRICE_LOG_SQLITE_FILE, help="대상 SQLite 파일")
+    parser.add_argument("--include-ticks", action="store_true", help="장중 틱 파일도 옮김")
+    parser.add_argument("--tick-directory", type=Path, default=INTRADAY_TICK_DIRECTORY, help="장중 틱 디렉토리")
+    parser.add_argument("--verify", action="store_true", help="옮긴 뒤 CSV와 같은지 확인")
+    arguments = parser.parse_args(argv)
+
+    try:
+        report = migrate_csv_to_sqlite(
+            arguments.csv,
+            arguments.database,
+            tick_directory=arguments.tick_directory if arguments.include_ticks else None,
+            verify=arguments.verify,
+        )
+    except (OSError, ValueError) as migration_error:
+        logger.error(f"마이그레이션 실패: {migration_error}")
+        return 1
+
+    print(f"일별 행 {report.daily_row_count}개, 장중 틱 {report.tick_count}개를 옮겼습니다.")
+    if report.verified is not None:
+        print("검증 성공" if report.verified else "검증 실패: CSV와 SQLite 내용이 다릅니다.")
+        return 0 if report.verified else 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
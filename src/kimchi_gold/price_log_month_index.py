@@ -0,0 +1,253 @@
+"""
+CSV 가격 로그에서 최근 기간만 읽기 위한 월별 바이트 위치 색인 모듈입니다.
+
+차트(최근 N×30일)와 이상치 분석(최근 365일)은 로그 끝부분만 쓰는데, 전체 이력을 읽은 뒤
+걸러 내면 로그가 길어질수록 읽는 시간도 늘어납니다. 로그 옆에 달마다 그 달 첫 행이 시작하는
+바이트 위치를 적어 둔 색인(.<로그 이름>.months.json)을 두면, 시작 날짜가 속한 달의 위치로
+바로 건너뛰어 그 뒤만 파싱하므로 읽는 비용이 이력 길이가 아니라 기간 길이에 비례합니다.
+
+    {"inode": ..., "size": 색인에 반영한 바이트 수, "tail": 끝부분 바이트(hex),
+     "ordered": 날짜순 여부, "last_date": 마지막 행 날짜, "months": [["2026-01", 위치], ...]}
+
+색인은 날짜 색인(`price_log_lookup.LoggedDateIndex`)과 같이 로그 inode, 크기, 끝부분 바이트를
+함께 저장해 두고, 줄이 추가되기만 했으면 늘어난 부분만 읽어 갱신합니다. 그 밖의 변경(백필 병합,
+수동 편집)이면 전체를 다시 읽습니다. 날짜순이 아니거나 날짜 형식이 다른 행이 있는 로그는
+색인을 쓰지 않고(`ordered: false`) 읽는 쪽이 전체 이력을 읽어 거릅니다.
+"""
+
+import bisect
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .price_columns import FAST_PARSE_CHUNK_BYTES, PriceColumns, read_price_log_arrays
+from .price_log_lookup import DATE_FIELD_LENGTH, INDEX_TAIL_CHECK_BYTES, apply_log_file_mode
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+MONTH_KEY_LENGTH = len("YYYY-MM")
+# "YYYY-MM-DD"에서 숫자여야 하는 자리와 '-'여야 하는 자리
+DATE_DIGIT_POSITIONS = np.array([0, 1, 2, 3, 5, 6, 8, 9])
+DATE_SEPARATOR_POSITIONS = np.array([4, 7])
+
+
+class MonthOffsetIndex:
+    """
+    로그 옆에 두는 월별 바이트 위치 색인 파일 (.<로그 이름>.months.json).
+
+    `update()`가 색인을 최신으로 맞추고, `find_offset()`이 시작 날짜가 속한 달의 첫 행 위치를
+    돌려줍니다. 기록 중인 마지막 줄(개행 전)은 다음 갱신 때 반영합니다.
+    """
+
+    def __init__(self, csv_file_path: Path, chunk_bytes: int = FAST_PARSE_CHUNK_BYTES):
+        self.csv_file_path = Path(csv_file_path)
+        self.index_path = self.csv_file_path.with_name(f".{self.csv_file_path.name}.months.json")
+        self.chunk_bytes = max(1, chunk_bytes)
+
+    def read_index(self) -> Optional[dict]:
+        try:
+            index_data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(index_data, dict) or not {
+            "inode", "size", "tail", "ordered", "last_date", "months"
+        } <= index_data.keys():
+            return None
+        return index_data
+
+    def update(self) -> dict:
+        """
+        색인을 로그의 현재 내용에 맞춥니다 (줄이 추가되기만 했으면 늘어난 부분만 읽음).
+
+        Raises:
+            FileNotFoundError: 로그 파일이 없는 경우
+        """
+        index_data = self.read_index()
+        with self.csv_file_path.open("rb") as binary_file:
+            csv_stat = os.fstat(binary_file.fileno())
+            if index_data is not None and index_data["inode"] == csv_stat.st_ino:
+                indexed_size = index_data["size"]
+                indexed_tail = bytes.fromhex(index_data["tail"])
+                if indexed_size == csv_stat.st_size:
+                    return index_data
+                if len(indexed_tail) <= indexed_size < csv_stat.st_size:
+                    binary_file.seek(indexed_size - len(indexed_tail))
+                    if binary_file.read(len(indexed_tail)) == indexed_tail:
+                        if self.scan_appended_rows(binary_file, csv_stat, index_data):
+                            self.save(index_data)
+                        return index_data
+
+            binary_file.seek(0)
+            header_line = binary_file.readline()
+            index_data = {
+                "inode": csv_stat.st_ino,
+                "size": len(header_line),
+                "tail": header_line[-INDEX_TAIL_CHECK_BYTES:].hex(),
+                "ordered": True,
+                "last_date": "",
+                "months": [],
+            }
+            if not header_line.endswith(b"\n"):
+                # 헤더도 아직 다 기록되지 않은 로그: 저장하지 않고 색인 없이 읽게 함
+                index_data["ordered"] = False
+                return index_data
+            self.scan_appended_rows(binary_file, csv_stat, index_data)
+            self.save(index_data)
+            logger.debug(f"월별 위치 색인을 새로 만들었습니다: {self.index_path} ({len(index_data['months'])}개월)")
+            return index_data
+
+    def scan_appended_rows(self, binary_file, csv_stat: os.stat_result, index_data: dict) -> bool:
+        """
+        색인에 반영한 위치 뒤의 완성된 줄을 읽어 달이 바뀌는 위치를 추가합니다.
+
+        Bolt Optimization: 줄마다 파이썬으로 나누지 않고 조각마다 개행 위치와 각 줄 앞 10바이트를
+        numpy로 한 번에 뽑아 비교합니다.
+
+        Returns:
+            새로 반영한 바이트가 있으면 True
+        """
+        scan_offset = index_data["size"]
+        last_date = index_data["last_date"].encode("ascii")
+        binary_file.seek(scan_offset)
+        while scan_offset < csv_stat.st_size:
+            chunk = binary_file.read(min(self.chunk_bytes, csv_stat.st_size - scan_offset))
+            complete_length = chunk.rfind(b"\n") + 1
+            if complete_length == 0:
+                if len(chunk) < csv_stat.st_size - scan_offset:
+                    # 조각보다 긴 줄: 개행이 나올 때까지 이어 읽는다
+                    binary_file.seek(scan_offset)
+                    chunk = binary_file.readline()
+                    complete_length = len(chunk) if chunk.endswith(b"\n") else 0
+                if complete_length == 0:
+                    break  # 기록 중인 마지막 줄은 다음 갱신 때 반영
+            if index_data["ordered"]:
+                last_date = self.index_month_boundaries(
+                    np.frombuffer(chunk, dtype=np.uint8, count=complete_length), scan_offset, last_date, index_data
+                )
+            index_data["tail"] = (bytes.fromhex(index_data["tail"]) + chunk[:complete_length])[
+                -INDEX_TAIL_CHECK_BYTES:
+            ].hex()
+            scan_offset += complete_length
+            binary_file.seek(scan_offset)
+
+        index_data["last_date"] = last_date.decode("ascii")
+        changed = scan_offset != index_data["size"]
+        index_data["size"] = scan_offset
+        return changed
+
+    def index_month_boundaries(
+        self, chunk_bytes: np.ndarray, chunk_offset: int, last_date: bytes, index_data: dict
+    ) -> bytes:
+        """완성된 줄만 담긴 조각에서 달이 바뀌는 줄의 위치를 색인에 추가하고 마지막 날짜를 반환합니다."""
+        line_ends = np.flatnonzero(chunk_bytes == ord("\n"))
+        line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+        line_lengths = line_ends - line_starts
+        # 빈 줄("\n", "\r\n")은 파서도 건너뛰므로 색인에서도 뺀다
+        is_blank_line = (line_lengths == 0) | (
+            (line_lengths == 1) & (chunk_bytes[line_starts] == ord("\r"))
+        )
+        line_starts = line_starts[~is_blank_line]
+        if len(line_starts) == 0:
+            return last_date
+        if int(line_lengths[~is_blank_line].min()) < DATE_FIELD_LENGTH:
+            index_data["ordered"] = False
+            return last_date
+
+        date_fields = chunk_bytes[line_starts[:, None] + np.arange(DATE_FIELD_LENGTH)]
+        digit_fields = date_fields[:, DATE_DIGIT_POSITIONS]
+        if not (
+            np.all((digit_fields >= ord("0")) & (digit_fields <= ord("9")))
+            and np.all(date_fields[:, DATE_SEPARATOR_POSITIONS] == ord("-"))
+        ):
+            # 따옴표, 공백 등으로 시작하는 행: 바이트 위치만으로 기간을 가를 수 없음
+            logger.info(f"날짜 형식이 다른 행이 있어 월별 위치 색인을 쓰지 않습니다: {self.csv_file_path}")
+            index_data["ordered"] = False
+            return last_date
+
+        # "YYYY-MM-DD" 바이트열은 사전순이 곧 날짜순
+        row_dates = np.ascontiguousarray(date_fields).view(f"S{DATE_FIELD_LENGTH}").ravel()
+        if row_dates[0] < last_date or bool(np.any(row_dates[1:] < row_dates[:-1])):
+            logger.info(f"날짜순이 아닌 로그라 월별 위치 색인을 쓰지 않습니다: {self.csv_file_path}")
+            index_data["ordered"] = False
+            return last_date
+
+        month_keys = np.ascontiguousarray(date_fields[:, :MONTH_KEY_LENGTH]).view(f"S{MONTH_KEY_LENGTH}").ravel()
+        is_new_month = np.empty(len(month_keys), dtype=bool)
+        is_new_month[0] = month_keys[0] != last_date[:MONTH_KEY_LENGTH]
+        is_new_month[1:] = month_keys[1:] != month_keys[:-1]
+        for row_index in np.flatnonzero(is_new_month):
+            index_data["months"].append(
+                [month_keys[row_index].decode("ascii"), chunk_offset + int(line_starts[row_index])]
+            )
+        return bytes(row_dates[-1])
+
+    def save(self, index_data: dict) -> None:
+        try:
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=self.index_path.parent, prefix=".months.", suffix=".tmp"
+            )
+            try:
+                apply_log_file_mode(file_descriptor, self.csv_file_path)
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as temporary_file:
+                    json.dump(index_data, temporary_file)
+                os.replace(temporary_path, self.index_path)
+            except BaseException:
+                os.unlink(temporary_path)
+                raise
+        except OSError as index_write_error:
+            # 색인을 저장하지 못해도 이번 조회에는 방금 갱신한 내용을 사용
+            logger.warning(f"월별 위치 색인을 저장하지 못했습니다: {self.index_path} - {index_write_error}")
+
+    def find_offset(self, start_date) -> Optional[int]:
+        """
+        `start_date` 이후 행이 시작할 수 있는 가장 앞 바이트 위치를 반환합니다.
+        날짜순이 아닌 로그라 색인을 쓸 수 없으면 None을 반환합니다.
+        """
+        index_data = self.update()
+        if not index_data["ordered"]:
+            return None
+        start_month = str(np.datetime64(start_date, "D"))[:MONTH_KEY_LENGTH]
+        month_keys = [month_key for month_key, _ in index_data["months"]]
+        month_position = bisect.bisect_left(month_keys, start_month)
+        if month_position == len(month_keys):
+            # 시작 달 이후 행이 없음: 색인에 아직 반영되지 않은 마지막 줄만 남음
+            return index_data["size"]
+        return index_data["months"][month_position][1]
+
+
+def read_price_log_range(csv_file_path: Path, start_date) -> Optional[PriceColumns]:
+    """
+    날짜순 로그에서 `start_date` 이후 행만 읽습니다 (시작 달의 첫 행부터 파싱해 앞부분을 거름).
+
+    Args:
+        csv_file_path: 가격 로그 CSV 경로
+        start_date: 시작 날짜 (date, datetime, "YYYY-MM-DD", np.datetime64, pd.Timestamp)
+
+    Returns:
+        PriceColumns: 날짜순 열 배열, 날짜순이 아니라 색인을 쓸 수 없으면 None
+
+    Raises:
+        FileNotFoundError: 로그 파일이 없는 경우
+    """
+    start_offset = MonthOffsetIndex(csv_file_path).find_offset(start_date)
+    if start_offset is None:
+        return None
+    price_columns = read_price_log_arrays(csv_file_path, start_offset=start_offset)
+    in_range = price_columns.dates >= np.datetime64(start_date, "D")
+    if bool(in_range.all()):
+        return price_columns
+    return PriceColumns(*(column[in_range] for column in price_columns))
+
+
+def sync_month_offset_index(csv_file_path: Path) -> None:
+    """CSV에 기록한 뒤 월별 위치 색인을 따라 갱신합니다. 실패해도 CSV 기록에는 영향을 주지 않습니다."""
+    try:
+        MonthOffsetIndex(csv_file_path).update()
+    except (OSError, ValueError) as index_error:
+        logger.warning(f"월별 위치 색인을 갱신하지 못했습니다: {csv_file_path} - {index_error}")
@@ -0,0 +1,83 @@
+"""
+응답 바이트가 도착하는 대로 DetailInfo_price 태그를 찾는 스트리밍 스캐너 모듈입니다.
+
+전체 페이지를 내려받아 DOM 트리를 만들지 않고, 가격 태그가 닫히는 즉시
+가격 문자열을 돌려주어 나머지 본문을 읽지 않아도 되게 합니다.
+"""
+
+import html
+import re
+from typing import Optional, Union
+
+# <strong class="... DetailInfo_price... ..."> 여는 태그
+_PRICE_OPEN_TAG_PATTERN = re.compile(
+    rb"<strong\b[^>]*?\bclass\s*=\s*"
+    rb"(?:\"[^\"]*DetailInfo_price[^\"]*\"|'[^']*DetailInfo_price[^']*')"
+    rb"[^>]*>",
+    re.IGNORECASE,
+)
+_PRICE_CLOSE_TAG_PATTERN = re.compile(rb"</strong\s*>", re.IGNORECASE)
+_STRONG_OPEN_MARKER = b"<strong"
+_INNER_TAG_PATTERN = re.compile(r"<[^>]*>")
+
+# 가격 태그 안쪽 내용이 이보다 길면 비정상 마크업으로 보고 빠른 경로를 포기
+MAX_PRICE_TAG_CONTENT_BYTES = 4096
+
+
+class StreamingPriceTagScanner:
+    """
+    누적 버퍼를 받아 이전에 확인한 위치부터 이어서 가격 태그를 찾습니다.
+
+    같은 바이트를 반복해서 훑지 않도록 스캔 위치를 기억하므로, 전체 비용은
+    읽은 바이트 수에 비례합니다. 가격 문자열은 한 번만 반환합니다.
+    """
+
+    def __init__(self):
+        self._scan_offset = 0
+        self._content_start: Optional[int] = None
+        self.finished = False
+
+    def scan(self, buffer: Union[bytes, bytearray]) -> Optional[str]:
+        """
+        지금까지 받은 본문에서 가격 태그의 텍스트를 찾습니다.
+
+        Args:
+            buffer: 지금까지 받은 응답 본문 전체 (뒤에 계속 덧붙여지는 버퍼)
+
+        Returns:
+            태그가 닫혔으면 태그 안의 텍스트, 아직 찾지 못했으면 None
+        """
+        if self.finished:
+            return None
+
+        if self._content_start is None:
+            open_tag_match = _PRICE_OPEN_TAG_PATTERN.search(buffer, self._scan_offset)
+            if open_tag_match is None:
+                self._scan_offset = self._next_scan_offset(buffer)
+                return None
+            self._content_start = open_tag_match.end()
+
+        close_tag_match = _PRICE_CLOSE_TAG_PATTERN.search(buffer, self._content_start)
+        if close_tag_match is None:
+            if len(buffer) - self._content_start > MAX_PRICE_TAG_CONTENT_BYTES:
+                self.finished = True
+            return None
+
+        self.finished = True
+        inner_html = bytes(
+            buffer[self._content_start:close_tag_match.start()]
+        ).decode("utf-8", errors="replace")
+        return html.unescape(_INNER_TAG_PATTERN.sub("", inner_html))
+
+    def _next_scan_offset(self, buffer: Union[bytes, bytearray]) -> int:
+        # 아직 '>'가 오지 않은 <strong 태그는 다음 chunk에서 다시 확인해야 한다
+        last_open_tag = buffer.rfind(_STRONG_OPEN_MARKER, self._scan_offset)
+        if last_open_tag != -1 and buffer.find(b">", last_open_tag) == -1:
+            return last_open_tag
+        # chunk 경계에 걸친 "<stro" 같은 조각을 놓치지 않도록 마커 길이만큼 겹쳐서 스캔
+        return max(self._scan_offset, len(buffer) - len(_STRONG_OPEN_MARKER) + 1)
+
+
+def scan_price_text(content: bytes) -> Optional[str]:
+    """완성된 본문에서 가격 태그 텍스트를 한 번에 찾습니다."""
+    return StreamingPriceTagScanner().scan(content)
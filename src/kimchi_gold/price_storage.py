@@ -0,0 +1,322 @@
+"""
+가격 로그 저장소 백엔드 모듈입니다.
+
+`data_collector`는 이 모듈의 백엔드를 통해 일별 가격을 기록하고 조회합니다.
+
+- `CsvPriceLogBackend`: 기존 `kimchi_gold_price_log.csv` (저장소에 커밋되고 웹사이트가 읽는 형식)
+- `SqlitePriceLogBackend`: 날짜(일별)와 timestamp(장중 틱)를 기본 키로 하는 SQLite 파일.
+  WAL 모드라 읽기가 쓰기를 막지 않고, 여러 프로세스가 동시에 써도 잠금 대기(busy timeout)로
+  순서대로 처리됩니다. 날짜 존재 확인과 기간 조회가 파일 전체를 읽지 않고 기본 키 색인을 탑니다.
+
+두 백엔드 모두 같은 날짜를 다시 쓰면 덮어쓰는 upsert 의미를 따릅니다.
+CSV에서 SQLite로 옮기려면 `price_log_migration` 모듈(`migrate_price_log`)을 사용하세요.
+"""
+
+import csv
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .configuration import (
+    CSV_COLUMN_HEADERS,
+    GOLD_PRICE_DATA_CSV_FILE,
+    PRICE_LOG_BACKEND,
+    PRICE_LOG_SQLITE_FILE,
+    SQLITE_BUSY_TIMEOUT_SECONDS,
+)
+from .data_models import GoldPriceData
+from .price_log_journal import append_rows_to_csv_atomically, price_log_write_lock, replace_csv_atomically
+from .price_log_lookup import DATE_FIELD_LENGTH, is_date_logged
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+PRICE_LOG_BACKEND_NAMES = ("csv", "sqlite")
+
+SQLITE_SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS daily_prices (
+        date TEXT PRIMARY KEY,
+        domestic_price REAL NOT NULL,
+        international_price REAL NOT NULL,
+        usd_krw_rate REAL NOT NULL,
+        kimchi_premium_amount REAL NOT NULL,
+        kimchi_premium_percent REAL NOT NULL
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS intraday_ticks (
+        timestamp REAL PRIMARY KEY,
+        domestic_price REAL NOT NULL,
+        international_price REAL NOT NULL,
+        usd_krw_rate REAL NOT NULL,
+        kimchi_premium_amount REAL NOT NULL,
+        kimchi_premium_percent REAL NOT NULL
+    ) WITHOUT ROWID
+    """,
+)
+
+# 값 열 순서 (CSV_COLUMN_HEADERS의 날짜 뒤 다섯 열과 같음)
+PRICE_VALUE_COLUMNS = (
+    "domestic_price",
+    "international_price",
+    "usd_krw_rate",
+    "kimchi_premium_amount",
+    "kimchi_premium_percent",
+)
+
+
+class DailyPriceRecord(NamedTuple):
+    """가격 로그의 일별 행 하나"""
+
+    date: str  # "YYYY-MM-DD"
+    domestic_price: float  # 국내 금 가격 (원/g)
+    international_price: float  # 국제 금 가격 (달러/온스)
+    usd_krw_rate: float  # 환율 (원/달러)
+    kimchi_premium_amount: float  # 김치 프리미엄 금액 (원/g)
+    kimchi_premium_percent: float  # 김치 프리미엄 비율 (%)
+
+    @classmethod
+    def from_gold_price_data(cls, gold_price_data: GoldPriceData) -> "DailyPriceRecord":
+        return cls.from_csv_row(gold_price_data.convert_to_csv_row_format())
+
+    @classmethod
+    def from_csv_row(cls, data_row: Sequence[str]) -> "DailyPriceRecord":
+        """
+        Raises:
+            ValueError: 열 수가 모자라거나 숫자가 아닌 경우
+        """
+        if len(data_row) < len(CSV_COLUMN_HEADERS):
+            raise ValueError(f"가격 로그 행의 열 수가 부족합니다: {data_row!r}")
+        return cls(data_row[0][:DATE_FIELD_LENGTH], *(float(value) for value in data_row[1:6]))
+
+    def to_csv_row(self) -> List[str]:
+        return [self.date] + [f"{value:.2f}" for value in self[1:]]
+
+
+class PriceLogBackend(ABC):
+    """일별 가격 로그 저장소 인터페이스"""
+
+    @abstractmethod
+    def has_date(self, date_string: str) -> bool:
+        """날짜("YYYY-MM-DD")의 행이 있는지 확인합니다."""
+
+    @abstractmethod
+    def upsert_records(self, records: Iterable[DailyPriceRecord]) -> int:
+        """행들을 기록합니다. 같은 날짜가 있으면 덮어씁니다. 기록한 행 수를 반환합니다."""
+
+    @abstractmethod
+    def read_records(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> List[DailyPriceRecord]:
+        """[start_date, end_date] 범위(None이면 열린 범위)의 행을 날짜순으로 읽습니다."""
+
+    def save(self, gold_price_data: GoldPriceData) -> None:
+        """수집한 스냅샷 하나를 그 날짜의 행으로 기록합니다."""
+        self.upsert_records([DailyPriceRecord.from_gold_price_data(gold_price_data)])
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class CsvPriceLogBackend(PriceLogBackend):
+    """
+    CSV 파일 백엔드.
+
+    새 날짜 하나는 파일 끝에 추가하고, 이미 있는 날짜를 덮어쓰거나 여러 행을 넣을 때는
+    `replace_csv_atomically()`로 날짜순으로 다시 써서 바꿉니다 (원본 권한 유지). 바꾸지 않는 행은 원래 문자열 그대로 둡니다.
+    어느 쪽이든 로그 쓰기 잠금 안에서 확인하고 기록합니다.
+    """
+
+    def __init__(self, csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE):
+        self.csv_file_path = Path(csv_file_path)
+
+    def has_date(self, date_string: str) -> bool:
+        if not self.csv_file_path.exists():
+            return False
+        return is_date_logged(self.csv_file_path, date_string)
+
+    def read_rows(self) -> Tuple[List[str], List[List[str]]]:
+        """(헤더, 데이터 행) 원본 문자열. 파일이 없으면 기본 헤더와 빈 목록."""
+        if not self.csv_file_path.exists():
+            return list(CSV_COLUMN_HEADERS), []
+        with self.csv_file_path.open("r", encoding="utf-8", newline="") as csv_file:
+            csv_reader = csv.reader(csv_file)
+            header_row = next(csv_reader, None) or list(CSV_COLUMN_HEADERS)
+            return header_row, [data_row for data_row in csv_reader if data_row]
+
+    def upsert_records(self, records: Iterable[DailyPriceRecord]) -> int:
+        new_rows = {record.date: record.to_csv_row() for record in records}
+        if not new_rows:
+            return 0
+        with price_log_write_lock(self.csv_file_path):
+            if len(new_rows) == 1:
+                (date_string, data_row), = new_rows.items()
+                # Bolt Optimization: 로그에 없는 날짜 하나는 다시 쓰지 않고 끝에 추가
+                if append_rows_to_csv_atomically(self.csv_file_path, [data_row], skip_if_date_logged=date_string):
+                    return 1
+            self.rewrite_with_rows(new_rows)
+        return len(new_rows)
+
+    def rewrite_with_rows(self, new_rows: Dict[str, List[str]]) -> None:
+        header_row, logged_rows = self.read_rows()
+        merged_rows = [
+            data_row for data_row in logged_rows if data_row[0][:DATE_FIELD_LENGTH] not in new_rows
+        ] + list(new_rows.values())
+        # 날짜 문자열("%Y-%m-%d")은 사전순이 곧 날짜순; 안정 정렬이라 같은 날짜의 기존 순서는 유지
+        merged_rows.sort(key=lambda data_row: data_row[0][:DATE_FIELD_LENGTH])
+        replace_csv_atomically(self.csv_file_path, header_row, merged_rows)
+
+    def read_records(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> List[DailyPriceRecord]:
+        _, logged_rows = self.read_rows()
+        records = []
+        for data_row in logged_rows:
+            row_date = data_row[0][:DATE_FIELD_LENGTH]
+            if (start_date is None or row_date >= start_date) and (end_date is None or row_date <= end_date):
+                try:
+                    records.append(DailyPriceRecord.from_csv_row(data_row))
+                except ValueError as row_error:
+                    logger.warning(f"가격 로그 행을 건너뜁니다: {row_error}")
+        records.sort(key=lambda record: record.date)
+        return records
+
+
+class SqlitePriceLogBackend(PriceLogBackend):
+    """
+    SQLite 파일 백엔드 (스레드 안전).
+
+    스레드마다 연결을 하나씩 열어 재사용하고, 쓰기는 `BEGIN IMMEDIATE` 트랜잭션으로 묶어
+    다른 프로세스와 동시에 써도 잠금 승격 교착 없이 busy timeout 안에서 차례로 처리합니다.
+    """
+
+    def __init__(
+        self,
+        database_path: Path = PRICE_LOG_SQLITE_FILE,
+        busy_timeout_seconds: float = SQLITE_BUSY_TIMEOUT_SECONDS,
+    ):
+        self.database_path = Path(database_path)
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self._thread_local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._thread_local, "connection", None)
+        if connection is None:
+            self.database_path.parent.mkdir(parents=True, exist_ok=True)
+            # isolation_level=None: 트랜잭션은 아래에서 직접 BEGIN/COMMIT
+            connection = sqlite3.connect(
+                self.database_path,
+                timeout=self.busy_timeout_seconds,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            # WAL에서는 NORMAL이어도 커밋 순서가 보장되고 정전 시 마지막 트랜잭션만 잃을 수 있음
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for schema_statement in SQLITE_SCHEMA_STATEMENTS:
+                connection.execute(schema_statement)
+            self._thread_local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def write(self, statement: str, parameter_rows: Iterable[Sequence]) -> int:
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = connection.executemany(statement, parameter_rows)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return cursor.rowcount
+
+    def has_date(self, date_string: str) -> bool:
+        return (
+            self.connection.execute(
+                "SELECT 1 FROM daily_prices WHERE date = ?", (date_string,)
+            ).fetchone()
+            is not None
+        )
+
+    def upsert_records(self, records: Iterable[DailyPriceRecord]) -> int:
+        value_updates = ", ".join(f"{column} = excluded.{column}" for column in PRICE_VALUE_COLUMNS)
+        return self.write(
+            f"INSERT INTO daily_prices (date, {', '.join(PRICE_VALUE_COLUMNS)}) "
+            f"VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(date) DO UPDATE SET {value_updates}",
+            (tuple(record) for record in records),
+        )
+
+    def read_records(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> List[DailyPriceRecord]:
+        cursor = self.connection.execute(
+            f"SELECT date, {', '.join(PRICE_VALUE_COLUMNS)} FROM daily_prices "
+            "WHERE date >= ? AND date <= ? ORDER BY date",
+            (start_date or "", end_date or "9999-12-31"),
+        )
+        return [DailyPriceRecord(*row) for row in cursor]
+
+    def upsert_ticks(self, ticks: Iterable) -> int:
+        """
+        장중 틱(`tick_store.IntradayTick`)을 기록합니다. 같은 timestamp는 덮어씁니다.
+        """
+        value_updates = ", ".join(f"{column} = excluded.{column}" for column in PRICE_VALUE_COLUMNS)
+        return self.write(
+            f"INSERT INTO intraday_ticks (timestamp, {', '.join(PRICE_VALUE_COLUMNS)}) "
+            f"VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(timestamp) DO UPDATE SET {value_updates}",
+            (
+                (tick.timestamp, *(getattr(tick, column) for column in PRICE_VALUE_COLUMNS))
+                for tick in ticks
+            ),
+        )
+
+    def read_tick_records(
+        self, start_timestamp: float = float("-inf"), end_timestamp: float = float("inf")
+    ) -> List[Tuple[float, ...]]:
+        """[start, end) 구간 틱의 (timestamp, 값 5개) 튜플을 시간순으로 읽습니다."""
+        return self.connection.execute(
+            f"SELECT timestamp, {', '.join(PRICE_VALUE_COLUMNS)} FROM intraday_ticks "
+            "WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp",
+            (start_timestamp, end_timestamp),
+        ).fetchall()
+
+    def close(self) -> None:
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._thread_local = threading.local()
+
+
+def open_price_log_backend(
+    backend_name: str = PRICE_LOG_BACKEND,
+    csv_file_path: Path = GOLD_PRICE_DATA_CSV_FILE,
+    database_path: Path = PRICE_LOG_SQLITE_FILE,
+) -> PriceLogBackend:
+    """
+    설정한 백엔드를 엽니다.
+
+    Raises:
+        ValueError: 알 수 없는 백엔드 이름인 경우
+    """
+    if backend_name == "csv":
+        return CsvPriceLogBackend(csv_file_path)
+    if backend_name == "sqlite":
+        return SqlitePriceLogBackend(database_path)
+    raise ValueError(
+        f"Unknown price log backend: {backend_name!r} (expected one of {PRICE_LOG_BACKEND_NAMES})"
+    )
@@ -0,0 +1,214 @@
+"""
+네이버 금융 시세를 URL별로 캐시하는 모듈입니다.
+
+- TTL(`QUOTE_CACHE_TTL_SECONDS`) 안의 값은 요청 없이 바로 반환합니다.
+- TTL이 지났지만 stale-while-revalidate 구간 안이면 캐시된 값을 먼저 반환하고
+  백그라운드 스레드에서 한 번만 갱신합니다.
+- 서버가 ETag/Last-Modified를 주면 갱신 요청을 조건부 GET으로 보내
+  304 응답이면 본문 없이 캐시를 그대로 연장합니다.
+- `persist_path`를 주면 캐시를 JSON 파일로 저장해 CLI 실행 사이에도 재사용합니다.
+  한 번 실행하고 끝나는 프로세스는 백그라운드 갱신이 끝나기 전에 종료되므로
+  `stale_while_revalidate_seconds=0`으로 만들어 TTL이 지난 값을 바로 재검증해야 합니다.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set
+
+from .configuration import (
+    QUOTE_CACHE_ENABLED,
+    QUOTE_CACHE_STALE_WHILE_REVALIDATE_SECONDS,
+    QUOTE_CACHE_TTL_SECONDS,
+)
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 캐시 파일이 비정상적으로 클 때 읽지 않도록 하는 상한 (세 URL이면 수백 바이트)
+MAX_QUOTE_CACHE_FILE_BYTES = 1024 * 1024
+
+
+@dataclass
+class CachedQuote:
+    """
+    캐시된 시세 하나.
+
+    Attributes:
+        target_url: 시세 URL
+        price: 추출한 가격
+        fetched_at: 마지막으로 가져오거나 재검증한 시각 (epoch 초, 프로세스 간 공유를 위해 벽시계 사용)
+        etag: 응답의 ETag 헤더
+        last_modified: 응답의 Last-Modified 헤더
+    """
+
+    target_url: str
+    price: float
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def age_seconds(self) -> float:
+        return max(0.0, time.time() - self.fetched_at)
+
+    def conditional_request_headers(self) -> Dict[str, str]:
+        """재검증 요청에 붙일 조건부 GET 헤더"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class QuoteCache:
+    """URL별 시세 캐시 (스레드 안전, 선택적으로 디스크에 저장)"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = QUOTE_CACHE_TTL_SECONDS,
+        stale_while_revalidate_seconds: float = QUOTE_CACHE_STALE_WHILE_REVALIDATE_SECONDS,
+        persist_path: Optional[Path] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.stale_while_revalidate_seconds = stale_while_revalidate_seconds
+        self.persist_path = Path(persist_path) if persist_path is not None else None
+        self._quotes: Dict[str, CachedQuote] = {}
+        self._revalidating_urls: Set[str] = set()
+        self._lock = threading.Lock()
+        # 스냅샷과 파일 교체를 한 번에 묶어, 먼저 찍은 스냅샷이 나중 것을 덮어쓰지 않게 함
+        self._save_lock = threading.Lock()
+        if self.persist_path is not None:
+            self._load_from_disk()
+
+    def get(self, target_url: str) -> Optional[CachedQuote]:
+        with self._lock:
+            return self._quotes.get(target_url)
+
+    def is_fresh(self, cached_quote: CachedQuote) -> bool:
+        return cached_quote.age_seconds() <= self.ttl_seconds
+
+    def can_serve_stale(self, cached_quote: CachedQuote) -> bool:
+        return (
+            cached_quote.age_seconds()
+            <= self.ttl_seconds + self.stale_while_revalidate_seconds
+        )
+
+    def store(
+        self,
+        target_url: str,
+        price: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._quotes[target_url] = CachedQuote(
+                target_url, price, time.time(), etag, last_modified
+            )
+        self._save_to_disk()
+
+    def mark_revalidated(self, target_url: str) -> Optional[CachedQuote]:
+        """304 Not Modified를 받았을 때 캐시 시각만 갱신합니다."""
+        with self._lock:
+            cached_quote = self._quotes.get(target_url)
+            if cached_quote is not None:
+                cached_quote.fetched_at = time.time()
+        self._save_to_disk()
+        return cached_quote
+
+    def revalidate_in_background(self, target_url: str, refresh: Callable[[], float]) -> bool:
+        """
+        URL당 하나의 백그라운드 갱신만 실행합니다.
+
+        Returns:
+            새 갱신을 시작했으면 True, 이미 진행 중이면 False
+        """
+        with self._lock:
+            if target_url in self._revalidating_urls:
+                return False
+            self._revalidating_urls.add(target_url)
+
+        def run_refresh():
+            try:
+                refresh()
+            except Exception as refresh_error:
+                logger.warning(f"백그라운드 시세 갱신 실패: {target_url} - {refresh_error}")
+            finally:
+                with self._lock:
+                    self._revalidating_urls.discard(target_url)
+
+        threading.Thread(target=run_refresh, name="quote-cache-revalidate", daemon=True).start()
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._quotes.clear()
+        self._save_to_disk()
+
+    def _load_from_disk(self) -> None:
+        try:
+            if self.persist_path.stat().st_size > MAX_QUOTE_CACHE_FILE_BYTES:
+                logger.warning(f"[SECURITY] 캐시 파일이 너무 커서 무시합니다: {self.persist_path}")
+                return
+            stored_quotes = json.loads(self.persist_path.read_text(encoding="utf-8"))
+            quotes = {
+                stored_quote["target_url"]: CachedQuote(
+                    target_url=str(stored_quote["target_url"]),
+                    price=float(stored_quote["price"]),
+                    fetched_at=float(stored_quote["fetched_at"]),
+                    etag=stored_quote.get("etag"),
+                    last_modified=stored_quote.get("last_modified"),
+                )
+                for stored_quote in stored_quotes
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as load_error:
+            # 손상된 캐시는 버리고 새로 받는다
+            logger.warning(f"시세 캐시 파일을 읽지 못해 무시합니다: {load_error}")
+            return
+        with self._lock:
+            self._quotes.update(quotes)
+
+    def _save_to_disk(self) -> None:
+        if self.persist_path is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                stored_quotes = [asdict(cached_quote) for cached_quote in self._quotes.values()]
+            try:
+                self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+                # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+                file_descriptor, temporary_path = tempfile.mkstemp(
+                    dir=self.persist_path.parent, prefix=".quote_cache.", suffix=".tmp"
+                )
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as temporary_file:
+                    json.dump(stored_quotes, temporary_file)
+                os.replace(temporary_path, self.persist_path)
+            except OSError as save_error:
+                logger.warning(f"시세 캐시 파일을 저장하지 못했습니다: {save_error}")
+
+
+_shared_quote_cache: Optional[QuoteCache] = QuoteCache() if QUOTE_CACHE_ENABLED else None
+
+
+def get_shared_quote_cache() -> Optional[QuoteCache]:
+    """fetch_* 함수가 사용하는 프로세스 공유 캐시 (비활성화되어 있으면 None)"""
+    return _shared_quote_cache
+
+
+def set_shared_quote_cache(quote_cache: Optional[QuoteCache]) -> Optional[QuoteCache]:
+    """
+    공유 캐시를 교체합니다 (예: CLI에서 디스크 캐시 사용, None이면 캐시 끔).
+
+    Returns:
+        이전 공유 캐시
+    """
+    global _shared_quote_cache
+    previous_quote_cache, _shared_quote_cache = _shared_quote_cache, quote_cache
+    return previous_quote_cache
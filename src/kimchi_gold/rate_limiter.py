@@ -0,0 +1,231 @@
+"""
+요청 속도를 제한하는 토큰 버킷 모듈입니다.
+
+과거 시세 백필처럼 많은 페이지를 동시에 받을 때 네이버에 초당 요청 수 이상을
+보내지 않도록 모든 작업 스레드가 하나의 버킷을 공유합니다.
+
+한 호스트에서 수집기, 백필, `check`를 여러 개 띄우면 프로세스마다 따로 세는 버킷으로는
+합계를 막을 수 없으므로, 업스트림 요청은 호스트별 상태 파일을 `fcntl.flock`으로 잠가
+공유하는 `FileTokenBucketRateLimiter`를 거칩니다.
+"""
+
+import logging
+import math
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from .configuration import (
+    UPSTREAM_RATE_LIMIT_DIRECTORY,
+    UPSTREAM_RATE_LIMIT_ENABLED,
+    UPSTREAM_REQUEST_BURST,
+    UPSTREAM_REQUESTS_PER_SECOND,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 프로세스 안에서만 제한
+    fcntl = None
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 상태 파일 레코드: (남은 토큰 수, 마지막으로 채운 시각(epoch 초))
+BUCKET_STATE_FORMAT = struct.Struct("<dd")
+
+
+class TokenBucketRateLimiter:
+    """
+    스레드 안전한 토큰 버킷.
+
+    초당 `rate_per_second`개의 토큰이 채워지고 최대 `burst`개까지 쌓입니다.
+    `acquire()`는 토큰을 예약한 뒤 락 밖에서 기다리므로, 기다리는 스레드가
+    다른 스레드의 예약을 막지 않습니다.
+    """
+
+    def __init__(self, rate_per_second: float, burst: Optional[int] = None):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive.")
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst if burst is not None else int(rate_per_second))
+        self._available_tokens = float(self.burst)
+        self._last_refill_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고, 그 토큰을 쓸 수 있을 때까지 기다릴 시간을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._available_tokens = min(
+                float(self.burst),
+                self._available_tokens + (now - self._last_refill_at) * self.rate_per_second,
+            )
+            self._last_refill_at = now
+            self._available_tokens -= 1.0
+            if self._available_tokens >= 0:
+                return 0.0
+            return -self._available_tokens / self.rate_per_second
+
+    def acquire(self) -> float:
+        """
+        토큰 하나를 얻을 때까지 기다립니다.
+
+        Returns:
+            기다린 시간 (초)
+        """
+        wait_seconds = self._reserve()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+
+class FileTokenBucketRateLimiter:
+    """
+    여러 프로세스가 상태 파일 하나를 공유하는 토큰 버킷.
+
+    토큰 수와 마지막 충전 시각을 16바이트 파일에 두고, 예약할 때만 `flock`으로 잠가
+    읽고-계산하고-쓰기를 한 번에 합니다. `TokenBucketRateLimiter`처럼 토큰이 음수가
+    되도록 예약하므로 먼저 예약한 요청이 먼저 나가고(선착순), 기다리는 동안에는
+    잠금을 잡지 않습니다. 요청은 실패하지 않고 자기 차례까지 기다립니다.
+
+    프로세스 간에 공유되는 시계가 필요하므로 `time.monotonic` 대신 `time.time`을
+    사용하고, 시계가 뒤로 가면 그 구간은 충전하지 않습니다.
+    """
+
+    def __init__(self, state_path: Path, rate_per_second: float, burst: Optional[int] = None):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive.")
+        self.state_path = Path(state_path)
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst if burst is not None else int(rate_per_second))
+        self._thread_lock = threading.Lock()
+        self._state_descriptor: Optional[int] = None
+        self._state_descriptor_pid: Optional[int] = None
+
+    def _open_state_file(self) -> int:
+        # fork한 자식은 부모와 같은 열린 파일을 공유하므로 flock이 서로를 막지 못한다. 다시 연다.
+        if self._state_descriptor is not None and self._state_descriptor_pid == os.getpid():
+            return self._state_descriptor
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        self._state_descriptor = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._state_descriptor_pid = os.getpid()
+        return self._state_descriptor
+
+    def reserve(self, max_wait_seconds: Optional[float] = None) -> Optional[float]:
+        """
+        토큰 하나를 예약합니다.
+
+        Args:
+            max_wait_seconds: 이보다 오래 기다려야 하면 예약하지 않음 (None이면 제한 없음)
+
+        Returns:
+            예약한 토큰을 쓸 수 있을 때까지 기다릴 시간(초),
+            `max_wait_seconds`를 넘으면 None (토큰은 소비하지 않음)
+        """
+        with self._thread_lock:
+            state_descriptor = self._open_state_file()
+            if fcntl is not None:
+                fcntl.flock(state_descriptor, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                os.lseek(state_descriptor, 0, os.SEEK_SET)
+                state_bytes = os.read(state_descriptor, BUCKET_STATE_FORMAT.size)
+                available_tokens, last_refill_at = float(self.burst), now
+                if len(state_bytes) == BUCKET_STATE_FORMAT.size:
+                    stored_tokens, stored_refill_at = BUCKET_STATE_FORMAT.unpack(state_bytes)
+                    # 손상된 상태는 가득 찬 버킷으로 다시 시작
+                    if math.isfinite(stored_tokens) and math.isfinite(stored_refill_at):
+                        available_tokens, last_refill_at = stored_tokens, stored_refill_at
+                available_tokens = min(
+                    float(self.burst),
+                    available_tokens + max(0.0, now - last_refill_at) * self.rate_per_second,
+                ) - 1.0
+                wait_seconds = 0.0 if available_tokens >= 0 else -available_tokens / self.rate_per_second
+                if max_wait_seconds is not None and wait_seconds > max_wait_seconds:
+                    return None
+                os.lseek(state_descriptor, 0, os.SEEK_SET)
+                os.write(state_descriptor, BUCKET_STATE_FORMAT.pack(available_tokens, now))
+                return wait_seconds
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(state_descriptor, fcntl.LOCK_UN)
+
+    def acquire(self) -> float:
+        """
+        토큰 하나를 얻을 때까지 기다립니다.
+
+        Returns:
+            기다린 시간 (초)
+        """
+        wait_seconds = self.reserve()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+    def close(self) -> None:
+        with self._thread_lock:
+            if self._state_descriptor is not None and self._state_descriptor_pid == os.getpid():
+                os.close(self._state_descriptor)
+            self._state_descriptor = None
+            self._state_descriptor_pid = None
+
+
+class UpstreamRateLimiters:
+    """호스트별 `FileTokenBucketRateLimiter` 모음 (상태 파일: <디렉토리>/<호스트>.bucket)"""
+
+    def __init__(
+        self,
+        directory: Path = UPSTREAM_RATE_LIMIT_DIRECTORY,
+        rate_per_second: float = UPSTREAM_REQUESTS_PER_SECOND,
+        burst: int = UPSTREAM_REQUEST_BURST,
+    ):
+        self.directory = Path(directory)
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._limiters: Dict[str, FileTokenBucketRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def for_url(self, target_url: str) -> FileTokenBucketRateLimiter:
+        host = (urlparse(target_url).hostname or "default").lower()
+        with self._lock:
+            rate_limiter = self._limiters.get(host)
+            if rate_limiter is None:
+                rate_limiter = FileTokenBucketRateLimiter(
+                    self.directory / f"{host}.bucket", self.rate_per_second, self.burst
+                )
+                self._limiters[host] = rate_limiter
+            return rate_limiter
+
+    def close(self) -> None:
+        with self._lock:
+            for rate_limiter in self._limiters.values():
+                rate_limiter.close()
+            self._limiters.clear()
+
+
+_shared_upstream_rate_limiters: Optional[UpstreamRateLimiters] = (
+    UpstreamRateLimiters() if UPSTREAM_RATE_LIMIT_ENABLED else None
+)
+
+
+def get_shared_upstream_rate_limiters() -> Optional[UpstreamRateLimiters]:
+    """네이버 요청 전에 거치는 호스트별 공유 토큰 버킷 (속도 제한을 끄면 None)"""
+    return _shared_upstream_rate_limiters
+
+
+def set_shared_upstream_rate_limiters(
+    rate_limiters: Optional[UpstreamRateLimiters],
+) -> Optional[UpstreamRateLimiters]:
+    """
+    공유 토큰 버킷을 교체합니다 (None이면 속도 제한 끔).
+
+    Returns:
+        이전 토큰 버킷 모음
+    """
+    global _shared_upstream_rate_limiters
+    previous_rate_limiters, _shared_upstream_rate_limiters = _shared_upstream_rate_limiters, rate_limiters
+    return previous_rate_limiters
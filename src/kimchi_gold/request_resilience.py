@@ -0,0 +1,133 @@
+"""
+네이버 금융 요청의 지연 헤징(hedged request)과 재시도 정책을 정의하는 모듈입니다.
+
+- `LatencyTracker`: URL별 최근 응답 시간을 기록하고 백분위수를 계산합니다.
+  헤징 모드에서는 응답이 이 백분위수 안에 오지 않으면 같은 요청을 하나 더 보내고
+  먼저 끝난 쪽을 사용합니다.
+- `RetryPolicy`: 일시적인 5xx 응답과 연결 오류에 대해 지수 백오프 + 지터로
+  제한된 횟수만큼 재시도합니다.
+"""
+
+import asyncio
+import math
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional
+
+import requests
+
+from .configuration import (
+    REQUEST_HEDGE_MIN_SAMPLES,
+    REQUEST_HEDGE_PERCENTILE,
+    REQUEST_MAX_RETRIES,
+    REQUEST_RETRY_BASE_DELAY_SECONDS,
+    REQUEST_RETRY_MAX_DELAY_SECONDS,
+)
+
+# URL별로 보관할 최근 응답 시간 개수
+LATENCY_WINDOW_SIZE = 100
+
+
+class LatencyTracker:
+    """URL별 최근 응답 시간(초)을 보관하는 스레드 안전한 슬라이딩 윈도우"""
+
+    def __init__(
+        self,
+        window_size: int = LATENCY_WINDOW_SIZE,
+        min_samples: int = REQUEST_HEDGE_MIN_SAMPLES,
+    ):
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, target_url: str, latency_seconds: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(target_url)
+            if latencies is None:
+                latencies = self._latencies[target_url] = deque(maxlen=self.window_size)
+            latencies.append(latency_seconds)
+
+    def percentile(self, target_url: str, percentile: float) -> Optional[float]:
+        """
+        최근 응답 시간의 백분위수를 반환합니다 (nearest-rank 방식).
+
+        Returns:
+            백분위수(초), 표본이 `min_samples`보다 적으면 None
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(target_url, ()))
+        if not latencies or len(latencies) < self.min_samples:
+            return None
+        rank = max(1, math.ceil(percentile / 100 * len(latencies)))
+        return latencies[rank - 1]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latencies.clear()
+
+
+@dataclass
+class RetryPolicy:
+    """
+    일시적 오류에 대한 재시도 정책.
+
+    Attributes:
+        max_retries: 첫 시도 이후 최대 재시도 횟수
+        base_delay_seconds: 첫 재시도 전 백오프 상한
+        max_delay_seconds: 백오프 상한의 최대값
+    """
+
+    max_retries: int = REQUEST_MAX_RETRIES
+    base_delay_seconds: float = REQUEST_RETRY_BASE_DELAY_SECONDS
+    max_delay_seconds: float = REQUEST_RETRY_MAX_DELAY_SECONDS
+
+    def backoff_delay(self, retry_number: int) -> float:
+        """
+        `retry_number`번째(0부터) 재시도 전 대기 시간.
+        full jitter: [0, min(max, base * 2^n)] 구간에서 균등하게 뽑아
+        여러 클라이언트가 같은 순간에 다시 몰리지 않게 합니다.
+        """
+        delay_ceiling = min(
+            self.max_delay_seconds, self.base_delay_seconds * (2 ** retry_number)
+        )
+        return random.uniform(0, delay_ceiling)
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    재시도해도 되는 일시적 오류인지 판단합니다.
+
+    연결 실패(연결 타임아웃 포함)와 5xx 응답만 재시도합니다. 읽기 타임아웃은
+    서버가 이미 느린 상태이므로 재시도하지 않고(헤징이 담당), 4xx나 파싱 실패는
+    다시 보내도 결과가 같으므로 재시도하지 않습니다.
+    """
+    if isinstance(error, requests.HTTPError):
+        response = error.response
+        return response is not None and 500 <= response.status_code < 600
+    if isinstance(error, requests.ReadTimeout):
+        return False
+    return isinstance(
+        error,
+        (
+            requests.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+            ConnectionError,
+            asyncio.IncompleteReadError,
+        ),
+    )
+
+
+_shared_latency_tracker = LatencyTracker()
+
+
+def get_shared_latency_tracker() -> LatencyTracker:
+    """프로세스 전체에서 공유되는 응답 시간 기록기를 반환합니다."""
+    return _shared_latency_tracker
+
+
+def get_hedge_delay(target_url: str, percentile: float = REQUEST_HEDGE_PERCENTILE) -> Optional[float]:
+    """헤지 요청을 보내기 전까지 기다릴 시간. 표본이 부족하면 None (헤징 안 함)."""
+    return _shared_latency_tracker.percentile(target_url, percentile)
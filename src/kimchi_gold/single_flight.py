@@ -0,0 +1,116 @@
+"""
+동시에 들어온 같은 요청을 하나로 합치는 single-flight 모듈입니다.
+
+API 프로세스에서 여러 스레드(또는 코루틴)가 같은 순간에 시세 스냅샷을 요청하면
+각자 세 번씩 HTTP 요청을 보내게 됩니다. 같은 키의 호출이 진행 중이면 새 호출은
+요청을 보내지 않고 그 결과(또는 예외)를 함께 받습니다. 결과를 캐시하지는 않으므로
+진행 중인 호출이 끝난 뒤에 들어온 호출은 새로 실행됩니다.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _InFlightCall:
+    """진행 중인 동기 호출 하나 (결과를 기다리는 스레드들이 공유)"""
+
+    def __init__(self):
+        self.done_event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """스레드 간 single-flight: 키별로 동시에 하나의 호출만 실행합니다."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+        self._lock = threading.Lock()
+
+    def call(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        `key`로 진행 중인 호출이 있으면 그 결과를 기다려 반환하고,
+        없으면 `function`을 실행합니다.
+
+        Raises:
+            `function`이 발생시킨 예외 (기다리던 호출자에게도 같은 예외)
+        """
+        with self._lock:
+            in_flight = self._calls.get(key)
+            is_leader = in_flight is None
+            if is_leader:
+                in_flight = self._calls[key] = _InFlightCall()
+
+        if not is_leader:
+            in_flight.done_event.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.result
+
+        try:
+            in_flight.result = function()
+            return in_flight.result
+        except BaseException as call_error:
+            in_flight.error = call_error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            in_flight.done_event.set()
+
+    def in_flight_count(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    asyncio single-flight: 같은 이벤트 루프 안에서 키별로 하나의 태스크만 실행합니다.
+
+    호출자 하나가 취소되어도 공유 태스크는 계속 실행되고(`asyncio.shield`),
+    기다리던 호출자가 모두 취소되었을 때만 공유 태스크를 취소합니다.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self._waiter_counts: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], int] = {}
+
+    async def call(self, key: Hashable, coroutine_function: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        `key`로 진행 중인 태스크가 있으면 그 결과를 기다려 반환하고,
+        없으면 `coroutine_function()`을 새 태스크로 실행합니다.
+        """
+        event_loop = asyncio.get_running_loop()
+        flight_key = (event_loop, key)
+        shared_task = self._tasks.get(flight_key)
+        if shared_task is None:
+            shared_task = event_loop.create_task(coroutine_function())
+            self._tasks[flight_key] = shared_task
+            self._waiter_counts[flight_key] = 0
+            shared_task.add_done_callback(
+                lambda finished_task: self._forget_task(flight_key, finished_task)
+            )
+
+        self._waiter_counts[flight_key] += 1
+        try:
+            return await asyncio.shield(shared_task)
+        except asyncio.CancelledError:
+            # 마지막으로 기다리던 호출자가 취소되면 더 이상 결과를 쓸 곳이 없다
+            if not shared_task.done() and self._waiter_counts.get(flight_key) == 1:
+                shared_task.cancel()
+            raise
+        finally:
+            if self._tasks.get(flight_key) is shared_task:
+                self._waiter_counts[flight_key] -= 1
+
+    def _forget_task(self, flight_key, finished_task: asyncio.Task) -> None:
+        if self._tasks.get(flight_key) is finished_task:
+            del self._tasks[flight_key]
+            del self._waiter_counts[flight_key]
+        if not finished_task.cancelled():
+            # 기다리던 호출자가 모두 취소된 경우 "exception was never retrieved" 경고 방지
+            finished_task.exception()
+
+    def in_flight_count(self) -> int:
+        return len(self._tasks)
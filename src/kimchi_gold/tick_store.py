@@ -0,0 +1,234 @@
+"""
+장중 시세 틱을 날짜별 바이너리 파일에 추가 기록하는 모듈입니다.
+
+CSV 한 줄을 쓰려면 포맷팅, 인코딩, 헤더 확인이 필요하지만 틱은 초 단위로 계속
+쌓이므로 고정 크기(48바이트) 레코드를 `O_APPEND`로 연 파일에 `os.write` 한 번으로
+추가합니다. 레코드 크기가 고정되어 있어 읽을 때 파싱이 필요 없고, 기록 도중
+프로세스가 죽어 마지막 레코드가 잘려도 완전한 레코드만 읽으면 됩니다.
+
+파일 구성: `<틱 디렉토리>/YYYY-MM-DD.ticks` (로컬 날짜 기준)
+    헤더 8바이트 (`TICK_FILE_MAGIC`) + 레코드 N개
+    레코드: timestamp(epoch 초), 국내 금(원/g), 국제 금(달러/온스), 환율(원/달러),
+            김치 프리미엄(원/g), 김치 프리미엄(%) - 리틀 엔디언 float64 6개
+"""
+
+import logging
+import os
+import struct
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from .configuration import INTRADAY_TICK_DIRECTORY
+from .data_collector import validate_safe_path
+from .data_models import GoldPriceData
+from .price_fetcher import build_gold_price_data
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+TICK_FILE_MAGIC = b"KGTICK1\n"
+TICK_RECORD_FORMAT = struct.Struct("<6d")
+TICK_FILE_SUFFIX = ".ticks"
+
+# 읽을 때 한 번에 읽는 레코드 수 (메모리 사용량 제한)
+TICK_READ_BATCH_RECORDS = 4096
+
+
+@dataclass
+class IntradayTick:
+    """장중 시세 틱 하나"""
+
+    timestamp: float  # 수집 시각 (epoch 초)
+    domestic_price: float  # 국내 금 가격 (원/g)
+    international_price: float  # 국제 금 가격 (달러/온스)
+    usd_krw_rate: float  # 환율 (원/달러)
+    kimchi_premium_amount: float  # 김치 프리미엄 금액 (원/g)
+    kimchi_premium_percent: float  # 김치 프리미엄 비율 (%)
+
+    @classmethod
+    def from_gold_price_data(cls, gold_price_data: GoldPriceData) -> "IntradayTick":
+        return cls(
+            timestamp=gold_price_data.data_collection_timestamp.timestamp(),
+            domestic_price=gold_price_data.domestic_price,
+            international_price=gold_price_data.international_price,
+            usd_krw_rate=gold_price_data.usd_krw_rate,
+            kimchi_premium_amount=gold_price_data.kimchi_premium_amount,
+            kimchi_premium_percent=gold_price_data.kimchi_premium_percent,
+        )
+
+    @property
+    def trading_day(self) -> date:
+        return datetime.fromtimestamp(self.timestamp).date()
+
+    def pack(self) -> bytes:
+        return TICK_RECORD_FORMAT.pack(
+            self.timestamp,
+            self.domestic_price,
+            self.international_price,
+            self.usd_krw_rate,
+            self.kimchi_premium_amount,
+            self.kimchi_premium_percent,
+        )
+
+
+@dataclass
+class IntradayTickSummary:
+    """
+    하루치 틱 요약 (틱을 한 번 순회하며 계산하므로 메모리는 틱 수와 무관).
+
+    Attributes:
+        trading_day: 날짜
+        tick_count: 틱 수
+        premium_percent_open/high/low/close: 김치 프리미엄(%)의 시가/고가/저가/종가
+        last_tick: 마지막 틱 (일별 CSV 행의 기준)
+    """
+
+    trading_day: date
+    tick_count: int
+    premium_percent_open: float
+    premium_percent_high: float
+    premium_percent_low: float
+    premium_percent_close: float
+    last_tick: IntradayTick
+
+    def to_daily_gold_price_data(self) -> GoldPriceData:
+        """
+        마지막 틱으로 일별 CSV 행에 쓸 GoldPriceData를 만듭니다.
+        원/g 환산과 프리미엄은 일별 수집과 같은 계산(`build_gold_price_data`)으로 다시 구합니다.
+        """
+        daily_gold_price_data = build_gold_price_data(
+            self.last_tick.domestic_price,
+            self.last_tick.international_price,
+            self.last_tick.usd_krw_rate,
+        )
+        daily_gold_price_data.data_collection_timestamp = datetime.fromtimestamp(
+            self.last_tick.timestamp
+        )
+        return daily_gold_price_data
+
+
+def summarize_intraday_ticks(ticks: Iterable[IntradayTick]) -> Optional[IntradayTickSummary]:
+    """
+    틱을 순서대로 한 번 순회하며 요약합니다.
+
+    Returns:
+        IntradayTickSummary, 틱이 없으면 None
+    """
+    summary: Optional[IntradayTickSummary] = None
+    for tick in ticks:
+        premium_percent = tick.kimchi_premium_percent
+        if summary is None:
+            summary = IntradayTickSummary(
+                trading_day=tick.trading_day,
+                tick_count=0,
+                premium_percent_open=premium_percent,
+                premium_percent_high=premium_percent,
+                premium_percent_low=premium_percent,
+                premium_percent_close=premium_percent,
+                last_tick=tick,
+            )
+        summary.tick_count += 1
+        summary.premium_percent_high = max(summary.premium_percent_high, premium_percent)
+        summary.premium_percent_low = min(summary.premium_percent_low, premium_percent)
+        summary.premium_percent_close = premium_percent
+        summary.last_tick = tick
+    return summary
+
+
+class TickStore:
+    """
+    날짜별 틱 파일에 추가 기록하고 읽는 저장소.
+
+    쓰기용 파일 디스크립터는 하나만 열어 두고 날짜가 바뀔 때만 교체합니다.
+    한 프로세스(수집 데몬)만 쓰는 것을 전제로 하며, 읽기는 언제든 가능합니다.
+    """
+
+    def __init__(self, directory: Path = INTRADAY_TICK_DIRECTORY):
+        self.directory = validate_safe_path(Path(directory))
+        self._write_day: Optional[date] = None
+        self._write_descriptor: Optional[int] = None
+
+    def tick_file_path(self, trading_day: date) -> Path:
+        return self.directory / f"{trading_day.isoformat()}{TICK_FILE_SUFFIX}"
+
+    def _open_for_append(self, trading_day: date) -> int:
+        self.close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tick_file_path = self.tick_file_path(trading_day)
+        write_descriptor = os.open(
+            tick_file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        file_size = os.fstat(write_descriptor).st_size
+        if file_size < len(TICK_FILE_MAGIC):
+            # 새 파일이거나 헤더를 쓰다 중단된 파일
+            os.truncate(tick_file_path, 0)
+            os.write(write_descriptor, TICK_FILE_MAGIC)
+        else:
+            # 이전 프로세스가 레코드 중간에 죽었으면 잘린 꼬리를 버려 레코드 경계를 맞춘다
+            record_bytes = file_size - len(TICK_FILE_MAGIC)
+            partial_bytes = record_bytes % TICK_RECORD_FORMAT.size
+            if partial_bytes:
+                logger.warning(f"잘린 틱 레코드({partial_bytes}바이트)를 제거합니다: {tick_file_path}")
+                os.truncate(tick_file_path, file_size - partial_bytes)
+        self._write_day = trading_day
+        self._write_descriptor = write_descriptor
+        return write_descriptor
+
+    def append(self, tick: IntradayTick) -> None:
+        """틱 하나를 해당 날짜 파일 끝에 추가합니다."""
+        trading_day = tick.trading_day
+        write_descriptor = self._write_descriptor
+        if write_descriptor is None or trading_day != self._write_day:
+            write_descriptor = self._open_for_append(trading_day)
+        os.write(write_descriptor, tick.pack())
+
+    def iter_ticks(self, trading_day: date) -> Iterator[IntradayTick]:
+        """하루치 틱을 기록 순서대로 읽습니다 (잘린 마지막 레코드는 무시)."""
+        tick_file_path = self.tick_file_path(trading_day)
+        try:
+            tick_file = open(tick_file_path, "rb")
+        except FileNotFoundError:
+            return
+        with tick_file:
+            if tick_file.read(len(TICK_FILE_MAGIC)) != TICK_FILE_MAGIC:
+                raise ValueError(f"틱 파일 형식이 올바르지 않습니다: {tick_file_path}")
+            batch_bytes = TICK_RECORD_FORMAT.size * TICK_READ_BATCH_RECORDS
+            while True:
+                data = tick_file.read(batch_bytes)
+                complete_bytes = len(data) - len(data) % TICK_RECORD_FORMAT.size
+                for record in TICK_RECORD_FORMAT.iter_unpack(data[:complete_bytes]):
+                    yield IntradayTick(*record)
+                if len(data) < batch_bytes:
+                    return
+
+    def read_ticks(self, trading_day: date) -> List[IntradayTick]:
+        return list(self.iter_ticks(trading_day))
+
+    def summarize_day(self, trading_day: date) -> Optional[IntradayTickSummary]:
+        return summarize_intraday_ticks(self.iter_ticks(trading_day))
+
+    def recorded_days(self) -> List[date]:
+        """틱 파일이 있는 날짜 목록 (오름차순)"""
+        if not self.directory.exists():
+            return []
+        recorded_days = []
+        for tick_file_path in self.directory.glob(f"*{TICK_FILE_SUFFIX}"):
+            try:
+                recorded_days.append(date.fromisoformat(tick_file_path.stem))
+            except ValueError:
+                continue
+        return sorted(recorded_days)
+
+    def close(self) -> None:
+        if self._write_descriptor is not None:
+            os.close(self._write_descriptor)
+        self._write_descriptor = None
+        self._write_day = None
+
+    def __enter__(self) -> "TickStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
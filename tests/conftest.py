@@ -0,0 +1,48 @@
+import pytest
+
+from kimchi_gold.circuit_breaker import reset_circuit_breakers
+from kimchi_gold.configuration import CSV_COLUMN_HEADERS
+from kimchi_gold.quote_cache import set_shared_quote_cache
+from kimchi_gold.rate_limiter import set_shared_upstream_rate_limiters
+
+
+@pytest.fixture(autouse=True)
+def isolate_circuit_breakers():
+    # 서킷 브레이커는 프로세스 전역 상태이므로 테스트 간 실패 횟수가 누적되지 않게 초기화
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
+@pytest.fixture(autouse=True)
+def disable_shared_quote_cache():
+    # 공유 시세 캐시가 켜져 있으면 이전 테스트의 값이 반환되어 요청 수 검증이 깨지므로 끔
+    previous_quote_cache = set_shared_quote_cache(None)
+    yield
+    set_shared_quote_cache(previous_quote_cache)
+
+
+@pytest.fixture(autouse=True)
+def disable_upstream_rate_limit():
+    # 스탠드인 서버 대상 테스트가 사용자 캐시 디렉토리의 버킷을 쓰거나 속도 제한에 걸리지 않게 끔
+    previous_rate_limiters = set_shared_upstream_rate_limiters(None)
+    yield
+    set_shared_upstream_rate_limiters(previous_rate_limiters)
+
+
+@pytest.fixture
+def price_log_header():
+    # 가격 기록 CSV의 헤더 줄 (설정의 열 이름을 그대로 사용해 헤더가 바뀌어도 테스트가 따라감)
+    return ",".join(CSV_COLUMN_HEADERS)
+
+
+@pytest.fixture
+def write_price_log(price_log_header):
+    """헤더와 주어진 데이터 줄로 가격 기록 CSV를 쓰고 경로를 돌려주는 함수를 제공합니다."""
+
+    def write(path, rows, line_ending="\n", trailing_newline=True):
+        lines = [price_log_header] + list(rows)
+        path.write_bytes((line_ending.join(lines) + (line_ending if trailing_newline else "")).encode("utf-8"))
+        return path
+
+    return write
@@ -0,0 +1,179 @@
+"""
+스탠드인 서버를 대상으로 시세 스냅샷 수집에 동시 부하를 거는 하네스입니다.
+
+동시성 단계마다 작업 스레드 N개가 `fetch_current_gold_market_data`(또는 지정한 수집
+함수)를 반복 호출하고, 호출별 소요 시간과 실패 원인, 서버가 실제로 받은 요청 수를
+모아 처리량과 지연 백분위수를 계산합니다. 테스트와 `benchmarks/bench_fetcher_load.py`가
+함께 사용합니다.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List
+
+import requests
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.circuit_breaker import reset_circuit_breakers
+from kimchi_gold.fetch_deadline import MarketDataCollectionError
+from naver_stand_in import NaverStandInServer
+
+LOAD_REPORT_PERCENTILES = (50, 90, 99)
+
+
+@dataclass
+class LoadLevelResult:
+    """
+    동시성 단계 하나의 결과.
+
+    Attributes:
+        concurrency: 동시에 호출한 작업 스레드 수
+        call_count: 전체 호출 수
+        elapsed_seconds: 단계 전체 소요 시간
+        latencies: 호출별 소요 시간 (성공/실패 모두)
+        failure_counts: 실패 원인별 호출 수 ("timeout", "http_error", "circuit_open" 등)
+        upstream_request_count: 스탠드인 서버가 받은 요청 수 (재시도 포함, single-flight로 합쳐진 호출 제외)
+        upstream_error_count: 스탠드인 서버가 오류로 응답한 요청 수
+    """
+
+    concurrency: int
+    call_count: int
+    elapsed_seconds: float
+    latencies: List[float] = field(default_factory=list)
+    failure_counts: Dict[str, int] = field(default_factory=dict)
+    upstream_request_count: int = 0
+    upstream_error_count: int = 0
+
+    @property
+    def failure_count(self) -> int:
+        return sum(self.failure_counts.values())
+
+    @property
+    def success_count(self) -> int:
+        return self.call_count - self.failure_count
+
+    @property
+    def throughput(self) -> float:
+        """초당 완료한 호출 수 (성공/실패 모두)"""
+        return self.call_count / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """호출 소요 시간의 백분위수 (nearest-rank 방식, 초)"""
+        if not self.latencies:
+            return 0.0
+        sorted_latencies = sorted(self.latencies)
+        rank = max(1, math.ceil(percentile / 100 * len(sorted_latencies)))
+        return sorted_latencies[rank - 1]
+
+
+def classify_snapshot_failure(error: BaseException) -> str:
+    """
+    실패한 호출의 원인을 하나로 정리합니다.
+    fail-fast로 취소된 소스는 원인이 아니므로 먼저 실패한 소스를 기준으로 합니다.
+    """
+    if not isinstance(error, MarketDataCollectionError):
+        return type(error).__name__
+    for failure in error.failures:
+        if failure.timed_out:
+            return "timeout"
+        if failure.circuit_open:
+            return "circuit_open"
+        if failure.cancelled:
+            continue
+        if isinstance(failure.error, requests.HTTPError):
+            return "http_error"
+        if isinstance(failure.error, requests.ConnectionError):
+            return "connection_error"
+        return type(failure.error).__name__ if failure.error is not None else "error"
+    return "cancelled"
+
+
+def run_load_level(
+    stand_in: NaverStandInServer,
+    concurrency: int,
+    calls_per_worker: int,
+    snapshot_fetcher: Callable[[], object] = price_fetcher.fetch_current_gold_market_data,
+) -> LoadLevelResult:
+    """
+    작업 스레드 `concurrency`개가 동시에 시작해 각자 `calls_per_worker`번 수집합니다.
+    단계마다 서킷 브레이커와 서버 카운터를 초기화해 이전 단계의 실패가 이어지지 않게 합니다.
+    """
+    reset_circuit_breakers()
+    stand_in.reset_counters()
+
+    latencies: List[float] = []
+    failure_counts: Dict[str, int] = {}
+    result_lock = threading.Lock()
+    start_barrier = threading.Barrier(concurrency + 1)
+
+    def worker():
+        start_barrier.wait()
+        for _ in range(calls_per_worker):
+            call_started = time.perf_counter()
+            failure_kind = None
+            try:
+                snapshot_fetcher()
+            except Exception as snapshot_error:
+                failure_kind = classify_snapshot_failure(snapshot_error)
+            call_seconds = time.perf_counter() - call_started
+            with result_lock:
+                latencies.append(call_seconds)
+                if failure_kind is not None:
+                    failure_counts[failure_kind] = failure_counts.get(failure_kind, 0) + 1
+
+    workers = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for worker_thread in workers:
+        worker_thread.start()
+    start_barrier.wait()
+    level_started = time.perf_counter()
+    for worker_thread in workers:
+        worker_thread.join()
+    elapsed_seconds = time.perf_counter() - level_started
+
+    return LoadLevelResult(
+        concurrency=concurrency,
+        call_count=concurrency * calls_per_worker,
+        elapsed_seconds=elapsed_seconds,
+        latencies=latencies,
+        failure_counts=failure_counts,
+        upstream_request_count=stand_in.request_count,
+        upstream_error_count=stand_in.error_count,
+    )
+
+
+def run_load_test(
+    stand_in: NaverStandInServer,
+    concurrency_levels: Iterable[int],
+    calls_per_worker: int,
+    snapshot_fetcher: Callable[[], object] = price_fetcher.fetch_current_gold_market_data,
+) -> List[LoadLevelResult]:
+    """동시성을 단계별로 높여 가며 `run_load_level`을 실행합니다."""
+    return [
+        run_load_level(stand_in, concurrency, calls_per_worker, snapshot_fetcher)
+        for concurrency in concurrency_levels
+    ]
+
+
+def format_load_report(results: Iterable[LoadLevelResult]) -> str:
+    """단계별 결과를 표로 만듭니다."""
+    percentile_headers = " | ".join(f"{f'p{p} (ms)':>9}" for p in LOAD_REPORT_PERCENTILES)
+    lines = [
+        f"{'conc':>4} | {'calls':>5} | {'ok':>5} | {'calls/s':>8} | {percentile_headers} | "
+        f"{'upstream':>8} | {'5xx':>4} | failures",
+        "-" * 100,
+    ]
+    for result in results:
+        percentile_cells = " | ".join(
+            f"{result.latency_percentile(p) * 1000:>9.1f}" for p in LOAD_REPORT_PERCENTILES
+        )
+        failure_summary = ", ".join(
+            f"{kind}={count}" for kind, count in sorted(result.failure_counts.items())
+        ) or "-"
+        lines.append(
+            f"{result.concurrency:>4} | {result.call_count:>5} | {result.success_count:>5} | "
+            f"{result.throughput:>8.1f} | {percentile_cells} | "
+            f"{result.upstream_request_count:>8} | {result.upstream_error_count:>4} | {failure_summary}"
+        )
+    return "\n".join(lines)
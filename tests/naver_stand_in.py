@@ -0,0 +1,402 @@
+"""
+네이버 금융 market-index 페이지를 흉내 내는 로컬 HTTPS 스탠드인 서버입니다.
+
+테스트와 벤치마크에서 실제 네트워크 없이 fetcher의 I/O 경로(커넥션 풀, TLS,
+스트리밍 읽기)를 검증하기 위해 사용합니다. 인증서는 fixtures 디렉토리의
+자체 서명 인증서(127.0.0.1, *.naver.com SAN)를 사용합니다.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import random
+import ssl
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from datetime import date
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from kimchi_gold.http_session import ConnectTimingHTTPAdapter
+
+FIXTURES_DIRECTORY = Path(__file__).resolve().parent / "fixtures"
+NAVER_FIXTURES_DIRECTORY = FIXTURES_DIRECTORY / "naver"
+STAND_IN_CERT_FILE = FIXTURES_DIRECTORY / "stand_in_cert.pem"
+STAND_IN_KEY_FILE = FIXTURES_DIRECTORY / "stand_in_key.pem"
+
+# 기본 시세 (configuration.py의 세 URL 경로 기준)
+DEFAULT_QUOTE_TEXTS = {
+    "/marketindex/metals/M04020000": "152,340.00",
+    "/marketindex/metals/GCcv1": "3,345.20",
+    "/marketindex/exchange/FX_USDKRW": "1,399.50",
+}
+
+
+def render_market_index_page(price_text: str, padding_bytes: int = 0) -> bytes:
+    """
+    네이버 모바일 market-index 페이지와 비슷한 구조의 HTML을 만듭니다.
+
+    Args:
+        price_text: DetailInfo_price 태그 안에 들어갈 가격 문자열
+        padding_bytes: 가격 태그 뒤에 붙일 스크립트 데이터 크기 (실제 페이지의 __NEXT_DATA__ 역할)
+
+    Returns:
+        UTF-8로 인코딩된 HTML
+    """
+    head = (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">'
+        "<title>네이버 증권</title>"
+        '<link rel="stylesheet" href="/_next/static/css/app.css">'
+        "</head><body><div id=\"__next\"><div class=\"DetailInfo_article__1\">"
+        '<div class="DetailInfo_price__wrap">'
+        f'<strong class="DetailInfo_price__I_VJn">{price_text}'
+        '<span class="DetailInfo_unit__2">원</span></strong>'
+        "</div></div></div>"
+    )
+    padding = "x" * padding_bytes
+    tail = (
+        '<script id="__NEXT_DATA__" type="application/json">'
+        f'{{"props":{{"pageProps":{{"padding":"{padding}"}}}}}}'
+        "</script></body></html>"
+    )
+    return (head + tail).encode("utf-8")
+
+
+def default_stand_in_pages(padding_bytes: int = 0) -> Dict[str, bytes]:
+    """세 시세 URL 경로에 대한 기본 페이지 묶음을 반환합니다."""
+    return {
+        path: render_market_index_page(price_text, padding_bytes)
+        for path, price_text in DEFAULT_QUOTE_TEXTS.items()
+    }
+
+
+NAVER_FIXTURE_FILES = {
+    "/marketindex/metals/M04020000": "domestic_gold_M04020000.html.gz",
+    "/marketindex/metals/GCcv1": "international_gold_GCcv1.html.gz",
+    "/marketindex/exchange/FX_USDKRW": "usd_krw_FX_USDKRW.html.gz",
+}
+
+
+def load_naver_fixture_pages() -> Dict[str, bytes]:
+    """fixtures/naver의 전체 크기 페이지를 URL 경로별로 읽어옵니다."""
+    return {
+        path: gzip.decompress((NAVER_FIXTURES_DIRECTORY / file_name).read_bytes())
+        for path, file_name in NAVER_FIXTURE_FILES.items()
+    }
+
+
+def render_daily_quote_page(history_rows: List[Tuple[date, str]]) -> bytes:
+    """
+    네이버 금융 일별 시세 페이지(goldDailyQuote 등)와 비슷한 구조의 표를 만듭니다.
+    행이 없으면 마지막 페이지 이후처럼 빈 표를 반환합니다.
+    """
+    table_rows = "".join(
+        '<tr class="up">'
+        f'<td class="date">{trading_day.strftime("%Y.%m.%d")}</td>\n'
+        f'<td class="num">{price_text}</td>\n'
+        '<td class="num"><img src="ico_up.gif" alt="상승"> 1.20</td>'
+        "</tr>"
+        for trading_day, price_text in history_rows
+    )
+    return (
+        '<html><head><meta http-equiv="Content-Type" content="text/html; charset=utf-8"></head>'
+        '<body><table class="tbl_exchange today"><thead><tr><th>날짜</th><th>종가</th>'
+        f"<th>전일대비</th></tr></thead><tbody>{table_rows}</tbody></table></body></html>"
+    ).encode("utf-8")
+
+
+class DailyQuotePages:
+    """
+    경로별 일별 시세(날짜 -> 가격 문자열)를 최신 날짜부터 `rows_per_page`개씩 나눠
+    `?page=N` 요청에 응답하는 `page_resolver`.
+    """
+
+    def __init__(self, quotes_by_path: Dict[str, Dict[date, str]], rows_per_page: int = 10):
+        self.rows_per_page = rows_per_page
+        self.rows_by_path = {
+            path: sorted(quotes.items(), reverse=True) for path, quotes in quotes_by_path.items()
+        }
+        self.requested_pages: List[Tuple[str, int]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, path_and_query: str) -> Optional[bytes]:
+        parsed_url = urlsplit(path_and_query)
+        history_rows = self.rows_by_path.get(parsed_url.path)
+        if history_rows is None:
+            return None
+        page_number = int(parse_qs(parsed_url.query).get("page", ["1"])[0])
+        with self._lock:
+            self.requested_pages.append((parsed_url.path, page_number))
+        offset = (page_number - 1) * self.rows_per_page
+        return render_daily_quote_page(history_rows[offset:offset + self.rows_per_page])
+
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+    disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 delayed-ACK 지연 방지
+
+    def do_GET(self):
+        stand_in = self.server.stand_in
+        stand_in._increment("request_count")
+
+        path = urlsplit(self.path).path
+        delay_seconds = stand_in.latency_seconds
+        fault = stand_in._next_fault(path)
+        if fault is None:
+            fault = stand_in._random_fault()
+        if stand_in.jitter_seconds:
+            delay_seconds += stand_in._random_uniform(0, stand_in.jitter_seconds)
+        if fault is not None:
+            fault_kind = fault[0]
+            if fault_kind == "drop":
+                # 응답 없이 연결을 끊는다 (클라이언트에는 연결 오류)
+                self.close_connection = True
+                return
+            if fault_kind == "status":
+                stand_in._increment("error_count")
+                self.send_response(fault[1])
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if fault_kind == "delay":
+                delay_seconds += fault[1]
+        if delay_seconds:
+            time.sleep(delay_seconds)
+
+        page = stand_in.resolve_page(self.path)
+        if page is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if stand_in.send_validators:
+            etag = '"%s"' % hashlib.sha1(page).hexdigest()
+            if self.headers.get("If-None-Match") == etag:
+                stand_in._increment("not_modified_count")
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if stand_in.send_validators:
+            self.send_header("ETag", etag)
+        if stand_in.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for offset in range(0, len(page), 4096):
+                piece = page[offset:offset + 4096]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(piece), piece))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+
+    def log_message(self, format, *args):
+        # 테스트 출력이 요청 로그로 뒤덮이지 않도록 무시
+        pass
+
+
+class _StandInHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # 동시 접속 시 listen backlog 초과로 인한 SYN 재전송 방지
+
+    def __init__(self, stand_in: "NaverStandInServer"):
+        self.stand_in = stand_in
+        super().__init__(("127.0.0.1", 0), _StandInRequestHandler)
+
+    def get_request(self):
+        connection, client_address = super().get_request()
+        if self.stand_in.ssl_context is not None:
+            # 핸드셰이크는 요청 스레드에서 수행하여 accept 루프를 막지 않는다
+            connection = self.stand_in.ssl_context.wrap_socket(
+                connection, server_side=True, do_handshake_on_connect=False
+            )
+        return connection, client_address
+
+    def finish_request(self, request, client_address):
+        if isinstance(request, ssl.SSLSocket):
+            try:
+                request.do_handshake()
+            except (ssl.SSLError, OSError):
+                return
+        self.stand_in._increment("handshake_count")
+        super().finish_request(request, client_address)
+
+
+class NaverStandInServer:
+    """
+    로컬 HTTPS 스탠드인 서버.
+
+    `handshake_count`는 새로 맺어진 연결(TLS 핸드셰이크) 수,
+    `request_count`는 처리한 GET 요청 수입니다.
+
+    `send_validators`가 True면 페이지 내용 기반 ETag를 보내고 If-None-Match가
+    일치하면 304로 응답합니다 (`not_modified_count`로 집계).
+
+    `page_resolver`를 주면 쿼리 문자열을 포함한 요청 경로로 먼저 페이지를 찾습니다
+    (일별 시세 페이지처럼 `?page=N`마다 내용이 다른 경우).
+
+    `latency_seconds`는 모든 응답 앞에 넣는 지연이고, `jitter_seconds`만큼의
+    균등 분포 지연이 요청마다 더해집니다. `error_rate`는 예약된 장애가 없는 요청이
+    `error_status`로 실패할 확률입니다 (`seed`로 재현 가능, `error_count`로 집계).
+    응답 크기는 `default_stand_in_pages(padding_bytes)`로 조절합니다.
+    `inject_faults()`로 경로별로 다음 요청들에 순서대로 적용할 장애를 예약할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        pages: Optional[Dict[str, bytes]] = None,
+        use_tls: bool = True,
+        chunked: bool = False,
+        send_validators: bool = False,
+        page_resolver: Optional[Callable[[str], Optional[bytes]]] = None,
+        latency_seconds: float = 0.0,
+        jitter_seconds: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ):
+        self.pages = pages if pages is not None else default_stand_in_pages()
+        self.page_resolver = page_resolver
+        self.chunked = chunked  # True면 Transfer-Encoding: chunked로 응답
+        self.send_validators = send_validators  # True면 ETag 전송, 조건부 GET에 304 응답
+        self.ssl_context: Optional[ssl.SSLContext] = None
+        if use_tls:
+            self.ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            self.ssl_context.load_cert_chain(STAND_IN_CERT_FILE, STAND_IN_KEY_FILE)
+        self.handshake_count = 0
+        self.request_count = 0
+        self.not_modified_count = 0
+        self.error_count = 0
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._faults: Dict[str, Deque[Tuple]] = defaultdict(deque)
+        self._counter_lock = threading.Lock()
+        self._http_server: Optional[_StandInHTTPServer] = None
+        self._serve_thread: Optional[threading.Thread] = None
+
+    def _increment(self, counter_name: str) -> None:
+        with self._counter_lock:
+            setattr(self, counter_name, getattr(self, counter_name) + 1)
+
+    def inject_faults(self, path: str, *faults: Tuple) -> None:
+        """
+        `path`로 오는 다음 요청들에 순서대로 적용할 장애를 예약합니다.
+
+        - ("delay", seconds): 응답 전에 추가로 기다림
+        - ("status", code): 본문 없이 해당 상태 코드로 응답
+        - ("drop",): 응답 없이 연결을 끊음
+        """
+        with self._counter_lock:
+            self._faults[path].extend(faults)
+
+    def _next_fault(self, path: str) -> Optional[Tuple]:
+        with self._counter_lock:
+            scheduled_faults = self._faults.get(path)
+            return scheduled_faults.popleft() if scheduled_faults else None
+
+    def _random_uniform(self, low: float, high: float) -> float:
+        with self._counter_lock:
+            return self._random.uniform(low, high)
+
+    def _random_fault(self) -> Optional[Tuple]:
+        if not self.error_rate:
+            return None
+        with self._counter_lock:
+            failed = self._random.random() < self.error_rate
+        return ("status", self.error_status) if failed else None
+
+    def resolve_page(self, path_and_query: str) -> Optional[bytes]:
+        if self.page_resolver is not None:
+            page = self.page_resolver(path_and_query)
+            if page is not None:
+                return page
+        return self.pages.get(urlsplit(path_and_query).path)
+
+    def reset_counters(self) -> None:
+        with self._counter_lock:
+            self.handshake_count = 0
+            self.request_count = 0
+            self.not_modified_count = 0
+            self.error_count = 0
+
+    @property
+    def base_url(self) -> str:
+        scheme = "https" if self.ssl_context is not None else "http"
+        host, port = self._http_server.server_address[:2]
+        return f"{scheme}://{host}:{port}"
+
+    def start(self) -> "NaverStandInServer":
+        self._http_server = _StandInHTTPServer(self)
+        self._serve_thread = threading.Thread(
+            target=self._http_server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._serve_thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+    def __enter__(self) -> "NaverStandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class StandInAdapter(ConnectTimingHTTPAdapter):
+    """*.naver.com으로 향하는 요청을 로컬 스탠드인 서버로 보내는 어댑터"""
+
+    def __init__(self, stand_in: NaverStandInServer, **kwargs):
+        self.stand_in = stand_in
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        parsed_url = urlsplit(request.url)
+        path_and_query = parsed_url.path + (f"?{parsed_url.query}" if parsed_url.query else "")
+        request.url = self.stand_in.base_url + path_and_query
+        if self.stand_in.ssl_context is not None:
+            kwargs["verify"] = str(STAND_IN_CERT_FILE)
+        return super().send(request, **kwargs)
+
+
+def route_session_to_stand_in(
+    session: requests.Session, stand_in: NaverStandInServer, **adapter_kwargs
+) -> requests.Session:
+    """세션의 HTTPS 요청이 스탠드인 서버로 가도록 어댑터를 마운트합니다."""
+    session.mount("https://", StandInAdapter(stand_in, **adapter_kwargs))
+    return session
+
+
+def route_async_pool_to_stand_in(pool, stand_in: NaverStandInServer):
+    """AsyncConnectionPool이 호스트 이름 대신 스탠드인 주소로 연결하도록 바꿉니다."""
+    host, port = stand_in._http_server.server_address[:2]
+    ssl_context = None
+    if stand_in.ssl_context is not None:
+        ssl_context = ssl.create_default_context(cafile=str(STAND_IN_CERT_FILE))
+
+    async def open_stand_in_connection(requested_host, requested_port):
+        return await asyncio.open_connection(
+            host,
+            port,
+            ssl=ssl_context,
+            server_hostname=requested_host if ssl_context is not None else None,
+        )
+
+    pool._open_connection = open_stand_in_connection
+    return pool
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.async_http_client import AsyncConnectionPool, AsyncProxyNotSupportedError, uses_environment_proxy
+
+
+@pytest.fixture(autouse=True)
+def no_proxy_environment(monkeypatch):
+    for variable in ("HTTPS_PROXY", "https_proxy", "ALL_PROXY", "all_proxy", "NO_PROXY", "no_proxy"):
+        monkeypatch.delenv(variable, raising=False)
+
+
+def run_against_raw_server(response_bytes, pool_requests):
+    """요청 머리를 기록하고 정해진 응답을 돌려주는 평문 TCP 서버에 풀을 붙여 실행합니다."""
+    received_requests = []
+
+    async def handle_client(reader, writer):
+        # 연결을 닫는 쪽은 클라이언트 (keep-alive 여부를 클라이언트가 판단하는지 확인)
+        try:
+            while True:
+                request_head = await reader.readuntil(b"\r\n\r\n")
+                received_requests.append(request_head.decode("latin-1"))
+                writer.write(response_bytes)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        writer.close()
+
+    async def runner():
+        server = await asyncio.start_server(handle_client, "127.0.0.1", 0)
+        server_port = server.sockets[0].getsockname()[1]
+        pool = AsyncConnectionPool()
+
+        async def open_plain_connection(requested_host, requested_port):
+            return await asyncio.open_connection("127.0.0.1", server_port)
+
+        pool._open_connection = open_plain_connection
+        try:
+            return await pool_requests(pool)
+        finally:
+            await pool.aclose()
+            server.close()
+            await server.wait_closed()
+
+    return asyncio.run(runner()), received_requests
+
+
+async def read_fully(pool, url):
+    async with await pool.get(url) as response:
+        return b"".join([chunk async for chunk in response.iter_content()])
+
+
+def test_host_header_carries_non_default_port():
+    async def two_requests(pool):
+        await read_fully(pool, "https://example.test/a")
+        await read_fully(pool, "https://example.test:8443/b")
+
+    _, received_requests = run_against_raw_server(
+        b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok", two_requests
+    )
+    assert "Host: example.test\r\n" in received_requests[0]
+    assert "Host: example.test:8443\r\n" in received_requests[1]
+
+
+@pytest.mark.parametrize(
+    "status_line, connection_header, pooled",
+    [
+        (b"HTTP/1.1 200 OK", b"", True),
+        (b"HTTP/1.1 200 OK", b"Connection: close\r\n", False),
+        (b"HTTP/1.0 200 OK", b"", False),
+        (b"HTTP/1.0 200 OK", b"Connection: keep-alive\r\n", True),
+    ],
+)
+def test_connection_is_pooled_only_when_keep_alive(status_line, connection_header, pooled):
+    async def one_request(pool):
+        body = await read_fully(pool, "https://example.test/")
+        return body, sum(len(idle) for idle in pool._idle_connections.values())
+
+    (body, idle_count), _ = run_against_raw_server(
+        status_line + b"\r\n" + connection_header + b"Content-Length: 2\r\n\r\nok", one_request
+    )
+    assert body == b"ok"
+    assert idle_count == (1 if pooled else 0)
+
+
+def test_pool_refuses_to_bypass_a_configured_proxy(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    assert uses_environment_proxy("https://m.stock.naver.com/")
+
+    async def direct_request():
+        await AsyncConnectionPool().get("https://m.stock.naver.com/")
+
+    with pytest.raises(AsyncProxyNotSupportedError):
+        asyncio.run(direct_request())
+
+    monkeypatch.setenv("NO_PROXY", "naver.com")
+    assert not uses_environment_proxy("https://m.stock.naver.com/")
+
+
+def test_async_fetch_uses_the_requests_path_behind_a_proxy(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    sync_calls = []
+
+    def fake_sync_request(target_url, error_message, price_pattern, deadline, quote_cache, phase_timer):
+        sync_calls.append(target_url)
+        return 1234.5
+
+    async def fail_async_request(*args, **kwargs):
+        raise AssertionError("asyncio 클라이언트로 직접 연결하면 안 됨")
+
+    monkeypatch.setattr(price_fetcher, "request_price_from_naver_finance", fake_sync_request)
+    monkeypatch.setattr(price_fetcher, "request_price_from_naver_finance_async", fail_async_request)
+
+    price = asyncio.run(
+        price_fetcher.fetch_price_from_naver_finance_once_async("https://m.stock.naver.com/x", "error")
+    )
+    assert price == 1234.5
+    assert sync_calls == ["https://m.stock.naver.com/x"]
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.async_http_client import get_shared_async_connection_pool
+from naver_stand_in import (
+    NaverStandInServer,
+    default_stand_in_pages,
+    route_async_pool_to_stand_in,
+)
+
+
+def run_with_stand_in(stand_in, coroutine_function):
+    async def runner():
+        pool = route_async_pool_to_stand_in(get_shared_async_connection_pool(), stand_in)
+        try:
+            return await coroutine_function()
+        finally:
+            await pool.aclose()
+
+    return asyncio.run(runner())
+
+
+def test_async_snapshot_reuses_connections_on_one_loop():
+    async def five_snapshots():
+        return [
+            await price_fetcher.fetch_current_gold_market_data_async() for _ in range(5)
+        ]
+
+    with NaverStandInServer() as stand_in:
+        snapshots = run_with_stand_in(stand_in, five_snapshots)
+
+    assert snapshots[-1].domestic_price == 152340.00
+    assert snapshots[-1].international_price == 3345.20
+    assert snapshots[-1].usd_krw_rate == 1399.50
+    assert stand_in.request_count == 15
+    assert stand_in.handshake_count <= 3
+
+
+def test_async_concurrent_snapshots_with_chunked_responses():
+    async def concurrent_snapshots():
+        # single-flight를 거치지 않는 수집 함수로 동시 스트리밍 읽기를 검증
+        return await asyncio.gather(
+            *(price_fetcher.collect_gold_market_data_snapshot_async() for _ in range(10))
+        )
+
+    with NaverStandInServer(pages=default_stand_in_pages(padding_bytes=50_000), chunked=True) as stand_in:
+        snapshots = run_with_stand_in(stand_in, concurrent_snapshots)
+
+    assert len(snapshots) == 10
+    assert all(snapshot.usd_krw_rate == 1399.50 for snapshot in snapshots)
+    assert stand_in.request_count == 30
+
+
+def test_async_extract_shares_url_validation():
+    with pytest.raises(ValueError) as excinfo:
+        asyncio.run(
+            price_fetcher.extract_price_from_naver_finance_async(
+                "https://example.com", "테스트 에러 메시지"
+            )
+        )
+    assert "Invalid domain" in str(excinfo.value)
+
+
+def test_async_extract_enforces_size_limit(monkeypatch):
+    monkeypatch.setattr(price_fetcher, "MAX_RESPONSE_SIZE_BYTES", 1024)
+    pages = default_stand_in_pages(padding_bytes=10_000)
+
+    with NaverStandInServer(pages=pages, chunked=True) as stand_in:
+        with pytest.raises(ValueError) as excinfo:
+            run_with_stand_in(
+                stand_in,
+                lambda: price_fetcher.extract_price_from_naver_finance_async(
+                    price_fetcher.NAVER_USD_KRW_EXCHANGE_URL, "환율 정보를 찾을 수 없습니다."
+                ),
+            )
+    assert "Response size exceeds the maximum limit" in str(excinfo.value)
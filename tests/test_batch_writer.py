@@ -0,0 +1,83 @@
+import os
+import shutil
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from kimchi_gold.data_collector import save_gold_price_data_batch_to_csv
+from kimchi_gold.history_backfill import merge_rows_into_csv
+from kimchi_gold.price_fetcher import build_gold_price_data
+
+@pytest.fixture(autouse=True)
+def allow_tmp_paths():
+    with patch("kimchi_gold.data_collector.validate_safe_path", side_effect=lambda path: path), patch(
+        "kimchi_gold.history_backfill.validate_safe_path", side_effect=lambda path: path
+    ):
+        yield
+
+
+def generate_daily_data(first_day, day_count, fail_after=None):
+    for day_number in range(day_count):
+        if day_number == fail_after:
+            raise RuntimeError("source failed")
+        gold_price_data = build_gold_price_data(150000.0 + day_number, 3345.0, 1399.0)
+        gold_price_data.data_collection_timestamp = first_day + timedelta(days=day_number)
+        yield gold_price_data
+
+
+def test_batch_writes_header_once_and_streams_a_generator(tmp_path, price_log_header):
+    csv_path = tmp_path / "log.csv"
+
+    assert save_gold_price_data_batch_to_csv(generate_daily_data(datetime(2026, 3, 2), 3), csv_path, flush_every_rows=2) == 3
+    assert save_gold_price_data_batch_to_csv(generate_daily_data(datetime(2026, 3, 5), 2), csv_path) == 2
+
+    lines = csv_path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == price_log_header
+    assert [line[:10] for line in lines[1:]] == ["2026-03-02", "2026-03-03", "2026-03-04", "2026-03-05", "2026-03-06"]
+    assert not list(tmp_path.glob("*.staging"))
+
+
+def test_failing_source_leaves_log_untouched(tmp_path, price_log_header):
+    csv_path = tmp_path / "log.csv"
+    csv_path.write_text(f"{price_log_header}\n2026-03-01,1,1,1,1,1", encoding="utf-8")
+    original_bytes = csv_path.read_bytes()
+
+    with pytest.raises(IOError):
+        save_gold_price_data_batch_to_csv(generate_daily_data(datetime(2026, 3, 2), 5, fail_after=3), csv_path)
+    assert csv_path.read_bytes() == original_bytes
+
+    # 개행 없이 끝난 로그에도 행이 이어 붙지 않는다
+    save_gold_price_data_batch_to_csv(generate_daily_data(datetime(2026, 3, 2), 1), csv_path)
+    assert csv_path.read_text(encoding="utf-8").splitlines()[2].startswith("2026-03-02,150000.00")
+    assert not list(tmp_path.glob("*.staging"))
+
+
+def test_interrupted_append_is_rolled_back(tmp_path, price_log_header):
+    csv_path = tmp_path / "log.csv"
+    csv_path.write_text(f"{price_log_header}\n2026-03-01,1,1,1,1,1\n", encoding="utf-8")
+    original_bytes = csv_path.read_bytes()
+
+    def copy_half_then_fail(source_file, destination_file, buffer_size):
+        destination_file.write(source_file.read()[:40])
+        destination_file.flush()
+        raise OSError("disk full")
+
+    with patch.object(shutil, "copyfileobj", copy_half_then_fail), pytest.raises(IOError):
+        save_gold_price_data_batch_to_csv(generate_daily_data(datetime(2026, 3, 2), 10), csv_path)
+
+    assert csv_path.read_bytes() == original_bytes
+
+
+def test_backfill_after_last_logged_date_appends_in_place(tmp_path, price_log_header):
+    csv_path = tmp_path / "log.csv"
+    csv_path.write_text(f"{price_log_header}\n2026-03-02,1,1,1,1,1\n2026-03-03,2,2,2,2,2\n", encoding="utf-8")
+    inode_before = os.stat(csv_path).st_ino
+
+    assert merge_rows_into_csv(csv_path, [["2026-03-05", "5", "5", "5", "5", "5"], ["2026-03-04", "4", "4", "4", "4", "4"]]) == 2
+    assert os.stat(csv_path).st_ino == inode_before
+    assert merge_rows_into_csv(csv_path, [["2026-03-01", "0", "0", "0", "0", "0"]]) == 1
+
+    assert [line[:10] for line in csv_path.read_text(encoding="utf-8").splitlines()[1:]] == [
+        "2026-03-01", "2026-03-02", "2026-03-03", "2026-03-04", "2026-03-05"
+    ]
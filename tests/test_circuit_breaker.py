@@ -0,0 +1,123 @@
+import time
+
+import pytest
+import requests
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.circuit_breaker import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+)
+from kimchi_gold.configuration import NAVER_DOMESTIC_GOLD_URL
+from kimchi_gold.fetch_deadline import MarketDataCollectionError
+from kimchi_gold.http_session import close_shared_http_session, get_shared_http_session
+from kimchi_gold.request_resilience import RetryPolicy
+from naver_stand_in import NaverStandInServer, route_session_to_stand_in
+
+DOMESTIC_GOLD_PATH = "/marketindex/metals/M04020000"
+NO_RETRY_POLICY = RetryPolicy(max_retries=0)
+
+
+@pytest.fixture
+def stand_in():
+    close_shared_http_session()
+    with NaverStandInServer() as server:
+        route_session_to_stand_in(get_shared_http_session(), server)
+        yield server
+    close_shared_http_session()
+
+
+def open_circuit(target_url):
+    circuit_breaker = get_circuit_breaker(target_url)
+    for _ in range(circuit_breaker.failure_threshold):
+        circuit_breaker.record_failure(requests.ConnectionError("connection refused"))
+    return circuit_breaker
+
+
+def test_breaker_state_transitions():
+    circuit_breaker = CircuitBreaker("https://m.stock.naver.com/x", failure_threshold=2, recovery_seconds=0.05)
+    circuit_breaker.before_call()
+    circuit_breaker.record_failure(ValueError("가격 정보 없음"))
+    assert circuit_breaker.state == CIRCUIT_CLOSED
+
+    circuit_breaker.before_call()
+    circuit_breaker.record_failure(ValueError("가격 정보 없음"))
+    assert circuit_breaker.state == CIRCUIT_OPEN
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_call()
+
+    time.sleep(0.06)
+    # 시험 요청은 하나만 허용
+    circuit_breaker.before_call()
+    assert circuit_breaker.state == CIRCUIT_HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_call()
+
+    # 시험 요청 실패 시 다시 열림
+    circuit_breaker.record_failure(ValueError("가격 정보 없음"))
+    assert circuit_breaker.state == CIRCUIT_OPEN
+
+    time.sleep(0.06)
+    circuit_breaker.before_call()
+    circuit_breaker.record_success(100.0)
+    status = circuit_breaker.status()
+    assert status.state == CIRCUIT_CLOSED
+    assert status.consecutive_failures == 0
+    assert status.last_good_value == 100.0
+
+
+def test_cancelled_trial_frees_half_open_slot():
+    circuit_breaker = CircuitBreaker("https://m.stock.naver.com/x", failure_threshold=1, recovery_seconds=0)
+    circuit_breaker.record_failure(ValueError("가격 정보 없음"))
+    circuit_breaker.before_call()
+    circuit_breaker.record_cancelled()
+    circuit_breaker.before_call()
+    assert circuit_breaker.state == CIRCUIT_HALF_OPEN
+
+
+def test_open_circuit_fails_without_request(stand_in):
+    stand_in.inject_faults(DOMESTIC_GOLD_PATH, *[("status", 503)] * 3)
+    for _ in range(3):
+        with pytest.raises(requests.HTTPError):
+            price_fetcher.extract_price_from_naver_finance(
+                NAVER_DOMESTIC_GOLD_URL, "에러", retry_policy=NO_RETRY_POLICY
+            )
+
+    with pytest.raises(CircuitOpenError):
+        price_fetcher.extract_price_from_naver_finance(NAVER_DOMESTIC_GOLD_URL, "에러")
+    assert stand_in.request_count == 3
+
+    feed_states = price_fetcher.get_market_data_feed_states()
+    assert feed_states["domestic_gold"].state == CIRCUIT_OPEN
+    assert "HTTPError" in feed_states["domestic_gold"].last_failure_message
+    assert feed_states["usd_krw"].state == CIRCUIT_CLOSED
+
+
+def test_snapshot_fails_fast_on_open_circuit(stand_in):
+    open_circuit(NAVER_DOMESTIC_GOLD_URL)
+
+    with pytest.raises(MarketDataCollectionError) as excinfo:
+        price_fetcher.fetch_current_gold_market_data()
+
+    assert stand_in.request_count == 0
+    [failure] = excinfo.value.failures
+    assert failure.source_name == "domestic_gold"
+    assert failure.circuit_open
+
+
+def test_snapshot_serves_stale_value_while_open(stand_in):
+    first_snapshot = price_fetcher.fetch_current_gold_market_data()
+    assert not first_snapshot.is_stale
+
+    open_circuit(NAVER_DOMESTIC_GOLD_URL)
+    stand_in.reset_counters()
+    stale_snapshot = price_fetcher.fetch_current_gold_market_data(serve_stale=True)
+
+    assert stale_snapshot.is_stale
+    assert stale_snapshot.stale_sources == ["domestic_gold"]
+    assert stale_snapshot.domestic_price == first_snapshot.domestic_price
+    assert stand_in.request_count == 2
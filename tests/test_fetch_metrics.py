@@ -0,0 +1,206 @@
+import asyncio
+import json
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.async_http_client import get_shared_async_connection_pool
+from kimchi_gold.configuration import NAVER_DOMESTIC_GOLD_URL
+from kimchi_gold.fetch_metrics import (
+    FetchMetricsSink,
+    FetchPhaseSample,
+    InMemoryHistogramSink,
+    JsonLinesMetricsSink,
+    PrometheusTextFileSink,
+    add_fetch_metrics_sink,
+    remove_fetch_metrics_sink,
+)
+from kimchi_gold.http_session import close_shared_http_session, get_shared_http_session
+from naver_stand_in import (
+    NaverStandInServer,
+    route_async_pool_to_stand_in,
+    route_session_to_stand_in,
+)
+
+DOMESTIC_GOLD_PATH = "/marketindex/metals/M04020000"
+
+
+class CapturingSink:
+    def __init__(self):
+        self.samples = []
+
+    def record(self, sample):
+        self.samples.append(sample)
+
+
+class BrokenSink:
+    def record(self, sample):
+        raise RuntimeError("sink down")
+
+
+@pytest.fixture
+def captured_samples():
+    sink = CapturingSink()
+    add_fetch_metrics_sink(sink)
+    yield sink.samples
+    remove_fetch_metrics_sink(sink)
+
+
+@pytest.fixture
+def stand_in():
+    close_shared_http_session()
+    with NaverStandInServer() as server:
+        route_session_to_stand_in(get_shared_http_session(), server)
+        yield server
+    close_shared_http_session()
+
+
+def extract_domestic_gold_price():
+    return price_fetcher.extract_price_from_naver_finance(
+        NAVER_DOMESTIC_GOLD_URL, "국내 금 가격 정보를 찾을 수 없습니다."
+    )
+
+
+def make_sample(source_name="domestic_gold", outcome="ok", total_seconds=0.2, **kwargs):
+    return FetchPhaseSample(
+        source_name=source_name,
+        target_url=NAVER_DOMESTIC_GOLD_URL,
+        outcome=outcome,
+        total_seconds=total_seconds,
+        **kwargs,
+    )
+
+
+def test_fetch_records_phase_timings(stand_in, captured_samples):
+    stand_in.latency_seconds = 0.05
+
+    extract_domestic_gold_price()
+    extract_domestic_gold_price()
+
+    first_sample, second_sample = captured_samples
+    assert first_sample.source_name == "domestic_gold"
+    assert first_sample.outcome == "ok"
+    assert first_sample.connect_seconds > 0
+    assert first_sample.ttfb_seconds >= first_sample.connect_seconds + 0.05
+    assert first_sample.bytes_read > 0
+    assert first_sample.download_seconds >= 0
+    assert first_sample.parse_seconds > 0
+    assert first_sample.total_seconds >= first_sample.ttfb_seconds
+    # 두 번째 요청은 keep-alive 연결을 재사용
+    assert second_sample.connect_seconds == 0.0
+
+
+@pytest.mark.parametrize(
+    "page, fault, expected_outcome",
+    [
+        (None, ("status", 404), "http_error"),
+        (None, ("drop",), "connection_error"),
+        (b"<html><body>no price</body></html>", None, "parse_error"),
+    ],
+)
+def test_fetch_records_failure_outcome(stand_in, captured_samples, page, fault, expected_outcome):
+    if page is not None:
+        stand_in.pages[DOMESTIC_GOLD_PATH] = page
+    if fault is not None:
+        stand_in.inject_faults(DOMESTIC_GOLD_PATH, *[fault] * 3)
+
+    with pytest.raises(Exception):
+        price_fetcher.fetch_price_from_naver_finance_once(NAVER_DOMESTIC_GOLD_URL, "에러")
+
+    assert [sample.outcome for sample in captured_samples] == [expected_outcome]
+    assert captured_samples[0].error_type is not None
+
+
+def test_broken_sink_does_not_break_fetch(stand_in):
+    broken_sink = BrokenSink()
+    add_fetch_metrics_sink(broken_sink)
+    try:
+        assert extract_domestic_gold_price() == 152340.00
+    finally:
+        remove_fetch_metrics_sink(broken_sink)
+
+
+def test_sink_without_record_fails_at_construction():
+    class IncompleteSink(FetchMetricsSink):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteSink()
+
+
+def test_async_fetch_records_phase_timings(captured_samples):
+    async def fetch_twice(stand_in):
+        pool = route_async_pool_to_stand_in(get_shared_async_connection_pool(), stand_in)
+        try:
+            for _ in range(2):
+                await price_fetcher.extract_price_from_naver_finance_async(
+                    NAVER_DOMESTIC_GOLD_URL, "에러"
+                )
+        finally:
+            await pool.aclose()
+
+    with NaverStandInServer() as stand_in:
+        asyncio.run(fetch_twice(stand_in))
+
+    first_sample, second_sample = captured_samples
+    assert first_sample.outcome == "ok"
+    assert first_sample.connect_seconds > 0
+    assert first_sample.bytes_read > 0
+    assert second_sample.connect_seconds == 0.0
+
+
+def test_histogram_renders_prometheus_text():
+    histogram = InMemoryHistogramSink(buckets=(0.1, 1.0))
+    histogram.record(make_sample(ttfb_seconds=0.05, bytes_read=100))
+    histogram.record(make_sample(ttfb_seconds=0.5, bytes_read=100))
+    histogram.record(make_sample(outcome="timeout", total_seconds=3.0))
+
+    text = histogram.render_prometheus_text()
+
+    assert 'kimchi_gold_fetch_phase_seconds_bucket{source="domestic_gold",phase="ttfb",le="0.1"} 1' in text
+    assert 'kimchi_gold_fetch_phase_seconds_bucket{source="domestic_gold",phase="ttfb",le="1.0"} 2' in text
+    assert 'kimchi_gold_fetch_phase_seconds_bucket{source="domestic_gold",phase="total",le="+Inf"} 3' in text
+    assert 'kimchi_gold_fetch_phase_seconds_count{source="domestic_gold",phase="total"} 3' in text
+    assert 'kimchi_gold_fetch_requests_total{source="domestic_gold",outcome="timeout"} 1' in text
+    assert 'kimchi_gold_fetch_response_bytes_total{source="domestic_gold"} 200' in text
+    assert histogram.quantile("domestic_gold", "ttfb", 0.5) == 0.1
+    assert histogram.quantile("domestic_gold", "total", 0.99) == float("inf")
+
+
+def test_file_sinks_write_samples(tmp_path):
+    jsonl_sink = JsonLinesMetricsSink(tmp_path / "metrics" / "fetch.jsonl")
+    prometheus_sink = PrometheusTextFileSink(tmp_path / "textfile" / "kimchi_gold.prom")
+
+    for sink in (jsonl_sink, prometheus_sink):
+        sink.record(make_sample(ttfb_seconds=0.05))
+        sink.record(make_sample(source_name="usd_krw", outcome="parse_error"))
+
+    lines = (tmp_path / "metrics" / "fetch.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["source_name"] for line in lines] == ["domestic_gold", "usd_krw"]
+    prometheus_text = (tmp_path / "textfile" / "kimchi_gold.prom").read_text(encoding="utf-8")
+    assert 'outcome="parse_error"} 1' in prometheus_text
+    assert sorted(path.name for path in (tmp_path / "textfile").iterdir()) == ["kimchi_gold.prom"]
+
+
+def test_prometheus_text_file_is_readable_by_other_users_and_not_left_half_written(tmp_path):
+    prom_path = tmp_path / "kimchi_gold.prom"
+    prometheus_sink = PrometheusTextFileSink(prom_path)
+    previous_umask = os.umask(0o022)
+    try:
+        prometheus_sink.record(make_sample())
+    finally:
+        os.umask(previous_umask)
+    # node_exporter는 보통 다른 사용자로 돌므로 mkstemp의 0600이 아니라 일반 파일 권한이어야 함
+    assert stat.S_IMODE(prom_path.stat().st_mode) == 0o644
+
+    os.chmod(prom_path, 0o640)
+    prometheus_sink.record(make_sample())
+    assert stat.S_IMODE(prom_path.stat().st_mode) == 0o640
+
+    with patch.object(prometheus_sink.histogram, "render_prometheus_text", side_effect=RuntimeError("render failed")):
+        with pytest.raises(RuntimeError):
+            prometheus_sink.record(make_sample())
+    assert [path.name for path in tmp_path.iterdir()] == ["kimchi_gold.prom"]
@@ -0,0 +1,71 @@
+import pytest
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.http_session import close_shared_http_session, get_shared_http_session
+from fetcher_load import format_load_report, run_load_level, run_load_test
+from naver_stand_in import NaverStandInServer, default_stand_in_pages, route_session_to_stand_in
+
+
+@pytest.fixture
+def make_stand_in():
+    servers = []
+
+    def start(**server_options):
+        close_shared_http_session()
+        server = NaverStandInServer(**server_options).start()
+        servers.append(server)
+        route_session_to_stand_in(get_shared_http_session(), server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+    close_shared_http_session()
+
+
+def test_load_levels_report_throughput_and_percentiles(make_stand_in):
+    stand_in = make_stand_in(
+        pages=default_stand_in_pages(padding_bytes=20_000), latency_seconds=0.02, jitter_seconds=0.02, seed=1
+    )
+
+    results = run_load_test(stand_in, (1, 4), calls_per_worker=3)
+
+    assert [result.concurrency for result in results] == [1, 4]
+    for result in results:
+        assert result.success_count == result.call_count
+        assert result.throughput > 0
+        # 세 요청은 동시에 나가므로 호출 하나는 지연 + 지터 범위 안에 끝난다
+        assert 0.02 <= result.latency_percentile(50) <= result.latency_percentile(99)
+    # 동시 호출은 single-flight로 합쳐져 서버 요청 수가 호출 수 x 3보다 적다
+    assert results[1].upstream_request_count < results[1].call_count * 3
+    assert "calls/s" in format_load_report(results)
+
+
+def test_error_rate_surfaces_as_classified_failures(make_stand_in):
+    stand_in = make_stand_in(error_rate=0.5, seed=7)
+
+    result = run_load_level(
+        stand_in,
+        concurrency=2,
+        calls_per_worker=4,
+        snapshot_fetcher=price_fetcher.collect_gold_market_data_snapshot,
+    )
+
+    assert stand_in.error_count > 0
+    assert result.failure_count > 0
+    assert set(result.failure_counts) <= {"http_error", "circuit_open"}
+    assert result.success_count + result.failure_count == result.call_count
+
+
+def test_slow_upstream_is_cut_off_at_snapshot_deadline(make_stand_in):
+    stand_in = make_stand_in(latency_seconds=0.5)
+
+    result = run_load_level(
+        stand_in,
+        concurrency=2,
+        calls_per_worker=1,
+        snapshot_fetcher=lambda: price_fetcher.collect_gold_market_data_snapshot(deadline_seconds=0.1),
+    )
+
+    assert result.failure_counts == {"timeout": 2}
+    assert result.latency_percentile(100) < 0.4
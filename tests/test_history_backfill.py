@@ -0,0 +1,207 @@
+import csv
+import os
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from kimchi_gold.configuration import CSV_COLUMN_HEADERS
+from kimchi_gold.history_backfill import backfill_missing_dates, parse_history_page
+from kimchi_gold.http_session import close_shared_http_session, get_shared_http_session
+from kimchi_gold.price_fetcher import build_gold_price_data
+from kimchi_gold.rate_limiter import TokenBucketRateLimiter
+from naver_stand_in import (
+    DailyQuotePages,
+    NaverStandInServer,
+    render_daily_quote_page,
+    route_session_to_stand_in,
+)
+
+DOMESTIC_HISTORY_PATH = "/marketindex/goldDailyQuote.naver"
+INTERNATIONAL_HISTORY_PATH = "/marketindex/worldDailyQuote.naver"
+USD_KRW_HISTORY_PATH = "/marketindex/exchangeDailyQuote.naver"
+
+HISTORY_START = date(2026, 1, 5)
+HISTORY_END = date(2026, 3, 31)
+
+
+def weekdays(start_date, end_date):
+    current_date = start_date
+    while current_date <= end_date:
+        if current_date.weekday() < 5:
+            yield current_date
+        current_date += timedelta(days=1)
+
+
+def recorded_history_quotes():
+    """약 3개월치 일별 시세 (평일만, 국제 금은 미국 휴장일 하루 빠짐)"""
+    trading_days = list(weekdays(HISTORY_START - timedelta(days=14), HISTORY_END))
+    return {
+        DOMESTIC_HISTORY_PATH: {
+            trading_day: f"{150000 + index * 100:,.2f}" for index, trading_day in enumerate(trading_days)
+        },
+        INTERNATIONAL_HISTORY_PATH: {
+            trading_day: f"{3300 + index:,.2f}"
+            for index, trading_day in enumerate(trading_days)
+            if trading_day != date(2026, 1, 19)
+        },
+        USD_KRW_HISTORY_PATH: {
+            trading_day: f"{1390 + index * 0.5:,.2f}" for index, trading_day in enumerate(trading_days)
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def allow_tmp_paths():
+    with patch("kimchi_gold.history_backfill.validate_safe_path", side_effect=lambda path: path):
+        yield
+
+
+@pytest.fixture
+def history_stand_in():
+    close_shared_http_session()
+    history_pages = DailyQuotePages(recorded_history_quotes(), rows_per_page=10)
+    with NaverStandInServer(pages={}, page_resolver=history_pages) as server:
+        server.history_pages = history_pages
+        route_session_to_stand_in(get_shared_http_session(), server)
+        yield server
+    close_shared_http_session()
+
+
+def write_log(csv_file, logged_dates):
+    with open(csv_file, "w", encoding="utf-8", newline="") as csv_writer_file:
+        csv_writer = csv.writer(csv_writer_file)
+        csv_writer.writerow(CSV_COLUMN_HEADERS)
+        for logged_date in logged_dates:
+            # 초기 로그처럼 소수점 없이 기록된 행도 그대로 유지되어야 한다
+            csv_writer.writerow([logged_date.isoformat(), "86400", "2024.5", "1323.88", "230", "0.27"])
+
+
+def read_log(csv_file):
+    with open(csv_file, encoding="utf-8") as csv_reader_file:
+        return list(csv.reader(csv_reader_file))
+
+
+def test_parse_history_page_reads_rows_newest_first():
+    page = render_daily_quote_page(
+        [(date(2026, 3, 31), "152,340.00"), (date(2026, 3, 30), "151,980.50")]
+    )
+    assert parse_history_page(page, "domestic_gold") == [
+        (date(2026, 3, 31), 152340.0),
+        (date(2026, 3, 30), 151980.5),
+    ]
+    assert parse_history_page(render_daily_quote_page([]), "domestic_gold") == []
+
+
+def test_backfill_fills_gaps_and_keeps_existing_rows(tmp_path, history_stand_in):
+    csv_file = tmp_path / "log.csv"
+    all_trading_days = list(weekdays(HISTORY_START, HISTORY_END))
+    missing_days = {date(2026, 1, 19), date(2026, 2, 10), date(2026, 2, 11), date(2026, 3, 31)}
+    write_log(csv_file, [day for day in all_trading_days if day not in missing_days])
+    original_rows = read_log(csv_file)
+
+    backfill_result = backfill_missing_dates(
+        HISTORY_START, HISTORY_END, csv_file, requests_per_second=100.0
+    )
+
+    assert backfill_result.filled_dates == sorted(missing_days)
+    assert backfill_result.unmatched_dates == []
+    rows = read_log(csv_file)
+    assert [row[0] for row in rows[1:]] == [day.isoformat() for day in all_trading_days]
+    # 기존 행은 형식까지 그대로
+    assert [row for row in rows if row[0] not in {day.isoformat() for day in missing_days}] == original_rows
+
+    # 국제 금 휴장일은 직전 거래일 값으로 채운다
+    quotes = recorded_history_quotes()
+    expected_row = build_gold_price_data(
+        float(quotes[DOMESTIC_HISTORY_PATH][date(2026, 1, 19)].replace(",", "")),
+        float(quotes[INTERNATIONAL_HISTORY_PATH][date(2026, 1, 16)].replace(",", "")),
+        float(quotes[USD_KRW_HISTORY_PATH][date(2026, 1, 19)].replace(",", "")),
+    ).convert_to_csv_row_format()
+    assert next(row for row in rows if row[0] == "2026-01-19")[1:] == expected_row[1:]
+
+
+def test_backfill_is_idempotent(tmp_path, history_stand_in):
+    csv_file = tmp_path / "log.csv"
+    write_log(csv_file, [date(2026, 2, 2), date(2026, 2, 4)])
+
+    first_result = backfill_missing_dates(
+        date(2026, 2, 1), date(2026, 2, 6), csv_file, requests_per_second=100.0
+    )
+    after_first_run = csv_file.read_bytes()
+    second_result = backfill_missing_dates(
+        date(2026, 2, 1), date(2026, 2, 6), csv_file, requests_per_second=100.0
+    )
+
+    assert first_result.filled_dates == [date(2026, 2, 3), date(2026, 2, 5), date(2026, 2, 6)]
+    assert second_result.filled_dates == []
+    assert csv_file.read_bytes() == after_first_run
+
+
+def test_backfill_dry_run_does_not_touch_log(tmp_path, history_stand_in):
+    csv_file = tmp_path / "log.csv"
+    write_log(csv_file, [date(2026, 3, 30)])
+    before = csv_file.read_bytes()
+
+    backfill_result = backfill_missing_dates(
+        date(2026, 3, 30), date(2026, 3, 31), csv_file, dry_run=True
+    )
+
+    assert backfill_result.filled_dates == [date(2026, 3, 31)]
+    assert csv_file.read_bytes() == before
+
+
+def test_backfill_fetches_pages_concurrently(tmp_path, history_stand_in):
+    history_stand_in.latency_seconds = 0.1
+    csv_file = tmp_path / "log.csv"
+
+    started = time.perf_counter()
+    backfill_result = backfill_missing_dates(
+        HISTORY_START, HISTORY_END, csv_file, max_concurrency=8, requests_per_second=200.0
+    )
+    elapsed_seconds = time.perf_counter() - started
+
+    serial_seconds = backfill_result.page_count * history_stand_in.latency_seconds
+    assert backfill_result.page_count >= 21
+    assert elapsed_seconds < serial_seconds / 2
+    assert len(backfill_result.filled_dates) == len(list(weekdays(HISTORY_START, HISTORY_END)))
+
+
+def test_backfill_respects_request_rate(tmp_path, history_stand_in):
+    csv_file = tmp_path / "log.csv"
+
+    started = time.perf_counter()
+    backfill_result = backfill_missing_dates(
+        date(2026, 3, 2), HISTORY_END, csv_file, max_concurrency=4, requests_per_second=20.0
+    )
+    elapsed_seconds = time.perf_counter() - started
+
+    # 버스트(동시 요청 수)만큼은 바로 나가고 나머지는 초당 20개로 제한된다
+    assert elapsed_seconds >= (backfill_result.page_count - 4) / 20.0
+    assert len(history_stand_in.history_pages.requested_pages) == backfill_result.page_count
+
+
+def test_token_bucket_spaces_requests_after_burst():
+    rate_limiter = TokenBucketRateLimiter(50.0, burst=2)
+    started = time.perf_counter()
+    waits = [rate_limiter.acquire() for _ in range(6)]
+    elapsed_seconds = time.perf_counter() - started
+
+    assert waits[:2] == [0.0, 0.0]
+    assert elapsed_seconds >= 4 / 50.0 * 0.9
+
+
+def test_backfill_rewrite_keeps_the_log_file_mode(tmp_path, history_stand_in):
+    csv_file = tmp_path / "log.csv"
+    # 빈 날짜가 로그 중간에 있어 끝에 덧붙이지 못하고 파일 전체를 다시 쓴다
+    write_log(csv_file, [date(2026, 2, 2), date(2026, 2, 4)])
+    os.chmod(csv_file, 0o644)
+
+    backfill_result = backfill_missing_dates(
+        date(2026, 2, 2), date(2026, 2, 4), csv_file, requests_per_second=100.0
+    )
+
+    assert backfill_result.filled_dates == [date(2026, 2, 3)]
+    assert [row[0] for row in read_log(csv_file)[1:]] == ["2026-02-02", "2026-02-03", "2026-02-04"]
+    assert oct(csv_file.stat().st_mode & 0o777) == oct(0o644)
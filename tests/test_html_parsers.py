@@ -0,0 +1,40 @@
+import pytest
+
+from kimchi_gold import html_parsers, price_fetcher
+from naver_stand_in import load_naver_fixture_pages
+
+EXPECTED_PRICES = {
+    "/marketindex/metals/M04020000": 152340.00,
+    "/marketindex/metals/GCcv1": 3345.20,
+    "/marketindex/exchange/FX_USDKRW": 1399.50,
+}
+
+
+@pytest.mark.parametrize("backend", html_parsers.available_html_parser_backends())
+def test_backends_agree_on_naver_fixtures(backend):
+    for path, page in load_naver_fixture_pages().items():
+        price = price_fetcher.parse_price_from_html(
+            page, "https://m.stock.naver.com" + path, "테스트 에러 메시지", parser_backend=backend
+        )
+        assert price == EXPECTED_PRICES[path]
+
+
+@pytest.mark.parametrize("backend", html_parsers.available_html_parser_backends())
+def test_backends_return_none_without_price_tag(backend):
+    assert html_parsers.extract_price_text(b"<html><body></body></html>", backend) is None
+    assert html_parsers.extract_price_text(b"", backend) is None
+
+
+def test_auto_prefers_lxml_when_installed(monkeypatch):
+    monkeypatch.setattr(html_parsers, "is_lxml_available", lambda: True)
+    assert html_parsers.resolve_html_parser_backend("auto") == "lxml"
+    monkeypatch.setattr(html_parsers, "is_lxml_available", lambda: False)
+    assert html_parsers.resolve_html_parser_backend("auto") == "html.parser"
+    # lxml을 명시했지만 설치되어 있지 않으면 html.parser로 대체
+    assert html_parsers.resolve_html_parser_backend("lxml") == "html.parser"
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError) as excinfo:
+        html_parsers.resolve_html_parser_backend("html5lib")
+    assert "Unknown HTML parser backend" in str(excinfo.value)
@@ -0,0 +1,47 @@
+import threading
+
+import pytest
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.http_session import (
+    close_shared_http_session,
+    get_shared_http_session,
+)
+from naver_stand_in import NaverStandInServer, route_session_to_stand_in
+
+
+@pytest.fixture
+def stand_in():
+    close_shared_http_session()
+    with NaverStandInServer() as server:
+        route_session_to_stand_in(get_shared_http_session(), server)
+        yield server
+    close_shared_http_session()
+
+
+def test_shared_session_is_reused_across_calls_and_threads():
+    close_shared_http_session()
+    sessions = []
+    threads = [
+        threading.Thread(target=lambda: sessions.append(get_shared_http_session()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(session) for session in sessions}) == 1
+    assert get_shared_http_session() is sessions[0]
+    close_shared_http_session()
+
+
+def test_consecutive_snapshots_reuse_pooled_connections(stand_in):
+    for _ in range(5):
+        gold_market_data = price_fetcher.fetch_current_gold_market_data()
+
+    assert gold_market_data.domestic_price == 152340.00
+    assert gold_market_data.usd_krw_rate == 1399.50
+    assert stand_in.request_count == 15
+    # 동시에 열린 세 연결 이후로는 새 핸드셰이크가 없어야 한다
+    assert stand_in.handshake_count <= 3
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.async_http_client import get_shared_async_connection_pool
+from kimchi_gold.fetch_deadline import MarketDataCollectionError
+from kimchi_gold.http_session import close_shared_http_session, get_shared_http_session
+from kimchi_gold.instruments import resolve_instruments
+from naver_stand_in import (
+    NaverStandInServer,
+    render_market_index_page,
+    route_async_pool_to_stand_in,
+    route_session_to_stand_in,
+)
+
+INSTRUMENT_QUOTE_TEXTS = {
+    "/marketindex/metals/M04020000": "152,340.00",
+    "/marketindex/metals/GCcv1": "3,345.20",
+    "/marketindex/metals/SIcv1": "38.50",
+    "/marketindex/metals/PLcv1": "1,402.10",
+    "/marketindex/exchange/FX_USDKRW": "1,399.50",
+    "/marketindex/exchange/FX_JPYKRW": "935.20",
+    "/marketindex/exchange/FX_CNYKRW": "193.40",
+    "/marketindex/exchange/FX_EURKRW": "1,620.30",
+}
+
+
+def instrument_pages():
+    return {
+        path: render_market_index_page(price_text)
+        for path, price_text in INSTRUMENT_QUOTE_TEXTS.items()
+    }
+
+
+@pytest.fixture
+def stand_in():
+    close_shared_http_session()
+    with NaverStandInServer(pages=instrument_pages()) as server:
+        route_session_to_stand_in(get_shared_http_session(), server)
+        yield server
+    close_shared_http_session()
+
+
+def test_resolve_instruments_expands_metals_and_currency_codes():
+    assert [instrument.key for instrument in resolve_instruments(["silver", "JPY"])] == [
+        "international_silver",
+        "usd_krw",
+        "jpy_krw",
+    ]
+    assert [instrument.key for instrument in resolve_instruments(["gold"])] == [
+        "domestic_gold",
+        "international_gold",
+        "usd_krw",
+    ]
+    assert len(resolve_instruments()) == 8
+    with pytest.raises(ValueError):
+        resolve_instruments(["palladium"])
+
+
+def test_batched_snapshot_fetches_every_instrument_once(stand_in):
+    snapshot = price_fetcher.fetch_instrument_snapshot()
+
+    assert stand_in.request_count == 8
+    assert snapshot.is_complete
+    assert snapshot.price("international_silver") == 38.50
+    assert snapshot.price("eur_krw") == 1620.30
+
+    gold_premium = snapshot.metal_premiums["gold"]
+    expected_gold = price_fetcher.build_gold_price_data(152340.00, 3345.20, 1399.50)
+    assert gold_premium.premium_percent == pytest.approx(expected_gold.kimchi_premium_percent)
+    assert gold_premium.international_krw_per_g == pytest.approx(expected_gold.international_krw_per_g)
+
+    # 국내 시세가 없는 귀금속은 원/g 환산값만 있다
+    assert snapshot.metal_premiums["platinum"].premium_percent is None
+    assert snapshot.metal_premiums["platinum"].international_krw_per_g == pytest.approx(
+        1402.10 * 1399.50 / 31.1035
+    )
+
+    # JPY는 100엔당 고시이므로 1달러당 엔 = 1399.50 / 9.352
+    assert snapshot.cross_rate("USD", "JPY") == pytest.approx(1399.50 / 9.352)
+
+
+def test_partial_failure_keeps_successful_quotes(stand_in):
+    stand_in.inject_faults("/marketindex/exchange/FX_CNYKRW", ("status", 404))
+
+    snapshot = price_fetcher.fetch_instrument_snapshot(["gold", "CNY", "EUR"])
+
+    assert not snapshot.is_complete
+    assert [failure.source_name for failure in snapshot.failures] == ["cny_krw"]
+    assert snapshot.price("cny_krw") is None
+    assert snapshot.price("eur_krw") == 1620.30
+    assert "gold" in snapshot.metal_premiums
+
+    stand_in.inject_faults("/marketindex/exchange/FX_CNYKRW", ("status", 404))
+    with pytest.raises(MarketDataCollectionError) as excinfo:
+        price_fetcher.fetch_instrument_snapshot(["gold", "CNY"], require_all=True)
+    # require_all은 fail-fast이므로 아직 끝나지 않은 종목은 취소로 기록될 수 있다
+    assert excinfo.value.failed_sources[0] == "cny_krw"
+
+
+def test_async_batched_snapshot_uses_one_loop():
+    async def two_snapshots(stand_in):
+        pool = route_async_pool_to_stand_in(get_shared_async_connection_pool(), stand_in)
+        try:
+            return [
+                await price_fetcher.fetch_instrument_snapshot_async(["gold", "silver", "platinum"])
+                for _ in range(2)
+            ]
+        finally:
+            await pool.aclose()
+
+    with NaverStandInServer(pages=instrument_pages()) as stand_in:
+        snapshots = asyncio.run(two_snapshots(stand_in))
+
+    assert stand_in.request_count == 10
+    assert stand_in.handshake_count <= 5
+    assert set(snapshots[-1].metal_premiums) == {"gold", "silver", "platinum"}
@@ -0,0 +1,213 @@
+import asyncio
+import csv
+import sqlite3
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from kimchi_gold import intraday_collector
+from kimchi_gold.fetch_deadline import MarketDataCollectionError, SourceFetchFailure
+from kimchi_gold.intraday_collector import IntradayCollector, write_daily_row_from_ticks
+from kimchi_gold.price_fetcher import build_gold_price_data
+from kimchi_gold.quote_cache import QuoteCache, get_shared_quote_cache, set_shared_quote_cache
+from kimchi_gold.tick_store import (
+    TICK_FILE_MAGIC,
+    TICK_RECORD_FORMAT,
+    IntradayTick,
+    TickStore,
+)
+
+
+@pytest.fixture(autouse=True)
+def allow_tmp_paths():
+    with patch("kimchi_gold.tick_store.validate_safe_path", side_effect=lambda path: path), patch(
+        "kimchi_gold.data_collector.validate_safe_path", side_effect=lambda path: path
+    ):
+        yield
+
+
+def make_tick(timestamp, domestic_price=152340.0):
+    gold_price_data = build_gold_price_data(domestic_price, 3345.2, 1399.5)
+    gold_price_data.data_collection_timestamp = timestamp
+    return IntradayTick.from_gold_price_data(gold_price_data)
+
+
+def test_tick_store_round_trip_and_day_rotation(tmp_path):
+    first_day = datetime(2026, 3, 2, 9, 0)
+    with TickStore(tmp_path) as tick_store:
+        for minute in range(3):
+            tick_store.append(make_tick(first_day + timedelta(minutes=minute), 150000.0 + minute))
+        tick_store.append(make_tick(first_day + timedelta(days=1)))
+
+        ticks = tick_store.read_ticks(first_day.date())
+        assert [tick.domestic_price for tick in ticks] == [150000.0, 150001.0, 150002.0]
+        assert len(tick_store.read_ticks(first_day.date() + timedelta(days=1))) == 1
+        assert tick_store.recorded_days() == [date(2026, 3, 2), date(2026, 3, 3)]
+
+    tick_file = tmp_path / "2026-03-02.ticks"
+    assert tick_file.stat().st_size == len(TICK_FILE_MAGIC) + 3 * TICK_RECORD_FORMAT.size
+
+
+def test_tick_store_drops_truncated_record(tmp_path):
+    trading_day = datetime(2026, 3, 2, 9, 0)
+    with TickStore(tmp_path) as tick_store:
+        tick_store.append(make_tick(trading_day))
+    tick_file = tmp_path / "2026-03-02.ticks"
+    with open(tick_file, "ab") as partial_writer:
+        partial_writer.write(b"\x00" * 10)
+
+    with TickStore(tmp_path) as tick_store:
+        assert len(tick_store.read_ticks(trading_day.date())) == 1
+        tick_store.append(make_tick(trading_day + timedelta(minutes=1)))
+        assert len(tick_store.read_ticks(trading_day.date())) == 2
+
+
+def test_daily_row_is_derived_from_last_tick(tmp_path):
+    trading_day = datetime(2026, 3, 2, 9, 0)
+    csv_file = tmp_path / "log.csv"
+    with TickStore(tmp_path / "ticks") as tick_store:
+        for minute, domestic_price in enumerate([150000.0, 160000.0, 140000.0, 152340.0]):
+            tick_store.append(make_tick(trading_day + timedelta(minutes=minute), domestic_price))
+
+        summary = tick_store.summarize_day(trading_day.date())
+        assert summary.tick_count == 4
+        assert summary.premium_percent_high > summary.premium_percent_close > summary.premium_percent_low
+
+        assert write_daily_row_from_ticks(tick_store, trading_day.date(), csv_file)
+        # 이미 기록된 날짜는 다시 쓰지 않는다
+        assert not write_daily_row_from_ticks(tick_store, trading_day.date(), csv_file)
+
+    with open(csv_file, encoding="utf-8") as csv_reader_file:
+        rows = list(csv.reader(csv_reader_file))
+    expected_row = build_gold_price_data(152340.0, 3345.2, 1399.5)
+    expected_row.data_collection_timestamp = trading_day
+    assert rows[1:] == [expected_row.convert_to_csv_row_format()]
+
+
+def test_collector_polls_on_schedule_and_survives_failures(tmp_path):
+    snapshots = [
+        build_gold_price_data(152340.0, 3345.2, 1399.5),
+        MarketDataCollectionError([SourceFetchFailure("usd_krw", timed_out=True)]),
+        build_gold_price_data(152500.0, 3345.2, 1399.5),
+    ]
+
+    async def fake_snapshot(deadline_seconds):
+        snapshot = snapshots.pop(0)
+        if isinstance(snapshot, Exception):
+            raise snapshot
+        return snapshot
+
+    collector = IntradayCollector(
+        poll_interval_seconds=0.05,
+        jitter_seconds=0.01,
+        tick_store=TickStore(tmp_path),
+        daily_csv_file_path=tmp_path / "log.csv",
+    )
+    started = datetime.now()
+    with patch.object(intraday_collector, "fetch_current_gold_market_data_async", fake_snapshot):
+        asyncio.run(collector.run(max_ticks=3))
+
+    assert collector.tick_count == 2
+    assert collector.failure_count == 1
+    ticks = collector.tick_store.read_ticks(started.date())
+    assert [tick.domestic_price for tick in ticks] == [152340.0, 152500.0]
+
+
+def test_collector_writes_previous_day_on_rollover(tmp_path):
+    yesterday = datetime.now() - timedelta(days=1)
+    yesterday_snapshot = build_gold_price_data(150000.0, 3345.2, 1399.5)
+    yesterday_snapshot.data_collection_timestamp = yesterday
+    snapshots = [yesterday_snapshot, build_gold_price_data(152340.0, 3345.2, 1399.5)]
+
+    async def fake_snapshot(deadline_seconds):
+        return snapshots.pop(0)
+
+    csv_file = tmp_path / "log.csv"
+    collector = IntradayCollector(
+        poll_interval_seconds=0.01,
+        jitter_seconds=0.0,
+        tick_store=TickStore(tmp_path / "ticks"),
+        daily_csv_file_path=csv_file,
+    )
+    with patch.object(intraday_collector, "fetch_current_gold_market_data_async", fake_snapshot):
+        asyncio.run(collector.run(max_ticks=2))
+
+    with open(csv_file, encoding="utf-8") as csv_reader_file:
+        rows = list(csv.reader(csv_reader_file))
+    assert [row[0] for row in rows[1:]] == [yesterday.strftime("%Y-%m-%d")]
+    assert rows[1][1] == "150000.00"
+
+
+def test_collector_stops_promptly_on_stop_event(tmp_path):
+    async def fake_snapshot(deadline_seconds):
+        return build_gold_price_data(152340.0, 3345.2, 1399.5)
+
+    async def run_then_stop(collector):
+        stop_event = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.1, stop_event.set)
+        await collector.run(stop_event)
+
+    collector = IntradayCollector(
+        poll_interval_seconds=60.0,
+        jitter_seconds=0.0,
+        tick_store=TickStore(tmp_path),
+        write_daily_rows=False,
+    )
+    with patch.object(intraday_collector, "fetch_current_gold_market_data_async", fake_snapshot):
+        asyncio.run(asyncio.wait_for(run_then_stop(collector), timeout=2.0))
+
+    assert collector.tick_count == 1
+
+
+def test_collector_bypasses_the_shared_quote_cache_while_running(tmp_path):
+    seen_quote_caches = []
+
+    async def fake_snapshot(deadline_seconds):
+        seen_quote_caches.append(get_shared_quote_cache())
+        return build_gold_price_data(152340.0, 3345.2, 1399.5)
+
+    default_quote_cache = QuoteCache()
+    previous_quote_cache = set_shared_quote_cache(default_quote_cache)
+    try:
+        collector = IntradayCollector(
+            poll_interval_seconds=0.01, jitter_seconds=0.0, tick_store=TickStore(tmp_path), write_daily_rows=False
+        )
+        with patch.object(intraday_collector, "fetch_current_gold_market_data_async", fake_snapshot):
+            asyncio.run(collector.run(max_ticks=2))
+        # 끝나면 원래 캐시를 되돌려 놓는다
+        assert get_shared_quote_cache() is default_quote_cache
+    finally:
+        set_shared_quote_cache(previous_quote_cache)
+
+    # 직전 회차 값을 캐시에서 받아 현재 시각의 틱으로 기록하지 않도록 매 회차 캐시 없이 수집
+    assert seen_quote_caches == [None, None]
+
+
+def test_storage_errors_are_logged_per_poll_without_stopping_the_collector(tmp_path):
+    async def fake_snapshot(deadline_seconds):
+        return build_gold_price_data(152340.0, 3345.2, 1399.5)
+
+    collector = IntradayCollector(
+        poll_interval_seconds=0.01, jitter_seconds=0.0, tick_store=TickStore(tmp_path), write_daily_rows=False
+    )
+    real_append = collector.tick_store.append
+    append_results = [OSError(28, "No space left on device")]
+
+    def flaky_append(tick):
+        if append_results:
+            raise append_results.pop(0)
+        real_append(tick)
+
+    with patch.object(intraday_collector, "fetch_current_gold_market_data_async", fake_snapshot), patch.object(
+        collector.tick_store, "append", side_effect=flaky_append
+    ):
+        asyncio.run(collector.run(max_ticks=3))
+
+    assert (collector.failure_count, collector.tick_count) == (1, 2)
+
+    collector.write_daily_rows = True
+    with patch.object(
+        intraday_collector, "write_daily_row_from_ticks", side_effect=sqlite3.OperationalError("database is locked")
+    ):
+        assert not collector.finalize_day(date(2026, 3, 2))
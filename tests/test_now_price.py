@@ -1,19 +1,28 @@
 import pytest
 from unittest.mock import patch
-from kimchi_gold import price_fetcher
+from kimchi_gold import html_parsers, price_fetcher
 
 MOCK_DOMESTIC_PRICE_TEXT = "80,123.45"
 MOCK_INTERNATIONAL_PRICE_TEXT = "1,999.99"
 MOCK_USD_KRW_TEXT = "1,355.67"
 
 
+@pytest.fixture(autouse=True)
+def pin_html_parser_backend():
+    # lxml 설치 여부와 관계없이 BeautifulSoup(html.parser) 경로를 검증
+    previous_backend = html_parsers.get_html_parser_backend()
+    html_parsers.set_html_parser_backend("html.parser")
+    yield
+    html_parsers.set_html_parser_backend(previous_backend)
+
+
 def test_get_price_from_naver_success():
     url = "https://finance.naver.com"
     error_msg = "테스트 에러 메시지"
 
     with (
-        patch("requests.get") as mock_get,
-        patch("kimchi_gold.price_fetcher.BeautifulSoup") as mock_bs,
+        patch("requests.Session.get") as mock_get,
+        patch("kimchi_gold.html_parsers.BeautifulSoup") as mock_bs,
     ):
         mock_get.return_value.__enter__.return_value.is_redirect = False
         mock_get.return_value.__enter__.return_value.headers = {"Content-Type": "text/html; charset=utf-8"}
@@ -25,22 +34,57 @@ def test_get_price_from_naver_success():
             </html>
         """.encode("utf-8")
         mock_get.return_value.__enter__.return_value.iter_content.return_value = [content]
-        mock_soup_instance = mock_bs.return_value
-        mock_soup_instance.find.return_value.get_text.return_value = (
-            MOCK_DOMESTIC_PRICE_TEXT
-        )
 
         price = price_fetcher.extract_price_from_naver_finance(url, error_msg)
         assert price == float(MOCK_DOMESTIC_PRICE_TEXT.replace(",", ""))
         mock_get.assert_called_once_with(
             url, headers=price_fetcher.REQUEST_HEADERS, timeout=(3.0, 10.0), allow_redirects=False, stream=True, verify=True
         )
-        mock_bs.assert_called_once_with(content, "html.parser")
-        # class_ 파라미터가 람다 함수이므로 호출 여부만 확인
-        mock_soup_instance.find.assert_called_once()
-        call_args = mock_soup_instance.find.call_args
-        assert call_args[0][0] == "strong"  # 첫 번째 인자가 "strong"인지 확인
-        assert "class_" in call_args[1]  # class_ 키워드 인자가 있는지 확인
+        # 스트리밍 스캐너가 가격을 찾았으므로 DOM 파서는 사용하지 않는다
+        mock_bs.assert_not_called()
+
+
+def test_get_price_from_naver_stops_reading_after_price_tag():
+    url = "https://finance.naver.com"
+    error_msg = "테스트 에러 메시지"
+    consumed_chunks = []
+
+    def iter_content(chunk_size):
+        for chunk in [
+            b"<html><body><strong class='DetailInfo_price__I_VJn'>80,1",
+            b"23.45</strong>",
+            b"<script>" + b"x" * 8192,
+            b"</script></body></html>",
+        ]:
+            consumed_chunks.append(chunk)
+            yield chunk
+
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.__enter__.return_value.is_redirect = False
+        mock_get.return_value.__enter__.return_value.headers = {"Content-Type": "text/html"}
+        mock_get.return_value.__enter__.return_value.iter_content.side_effect = iter_content
+
+        price = price_fetcher.extract_price_from_naver_finance(url, error_msg)
+
+    assert price == 80123.45
+    assert len(consumed_chunks) == 2
+
+
+def test_get_price_from_naver_falls_back_to_dom_parser():
+    url = "https://finance.naver.com"
+    error_msg = "테스트 에러 메시지"
+
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.__enter__.return_value.is_redirect = False
+        mock_get.return_value.__enter__.return_value.headers = {"Content-Type": "text/html"}
+        # 따옴표 없는 class 속성은 빠른 경로가 인식하지 않지만 BeautifulSoup은 인식한다
+        mock_get.return_value.__enter__.return_value.iter_content.return_value = [
+            f"<html><body><strong class=DetailInfo_price__I_VJn>{MOCK_USD_KRW_TEXT}</strong></body></html>".encode("utf-8")
+        ]
+
+        price = price_fetcher.extract_price_from_naver_finance(url, error_msg)
+
+    assert price == float(MOCK_USD_KRW_TEXT.replace(",", ""))
 
 
 def test_get_price_from_naver_no_price_tag():
@@ -48,8 +92,8 @@ def test_get_price_from_naver_no_price_tag():
     error_msg = "테스트 에러 메시지"
 
     with (
-        patch("requests.get") as mock_get,
-        patch("kimchi_gold.price_fetcher.BeautifulSoup") as mock_bs,
+        patch("requests.Session.get") as mock_get,
+        patch("kimchi_gold.html_parsers.BeautifulSoup") as mock_bs,
     ):
         mock_get.return_value.__enter__.return_value.is_redirect = False
         mock_get.return_value.__enter__.return_value.headers = {"Content-Type": "text/html"}
@@ -83,8 +127,8 @@ def test_get_price_from_naver_no_price_in_text():
     error_msg = "테스트 에러 메시지"
 
     with (
-        patch("requests.get") as mock_get,
-        patch("kimchi_gold.price_fetcher.BeautifulSoup") as mock_bs,
+        patch("requests.Session.get") as mock_get,
+        patch("kimchi_gold.html_parsers.BeautifulSoup") as mock_bs,
     ):
         mock_get.return_value.__enter__.return_value.is_redirect = False
         mock_get.return_value.__enter__.return_value.headers = {"Content-Type": "text/html"}
@@ -142,8 +186,8 @@ def test_extract_price_invalid_values():
     error_msg = "국내 금 가격 정보를 찾을 수 없습니다."
 
     with (
-        patch("requests.get") as mock_get,
-        patch("kimchi_gold.price_fetcher.BeautifulSoup") as mock_bs,
+        patch("requests.Session.get") as mock_get,
+        patch("kimchi_gold.html_parsers.BeautifulSoup") as mock_bs,
     ):
         mock_get.return_value.__enter__.return_value.is_redirect = False
         mock_get.return_value.__enter__.return_value.headers = {"Content-Type": "text/html"}
@@ -185,7 +229,7 @@ def test_extract_price_ssrf_protection_no_redirects():
     url = "https://finance.naver.com"
     error_msg = "테스트 에러 메시지"
 
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.is_redirect = True
         with pytest.raises(ValueError) as excinfo:
             price_fetcher.extract_price_from_naver_finance(url, error_msg)
@@ -227,7 +271,7 @@ def test_extract_price_invalid_content_type():
     url = "https://finance.naver.com"
     error_msg = "테스트 에러 메시지"
 
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.__enter__.return_value.is_redirect = False
         mock_get.return_value.__enter__.return_value.headers = {"Content-Type": "application/json"}
 
@@ -239,7 +283,7 @@ def test_extract_price_content_length_exceeds_limit():
     url = "https://finance.naver.com"
     error_msg = "테스트 에러 메시지"
 
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.__enter__.return_value.is_redirect = False
         mock_get.return_value.__enter__.return_value.headers = {
             "Content-Type": "text/html",
@@ -254,7 +298,7 @@ def test_extract_price_slow_read_dos_timeout():
     url = "https://finance.naver.com"
     error_msg = "테스트 에러 메시지"
 
-    with patch("requests.get") as mock_get, patch("kimchi_gold.price_fetcher.time.monotonic") as mock_time:
+    with patch("requests.Session.get") as mock_get, patch("kimchi_gold.price_fetcher.time.monotonic") as mock_time:
         mock_get.return_value.__enter__.return_value.is_redirect = False
         mock_get.return_value.__enter__.return_value.headers = {"Content-Type": "text/html"}
 
@@ -277,8 +321,8 @@ def test_extract_price_algorithmic_complexity_dos_mitigation():
     long_price_string = "1" * 51
 
     with (
-        patch("requests.get") as mock_get,
-        patch("kimchi_gold.price_fetcher.BeautifulSoup") as mock_bs,
+        patch("requests.Session.get") as mock_get,
+        patch("kimchi_gold.html_parsers.BeautifulSoup") as mock_bs,
     ):
         mock_get.return_value.__enter__.return_value.is_redirect = False
         mock_get.return_value.__enter__.return_value.headers = {"Content-Type": "text/html"}
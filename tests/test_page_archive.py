@@ -0,0 +1,115 @@
+import gzip
+
+import pytest
+import requests
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.configuration import (
+    NAVER_DOMESTIC_GOLD_URL,
+    NAVER_INTERNATIONAL_GOLD_URL,
+    NAVER_USD_KRW_EXCHANGE_URL,
+)
+from kimchi_gold.http_session import close_shared_http_session, get_shared_http_session
+from kimchi_gold.page_archive import PageArchive, set_shared_page_archive
+from kimchi_gold.page_replay import (
+    install_replay,
+    reparse_archived_pages,
+    replay_latest_snapshot,
+)
+from naver_stand_in import (
+    NaverStandInServer,
+    load_naver_fixture_pages,
+    render_market_index_page,
+    route_session_to_stand_in,
+)
+
+
+@pytest.fixture
+def recording_archive(tmp_path):
+    page_archive = PageArchive(tmp_path / "page_archive")
+    previous_page_archive = set_shared_page_archive(page_archive)
+    yield page_archive
+    set_shared_page_archive(previous_page_archive)
+
+
+def record_live_snapshots(pages, snapshot_count=1):
+    close_shared_http_session()
+    with NaverStandInServer(pages=pages) as stand_in:
+        route_session_to_stand_in(get_shared_http_session(), stand_in)
+        try:
+            return [price_fetcher.fetch_current_gold_market_data() for _ in range(snapshot_count)]
+        finally:
+            close_shared_http_session()
+
+
+def test_recording_stores_full_pages_once(recording_archive):
+    fixture_pages = load_naver_fixture_pages()
+
+    record_live_snapshots(fixture_pages, snapshot_count=2)
+
+    records = list(recording_archive.iter_records())
+    assert len(records) == 6
+    # 같은 페이지는 내용 해시가 같아 한 번만 저장된다
+    assert recording_archive.object_count() == 3
+    latest_domestic = recording_archive.latest_records()[NAVER_DOMESTIC_GOLD_URL]
+    # 가격 태그 뒤에서 읽기를 멈추지 않고 본문 전체를 보관한다
+    assert recording_archive.load_page(latest_domestic.digest) == fixture_pages["/marketindex/metals/M04020000"]
+    assert latest_domestic.price is not None
+
+
+def test_replay_reproduces_live_snapshot_without_network(recording_archive):
+    live_snapshot = record_live_snapshots(load_naver_fixture_pages())[0]
+    set_shared_page_archive(None)
+
+    replayed_snapshot = replay_latest_snapshot(recording_archive)
+
+    assert replayed_snapshot.domestic_price == live_snapshot.domestic_price
+    assert replayed_snapshot.international_price == live_snapshot.international_price
+    assert replayed_snapshot.usd_krw_rate == live_snapshot.usd_krw_rate
+
+
+def test_sequential_replay_follows_recorded_order(tmp_path):
+    page_archive = PageArchive(tmp_path)
+    for price_text in ("1,300.00", "1,310.00"):
+        page_archive.record(NAVER_USD_KRW_EXCHANGE_URL, render_market_index_page(price_text))
+    close_shared_http_session()
+    replay_adapter = install_replay(get_shared_http_session(), page_archive, sequential=True)
+    try:
+        replayed_rates = [price_fetcher.fetch_usd_krw_exchange_rate() for _ in range(3)]
+        # 보관되지 않은 URL은 404
+        with pytest.raises(requests.HTTPError):
+            price_fetcher.fetch_domestic_gold_price()
+    finally:
+        close_shared_http_session()
+
+    assert replayed_rates == [1300.0, 1310.0, 1310.0]
+    assert replay_adapter.replayed_count == 3
+
+
+def test_reparse_reports_changed_and_unparseable_pages(tmp_path):
+    page_archive = PageArchive(tmp_path)
+    page_archive.record(NAVER_DOMESTIC_GOLD_URL, render_market_index_page("152,340.00"), 152340.0)
+    # 수집 당시 파서가 잘못 읽었던 값
+    page_archive.record(NAVER_INTERNATIONAL_GOLD_URL, render_market_index_page("3,345.20"), 3345.0)
+    page_archive.record(NAVER_USD_KRW_EXCHANGE_URL, b"<html><body>maintenance</body></html>", 1399.5)
+    # 기록 도중 잘린 색인 줄은 건너뛴다
+    with page_archive.index_path.open("a", encoding="utf-8") as index_file:
+        index_file.write('{"fetched_at": 1.0, "url": "https://m.stock')
+
+    report = reparse_archived_pages(page_archive)
+
+    assert report.page_count == 3
+    assert [(page.url, price) for page, price in report.changed_pages] == [
+        (NAVER_INTERNATIONAL_GOLD_URL, 3345.20)
+    ]
+    assert [page.url for page, _ in report.failed_pages] == [NAVER_USD_KRW_EXCHANGE_URL]
+
+
+def test_corrupted_object_is_detected(tmp_path):
+    page_archive = PageArchive(tmp_path)
+    archived_page = page_archive.record(NAVER_DOMESTIC_GOLD_URL, render_market_index_page("1.00"))
+    object_path = page_archive.object_path(archived_page.digest)
+    object_path.write_bytes(gzip.compress(b"tampered"))
+
+    with pytest.raises(ValueError):
+        page_archive.load_page(archived_page.digest)
@@ -0,0 +1,120 @@
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kimchi_gold.backtest import load_data, run_backtest
+from kimchi_gold.data_collector import save_gold_price_data_to_csv
+from kimchi_gold.price_columns import (
+    FAST_PARSE_CHUNK_BYTES,
+    ColumnarPriceStore,
+    load_price_columns,
+    parse_price_log_rows,
+    read_price_log_arrays,
+)
+from kimchi_gold.price_fetcher import build_gold_price_data
+
+def test_columns_match_read_csv_and_are_memory_mapped(tmp_path, write_price_log):
+    csv_path = write_price_log(
+        tmp_path / "log.csv",
+        ["2026-03-02,86400,1909.50,1350,0,0", "2026-03-03 15:30:00,150000.00,3345.00,1399.00,-100.00,-0.07"],
+    )
+
+    price_columns = load_price_columns(csv_path)
+
+    assert isinstance(price_columns.domestic_price, np.memmap)
+    assert price_columns.dates.dtype == np.dtype("datetime64[D]")
+    assert price_columns.dates.tolist() == [np.datetime64("2026-03-02").item(), np.datetime64("2026-03-03").item()]
+    expected_dataframe = pd.read_csv(csv_path)
+    expected_dataframe["날짜"] = pd.to_datetime(expected_dataframe["날짜"], format="mixed").dt.normalize()
+    pd.testing.assert_frame_equal(price_columns.to_dataframe(), expected_dataframe, check_dtype=False)
+
+
+def test_csv_appends_are_mirrored_incrementally(tmp_path, write_price_log):
+    csv_path = write_price_log(tmp_path / "log.csv", ["2026-03-02,86400,1909.50,1350,0,0"])
+    columnar_store = ColumnarPriceStore(csv_path)
+    assert columnar_store.sync() == 1
+
+    with patch("kimchi_gold.data_collector.validate_safe_path", side_effect=lambda path: path):
+        save_gold_price_data_to_csv(build_gold_price_data(150000.0, 3345.0, 1399.0), csv_path)
+    assert columnar_store.read_meta()["row_count"] == 2
+    assert columnar_store.load().domestic_price.tolist() == [86400.0, 150000.0]
+
+    # 개행 전까지 기록된 줄은 아직 반영하지 않는다
+    with csv_path.open("a", encoding="utf-8") as csv_file:
+        csv_file.write("2030-01-01,1,2,3")
+    assert columnar_store.sync() == 0
+    with csv_path.open("a", encoding="utf-8") as csv_file:
+        csv_file.write(",4,5\n")
+    assert columnar_store.sync() == 1
+    assert str(columnar_store.load().dates[-1]) == "2030-01-01"
+
+
+def test_rewritten_log_is_rebuilt_without_breaking_open_mappings(tmp_path, write_price_log):
+    csv_path = write_price_log(tmp_path / "log.csv", ["2026-03-02,1,1,1,1,1", "2026-03-03,2,2,2,2,2"])
+    old_columns = load_price_columns(csv_path)
+
+    replacement_path = write_price_log(tmp_path / "replacement.csv", ["2026-03-04,3,3,3,3,3"])
+    os.replace(replacement_path, csv_path)
+    new_columns = load_price_columns(csv_path)
+
+    assert new_columns.domestic_price.tolist() == [3.0]
+    # 먼저 매핑한 쪽은 바꿔 끼우기 전의 파일을 계속 본다
+    assert old_columns.domestic_price.tolist() == [1.0, 2.0]
+
+
+def test_leftover_tail_from_interrupted_append_is_discarded(tmp_path, write_price_log):
+    csv_path = write_price_log(tmp_path / "log.csv", ["2026-03-02,1,1,1,1,1"])
+    columnar_store = ColumnarPriceStore(csv_path)
+    columnar_store.sync()
+    # meta.json을 갱신하기 전에 중단된 추가
+    with columnar_store.column_path("domestic_price").open("ab") as column_file:
+        column_file.write(np.array([99.0]).tobytes())
+
+    with csv_path.open("a", encoding="utf-8") as csv_file:
+        csv_file.write("2026-03-03,2,2,2,2,2\n")
+    columnar_store.sync()
+
+    assert columnar_store.load().domestic_price.tolist() == [1.0, 2.0]
+    assert os.path.getsize(columnar_store.column_path("domestic_price")) == 2 * 8
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 64, FAST_PARSE_CHUNK_BYTES])
+def test_fast_parser_matches_row_parser_across_chunk_boundaries(tmp_path, chunk_bytes, price_log_header):
+    rows = [f"2026-01-{day:02d},{150000 + day}.25,3345.{day},1399.5,-{day}.01,-0.{day:02d}" for day in range(1, 29)]
+    # 시각이 붙은 날짜, 남는 열, 빈 줄, 개행 없는 마지막 줄
+    rows[3] = "2026-01-04 15:30:00,1,2,3,4,5"
+    rows[5] += ",extra"
+    csv_path = tmp_path / "log.csv"
+    csv_path.write_bytes(("\r\n".join([price_log_header] + rows[:10] + [""] + rows[10:])).encode("utf-8"))
+
+    price_columns = read_price_log_arrays(csv_path, chunk_bytes=chunk_bytes)
+
+    expected_day_numbers, expected_values = parse_price_log_rows("\n".join(rows))
+    assert price_columns.dates.dtype == np.dtype("datetime64[D]")
+    assert price_columns.dates.astype("int64").tolist() == expected_day_numbers.tolist()
+    for column_index, column in enumerate(price_columns[1:]):
+        assert column.dtype == np.float64 and column.flags.c_contiguous
+        assert column.tolist() == expected_values[:, column_index].tolist()
+
+
+def test_malformed_rows_fall_back_to_row_parser(tmp_path, write_price_log):
+    csv_path = write_price_log(tmp_path / "log.csv", ["2026-03-02,1,1,1,1,1", "2026-03-03,n/a,1,1,1,1", "2026-03-04,4,4,4,4,4"])
+
+    assert read_price_log_arrays(csv_path).domestic_price.tolist() == [1.0, 4.0]
+    assert read_price_log_arrays(write_price_log(tmp_path / "empty.csv", [])).row_count == 0
+
+
+def test_backtest_on_arrays_matches_backtest_on_dataframe(tmp_path, write_price_log):
+    csv_path = write_price_log(
+        tmp_path / "log.csv",
+        [f"2026-03-{day:02d},{100000 + 1000 * day},1,1,1,{premium}" for day, premium in zip(range(1, 21), [0, -4, 1, 4, 0.1] * 4)],
+    )
+
+    for start_date in (None, datetime(2026, 3, 5)):
+        array_result = run_backtest(read_price_log_arrays(csv_path), start_date=start_date)
+        dataframe_result = run_backtest(load_data(csv_path), start_date=start_date)
+        pd.testing.assert_frame_equal(array_result, dataframe_result, check_dtype=False)
@@ -0,0 +1,163 @@
+import os
+import stat
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kimchi_gold import price_history
+from kimchi_gold.backtest import load_data
+from kimchi_gold.outlier_analyzer import filter_dataframe_by_recent_dates
+from kimchi_gold.price_history import (
+    IncrementalPriceHistory,
+    clear_price_history_cache,
+    load_price_history,
+    load_price_history_since,
+)
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_price_history_cache()
+    yield
+    clear_price_history_cache()
+
+
+@pytest.mark.parametrize("use_disk_cache", [False, True])
+def test_history_is_sorted_with_datetime_index_and_float_columns(
+    tmp_path, use_disk_cache, write_price_log, price_log_header
+):
+    csv_path = write_price_log(
+        tmp_path / "log.csv",
+        ["2026-03-03 15:30:00,150000.00,3345.00,1399.00,-100.00,-0.07", "2026-03-02,86400,1909.50,1350,0,0"],
+    )
+
+    history = load_price_history(csv_path, use_disk_cache=use_disk_cache)
+
+    assert isinstance(history.index, pd.DatetimeIndex)
+    assert history.index.name == "날짜"
+    assert history.index.dtype == "datetime64[s]"
+    assert list(history.index.strftime("%Y-%m-%d %H:%M")) == ["2026-03-02 00:00", "2026-03-03 00:00"]
+    assert list(history.columns) == price_log_header.split(",")[1:]
+    assert (history.dtypes == "float64").all()
+    assert history["국내금(원/g)"].tolist() == [86400.0, 150000.0]
+
+
+def test_unchanged_log_is_parsed_once_and_cached_copy_is_not_shared(tmp_path, write_price_log):
+    csv_path = write_price_log(tmp_path / "log.csv", ["2026-03-02,1,1,1,1,1"])
+
+    with patch.object(price_history, "read_price_history_csv", wraps=price_history.read_price_history_csv) as read_csv:
+        first_history = load_price_history(csv_path, use_disk_cache=False)
+        first_history["국내금(원/g)"] = 0.0
+        first_history["추가 열"] = 1.0
+        second_history = load_price_history(csv_path, use_disk_cache=False)
+
+    assert read_csv.call_count == 1
+    assert second_history["국내금(원/g)"].tolist() == [1.0]
+    assert "추가 열" not in second_history.columns
+
+
+@pytest.mark.parametrize("use_disk_cache", [False, True])
+def test_in_place_edits_never_reach_the_cache_even_without_copy_on_write(tmp_path, use_disk_cache, write_price_log):
+    csv_path = write_price_log(tmp_path / "log.csv", ["2026-03-02,1,1,1,1,1", "2026-03-03,2,2,2,2,2"])
+
+    first_history = load_price_history(csv_path, use_disk_cache=use_disk_cache)
+    second_history = load_price_history(csv_path, use_disk_cache=use_disk_cache)
+    # Copy-on-Write가 꺼진 pandas(2.x 기본값)에서는 버퍼를 공유하면 제자리 수정이 캐시까지 바뀜
+    assert not np.shares_memory(first_history["국내금(원/g)"].to_numpy(), second_history["국내금(원/g)"].to_numpy())
+    first_history.iloc[0, 0] = -1.0
+    first_history.loc[first_history.index[1], "환율(원/달러)"] = -1.0
+    window = load_price_history_since(csv_path, "2026-03-03", use_month_index=False, use_disk_cache=use_disk_cache)
+    window.iloc[0, 0] = -1.0
+
+    reloaded_history = load_price_history(csv_path, use_disk_cache=use_disk_cache)
+    assert reloaded_history["국내금(원/g)"].tolist() == [1.0, 2.0]
+    assert reloaded_history["환율(원/달러)"].tolist() == [1.0, 2.0]
+
+
+def test_sidecars_written_while_reading_keep_the_log_file_mode(tmp_path, write_price_log):
+    csv_path = write_price_log(tmp_path / "log.csv", ["2026-03-02,1,1,1,1,1", "2026-04-01,2,2,2,2,2"])
+    os.chmod(csv_path, 0o640)
+
+    load_price_history(csv_path, use_disk_cache=True)
+    clear_price_history_cache()
+    load_price_history_since(csv_path, "2026-04-01", use_month_index=True)
+
+    sidecar_files = [tmp_path / ".log.csv.months.json", *(tmp_path / ".log.csv.columns").iterdir()]
+    assert len(sidecar_files) > 2
+    assert {path.name: stat.S_IMODE(path.stat().st_mode) for path in sidecar_files} == {
+        path.name: 0o640 for path in sidecar_files
+    }
+
+
+def test_appended_or_replaced_log_invalidates_the_cache(tmp_path, write_price_log):
+    csv_path = write_price_log(tmp_path / "log.csv", ["2026-03-02,1,1,1,1,1"])
+    assert len(load_price_history(csv_path)) == 1
+
+    with csv_path.open("a", encoding="utf-8") as csv_file:
+        csv_file.write("2026-03-03,2,2,2,2,2\n")
+    assert load_price_history(csv_path)["국내금(원/g)"].tolist() == [1.0, 2.0]
+
+    replacement_path = write_price_log(tmp_path / "replacement.csv", ["2026-03-04,4,4,4,4,4"])
+    os.replace(replacement_path, csv_path)
+    assert load_price_history(csv_path)["국내금(원/g)"].tolist() == [4.0]
+
+
+def test_consumers_share_the_loader(tmp_path, write_price_log):
+    today = datetime.now().date()
+    csv_path = write_price_log(
+        tmp_path / "log.csv",
+        [f"{today - timedelta(days=days_ago)},{days_ago},1,1,1,{days_ago}" for days_ago in (400, 10, 0)],
+    )
+
+    backtest_data = load_data(csv_path)
+    assert list(backtest_data.columns) == ["date", "krx_gold", "Inter_gold", "exchange_rate", "disparity_won", "disparity"]
+    assert backtest_data["krx_gold"].tolist() == [400.0, 10.0, 0.0]
+
+    recent_data = filter_dataframe_by_recent_dates(load_price_history(csv_path).reset_index(), "날짜", 365)
+    assert recent_data["국내금(원/g)"].tolist() == [10.0, 0.0]
+
+
+def test_incremental_history_parses_only_appended_rows(tmp_path, write_price_log):
+    csv_path = write_price_log(tmp_path / "log.csv", ["2026-03-02,1,1,1,1,1"])
+    incremental_history = IncrementalPriceHistory(csv_path, initial_capacity=1)
+    assert incremental_history.refresh() == 1
+    first_columns = incremental_history.columns()
+
+    with patch.object(price_history, "parse_price_log_bytes", wraps=price_history.parse_price_log_bytes) as parse_rows:
+        with csv_path.open("a", encoding="utf-8") as csv_file:
+            csv_file.write("2026-03-03,2,2,2,2,2\n2026-03-04,3,3")
+        assert incremental_history.refresh() == 1
+        assert incremental_history.refresh() == 0
+        with csv_path.open("a", encoding="utf-8") as csv_file:
+            csv_file.write(",3,3,3\n")
+        assert incremental_history.refresh() == 1
+
+    assert [call.args[0].count(b"\n") for call in parse_rows.call_args_list] == [1, 1]
+    assert incremental_history.row_count == 3
+    assert incremental_history.byte_offset == csv_path.stat().st_size
+    assert incremental_history.columns().domestic_price.tolist() == [1.0, 2.0, 3.0]
+    # 앞서 받아 둔 뷰는 추가에 영향받지 않는다
+    assert first_columns.domestic_price.tolist() == [1.0]
+    pd.testing.assert_frame_equal(
+        incremental_history.to_dataframe(), load_price_history(csv_path, use_disk_cache=False)
+    )
+    assert incremental_history.full_reload_count == 0
+
+
+def test_incremental_history_reloads_truncated_or_replaced_log(tmp_path, write_price_log):
+    csv_path = write_price_log(tmp_path / "log.csv", ["2026-03-02,1,1,1,1,1", "2026-03-03,2,2,2,2,2"])
+    incremental_history = IncrementalPriceHistory(csv_path)
+    assert incremental_history.refresh() == 2
+
+    # 같은 inode에서 잘린 뒤 다시 길어진 로그
+    write_price_log(csv_path, ["2026-03-02,1,1,1,1,1", "2026-03-05,5,5,5,5,5", "2026-03-06,6,6,6,6,6"])
+    assert incremental_history.refresh() == 3
+    assert incremental_history.columns().domestic_price.tolist() == [1.0, 5.0, 6.0]
+
+    replacement_path = write_price_log(tmp_path / "replacement.csv", ["2026-03-07,7,7,7,7,7"])
+    os.replace(replacement_path, csv_path)
+    assert incremental_history.refresh() == 1
+    assert incremental_history.columns().domestic_price.tolist() == [7.0]
+    assert incremental_history.full_reload_count == 2
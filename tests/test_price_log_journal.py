@@ -0,0 +1,135 @@
+import multiprocessing
+import os
+import shutil
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from kimchi_gold.data_collector import save_gold_price_data_to_csv
+from kimchi_gold.price_fetcher import build_gold_price_data
+from kimchi_gold.price_log_journal import PriceLogAppendJournal, fcntl, replace_csv_atomically
+
+@pytest.fixture(autouse=True)
+def allow_tmp_paths():
+    with patch("kimchi_gold.data_collector.validate_safe_path", side_effect=lambda path: path), patch(
+        "kimchi_gold.data_collector.PRICE_COLUMNS_ENABLED", False
+    ):
+        yield
+
+
+def daily_data(day_number, domestic_price=150000.0):
+    gold_price_data = build_gold_price_data(domestic_price, 3345.0, 1399.0)
+    gold_price_data.data_collection_timestamp = datetime(2000, 1, 1) + timedelta(days=day_number)
+    return gold_price_data
+
+
+def save_days(csv_path, first_day_number, day_count):
+    for day_number in range(first_day_number, first_day_number + day_count):
+        save_gold_price_data_to_csv(daily_data(day_number), csv_path)
+
+
+@pytest.mark.skipif(fcntl is None, reason="프로세스 간 잠금에는 fcntl이 필요")
+def test_parallel_writer_processes_never_interleave_rows(tmp_path, price_log_header):
+    csv_path = tmp_path / "log.csv"
+    process_context = multiprocessing.get_context("fork")
+    writers = [process_context.Process(target=save_days, args=(csv_path, number * 30, 30)) for number in range(4)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join(timeout=30)
+        assert writer.exitcode == 0
+
+    lines = csv_path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == price_log_header
+    assert price_log_header not in lines[1:]
+    assert sorted(line[:10] for line in lines[1:]) == sorted(
+        (datetime(2000, 1, 1) + timedelta(days=day_number)).strftime("%Y-%m-%d") for day_number in range(120)
+    )
+    assert all(line.count(",") == 5 for line in lines)
+
+
+def test_date_check_and_append_are_one_critical_section(tmp_path):
+    csv_path = tmp_path / "log.csv"
+    results = []
+    writer_threads = [
+        threading.Thread(
+            target=lambda price=price: results.append(
+                save_gold_price_data_to_csv(daily_data(0, price), csv_path, skip_if_date_already_logged=True)
+            )
+        )
+        for price in range(150000, 150008)
+    ]
+    for writer_thread in writer_threads:
+        writer_thread.start()
+    for writer_thread in writer_threads:
+        writer_thread.join()
+
+    assert results.count(True) == 1
+    assert len(csv_path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def crash_during_append(csv_path):
+    def copy_half_then_die(source_file, destination_file, buffer_size):
+        destination_file.write(source_file.read()[:25])
+        destination_file.flush()
+        os._exit(1)
+
+    with patch.object(shutil, "copyfileobj", copy_half_then_die):
+        save_days(csv_path, 1, 3)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="중단을 흉내 내려면 fork가 필요")
+def test_append_interrupted_by_crash_is_completed_by_next_writer(tmp_path):
+    csv_path = tmp_path / "log.csv"
+    save_days(csv_path, 0, 1)
+    crashing_writer = multiprocessing.get_context("fork").Process(target=crash_during_append, args=(csv_path,))
+    crashing_writer.start()
+    crashing_writer.join(timeout=30)
+    assert crashing_writer.exitcode == 1
+    # 죽은 쓰기가 반쯤 붙인 행
+    assert not csv_path.read_text(encoding="utf-8").endswith("\n")
+
+    save_days(csv_path, 5, 1)
+
+    assert [line[:10] for line in csv_path.read_text(encoding="utf-8").splitlines()[1:]] == [
+        "2000-01-01", "2000-01-02", "2000-01-06"
+    ]
+    assert not PriceLogAppendJournal(csv_path).journal_path.exists()
+
+
+def test_uncommitted_journal_is_discarded(tmp_path):
+    csv_path = tmp_path / "log.csv"
+    save_days(csv_path, 0, 1)
+    original_bytes = csv_path.read_bytes()
+    journal = PriceLogAppendJournal(csv_path)
+    # 커밋 기록을 남기기 전에 중단된 저널
+    journal.journal_path.write_bytes(b"2000-01-02,1,1,1,1,1\r\n")
+
+    save_days(csv_path, 2, 1)
+
+    assert csv_path.read_bytes().startswith(original_bytes)
+    assert "2000-01-02" not in csv_path.read_text(encoding="utf-8")
+    assert not journal.journal_path.exists()
+
+
+def test_atomic_replacement_keeps_the_log_mode_and_syncs_before_rename(tmp_path, price_log_header):
+    csv_path = tmp_path / "log.csv"
+    csv_path.write_text(f"{price_log_header}\n2026-03-02,1,1,1,1,1\n", encoding="utf-8")
+    os.chmod(csv_path, 0o664)
+    synced_descriptors = []
+    real_fsync = os.fsync
+
+    def recording_fsync(file_descriptor):
+        # 교체 전에 임시 파일이 아직 원래 경로에 반영되지 않은 상태여야 한다
+        synced_descriptors.append(csv_path.read_text(encoding="utf-8").count("\n"))
+        real_fsync(file_descriptor)
+
+    with patch("kimchi_gold.price_log_journal.os.fsync", side_effect=recording_fsync):
+        replace_csv_atomically(csv_path, price_log_header.split(","), [["2026-03-02", "2", "1", "1", "1", "1"]])
+
+    assert synced_descriptors == [2]
+    assert csv_path.read_text(encoding="utf-8").splitlines()[1] == "2026-03-02,2,1,1,1,1"
+    assert oct(csv_path.stat().st_mode & 0o777) == oct(0o664)
+    assert [path.name for path in tmp_path.iterdir()] == ["log.csv"]
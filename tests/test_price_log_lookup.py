@@ -0,0 +1,92 @@
+import io
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from kimchi_gold.price_log_lookup import (
+    LoggedDateIndex,
+    find_date_in_log_tail,
+    is_date_logged,
+    iter_lines_reversed,
+)
+
+def dated_rows(dates):
+    return [f"{logged_date},150000.00,3345.00,1399.00,-100.00,-0.07" for logged_date in dates]
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 64 * 1024])
+def test_reversed_lines_match_forward_lines_across_block_boundaries(block_size):
+    content = b"header\r\nfirst,1\r\n\r\nsecond,22\r\nthird,333"
+
+    reversed_lines = list(iter_lines_reversed(io.BytesIO(content), block_size=block_size))
+
+    assert [line for _, line in reversed_lines] == [b"third,333", b"second,22", b"", b"first,1", b"header"]
+    # 줄 시작 위치로 다시 읽으면 같은 줄이 나온다
+    for line_offset, line in reversed_lines:
+        assert content[line_offset:].startswith(line)
+
+
+@pytest.mark.parametrize("line_ending", ["\n", "\r\n"])
+def test_tail_scan_finds_recent_and_stops_at_older_rows(tmp_path, line_ending, write_price_log):
+    log_path = write_price_log(
+        tmp_path / "log.csv", dated_rows(["2026-03-02", "2026-03-03", "2026-03-05"]), line_ending, trailing_newline=False
+    )
+
+    assert find_date_in_log_tail(log_path, "2026-03-05") is True
+    assert find_date_in_log_tail(log_path, "2026-03-02") is True
+    assert find_date_in_log_tail(log_path, "2026-03-06") is False
+    assert find_date_in_log_tail(log_path, "2026-03-04") is False
+    assert find_date_in_log_tail(log_path, "2026-01-01") is False
+
+
+def test_tail_scan_reads_only_the_end_of_a_long_log(tmp_path, write_price_log):
+    log_path = write_price_log(tmp_path / "log.csv", dated_rows([f"2025-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)]))
+    read_sizes = []
+    real_open = type(log_path).open
+
+    def tracking_open(path, *args, **kwargs):
+        opened_file = real_open(path, *args, **kwargs)
+        real_read = opened_file.read
+        opened_file.read = lambda size=-1: read_sizes.append(size) or real_read(size)
+        return opened_file
+
+    with patch.object(type(log_path), "open", tracking_open):
+        assert find_date_in_log_tail(log_path, "2026-01-02", block_size=256) is False
+
+    assert sum(read_sizes) < os.path.getsize(log_path) / 10
+
+
+def test_out_of_order_tail_falls_back_to_full_read(tmp_path, write_price_log):
+    # 과거 날짜가 뒤에 붙은 로그
+    log_path = write_price_log(tmp_path / "log.csv", dated_rows(["2026-03-03", "2026-03-06", "2026-03-04", "2026-03-05"]))
+
+    assert find_date_in_log_tail(log_path, "2026-03-03") is None
+    assert is_date_logged(log_path, "2026-03-03")
+    assert not is_date_logged(log_path, "2026-03-02")
+
+
+def test_date_index_updates_from_appended_rows(tmp_path, write_price_log):
+    log_path = write_price_log(tmp_path / "log.csv", dated_rows(["2026-03-06", "2026-03-02", "2026-03-04"]))
+    date_index = LoggedDateIndex(log_path)
+
+    assert is_date_logged(log_path, "2026-03-06", use_date_index=True)
+    assert date_index.index_path.exists()
+
+    # 색인에만 있는 표식 날짜: 전체를 다시 읽으면 사라지고, 추가분만 읽으면 남는다
+    index_data = date_index.read_index()
+    index_data["dates"].append("1999-12-31")
+    date_index.index_path.write_text(json.dumps(index_data), encoding="utf-8")
+
+    with log_path.open("a", encoding="utf-8") as log_file:
+        log_file.write("2026-03-01,1,1,1,1,1\n")
+    assert date_index.contains("2026-03-01")
+    assert date_index.read_index()["dates"] == [
+        "1999-12-31", "2026-03-01", "2026-03-02", "2026-03-04", "2026-03-06"
+    ]
+
+    # 파일을 통째로 바꾸면(inode 변경) 전체를 다시 읽는다
+    replaced_path = write_price_log(tmp_path / "replacement.csv", dated_rows(["2026-03-09"]))
+    os.replace(replaced_path, log_path)
+    assert date_index.load_dates() == {"2026-03-09"}
@@ -0,0 +1,121 @@
+import json
+import os
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from kimchi_gold import price_log_month_index
+from kimchi_gold.chart_generator import load_and_preprocess_gold_price_data
+from kimchi_gold.outlier_analyzer import perform_kimchi_premium_outlier_analysis
+from kimchi_gold.price_history import clear_price_history_cache, load_price_history, load_price_history_since
+from kimchi_gold.price_log_month_index import MonthOffsetIndex, read_price_log_range
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_price_history_cache()
+    yield
+    clear_price_history_cache()
+
+
+def daily_rows(first_date, day_count):
+    return [
+        f"{first_date + timedelta(days=day_number)},{day_number},1,1,1,{day_number % 7}"
+        for day_number in range(day_count)
+    ]
+
+
+def full_history_since(csv_path, start_date):
+    full_history = load_price_history(csv_path, use_disk_cache=False)
+    clear_price_history_cache()
+    return full_history[full_history.index >= pd.Timestamp(start_date)]
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 100, 1 << 20])
+def test_index_records_the_first_row_of_each_month(tmp_path, chunk_bytes, write_price_log, price_log_header):
+    csv_path = write_price_log(tmp_path / "log.csv", daily_rows(date(2025, 12, 30), 35))
+    log_bytes = csv_path.read_bytes()
+
+    index_data = MonthOffsetIndex(csv_path, chunk_bytes=chunk_bytes).update()
+
+    assert index_data["ordered"] is True
+    assert index_data["last_date"] == "2026-02-02"
+    assert [month_key for month_key, _ in index_data["months"]] == ["2025-12", "2026-01", "2026-02"]
+    for month_key, byte_offset in index_data["months"]:
+        assert log_bytes[byte_offset - 1 : byte_offset + 8] == f"\n{month_key}-".encode()
+    assert index_data["months"][0][1] == len(price_log_header.encode()) + 1
+    assert json.loads((tmp_path / ".log.csv.months.json").read_text(encoding="utf-8")) == index_data
+
+
+def test_range_read_parses_only_from_the_start_month(tmp_path, write_price_log):
+    csv_path = write_price_log(tmp_path / "log.csv", daily_rows(date(2024, 1, 1), 800))
+    MonthOffsetIndex(csv_path).update()
+    start_date = date(2026, 1, 15)
+
+    with patch.object(price_log_month_index, "read_price_log_arrays", wraps=price_log_month_index.read_price_log_arrays) as read_arrays:
+        range_history = load_price_history_since(csv_path, start_date)
+
+    start_offset = read_arrays.call_args.kwargs["start_offset"]
+    assert csv_path.read_bytes()[start_offset:].startswith(b"2026-01-01,")
+    pd.testing.assert_frame_equal(range_history, full_history_since(csv_path, start_date))
+    assert range_history.index[0] == pd.Timestamp(start_date)
+    # 로그의 마지막 날짜 이후부터 읽으면 빈 결과
+    assert load_price_history_since(csv_path, date(2030, 1, 1)).empty
+
+
+def test_appended_rows_update_the_index_without_rescanning(tmp_path, write_price_log):
+    csv_path = write_price_log(tmp_path / "log.csv", daily_rows(date(2026, 1, 1), 31))
+    month_index = MonthOffsetIndex(csv_path)
+    month_index.update()
+    indexed_size = csv_path.stat().st_size
+
+    with csv_path.open("a", encoding="utf-8") as csv_file:
+        csv_file.write("2026-02-01,100,1,1,1,1\n2026-02-02,101,1")
+    with patch.object(MonthOffsetIndex, "index_month_boundaries", wraps=month_index.index_month_boundaries) as index_rows:
+        index_data = month_index.update()
+    # 늘어난 부분만 한 조각으로 읽음
+    assert [call.args[1] for call in index_rows.call_args_list] == [indexed_size]
+    assert [month_key for month_key, _ in index_data["months"]] == ["2026-01", "2026-02"]
+    assert index_data["months"][1][1] == indexed_size
+    # 개행 전 마지막 줄은 아직 색인에 반영하지 않음
+    assert index_data["size"] == indexed_size + len("2026-02-01,100,1,1,1,1\n")
+
+    with csv_path.open("a", encoding="utf-8") as csv_file:
+        csv_file.write(",1,1,1\n2026-03-01,102,1,1,1,1\n")
+    index_data = month_index.update()
+    assert index_data["last_date"] == "2026-03-01"
+    assert [month_key for month_key, _ in index_data["months"]] == ["2026-01", "2026-02", "2026-03"]
+    assert read_price_log_range(csv_path, "2026-02-02").domestic_price.tolist() == [101.0, 102.0]
+
+
+def test_unordered_or_replaced_log_falls_back_to_the_full_history(tmp_path, write_price_log):
+    csv_path = write_price_log(
+        tmp_path / "log.csv", ["2026-03-02,2,1,1,1,1", "2026-01-05,1,1,1,1,1", "2026-03-03,3,1,1,1,1"]
+    )
+    assert MonthOffsetIndex(csv_path).update()["ordered"] is False
+    assert read_price_log_range(csv_path, "2026-03-01") is None
+    assert load_price_history_since(csv_path, "2026-03-01")["국내금(원/g)"].tolist() == [2.0, 3.0]
+
+    replacement_path = write_price_log(tmp_path / "replacement.csv", daily_rows(date(2026, 1, 1), 70))
+    os.replace(replacement_path, csv_path)
+    assert MonthOffsetIndex(csv_path).update()["ordered"] is True
+    clear_price_history_cache()
+    pd.testing.assert_frame_equal(
+        load_price_history_since(csv_path, "2026-03-01"), full_history_since(csv_path, "2026-03-01")
+    )
+
+
+def test_chart_and_outlier_loaders_read_only_their_window(tmp_path, write_price_log):
+    today = datetime.now().date()
+    csv_path = write_price_log(tmp_path / "log.csv", daily_rows(today - timedelta(days=1500), 1501))
+
+    with patch.object(price_log_month_index, "read_price_log_arrays", wraps=price_log_month_index.read_price_log_arrays) as read_arrays:
+        chart_data = load_and_preprocess_gold_price_data(csv_path, 12)
+        outlier_result = perform_kimchi_premium_outlier_analysis(csv_path)
+
+    pd.testing.assert_frame_equal(chart_data, full_history_since(csv_path, today - timedelta(days=360)))
+    assert outlier_result["latest_value"] == 1500 % 7
+    log_bytes = csv_path.read_bytes()
+    for start_date, range_read in zip([today - timedelta(days=360), today - timedelta(days=365)], read_arrays.call_args_list):
+        assert log_bytes[range_read.kwargs["start_offset"] :].startswith(f"{start_date:%Y-%m}-01,".encode())
@@ -0,0 +1,52 @@
+from kimchi_gold.price_scanner import StreamingPriceTagScanner, scan_price_text
+
+PAGE = (
+    '<html><head><title>네이버 증권</title></head><body>'
+    '<strong class="Other_price">1</strong>'
+    '<div class="DetailInfo_price__wrap">'
+    '<strong class="DetailInfo_price__I_VJn DetailInfo_up">152,340.00'
+    '<span class="DetailInfo_unit">원</span></strong></div>'
+    '<script>{"padding": "xxxx"}</script></body></html>'
+).encode("utf-8")
+
+
+def test_scan_price_text_strips_inner_tags():
+    assert scan_price_text(PAGE) == "152,340.00원"
+
+
+def test_scanner_handles_every_chunk_boundary():
+    for split_size in range(1, 40):
+        scanner = StreamingPriceTagScanner()
+        buffer = bytearray()
+        found = None
+        for offset in range(0, len(PAGE), split_size):
+            buffer += PAGE[offset:offset + split_size]
+            found = scanner.scan(buffer)
+            if found is not None:
+                break
+        assert found == "152,340.00원", split_size
+        # 태그가 닫히는 시점에 멈추므로 뒤쪽 스크립트는 읽지 않는다
+        assert len(buffer) < PAGE.index(b"<script>") + split_size
+
+
+def test_scanner_returns_none_without_price_tag():
+    assert scan_price_text(b"<html><body><strong>1</strong></body></html>") is None
+
+
+def test_scanner_gives_up_on_unclosed_tag():
+    scanner = StreamingPriceTagScanner()
+    page = b'<strong class="DetailInfo_price">' + b"1" * 5000
+    assert scanner.scan(page) is None
+    assert scanner.finished
+
+
+def test_scanner_matches_dom_parser_on_naver_fixtures():
+    from bs4 import BeautifulSoup
+    from naver_stand_in import load_naver_fixture_pages
+
+    for page in load_naver_fixture_pages().values():
+        price_tag = BeautifulSoup(page, "html.parser").find(
+            "strong",
+            class_=lambda class_name: class_name and "DetailInfo_price" in class_name,
+        )
+        assert scan_price_text(page) == price_tag.get_text()
@@ -0,0 +1,157 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+from kimchi_gold.data_collector import collect_and_save_current_gold_market_data, save_gold_price_data_to_price_log
+from kimchi_gold.price_fetcher import build_gold_price_data
+from kimchi_gold.price_history import clear_price_history_cache, load_price_history
+from kimchi_gold.price_log_migration import migrate_csv_to_sqlite
+from kimchi_gold.price_storage import CsvPriceLogBackend, DailyPriceRecord, SqlitePriceLogBackend
+from kimchi_gold.tick_store import IntradayTick, TickStore
+
+def daily_record(date_string, domestic_price=150000.0):
+    return DailyPriceRecord(date_string, domestic_price, 3345.0, 1399.0, -100.0, -0.07)
+
+
+def test_sqlite_upserts_by_date_and_queries_ranges(tmp_path):
+    database_path = tmp_path / "log.sqlite3"
+    with SqlitePriceLogBackend(database_path) as price_log:
+        price_log.upsert_records([daily_record("2026-03-05"), daily_record("2026-03-02"), daily_record("2026-03-03")])
+        price_log.upsert_records([daily_record("2026-03-03", domestic_price=151000.0)])
+
+        assert price_log.has_date("2026-03-03")
+        assert not price_log.has_date("2026-03-04")
+        assert [record.date for record in price_log.read_records()] == ["2026-03-02", "2026-03-03", "2026-03-05"]
+        assert price_log.read_records("2026-03-03", "2026-03-04") == [daily_record("2026-03-03", 151000.0)]
+
+    with sqlite3.connect(database_path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # 날짜 조회가 전체 스캔이 아니라 기본 키 색인을 탄다
+        query_plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT 1 FROM daily_prices WHERE date = '2026-03-03'"
+        ).fetchall()
+        assert "PRIMARY KEY" in str(query_plan)
+
+
+def test_sqlite_concurrent_writers_keep_every_row(tmp_path):
+    price_log = SqlitePriceLogBackend(tmp_path / "log.sqlite3")
+
+    def write_month(month):
+        for day in range(1, 29):
+            price_log.upsert_records([daily_record(f"2025-{month:02d}-{day:02d}")])
+
+    writer_threads = [threading.Thread(target=write_month, args=(month,)) for month in range(1, 9)]
+    for writer_thread in writer_threads:
+        writer_thread.start()
+    for writer_thread in writer_threads:
+        writer_thread.join()
+
+    assert len(price_log.read_records()) == 8 * 28
+    price_log.close()
+
+
+def test_csv_upsert_replaces_dates_and_keeps_other_rows_verbatim(tmp_path, price_log_header):
+    csv_path = tmp_path / "log.csv"
+    csv_path.write_text(
+        f"{price_log_header}\n2026-03-02,86400,1909.50,1350,0,0\n2026-03-04,150000.00,3345.00,1399.00,-100.00,-0.07\n",
+        encoding="utf-8",
+    )
+    price_log = CsvPriceLogBackend(csv_path)
+
+    # 없는 날짜 하나는 끝에 추가만 한다
+    price_log.upsert_records([daily_record("2026-03-05")])
+    assert csv_path.read_text(encoding="utf-8").endswith("2026-03-05,150000.00,3345.00,1399.00,-100.00,-0.07\n")
+
+    price_log.upsert_records([daily_record("2026-03-04", 152000.0), daily_record("2026-03-03")])
+
+    assert csv_path.read_text(encoding="utf-8").splitlines() == [
+        price_log_header,
+        "2026-03-02,86400,1909.50,1350,0,0",
+        "2026-03-03,150000.00,3345.00,1399.00,-100.00,-0.07",
+        "2026-03-04,152000.00,3345.00,1399.00,-100.00,-0.07",
+        "2026-03-05,150000.00,3345.00,1399.00,-100.00,-0.07",
+    ]
+    assert price_log.has_date("2026-03-03")
+    assert [record.date for record in price_log.read_records("2026-03-03", "2026-03-04")] == ["2026-03-03", "2026-03-04"]
+
+
+def test_csv_upsert_rewrite_keeps_the_log_file_mode(tmp_path, price_log_header):
+    csv_path = tmp_path / "log.csv"
+    csv_path.write_text(f"{price_log_header}\n2026-03-04,150000.00,3345.00,1399.00,-100.00,-0.07\n", encoding="utf-8")
+    os.chmod(csv_path, 0o644)
+
+    CsvPriceLogBackend(csv_path).upsert_records([daily_record("2026-03-04", 152000.0)])
+
+    assert csv_path.read_text(encoding="utf-8").splitlines()[1].startswith("2026-03-04,152000.00,")
+    assert oct(csv_path.stat().st_mode & 0o777) == oct(0o644)
+
+
+def test_migration_is_idempotent_and_includes_ticks(tmp_path, price_log_header):
+    csv_path = tmp_path / "log.csv"
+    csv_path.write_text(
+        f"{price_log_header}\n2026-03-02,86400,1909.50,1350,0,0\n2026-03-03,150000.00,3345.00,1399.00,-100.00,-0.07\n",
+        encoding="utf-8",
+    )
+    tick_directory = tmp_path / "ticks"
+    with patch("kimchi_gold.tick_store.validate_safe_path", side_effect=lambda path: path):
+        with TickStore(tick_directory) as tick_store:
+            for minute in range(3):
+                tick_store.append(IntradayTick(datetime(2026, 3, 3, 9, minute).timestamp(), 1, 2, 3, 4, 5))
+
+    with patch("kimchi_gold.price_log_migration.validate_safe_path", side_effect=lambda path: path), patch(
+        "kimchi_gold.tick_store.validate_safe_path", side_effect=lambda path: path
+    ):
+        for _ in range(2):
+            report = migrate_csv_to_sqlite(csv_path, tmp_path / "log.sqlite3", tick_directory, verify=True)
+
+    assert (report.daily_row_count, report.tick_count, report.verified) == (2, 3, True)
+    with SqlitePriceLogBackend(tmp_path / "log.sqlite3") as price_log:
+        assert price_log.read_records()[0] == DailyPriceRecord("2026-03-02", 86400.0, 1909.5, 1350.0, 0.0, 0.0)
+        assert len(price_log.read_tick_records()) == 3
+
+
+def test_collect_and_save_writes_to_sqlite_backend_and_keeps_the_csv_for_readers(tmp_path):
+    csv_path = tmp_path / "log.csv"
+    database_path = tmp_path / "log.sqlite3"
+    gold_market_data = build_gold_price_data(150000.0, 3345.0, 1399.0)
+    expected_record = DailyPriceRecord.from_gold_price_data(gold_market_data)
+
+    with patch("kimchi_gold.data_collector.validate_safe_path", side_effect=lambda path: path), patch(
+        "kimchi_gold.data_collector.PRICE_COLUMNS_ENABLED", False
+    ), patch("kimchi_gold.data_collector.fetch_current_gold_market_data", return_value=gold_market_data) as fetch_mock:
+        for _ in range(2):
+            assert collect_and_save_current_gold_market_data(
+                csv_path, price_log_backend="sqlite", output_database_path=database_path
+            )
+
+    # 두 번째 실행은 오늘 날짜가 이미 있어 수집하지 않는다
+    assert fetch_mock.call_count == 1
+    with SqlitePriceLogBackend(database_path) as price_log:
+        assert price_log.read_records() == [expected_record]
+    # 차트, 이상치 분석, 백테스트, 웹사이트가 읽는 CSV 로그에도 같은 행이 들어간다
+    clear_price_history_cache()
+    price_history = load_price_history(csv_path, use_disk_cache=False)
+    assert price_history.index[-1].strftime("%Y-%m-%d") == expected_record.date
+    assert price_history["국내금(원/g)"].tolist() == [expected_record.domestic_price]
+
+
+def test_sqlite_backend_copies_a_date_the_csv_already_had(tmp_path, price_log_header):
+    csv_path = tmp_path / "log.csv"
+    database_path = tmp_path / "log.sqlite3"
+    gold_market_data = build_gold_price_data(150000.0, 3345.0, 1399.0)
+    logged_date = gold_market_data.data_collection_timestamp.strftime("%Y-%m-%d")
+    csv_path.write_text(f"{price_log_header}\n{logged_date},149000.00,3345.00,1399.00,-100.00,-0.07\n", encoding="utf-8")
+
+    with patch("kimchi_gold.data_collector.validate_safe_path", side_effect=lambda path: path), patch(
+        "kimchi_gold.data_collector.PRICE_COLUMNS_ENABLED", False
+    ):
+        assert not save_gold_price_data_to_price_log(
+            gold_market_data, "sqlite", csv_path, database_path, skip_if_date_already_logged=True
+        )
+
+    # CSV에 먼저 기록된 값을 그대로 옮기고, 새로 수집한 값으로 덮어쓰지 않는다
+    with SqlitePriceLogBackend(database_path) as price_log:
+        assert [record.domestic_price for record in price_log.read_records()] == [149000.0]
+    assert csv_path.read_text(encoding="utf-8").count(logged_date) == 1
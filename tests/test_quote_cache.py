@@ -0,0 +1,193 @@
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.async_http_client import get_shared_async_connection_pool
+from kimchi_gold.configuration import NAVER_DOMESTIC_GOLD_URL, NAVER_INTERNATIONAL_GOLD_URL, NAVER_USD_KRW_EXCHANGE_URL
+from kimchi_gold.http_session import close_shared_http_session, get_shared_http_session
+from kimchi_gold.quote_cache import QuoteCache, set_shared_quote_cache
+from naver_stand_in import (
+    NaverStandInServer,
+    render_market_index_page,
+    route_async_pool_to_stand_in,
+    route_session_to_stand_in,
+)
+
+DOMESTIC_GOLD_PATH = "/marketindex/metals/M04020000"
+
+
+@pytest.fixture
+def stand_in():
+    close_shared_http_session()
+    with NaverStandInServer(send_validators=True) as server:
+        route_session_to_stand_in(get_shared_http_session(), server)
+        yield server
+    close_shared_http_session()
+
+
+def extract_domestic_gold_price(quote_cache):
+    return price_fetcher.extract_price_from_naver_finance(
+        NAVER_DOMESTIC_GOLD_URL, "국내 금 가격 정보를 찾을 수 없습니다.", quote_cache=quote_cache
+    )
+
+
+def age_cached_quote(quote_cache, seconds):
+    quote_cache.get(NAVER_DOMESTIC_GOLD_URL).fetched_at -= seconds
+
+
+def wait_for_revalidation(quote_cache, timeout_seconds=5.0):
+    deadline = time.monotonic() + timeout_seconds
+    while quote_cache._revalidating_urls and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_fresh_quote_is_served_without_request(stand_in):
+    quote_cache = QuoteCache(ttl_seconds=30.0, stale_while_revalidate_seconds=0.0)
+
+    prices = [extract_domestic_gold_price(quote_cache) for _ in range(5)]
+
+    assert prices == [152340.00] * 5
+    assert stand_in.request_count == 1
+
+
+def test_stale_quote_is_served_while_revalidating(stand_in):
+    quote_cache = QuoteCache(ttl_seconds=30.0, stale_while_revalidate_seconds=60.0)
+    extract_domestic_gold_price(quote_cache)
+    stand_in.pages[DOMESTIC_GOLD_PATH] = render_market_index_page("153,000.00")
+    age_cached_quote(quote_cache, 40.0)
+
+    # 갱신이 끝나기 전까지는 오래된 값을 바로 반환하고, 갱신 요청은 한 번만 보낸다
+    assert extract_domestic_gold_price(quote_cache) == 152340.00
+    assert extract_domestic_gold_price(quote_cache) == 152340.00
+    wait_for_revalidation(quote_cache)
+
+    assert stand_in.request_count == 2
+    assert extract_domestic_gold_price(quote_cache) == 153000.00
+    assert stand_in.request_count == 2
+
+
+def test_expired_quote_is_revalidated_with_etag(stand_in):
+    quote_cache = QuoteCache(ttl_seconds=30.0, stale_while_revalidate_seconds=0.0)
+    extract_domestic_gold_price(quote_cache)
+    assert quote_cache.get(NAVER_DOMESTIC_GOLD_URL).etag is not None
+    age_cached_quote(quote_cache, 40.0)
+
+    assert extract_domestic_gold_price(quote_cache) == 152340.00
+
+    assert stand_in.request_count == 2
+    assert stand_in.not_modified_count == 1
+    assert quote_cache.is_fresh(quote_cache.get(NAVER_DOMESTIC_GOLD_URL))
+
+
+def test_quote_cache_persists_to_disk(tmp_path):
+    cache_file = tmp_path / "quote_cache.json"
+    QuoteCache(persist_path=cache_file).store(
+        NAVER_DOMESTIC_GOLD_URL, 152340.0, etag='"abc"'
+    )
+
+    reloaded_quote = QuoteCache(persist_path=cache_file).get(NAVER_DOMESTIC_GOLD_URL)
+
+    assert reloaded_quote.price == 152340.0
+    assert reloaded_quote.etag == '"abc"'
+    assert list(tmp_path.iterdir()) == [cache_file]
+
+
+def test_concurrent_stores_all_reach_the_cache_file(tmp_path):
+    cache_file = tmp_path / "quote_cache.json"
+    quote_cache = QuoteCache(persist_path=cache_file)
+    target_urls = [f"https://m.stock.naver.com/quote/{quote_number}" for quote_number in range(8)]
+    real_dump = json.dump
+
+    def slow_dump(stored_quotes, temporary_file):
+        # 스냅샷을 찍은 뒤 파일을 바꾸기까지 시간이 걸리는 상황 (먼저 찍은 스냅샷이 늦게 쓰일 수 있음)
+        time.sleep(0.01 * (len(target_urls) - len(stored_quotes)))
+        real_dump(stored_quotes, temporary_file)
+
+    with patch("kimchi_gold.quote_cache.json.dump", side_effect=slow_dump):
+        store_threads = [
+            threading.Thread(target=quote_cache.store, args=(target_url, 1.0)) for target_url in target_urls
+        ]
+        for store_thread in store_threads:
+            store_thread.start()
+        for store_thread in store_threads:
+            store_thread.join()
+
+    reloaded_cache = QuoteCache(persist_path=cache_file)
+    assert all(reloaded_cache.get(target_url) is not None for target_url in target_urls)
+
+
+@pytest.mark.parametrize(
+    "file_content",
+    ["{not json", json.dumps([{"target_url": NAVER_DOMESTIC_GOLD_URL}]), json.dumps({"a": 1})],
+)
+def test_corrupt_cache_file_is_ignored(tmp_path, file_content):
+    cache_file = tmp_path / "quote_cache.json"
+    cache_file.write_text(file_content, encoding="utf-8")
+
+    assert QuoteCache(persist_path=cache_file).get(NAVER_DOMESTIC_GOLD_URL) is None
+
+
+def test_async_path_uses_quote_cache():
+    quote_cache = QuoteCache(ttl_seconds=30.0, stale_while_revalidate_seconds=0.0)
+
+    async def fetch_three_times():
+        pool = route_async_pool_to_stand_in(get_shared_async_connection_pool(), stand_in)
+        try:
+            prices = []
+            for _ in range(2):
+                prices.append(
+                    await price_fetcher.extract_price_from_naver_finance_async(
+                        NAVER_DOMESTIC_GOLD_URL, "에러", quote_cache=quote_cache
+                    )
+                )
+            age_cached_quote(quote_cache, 40.0)
+            prices.append(
+                await price_fetcher.extract_price_from_naver_finance_async(
+                    NAVER_DOMESTIC_GOLD_URL, "에러", quote_cache=quote_cache
+                )
+            )
+            return prices
+        finally:
+            await pool.aclose()
+
+    with NaverStandInServer(send_validators=True) as stand_in:
+        prices = asyncio.run(fetch_three_times())
+
+    assert prices == [152340.00] * 3
+    assert stand_in.request_count == 2
+    assert stand_in.not_modified_count == 1
+
+
+def test_check_cli_revalidates_an_expired_disk_cache_in_the_foreground(stand_in, tmp_path, monkeypatch, capsys):
+    cache_file = tmp_path / "quote_cache.json"
+    previous_writer = QuoteCache(persist_path=cache_file)
+    for target_url in (NAVER_DOMESTIC_GOLD_URL, NAVER_INTERNATIONAL_GOLD_URL, NAVER_USD_KRW_EXCHANGE_URL):
+        previous_writer.store(target_url, 1.0)
+    # TTL(30초)은 지났고 예전 stale 구간(150초) 안인 캐시 파일
+    stored_quotes = json.loads(cache_file.read_text(encoding="utf-8"))
+    for stored_quote in stored_quotes:
+        stored_quote["fetched_at"] -= 60.0
+    cache_file.write_text(json.dumps(stored_quotes), encoding="utf-8")
+    monkeypatch.setattr(price_fetcher, "QUOTE_CACHE_ENABLED", True)
+    monkeypatch.setattr(price_fetcher, "QUOTE_CACHE_FILE", cache_file)
+    previous_quote_cache = set_shared_quote_cache(None)
+    try:
+        assert price_fetcher.main() == 0
+        first_output = capsys.readouterr().out
+        assert price_fetcher.main() == 0
+        second_output = capsys.readouterr().out
+    finally:
+        set_shared_quote_cache(previous_quote_cache)
+
+    # 첫 실행이 새 값을 받아 출력하고 캐시 파일을 갱신했으므로 두 번째 실행은 요청 없이 새 값을 출력
+    assert "152,340" in first_output and "1.00" not in first_output
+    assert first_output == second_output
+    assert stand_in.request_count == 3
+    reloaded_quote = QuoteCache(persist_path=cache_file).get(NAVER_DOMESTIC_GOLD_URL)
+    assert reloaded_quote.price == 152340.00
+    assert reloaded_quote.age_seconds() < 30.0
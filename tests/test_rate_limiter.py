@@ -0,0 +1,146 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.circuit_breaker import get_circuit_breaker
+from kimchi_gold.configuration import CIRCUIT_BREAKER_FAILURE_THRESHOLD, NAVER_USD_KRW_EXCHANGE_URL
+from kimchi_gold.fetch_deadline import FetchCancelledError, FetchDeadline
+from kimchi_gold.http_session import close_shared_http_session, get_shared_http_session
+from kimchi_gold.rate_limiter import (
+    FileTokenBucketRateLimiter,
+    UpstreamRateLimiters,
+    fcntl,
+    set_shared_upstream_rate_limiters,
+)
+from naver_stand_in import NaverStandInServer, route_session_to_stand_in
+
+
+def acquire_tokens(state_path, token_count, start_event, finished_at):
+    rate_limiter = FileTokenBucketRateLimiter(state_path, rate_per_second=40.0, burst=1)
+    start_event.wait()
+    for _ in range(token_count):
+        rate_limiter.acquire()
+    finished_at.value = time.time()
+
+
+@pytest.mark.skipif(fcntl is None, reason="프로세스 간 잠금에는 fcntl이 필요")
+def test_processes_share_one_bucket(tmp_path):
+    state_path = tmp_path / "m.stock.naver.com.bucket"
+    process_context = multiprocessing.get_context("fork")
+    start_event = process_context.Event()
+    finish_times = [process_context.Value("d", 0.0) for _ in range(3)]
+    processes = [
+        process_context.Process(target=acquire_tokens, args=(state_path, 4, start_event, finished_at))
+        for finished_at in finish_times
+    ]
+    for process in processes:
+        process.start()
+    started_at = time.time()
+    start_event.set()
+    for process in processes:
+        process.join(timeout=10)
+        assert process.exitcode == 0
+
+    # 프로세스마다 따로 세면 4개 토큰은 0.075초면 끝나지만, 합계 12개를 초당 40개로 나눠 쓴다
+    assert max(finished_at.value for finished_at in finish_times) - started_at >= 11 / 40 - 0.02
+
+
+def test_waiting_callers_are_served_in_reservation_order(tmp_path):
+    rate_limiter = FileTokenBucketRateLimiter(tmp_path / "bucket", rate_per_second=50.0, burst=2)
+
+    waits = [rate_limiter.reserve() for _ in range(5)]
+
+    # 버킷이 비면 예약 순서대로 1/50초씩 차례가 밀린다
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == pytest.approx([0.02, 0.04, 0.06], abs=0.005)
+    # 마감 시간 안에 차례가 오지 않으면 토큰을 쓰지 않는다
+    assert rate_limiter.reserve(max_wait_seconds=0.01) is None
+    assert rate_limiter.reserve() == pytest.approx(0.08, abs=0.005)
+
+
+def test_fetches_queue_on_shared_bucket_instead_of_failing(tmp_path):
+    set_shared_upstream_rate_limiters(UpstreamRateLimiters(tmp_path, rate_per_second=20.0, burst=2))
+    close_shared_http_session()
+    with NaverStandInServer() as stand_in:
+        route_session_to_stand_in(get_shared_http_session(), stand_in)
+        try:
+            rates = []
+            fetch_threads = [
+                threading.Thread(target=lambda: rates.append(price_fetcher.fetch_usd_krw_exchange_rate()))
+                for _ in range(6)
+            ]
+            started_at = time.perf_counter()
+            for fetch_thread in fetch_threads:
+                fetch_thread.start()
+            for fetch_thread in fetch_threads:
+                fetch_thread.join()
+            elapsed_seconds = time.perf_counter() - started_at
+
+            # 버킷이 마감 시간 뒤까지 밀려 있으면 기다리지 않고 바로 포기
+            for _ in range(10):
+                price_fetcher.get_shared_upstream_rate_limiters().for_url(NAVER_USD_KRW_EXCHANGE_URL).reserve()
+            with pytest.raises(FetchCancelledError):
+                price_fetcher.fetch_price_from_naver_finance_once(
+                    NAVER_USD_KRW_EXCHANGE_URL, "환율 정보를 찾을 수 없습니다.", deadline=FetchDeadline(0.1)
+                )
+        finally:
+            close_shared_http_session()
+
+    assert len(rates) == 6
+    assert stand_in.request_count == 6
+    # 처음 2개는 바로, 나머지 4개는 1/20초 간격으로 나간다
+    assert elapsed_seconds >= 4 / 20 - 0.02
+    assert (tmp_path / "m.stock.naver.com.bucket").exists()
+
+
+def test_async_fetch_gives_up_on_a_queue_past_the_deadline_off_the_event_loop(tmp_path, monkeypatch):
+    set_shared_upstream_rate_limiters(UpstreamRateLimiters(tmp_path, rate_per_second=20.0, burst=1))
+    rate_limiter = price_fetcher.get_shared_upstream_rate_limiters().for_url(NAVER_USD_KRW_EXCHANGE_URL)
+    reserving_threads = []
+    real_reserve = rate_limiter.reserve
+
+    def recording_reserve(max_wait_seconds=None):
+        reserving_threads.append(threading.current_thread())
+        return real_reserve(max_wait_seconds)
+
+    monkeypatch.setattr(rate_limiter, "reserve", recording_reserve)
+    for _ in range(10):
+        real_reserve()
+    queued_wait = real_reserve()
+
+    with pytest.raises(FetchCancelledError) as excinfo:
+        asyncio.run(
+            price_fetcher.fetch_price_from_naver_finance_once_async(
+                NAVER_USD_KRW_EXCHANGE_URL, "환율 정보를 찾을 수 없습니다.", deadline=FetchDeadline(0.1)
+            )
+        )
+
+    assert excinfo.value.deadline_exceeded
+    # 버킷 예약(파일 잠금)은 이벤트 루프 스레드가 아닌 작업 스레드에서 실행
+    assert reserving_threads and threading.main_thread() not in reserving_threads
+    # 포기한 요청은 토큰을 쓰지 않았으므로 다음 차례는 1/20초만 밀린다
+    assert real_reserve() - queued_wait < 1.5 / 20
+
+
+def test_async_rate_limit_cancellations_do_not_open_the_circuit(tmp_path):
+    set_shared_upstream_rate_limiters(UpstreamRateLimiters(tmp_path, rate_per_second=20.0, burst=1))
+    rate_limiter = price_fetcher.get_shared_upstream_rate_limiters().for_url(NAVER_USD_KRW_EXCHANGE_URL)
+    for _ in range(10):
+        rate_limiter.reserve()
+
+    async def fetch_with_short_deadline():
+        return await price_fetcher.extract_price_from_naver_finance_async(
+            NAVER_USD_KRW_EXCHANGE_URL, "환율 정보를 찾을 수 없습니다.", deadline=FetchDeadline(0.01)
+        )
+
+    # 동기 경로와 같이 요청 속도 제한 대기로 포기한 요청은 실패 횟수에 넣지 않는다
+    for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD + 1):
+        with pytest.raises(FetchCancelledError):
+            asyncio.run(fetch_with_short_deadline())
+
+    circuit_status = get_circuit_breaker(NAVER_USD_KRW_EXCHANGE_URL).status()
+    assert (circuit_status.state, circuit_status.consecutive_failures) == ("closed", 0)
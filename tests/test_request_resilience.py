@@ -0,0 +1,177 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.async_http_client import get_shared_async_connection_pool
+from kimchi_gold.configuration import NAVER_DOMESTIC_GOLD_URL
+from kimchi_gold.http_session import close_shared_http_session, get_shared_http_session
+from kimchi_gold.request_resilience import (
+    LatencyTracker,
+    RetryPolicy,
+    get_shared_latency_tracker,
+    is_retryable_error,
+)
+from naver_stand_in import (
+    NaverStandInServer,
+    route_async_pool_to_stand_in,
+    route_session_to_stand_in,
+)
+
+DOMESTIC_GOLD_PATH = "/marketindex/metals/M04020000"
+FAST_RETRY_POLICY = RetryPolicy(max_retries=2, base_delay_seconds=0.01, max_delay_seconds=0.02)
+
+
+@pytest.fixture(autouse=True)
+def reset_latency_tracker():
+    get_shared_latency_tracker().reset()
+    yield
+    get_shared_latency_tracker().reset()
+
+
+@pytest.fixture
+def stand_in():
+    close_shared_http_session()
+    with NaverStandInServer() as server:
+        route_session_to_stand_in(get_shared_http_session(), server)
+        yield server
+    close_shared_http_session()
+
+
+def prime_latency_samples(latency_seconds=0.02, sample_count=20):
+    for _ in range(sample_count):
+        get_shared_latency_tracker().record(NAVER_DOMESTIC_GOLD_URL, latency_seconds)
+
+
+def extract_domestic_gold_price(**kwargs):
+    return price_fetcher.extract_price_from_naver_finance(
+        NAVER_DOMESTIC_GOLD_URL, "국내 금 가격 정보를 찾을 수 없습니다.", **kwargs
+    )
+
+
+def test_latency_tracker_percentile_needs_min_samples():
+    tracker = LatencyTracker(window_size=10, min_samples=5)
+    for latency in [0.1, 0.2, 0.3, 0.4]:
+        tracker.record("url", latency)
+    assert tracker.percentile("url", 95) is None
+
+    for latency in [0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1]:
+        tracker.record("url", latency)
+    # 윈도우에는 최근 10개(0.2 ~ 1.1)만 남는다
+    assert tracker.percentile("url", 50) == 0.6
+    assert tracker.percentile("url", 95) == 1.1
+
+
+def test_retry_backoff_is_bounded_and_jittered():
+    policy = RetryPolicy(max_retries=5, base_delay_seconds=0.1, max_delay_seconds=0.3)
+    with patch("kimchi_gold.request_resilience.random.uniform", side_effect=lambda low, high: high):
+        assert [policy.backoff_delay(n) for n in range(4)] == [0.1, 0.2, 0.3, 0.3]
+    delays = {policy.backoff_delay(3) for _ in range(20)}
+    assert all(0 <= delay <= 0.3 for delay in delays)
+    assert len(delays) > 1
+
+
+def test_only_transient_errors_are_retryable():
+    server_error = requests.Response()
+    server_error.status_code = 503
+    not_found = requests.Response()
+    not_found.status_code = 404
+
+    assert is_retryable_error(requests.HTTPError(response=server_error))
+    assert is_retryable_error(requests.ConnectionError())
+    assert is_retryable_error(requests.ConnectTimeout())
+    assert not is_retryable_error(requests.HTTPError(response=not_found))
+    assert not is_retryable_error(requests.ReadTimeout())
+    assert not is_retryable_error(ValueError("가격 정보를 찾을 수 없습니다."))
+
+
+def test_retries_transient_server_errors(stand_in):
+    stand_in.inject_faults(DOMESTIC_GOLD_PATH, ("status", 503), ("drop",))
+
+    price = extract_domestic_gold_price(retry_policy=FAST_RETRY_POLICY)
+
+    assert price == 152340.00
+    assert stand_in.request_count == 3
+
+
+def test_gives_up_after_max_retries(stand_in):
+    stand_in.inject_faults(DOMESTIC_GOLD_PATH, *[("status", 502)] * 5)
+
+    with pytest.raises(requests.HTTPError):
+        extract_domestic_gold_price(retry_policy=FAST_RETRY_POLICY)
+
+    assert stand_in.request_count == 3
+
+
+def test_client_errors_are_not_retried(stand_in):
+    stand_in.inject_faults(DOMESTIC_GOLD_PATH, ("status", 404))
+
+    with pytest.raises(requests.HTTPError):
+        extract_domestic_gold_price(retry_policy=FAST_RETRY_POLICY)
+
+    assert stand_in.request_count == 1
+
+
+def test_hedged_request_beats_slow_primary(stand_in):
+    prime_latency_samples()
+    stand_in.inject_faults(DOMESTIC_GOLD_PATH, ("delay", 1.5))
+
+    started = time.perf_counter()
+    price = extract_domestic_gold_price(hedge=True)
+
+    assert price == 152340.00
+    assert time.perf_counter() - started < 1.0
+    assert stand_in.request_count == 2
+
+
+def test_no_hedge_without_latency_samples(stand_in):
+    stand_in.inject_faults(DOMESTIC_GOLD_PATH, ("delay", 0.1))
+
+    assert extract_domestic_gold_price(hedge=True) == 152340.00
+    assert stand_in.request_count == 1
+
+
+def run_with_async_stand_in(stand_in, coroutine_function):
+    async def runner():
+        pool = route_async_pool_to_stand_in(get_shared_async_connection_pool(), stand_in)
+        try:
+            return await coroutine_function()
+        finally:
+            await pool.aclose()
+
+    return asyncio.run(runner())
+
+
+def test_async_retries_transient_server_errors():
+    with NaverStandInServer() as stand_in:
+        stand_in.inject_faults(DOMESTIC_GOLD_PATH, ("status", 500), ("drop",))
+        price = run_with_async_stand_in(
+            stand_in,
+            lambda: price_fetcher.extract_price_from_naver_finance_async(
+                NAVER_DOMESTIC_GOLD_URL, "에러", retry_policy=FAST_RETRY_POLICY
+            ),
+        )
+
+    assert price == 152340.00
+    assert stand_in.request_count == 3
+
+
+def test_async_hedged_request_beats_slow_primary():
+    prime_latency_samples()
+    with NaverStandInServer() as stand_in:
+        stand_in.inject_faults(DOMESTIC_GOLD_PATH, ("delay", 1.5))
+        started = time.perf_counter()
+        price = run_with_async_stand_in(
+            stand_in,
+            lambda: price_fetcher.extract_price_from_naver_finance_async(
+                NAVER_DOMESTIC_GOLD_URL, "에러", hedge=True
+            ),
+        )
+        elapsed = time.perf_counter() - started
+
+    assert price == 152340.00
+    assert elapsed < 1.0
+    assert stand_in.request_count == 2
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.async_http_client import get_shared_async_connection_pool
+from kimchi_gold.fetch_deadline import MarketDataCollectionError
+from kimchi_gold.http_session import close_shared_http_session, get_shared_http_session
+from kimchi_gold.single_flight import AsyncSingleFlight, SingleFlight
+from naver_stand_in import (
+    NaverStandInServer,
+    route_async_pool_to_stand_in,
+    route_session_to_stand_in,
+)
+
+CONCURRENT_CALLERS = 16
+
+
+@pytest.fixture
+def slow_stand_in():
+    close_shared_http_session()
+    with NaverStandInServer() as server:
+        server.latency_seconds = 0.2
+        route_session_to_stand_in(get_shared_http_session(), server)
+        yield server
+    close_shared_http_session()
+
+
+def assert_callers_own_their_snapshots(snapshots):
+    # 합쳐진 호출자도 서로 다른 객체를 받아 한 쪽의 수정이 다른 쪽에 보이지 않아야 함
+    assert len({id(snapshot) for snapshot in snapshots}) == len(snapshots)
+    original_timestamp = snapshots[1].data_collection_timestamp
+    snapshots[0].stale_sources.append("국내 금 시세")
+    snapshots[0].data_collection_timestamp = "변경됨"
+    assert snapshots[1].stale_sources == []
+    assert snapshots[1].data_collection_timestamp == original_timestamp
+
+
+def test_single_flight_shares_result_between_threads():
+    single_flight = SingleFlight()
+    call_count = 0
+    release_event = threading.Event()
+
+    def slow_function():
+        nonlocal call_count
+        call_count += 1
+        release_event.wait(5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(single_flight.call, "key", slow_function) for _ in range(8)]
+        time.sleep(0.1)
+        release_event.set()
+        results = [future.result() for future in futures]
+
+    assert call_count == 1
+    assert all(result is results[0] for result in results)
+    assert single_flight.in_flight_count() == 0
+
+
+def test_single_flight_shares_errors_and_runs_again_afterwards():
+    single_flight = SingleFlight()
+
+    def failing_function():
+        raise ValueError("실패")
+
+    with pytest.raises(ValueError):
+        single_flight.call("key", failing_function)
+    assert single_flight.call("key", lambda: 42) == 42
+
+
+def test_concurrent_snapshots_send_one_request_per_source(slow_stand_in):
+    with ThreadPoolExecutor(max_workers=CONCURRENT_CALLERS) as executor:
+        futures = [
+            executor.submit(price_fetcher.fetch_current_gold_market_data)
+            for _ in range(CONCURRENT_CALLERS)
+        ]
+        snapshots = [future.result() for future in futures]
+
+    assert {snapshot.domestic_price for snapshot in snapshots} == {152340.00}
+    assert slow_stand_in.request_count == 3
+    assert_callers_own_their_snapshots(snapshots)
+
+
+def test_concurrent_snapshot_failure_is_shared(slow_stand_in):
+    slow_stand_in.pages.pop("/marketindex/metals/GCcv1")
+
+    with ThreadPoolExecutor(max_workers=CONCURRENT_CALLERS) as executor:
+        futures = [
+            executor.submit(price_fetcher.fetch_current_gold_market_data)
+            for _ in range(CONCURRENT_CALLERS)
+        ]
+        for future in futures:
+            with pytest.raises(MarketDataCollectionError):
+                future.result()
+
+    assert slow_stand_in.request_count <= 3
+
+
+def test_async_concurrent_snapshots_send_one_request_per_source():
+    async def gather_snapshots(stand_in):
+        pool = route_async_pool_to_stand_in(get_shared_async_connection_pool(), stand_in)
+        try:
+            return await asyncio.gather(
+                *[price_fetcher.fetch_current_gold_market_data_async() for _ in range(CONCURRENT_CALLERS)]
+            )
+        finally:
+            await pool.aclose()
+
+    with NaverStandInServer() as stand_in:
+        stand_in.latency_seconds = 0.2
+        snapshots = asyncio.run(gather_snapshots(stand_in))
+
+    assert {snapshot.usd_krw_rate for snapshot in snapshots} == {1399.50}
+    assert stand_in.request_count == 3
+    assert_callers_own_their_snapshots(snapshots)
+
+
+def test_async_single_flight_survives_cancelled_follower():
+    single_flight = AsyncSingleFlight()
+    call_count = 0
+
+    async def slow_coroutine():
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run():
+        leader = asyncio.ensure_future(single_flight.call("key", slow_coroutine))
+        follower = asyncio.ensure_future(single_flight.call("key", slow_coroutine))
+        await asyncio.sleep(0)
+        follower.cancel()
+        result = await leader
+        assert follower.cancelled()
+        return result
+
+    assert asyncio.run(run()) == "done"
+    assert call_count == 1
+    assert single_flight.in_flight_count() == 0
+
+
+def test_async_single_flight_cancels_task_when_all_callers_cancelled():
+    single_flight = AsyncSingleFlight()
+    task_cancelled = False
+
+    async def hanging_coroutine():
+        nonlocal task_cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            task_cancelled = True
+            raise
+
+    async def run():
+        caller = asyncio.ensure_future(single_flight.call("key", hanging_coroutine))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.gather(caller, return_exceptions=True)
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert task_cancelled
+    assert single_flight.in_flight_count() == 0
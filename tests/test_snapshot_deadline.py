@@ -0,0 +1,188 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kimchi_gold import price_fetcher
+from kimchi_gold.fetch_deadline import (
+    FetchCancelledError,
+    FetchDeadline,
+    MarketDataCollectionError,
+)
+
+
+def quote_fetcher(price):
+    def fetch(deadline=None):
+        return price
+
+    return fetch
+
+
+def failing_fetcher(deadline=None):
+    raise ValueError("가격 정보를 찾을 수 없습니다.")
+
+
+def make_hanging_fetcher(stopped_event):
+    """취소 신호를 받을 때까지 응답을 기다리는 것처럼 동작하는 fetcher"""
+
+    def fetch(deadline=None):
+        try:
+            for _ in range(500):
+                deadline.check("https://m.stock.naver.com/hanging")
+                time.sleep(0.01)
+            return 1.0
+        finally:
+            stopped_event.set()
+
+    return fetch
+
+
+def patch_sync_fetchers(domestic, international, usd_krw):
+    return (
+        patch.object(price_fetcher, "fetch_domestic_gold_price", domestic),
+        patch.object(price_fetcher, "fetch_international_gold_price", international),
+        patch.object(price_fetcher, "fetch_usd_krw_exchange_rate", usd_krw),
+    )
+
+
+def test_snapshot_succeeds_with_named_quotes():
+    patches = patch_sync_fetchers(quote_fetcher(152340.0), quote_fetcher(3345.2), quote_fetcher(1399.5))
+    with patches[0], patches[1], patches[2]:
+        data = price_fetcher.fetch_current_gold_market_data(deadline_seconds=1.0)
+
+    assert data.domestic_price == 152340.0
+    assert data.international_price == 3345.2
+    assert data.usd_krw_rate == 1399.5
+
+
+def test_fail_fast_cancels_in_flight_siblings():
+    stopped_event = threading.Event()
+    patches = patch_sync_fetchers(
+        make_hanging_fetcher(stopped_event), failing_fetcher, quote_fetcher(1399.5)
+    )
+    started = time.monotonic()
+    with patches[0], patches[1], patches[2]:
+        with pytest.raises(MarketDataCollectionError) as excinfo:
+            price_fetcher.fetch_current_gold_market_data(deadline_seconds=5.0, fail_fast=True)
+
+    assert time.monotonic() - started < 1.0
+    failures = {failure.source_name: failure for failure in excinfo.value.failures}
+    assert not failures["international_gold"].timed_out
+    assert isinstance(failures["international_gold"].error, ValueError)
+    assert failures["domestic_gold"].cancelled
+    # 빠른 소스는 실패 시점에 이미 끝났을 수도, 함께 취소되었을 수도 있다
+    assert "usd_krw" not in failures or failures["usd_krw"].cancelled
+    # 취소 신호를 받은 스레드가 스스로 끝나야 한다
+    assert stopped_event.wait(1.0)
+
+
+def test_deadline_bounds_snapshot_and_names_slow_source():
+    stopped_event = threading.Event()
+    patches = patch_sync_fetchers(
+        make_hanging_fetcher(stopped_event), quote_fetcher(3345.2), quote_fetcher(1399.5)
+    )
+    started = time.monotonic()
+    with patches[0], patches[1], patches[2]:
+        with pytest.raises(MarketDataCollectionError) as excinfo:
+            price_fetcher.fetch_current_gold_market_data(deadline_seconds=0.2)
+
+    assert time.monotonic() - started < 1.0
+    assert excinfo.value.timed_out_sources == ["domestic_gold"]
+    assert excinfo.value.failed_sources == ["domestic_gold"]
+    # 사용자에게는 기존과 같은 일반 메시지만 노출
+    assert isinstance(excinfo.value, ValueError)
+    assert str(excinfo.value) == "금 가격 데이터를 가져올 수 없습니다. 시스템 로그를 확인해주세요."
+    assert stopped_event.wait(1.0)
+
+
+def test_without_fail_fast_all_failures_are_reported():
+    patches = patch_sync_fetchers(failing_fetcher, quote_fetcher(3345.2), failing_fetcher)
+    with patches[0], patches[1], patches[2]:
+        with pytest.raises(MarketDataCollectionError) as excinfo:
+            price_fetcher.fetch_current_gold_market_data(deadline_seconds=1.0, fail_fast=False)
+
+    assert sorted(excinfo.value.failed_sources) == ["domestic_gold", "usd_krw"]
+    assert excinfo.value.timed_out_sources == []
+
+
+def test_extract_clamps_timeouts_to_deadline():
+    mock_response = MagicMock()
+    mock_response.__enter__.return_value = mock_response
+    mock_response.is_redirect = False
+    mock_response.headers = {"Content-Type": "text/html"}
+    mock_response.iter_content.return_value = [
+        b'<strong class="DetailInfo_price__I_VJn">1,234.00</strong>'
+    ]
+
+    with patch("requests.Session.get", return_value=mock_response) as mock_get:
+        price = price_fetcher.extract_price_from_naver_finance(
+            "https://finance.naver.com", "에러", deadline=FetchDeadline(0.5)
+        )
+
+    assert price == 1234.0
+    connect_timeout, read_timeout = mock_get.call_args[1]["timeout"]
+    assert 0 < connect_timeout <= 0.5
+    assert 0 < read_timeout <= 0.5
+
+
+def test_extract_does_not_start_request_after_cancel():
+    deadline = FetchDeadline(5.0)
+    deadline.cancel()
+    with patch("requests.Session.get") as mock_get:
+        with pytest.raises(FetchCancelledError):
+            price_fetcher.extract_price_from_naver_finance(
+                "https://finance.naver.com", "에러", deadline=deadline
+            )
+    mock_get.assert_not_called()
+
+
+def test_async_fail_fast_cancels_pending_tasks():
+    cancelled_sources = []
+
+    async def hanging(deadline):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled_sources.append("domestic_gold")
+            raise
+
+    async def failing(deadline):
+        raise ValueError("가격 정보를 찾을 수 없습니다.")
+
+    async def quote(deadline):
+        return 1399.5
+
+    with (
+        patch.object(price_fetcher, "fetch_domestic_gold_price_async", hanging),
+        patch.object(price_fetcher, "fetch_international_gold_price_async", failing),
+        patch.object(price_fetcher, "fetch_usd_krw_exchange_rate_async", quote),
+    ):
+        started = time.monotonic()
+        with pytest.raises(MarketDataCollectionError) as excinfo:
+            asyncio.run(price_fetcher.fetch_current_gold_market_data_async(deadline_seconds=5.0))
+
+    assert time.monotonic() - started < 1.0
+    assert cancelled_sources == ["domestic_gold"]
+    failures = {failure.source_name: failure for failure in excinfo.value.failures}
+    assert failures["domestic_gold"].cancelled
+    assert not failures["international_gold"].timed_out
+
+
+def test_async_deadline_marks_slow_source_timed_out():
+    async def slow(deadline):
+        await asyncio.sleep(5)
+
+    async def quote(deadline):
+        return 1.0
+
+    with (
+        patch.object(price_fetcher, "fetch_domestic_gold_price_async", quote),
+        patch.object(price_fetcher, "fetch_international_gold_price_async", quote),
+        patch.object(price_fetcher, "fetch_usd_krw_exchange_rate_async", slow),
+    ):
+        with pytest.raises(MarketDataCollectionError) as excinfo:
+            asyncio.run(price_fetcher.fetch_current_gold_market_data_async(deadline_seconds=0.1))
+
+    assert excinfo.value.timed_out_sources == ["usd_krw"]